@@ -4,6 +4,7 @@ from utils.task_manager import TaskManager
 from utils.task import Task
 from utils.notifier import EmailNotifier
 from utils.agent_talker import AgentTalker
+from utils.agent_talker import poll_agents
 from dynamic.policies.computation import ComputationPolicy
 from dynamic.policies.network_host import NetworkHostPolicy
 from dynamic.policies.network_container import NetworkContainerPolicy
@@ -49,85 +50,91 @@ computation_policy = ComputationPolicy()
 
 
 async def task_dynamic_computation():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_dynamic_computation()
+    async def handle(agent_taker, resp):
         subject, body = computation_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_dynamic_computation, handle)
+
 
 network_host_policy = NetworkHostPolicy()
 
 
 async def task_dynamic_network_host():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_dynamic_network_host()
+    async def handle(agent_taker, resp):
         subject, body = network_host_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_dynamic_network_host, handle)
+
 
 network_container_policy = NetworkContainerPolicy()
 
 
 async def task_dynamic_network_container():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_dynamic_network_containers()
+    async def handle(agent_taker, resp):
         subject, body = network_container_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_dynamic_network_containers, handle)
+
 
 storage_policy = StoragePolicy()
 
 
 async def task_dynamic_storage():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_dynamic_storage()
+    async def handle(agent_taker, resp):
         subject, body = storage_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_dynamic_storage, handle)
+
 
 container_image_policy = ContainerSuspiciousImagePolicy()
 
 
 async def task_dynamic_container_image():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_dynamic_containers()
+    async def handle(agent_taker, resp):
         subject, body, suspicious_containers = container_image_policy.apply(resp)
         if subject is None:
-            continue
+            return
         for container in suspicious_containers:
             container_id = container['container_id']
-            agent_taker.post_dynamic_stop_container(container_id)
+            await agent_taker.post_dynamic_stop_container(container_id)
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_dynamic_containers, handle)
+
 
 container_signature_policy = ContainerSuspiciousSignaturePolicy('master.crt')
 
 
 async def task_dynamic_container_signature():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_dynamic_containers()
+    async def handle(agent_taker, resp):
         subject, body, suspicious_containers = container_signature_policy.apply(resp)
         if subject is None:
-            continue
+            return
         for container in suspicious_containers:
             container_id = container['container_id']
-            agent_taker.post_dynamic_stop_container(container_id)
+            await agent_taker.post_dynamic_stop_container(container_id)
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_dynamic_containers, handle)
+
 
 if __name__ == "__main__":
     manager = TaskManager('SIME Dynamic')
@@ -143,5 +150,7 @@ if __name__ == "__main__":
 
     for task in tasks:
         manager.add_task(task)
+    for agent_taker in agent_talkers:
+        manager.add_cleanup(agent_taker.close)
 
     manager.run()
@@ -4,6 +4,7 @@ from utils.task_manager import TaskManager
 from utils.task import Task
 from utils.notifier import EmailNotifier
 from utils.agent_talker import AgentTalker
+from utils.agent_talker import poll_agents
 from static.policies.images import ImagesPolicy
 from static.policies.storage import StoragePolicy
 from static.policies.network import NetworkPolicy
@@ -48,53 +49,57 @@ images_policy = ImagesPolicy()
 
 
 async def task_static_images():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_static_images()
+    async def handle(agent_taker, resp):
         subject, body = images_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_static_images, handle)
+
 
 storage_policy = StoragePolicy()
 
 
 async def task_static_storage():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_static_storage()
+    async def handle(agent_taker, resp):
         subject, body = storage_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_static_storage, handle)
+
 
 network_policy = NetworkPolicy()
 
 
 async def task_static_network():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_static_network_config()
+    async def handle(agent_taker, resp):
         subject, body = network_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_static_network_config, handle)
+
 
 host_config_policy = HostConfigPolicy()
 
 
 async def task_static_host_config():
-    for agent_taker in agent_talkers:
-        resp = agent_taker.get_static_host_config()
+    async def handle(agent_taker, resp):
         subject, body = host_config_policy.apply(resp)
         if subject is None:
-            continue
+            return
         body = format_body(agent_taker, body)
         email_notifier.send_email(subject, body)
 
+    await poll_agents(agent_talkers, AgentTalker.get_static_host_config, handle)
+
 
 if __name__ == "__main__":
     manager = TaskManager('SIME Static')
@@ -108,5 +113,7 @@ if __name__ == "__main__":
 
     for task in tasks:
         manager.add_task(task)
+    for agent_taker in agent_talkers:
+        manager.add_cleanup(agent_taker.close)
 
     manager.run()
@@ -0,0 +1,182 @@
+"""
+Benchmark of a full poll round of the dynamic policies on a local farm of
+stub agents.
+
+Run from the sources folder of the SIEM:
+    python -m utils.agent_farm_benchmark --agents 100
+
+The stub agents answer every endpoint after --delay milliseconds, as an
+agent collecting its statistics would. The round is polled one request
+after another with a new connection each, as before, then with the
+asynchronous AgentTalker, twice, to show the connections being reused.
+"""
+import argparse
+import asyncio
+import requests
+from aiohttp import web
+from multiprocessing import Process
+from multiprocessing import Queue
+from time import time
+from .agent_talker import AgentTalker
+from .agent_talker import poll_agents
+
+# The endpoints read by the dynamic policies in one cycle, as in run_dynamic.py
+ROUND = [
+    AgentTalker.get_dynamic_computation,
+    AgentTalker.get_dynamic_network_host,
+    AgentTalker.get_dynamic_network_containers,
+    AgentTalker.get_dynamic_storage,
+    # ContainerSuspiciousImagePolicy
+    AgentTalker.get_dynamic_containers,
+    # ContainerSuspiciousSignaturePolicy
+    AgentTalker.get_dynamic_containers,
+]
+PATHS = [
+    'dynamic/computation',
+    'dynamic/network-host',
+    'dynamic/network-container',
+    'dynamic/storage',
+    'dynamic/containers',
+    'dynamic/containers',
+]
+
+
+class NullAuditLogger:
+
+    def log(self,
+            message,
+            *arg,
+            **kwargs):
+        pass
+
+
+async def serve_farm(agents,
+                     first_port,
+                     delay,
+                     stats):
+    # Kept, so that no two connections are counted as one
+    connections = set()
+
+    async def handle(request):
+        connections.add(request.transport)
+        stats.put(len(connections))
+        await asyncio.sleep(delay / 1000)
+        return web.json_response({'data': []})
+
+    app = web.Application()
+    app.router.add_get('/{path:.*}', handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    for port in range(first_port, first_port + agents):
+        await web.TCPSite(runner, '127.0.0.1', port).start()
+    stats.put(0)
+    while True:
+        await asyncio.sleep(3600)
+
+
+def run_farm(agents,
+             first_port,
+             delay,
+             stats):
+    asyncio.run(serve_farm(agents, first_port, delay, stats))
+
+
+class ConnectionsOpened:
+
+    def __init__(self,
+                 stats):
+        self.stats = stats
+        self.total = 0
+
+    def since_last(self):
+        total = self.total
+        while not self.stats.empty():
+            total = self.stats.get()
+        opened = total - self.total
+        self.total = total
+        return opened
+
+
+def poll_blocking(agents,
+                  first_port):
+    for port in range(first_port, first_port + agents):
+        for path in PATHS:
+            response = requests.get(
+                f'http://127.0.0.1:{port}/{path}',
+                auth=('user', 'pass'))
+            response.raise_for_status()
+            response.json()
+
+
+async def poll_async(agent_talkers):
+    async def handle(agent_talker, resp):
+        pass
+
+    await asyncio.gather(*[
+        poll_agents(agent_talkers, get, handle) for get in ROUND])
+
+
+def report(name,
+           elapsed,
+           requests_sent,
+           opened):
+    print('%-22s %9.1f ms %6d requests %6d connections opened' % (
+        name, elapsed * 1000, requests_sent, opened))
+
+
+async def benchmark(args,
+                    connections_opened):
+    agent_talkers = [
+        AgentTalker(
+            '127.0.0.1', port, 'user', 'pass',
+            max_concurrency=args.maxConcurrency,
+            audit_logger=NullAuditLogger())
+        for port in range(args.firstPort, args.firstPort + args.agents)]
+    for i in range(2):
+        for agent_talker in agent_talkers:
+            agent_talker.requests_sent = 0
+        start_time = time()
+        await poll_async(agent_talkers)
+        elapsed = time() - start_time
+        # The next round comes after the time responses are reused for
+        for agent_talker in agent_talkers:
+            agent_talker._responses.clear()
+        report(
+            'AgentTalker round %d' % (i + 1),
+            elapsed,
+            sum(agent_talker.requests_sent for agent_talker in agent_talkers),
+            connections_opened.since_last())
+    for agent_talker in agent_talkers:
+        await agent_talker.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Agent farm benchmark')
+    parser.add_argument('--agents', type=int, default=100)
+    parser.add_argument('--delay', type=float, default=20,
+                        help='milliseconds a stub agent takes to respond')
+    parser.add_argument('--firstPort', type=int, default=47000)
+    parser.add_argument('--maxConcurrency', type=int, default=4)
+    args = parser.parse_args()
+    stats = Queue()
+    farm = Process(
+        target=run_farm,
+        args=(args.agents, args.firstPort, args.delay, stats),
+        daemon=True)
+    farm.start()
+    stats.get()
+    connections_opened = ConnectionsOpened(stats)
+    start_time = time()
+    poll_blocking(args.agents, args.firstPort)
+    elapsed = time() - start_time
+    report(
+        'blocking requests',
+        elapsed,
+        len(PATHS) * args.agents,
+        connections_opened.since_last())
+    asyncio.run(benchmark(args, connections_opened))
+    farm.terminate()
+
+
+if __name__ == '__main__':
+    main()
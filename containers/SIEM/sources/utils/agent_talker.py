@@ -1,110 +1,162 @@
-import requests
+import asyncio
+import aiohttp
 import dotenv
 import os
-from requests.auth import HTTPBasicAuth
+from time import time
 from .audit_logger import FileAuditLogger
 
 
 class AgentTalker:
+    """
+    Asynchronous client of one agent. Requests go through one keep-alive
+    session, at most max_concurrency at a time, and give up after timeout
+    seconds. GET requests of the same path that overlap, or that come
+    within reuse_for seconds of each other, e.g. from the policies of one
+    poll cycle, share one response.
+    """
+
     def __init__(self,
                  ip,
                  port,
                  username,
-                 password):
+                 password,
+                 max_concurrency=4,
+                 timeout=10,
+                 reuse_for=1,
+                 audit_logger=None):
         self.ip = ip
         self.port = port
         self.base_url = f"http://{ip}:{port}"
-        self.auth = HTTPBasicAuth(username, password)
-        self.audit_logger = FileAuditLogger(f'logs/{ip}-{port}')
-
-    def _get(self,
-             path):
+        self.auth = aiohttp.BasicAuth(username, password)
+        if audit_logger is None:
+            audit_logger = FileAuditLogger(f'logs/{ip}-{port}')
+        self.audit_logger = audit_logger
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.reuse_for = reuse_for
+        self.requests_sent = 0
+        self._session = None
+        self._pending = {}
+        self._responses = {}
+
+    def _get_session(self):
+        # Created in the event loop that uses it
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                auth=self.auth,
+                timeout=self.timeout)
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+    async def _request(self,
+                       method,
+                       path,
+                       data=None):
+        self.requests_sent += 1
         try:
-            response = requests.get(f"{self.base_url}/{path}", auth=self.auth)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"An error occurred: {e}")
+            async with self._get_session().request(
+                    method, f"{self.base_url}/{path}", json=data) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"An error occurred: {self.base_url}/{path}: {e!r}")
             return None
 
-    def _post(self,
-              path,
-              data):
+    async def _fetch(self,
+                     path):
         try:
-            response = requests.post(f"{self.base_url}/{path}", json=data, auth=self.auth)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"An error occurred: {e}")
-            return None
-
-    def get_static_storage(self):
-        path = "static/storage"
-        resp = self._get(path)
+            resp = await self._request('GET', path)
+            self.audit_logger.log(resp, file_path=path)
+            # A failed request is not reused, the next call tries again
+            if resp is not None:
+                self._responses[path] = (time(), resp)
+            return resp
+        finally:
+            self._pending.pop(path, None)
+
+    async def _get(self,
+                   path):
+        if path in self._responses:
+            fetched_at, resp = self._responses[path]
+            if time() - fetched_at < self.reuse_for:
+                return resp
+        if path not in self._pending:
+            self._pending[path] = asyncio.ensure_future(self._fetch(path))
+        # Shielded, so that a caller cancelled does not cancel the others
+        return await asyncio.shield(self._pending[path])
+
+    async def _post(self,
+                    path,
+                    data):
+        resp = await self._request('POST', path, data)
         self.audit_logger.log(resp, file_path=path)
         return resp
 
-    def get_static_network_config(self):
-        path = "static/network-config"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_static_storage(self):
+        return await self._get("static/storage")
 
-    def get_static_host_config(self):
-        path = "static/host-config"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_static_network_config(self):
+        return await self._get("static/network-config")
 
-    def get_static_images(self):
-        path = "static/images"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_static_host_config(self):
+        return await self._get("static/host-config")
 
-    def get_dynamic_network_containers(self):
-        path = "dynamic/network-container"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_static_images(self):
+        return await self._get("static/images")
 
-    def get_dynamic_network_host(self):
-        path = "dynamic/network-host"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_dynamic_network_containers(self):
+        return await self._get("dynamic/network-container")
 
-    def get_dynamic_storage(self):
-        path = "dynamic/storage"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_dynamic_network_host(self):
+        return await self._get("dynamic/network-host")
 
-    def get_dynamic_computation(self):
-        path = "dynamic/computation"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_dynamic_storage(self):
+        return await self._get("dynamic/storage")
 
-    def get_dynamic_containers(self):
-        path = "dynamic/containers"
-        resp = self._get(path)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+    async def get_dynamic_computation(self):
+        return await self._get("dynamic/computation")
+
+    async def get_dynamic_containers(self):
+        return await self._get("dynamic/containers")
 
-    def post_dynamic_stop_container(self,
-                                    container_id):
+    async def post_dynamic_stop_container(self,
+                                          container_id):
         path = "dynamic/containers"
         payload = {
             "action": "stop",
             "container_id": container_id
         }
-        resp = self._post(path, payload)
-        self.audit_logger.log(resp, file_path=path)
-        return resp
+        # The containers have changed
+        self._responses.pop(path, None)
+        return await self._post(path, payload)
 
 
-if __name__ == "__main__":
+async def poll_agents(agent_talkers,
+                      get,
+                      handle):
+    """
+    Polls every agent at the same time and handles each response as it
+    arrives. Agents that did not respond are skipped.
+    :param agent_talkers: the agents to poll
+    :param get: returns the awaitable response of an agent
+    :param handle: coroutine function of the agent and its response
+    """
+
+    async def poll(agent_talker):
+        resp = await get(agent_talker)
+        if resp is None:
+            return
+        await handle(agent_talker, resp)
+
+    await asyncio.gather(*[poll(agent_talker) for agent_talker in agent_talkers])
+
+
+async def main():
     dotenv.load_dotenv()
     hostname = os.getenv("AGENT_HOSTNAME")
     port = int(os.getenv("AGENT_PORT"))
@@ -112,13 +164,18 @@ if __name__ == "__main__":
     password = os.getenv("AGENT_BASIC_HTTP_PASS")
     agent_talker = AgentTalker(hostname, port, username, password)
 
-    print(agent_talker.get_static_host_config())
-    print(agent_talker.get_static_network_config())
-    print(agent_talker.get_static_storage())
-    print(agent_talker.get_static_images())
-    print(agent_talker.get_dynamic_network_containers())
-    print(agent_talker.get_dynamic_network_host())
-    print(agent_talker.get_dynamic_storage())
-    print(agent_talker.get_dynamic_computation())
-    print(agent_talker.get_dynamic_containers())
-    print(agent_talker.post_dynamic_stop_container("89d79f69ae"))
+    print(await agent_talker.get_static_host_config())
+    print(await agent_talker.get_static_network_config())
+    print(await agent_talker.get_static_storage())
+    print(await agent_talker.get_static_images())
+    print(await agent_talker.get_dynamic_network_containers())
+    print(await agent_talker.get_dynamic_network_host())
+    print(await agent_talker.get_dynamic_storage())
+    print(await agent_talker.get_dynamic_computation())
+    print(await agent_talker.get_dynamic_containers())
+    print(await agent_talker.post_dynamic_stop_container("89d79f69ae"))
+    await agent_talker.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
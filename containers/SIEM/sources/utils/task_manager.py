@@ -6,11 +6,16 @@ class TaskManager:
                  name):
         self.name = name
         self.tasks = []
+        self.cleanups = []
 
     def add_task(self,
                  task):
         self.tasks.append(task)
 
+    def add_cleanup(self,
+                    cleanup):
+        self.cleanups.append(cleanup)
+
     async def start(self):
         for task in self.tasks:
             task.start()
@@ -27,5 +32,7 @@ class TaskManager:
         finally:
             for task in self.tasks:
                 task.stop()
+            for cleanup in self.cleanups:
+                loop.run_until_complete(cleanup())
             loop.run_until_complete(loop.shutdown_asyncgens())
             loop.close()
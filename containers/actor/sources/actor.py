@@ -28,6 +28,8 @@ class Actor:
             certFile: str = '',
             keyFile: str = '',
             domainName: str = '',
+            wireCodec: str = 'pickle',
+            transport: str = 'threads',
             enableOverlay: bool = False):
         self.basicComponent = BasicComponent(
             ignoreSocketError=True,
@@ -39,7 +41,9 @@ class Actor:
             enableTLS=enableTLS,
             certFile=certFile,
             keyFile=keyFile,
-            domainName=domainName)
+            domainName=domainName,
+            wireCodec=wireCodec,
+            transport=transport)
         self.resourcesDiscovery = ResourcesDiscovery(
             basicComponent=self.basicComponent)
         self.discoverIfUnset()
@@ -202,6 +206,21 @@ def parseArg():
         default=False,
         type=bool,
         help='Enable docker overlay or not')
+    parser.add_argument(
+        '--wireCodec',
+        metavar='WireCodec',
+        nargs='?',
+        default='pickle',
+        type=str,
+        help='Codec of messages sent by this component, pickle or binary')
+    parser.add_argument(
+        '--transport',
+        metavar='Transport',
+        nargs='?',
+        default='threads',
+        type=str,
+        help='threads to run two threads per connection, '
+             'or eventLoop to drive all connections from one thread')
 
     return parser.parse_args()
 
@@ -217,5 +236,7 @@ if __name__ == '__main__':
         certFile=args.certFile,
         keyFile=args.keyFile,
         domainName=args.domainName,
+        wireCodec=args.wireCodec,
+        transport=args.transport,
         enableOverlay=args.enableOverlay)
     actor_.run()
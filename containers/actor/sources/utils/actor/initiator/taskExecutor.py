@@ -63,6 +63,7 @@ class TaskExecutorInitiator(BaseInitiator):
         childTaskTokens = self.serialize(childTaskTokens)
         args = ''
         args += ' --domainName %s' % self.basicComponent.domainName
+        args += ' --wireCodec %s' % self.basicComponent.codec.name
         if self.port >= ConfigTaskExecutor.portRange[1]:
             self.basicComponent.debugLogger.warning("Task Executor Port out of range")
             self.port = ConfigTaskExecutor.portRange[0]
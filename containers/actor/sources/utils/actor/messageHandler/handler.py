@@ -9,6 +9,7 @@ from pythonping import ping as testLatency
 from ..initiator.complete import Initiator
 from ..profiler.actor import ActorProfiler
 from ...component import BasicComponent
+from ...connection.dispatcher import handles
 from ...connection.message.received import MessageReceived
 from ...container.manager import ContainerManager
 from ...resourceDiscovery.resourceDiscovery import ResourcesDiscovery
@@ -35,50 +36,19 @@ class ActorMessageHandler:
         self.basicComponent.handleMessage = self.handleMessage
         self._runningIperfClient = Lock()
         self._runningIperfServer = Lock()
+        dispatcher = self.basicComponent.dispatcher
+        dispatcher.registerHandlers(self)
+        dispatcher.register(
+            self.resourcesDiscovery.handleMessage,
+            MessageType.RESOURCE_DISCOVERY,
+            MessageSubType.PROBE,
+            MessageSubSubType.RESULT)
 
     def handleMessage(self,
                       message: MessageReceived):
-        if message.typeIs(
-                messageType=MessageType.PLACEMENT,
-                messageSubType=MessageSubType.RUN_TASK_EXECUTOR):
-            self.handleInitTaskExecutor(message)
-            return
-        if message.typeIs(
-                messageType=MessageType.RESOURCE_DISCOVERY,
-                messageSubType=MessageSubType.ADVERTISE_MASTER):
-            self.handleAdvertise(message)
-            return
-        if message.typeIs(
-                messageType=MessageType.SCALING,
-                messageSubType=MessageSubType.INIT_NEW_MASTER):
-            self.handleInitMaster(message)
-            return
-        if message.typeIs(
-                messageType=MessageType.PROFILING,
-                messageSubType=MessageSubType.DATA_RATE_TEST,
-                messageSubSubType=MessageSubSubType.RECEIVE):
-            self.handleDataRateTestReceive(message)
-            return
-        if message.typeIs(
-                messageType=MessageType.PROFILING,
-                messageSubType=MessageSubType.DATA_RATE_TEST,
-                messageSubSubType=MessageSubSubType.SEND):
-            self.handleDataRateTestSend(message)
-            return
-
-        if message.typeIs(
-                messageType=MessageType.REGISTRATION,
-                messageSubType=MessageSubType.REGISTERED):
-            self.handleRegistered(message)
-            return
-
-        if message.typeIs(
-                messageType=MessageType.MessageType.RESOURCE_DISCOVERY,
-                messageSubType=MessageSubType.PROBE,
-                messageSubSubType=MessageSubSubType.RESULT):
-            self.resourcesDiscovery.handleMessage(message=message)
-            return
+        self.basicComponent.dispatcher.dispatch(message)
 
+    @handles(MessageType.REGISTRATION, MessageSubType.REGISTERED)
     def handleRegistered(self,
                          message: MessageReceived):
         source = message.source
@@ -111,6 +81,7 @@ class ActorMessageHandler:
                     str(e))
         self.basicComponent.debugLogger.info("Registered, running...")
 
+    @handles(MessageType.PLACEMENT, MessageSubType.RUN_TASK_EXECUTOR)
     def handleInitTaskExecutor(self,
                                message: MessageReceived):
         data = message.data
@@ -154,6 +125,7 @@ class ActorMessageHandler:
             return False
         return True
 
+    @handles(MessageType.SCALING, MessageSubType.INIT_NEW_MASTER)
     def handleInitMaster(self,
                          message: MessageReceived):
         self.basicComponent.debugLogger.debug('Received init master msg')
@@ -168,6 +140,9 @@ class ActorMessageHandler:
             isContainerMode=self.containerManager.isContainerMode)
         return
 
+    @handles(
+        MessageType.RESOURCE_DISCOVERY,
+        MessageSubType.ADVERTISE_MASTER)
     def handleAdvertise(self,
                         message: MessageReceived):
         if not self.canInitComponent():
@@ -181,6 +156,10 @@ class ActorMessageHandler:
             isContainerMode=self.containerManager.isContainerMode)
         return
 
+    @handles(
+        MessageType.PROFILING,
+        MessageSubType.DATA_RATE_TEST,
+        MessageSubSubType.RECEIVE)
     def handleDataRateTestReceive(self,
                                   message: MessageReceived):
         data = message.data
@@ -236,6 +215,10 @@ class ActorMessageHandler:
                 continue
         self._runningIperfServer.release()
 
+    @handles(
+        MessageType.PROFILING,
+        MessageSubType.DATA_RATE_TEST,
+        MessageSubSubType.SEND)
     def handleDataRateTestSend(self,
                                message: MessageReceived):
         self._runningIperfClient.acquire()
@@ -1,4 +1,6 @@
 from .configActor import ConfigActor
+from .configCompression import ConfigCompression
+from .configFlowControl import ConfigFlowControl
 from .configMaster import ConfigMaster
 from .configUser import ConfigUser
 from .taskExecutor import ConfigTaskExecutor
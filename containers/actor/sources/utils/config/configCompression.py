@@ -0,0 +1,22 @@
+from dotenv import dotenv_values
+
+from .base import Config
+
+environment = dotenv_values()
+
+
+def _value(key: str, default):
+    return type(default)(environment.get('COMPRESSION_' + key, default))
+
+
+class ConfigCompression(Config):
+    # The compressors to use, in order of preference, of which the ones
+    # not installed are skipped. Empty for no compression
+    compressors: str = _value('COMPRESSORS', 'zstd,lz4,zlib')
+    # The fewest bytes of a payload to compress
+    minSize: int = _value('MIN_SIZE', 16 * 1024)
+    # The megabits per second of the links, against which the time
+    # compressing is weighed
+    linkBandwidth: float = _value('LINK_BANDWIDTH', 100.)
+    # The largest compressed to original size ratio worth sending
+    maxRatio: float = _value('MAX_RATIO', .9)
@@ -1,4 +1,11 @@
 from .basicMessageHandler import BasicMessageHandler
+from .codec import Compression
+from .dispatcher import Dispatcher
+from .dispatcher import handles
+from .flowControl import Credits
+from .flowControl import FlowControl
+from .flowControl import Lane
+from .flowControl import OverflowPolicy
 from .handlerReturn import HandlerReturn
 from .message import MessageReceived
 from .message import MessageToSend
@@ -4,6 +4,9 @@ from time import time
 from traceback import print_exc
 from typing import Tuple
 
+from .codec import Compression
+from .dispatcher import Dispatcher
+from .flowControl import FlowControl
 from .message import MessageReceived
 from .messageReceiver import MessageReceiver
 from ..tools.terminate import terminate
@@ -28,7 +31,11 @@ class BasicMessageHandler(MessageReceiver, ABC):
             ignoreSocketError: bool = False,
             enableTLS: bool = False,
             certFile: str = '',
-            keyFile: str = ''):
+            keyFile: str = '',
+            wireCodec: str = 'pickle',
+            transport: str = 'threads',
+            flowControl: FlowControl = None,
+            compression: Compression = None):
         MessageReceiver.__init__(
             self,
             role=role,
@@ -38,12 +45,18 @@ class BasicMessageHandler(MessageReceiver, ABC):
             portRange=portRange,
             tls_enabled=enableTLS,
             cert_file=certFile,
-            key_file=keyFile)
+            key_file=keyFile,
+            wireCodec=wireCodec,
+            transport=transport,
+            flowControl=flowControl,
+            compression=compression)
         self.receivedPacketSize: PairsMedian[
             str, SequenceMedian] = PairsMedian()
         self.delays: PairsMedian[str, SequenceMedian] = PairsMedian()
         self.lastTimeTestDiff = .0
         self.testDiffInterval = 10
+        # The messageHandler of components registers its handlers here
+        self.dispatcher = Dispatcher()
 
     def handle(self):
         while True:
@@ -58,6 +71,12 @@ class BasicMessageHandler(MessageReceiver, ABC):
                     if self.role is not ComponentRole.MASTER:
                         self.handleTermination(message)
                         continue
+                elif message.typeIs(
+                        messageType=MessageType.ACKNOWLEDGEMENT,
+                        messageSubType=MessageSubType.NACK):
+                    self.flowControl.nacksReceived += 1
+                    self.handleNack(message)
+                    continue
                 elif message.typeIs(
                         messageType=MessageType.RESOURCE_DISCOVERY,
                         messageSubType=MessageSubType.PROBE,
@@ -86,6 +105,17 @@ class BasicMessageHandler(MessageReceiver, ABC):
             destination=message.source)
         return
 
+    def handleNack(self, message: MessageReceived):
+        # This method may be overridden by messageHandler of components
+        # that slow down when their messages are rejected
+        data = message.data
+        self.debugLogger.debug(
+            '%s rejected %s/%s: %s',
+            message.source.nameLogPrinting,
+            data['type'],
+            data['subType'],
+            data['reason'])
+
     def handleTermination(self, message: MessageReceived):
         if self.role in {ComponentRole.REMOTE_LOGGER, ComponentRole.MASTER}:
             return
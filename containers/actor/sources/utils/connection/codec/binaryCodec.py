@@ -0,0 +1,165 @@
+from pickle import dumps
+from pickle import loads
+from struct import Struct
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from .base import Buffer
+from .base import Codec
+from ...types import ComponentRole
+from ...types import MessageSubSubType
+from ...types import MessageSubType
+from ...types import MessageType
+
+# type, subType, subSubType, sentAtSourceTimestamp,
+# receivedAtLocalTimestamp, which components are present
+_header = Struct('!BBBddB')
+# pickled data length, out-of-band buffers count
+_dataHeader = Struct('!IH')
+_bufferLength = Struct('!Q')
+_stringLength = Struct('!H')
+_port = Struct('!I')
+_role = Struct('!B')
+
+_hasSource = 1
+_hasDestination = 2
+
+_componentStrings = (
+    'componentID',
+    'name',
+    'nameLogPrinting',
+    'nameConsistent',
+    'hostID')
+_schemaKeys = {
+    'type',
+    'subType',
+    'subSubType',
+    'data',
+    'receivedAtLocalTimestamp',
+    'sentAtSourceTimestamp',
+    'source',
+    'destination'}
+
+
+def _enumTables(enumClass) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    values = tuple(member.value for member in enumClass)
+    return values, {value: i for i, value in enumerate(values)}
+
+
+_types, _typesIndex = _enumTables(MessageType)
+_subTypes, _subTypesIndex = _enumTables(MessageSubType)
+_subSubTypes, _subSubTypesIndex = _enumTables(MessageSubSubType)
+_roles, _rolesIndex = _enumTables(ComponentRole)
+
+
+class BinaryCodec(Codec):
+    """
+    Fixed schema header for the fields of MessageToSend and MessageReceived,
+    followed by the pickled data and the raw out-of-band buffers of the data,
+    e.g., the memory of numpy frames, which are neither copied into the
+    pickle when sending nor copied out of the frame when receiving
+    """
+    codecID = ord('B')
+    name = 'binary'
+
+    def encode(self, messageInDict: Dict) -> List[Buffer]:
+        flags = 0
+        components = []
+        for key, flag in (('source', _hasSource),
+                          ('destination', _hasDestination)):
+            if key not in messageInDict:
+                continue
+            flags |= flag
+            components.append(self._packComponent(messageInDict[key]))
+        header = _header.pack(
+            _typesIndex[messageInDict['type']],
+            _subTypesIndex[messageInDict['subType']],
+            _subSubTypesIndex[messageInDict['subSubType']],
+            messageInDict['sentAtSourceTimestamp'],
+            messageInDict['receivedAtLocalTimestamp'],
+            flags)
+
+        # keys out of the schema still get through, just not compactly
+        extra = {k: v for k, v in messageInDict.items()
+                 if k not in _schemaKeys}
+        buffers = []
+        pickled = dumps(
+            (messageInDict['data'], extra),
+            protocol=5,
+            buffer_callback=buffers.append)
+        buffers = [buffer.raw() for buffer in buffers]
+        dataHeader = [_dataHeader.pack(len(pickled), len(buffers))]
+        for buffer in buffers:
+            dataHeader.append(_bufferLength.pack(buffer.nbytes))
+        return [header, *components, b''.join(dataHeader), pickled, *buffers]
+
+    def decode(self, payload: memoryview, isOwned: bool) -> Dict:
+        typeIndex, subTypeIndex, subSubTypeIndex, sentAt, receivedAt, flags = \
+            _header.unpack_from(payload)
+        offset = _header.size
+        messageInDict = {
+            'type': _types[typeIndex],
+            'subType': _subTypes[subTypeIndex],
+            'subSubType': _subSubTypes[subSubTypeIndex],
+            'sentAtSourceTimestamp': sentAt,
+            'receivedAtLocalTimestamp': receivedAt}
+        if flags & _hasSource:
+            messageInDict['source'], offset = self._unpackComponent(
+                payload, offset)
+        if flags & _hasDestination:
+            messageInDict['destination'], offset = self._unpackComponent(
+                payload, offset)
+
+        pickledLength, buffersCount = _dataHeader.unpack_from(payload, offset)
+        offset += _dataHeader.size
+        bufferLengths = []
+        for _ in range(buffersCount):
+            bufferLengths.append(_bufferLength.unpack_from(payload, offset)[0])
+            offset += _bufferLength.size
+        pickled = payload[offset:offset + pickledLength]
+        offset += pickledLength
+        buffers = []
+        for bufferLength in bufferLengths:
+            buffer = payload[offset:offset + bufferLength]
+            if not isOwned:
+                buffer = bytearray(buffer)
+            buffers.append(buffer)
+            offset += bufferLength
+        data, extra = loads(pickled, buffers=buffers)
+        messageInDict['data'] = data
+        messageInDict.update(extra)
+        return messageInDict
+
+    @staticmethod
+    def _packComponent(componentInDict: Dict) -> bytes:
+        parts = [_role.pack(_rolesIndex[componentInDict['role']])]
+        ip, port = componentInDict['addr']
+        for string in (ip, *(componentInDict[key]
+                             for key in _componentStrings)):
+            encoded = string.encode('utf-8')
+            parts.append(_stringLength.pack(len(encoded)))
+            parts.append(encoded)
+        parts.append(_port.pack(port))
+        return b''.join(parts)
+
+    @staticmethod
+    def _unpackComponent(
+            payload: memoryview,
+            offset: int) -> Tuple[Dict, int]:
+        roleIndex, = _role.unpack_from(payload, offset)
+        offset += _role.size
+        strings = []
+        for _ in range(len(_componentStrings) + 1):
+            length, = _stringLength.unpack_from(payload, offset)
+            offset += _stringLength.size
+            strings.append(str(payload[offset:offset + length], 'utf-8'))
+            offset += length
+        port, = _port.unpack_from(payload, offset)
+        offset += _port.size
+        componentInDict = {
+            'role': _roles[roleIndex],
+            'addr': [strings[0], port]}
+        for key, string in zip(_componentStrings, strings[1:]):
+            componentInDict[key] = string
+        return componentInDict, offset
@@ -0,0 +1,219 @@
+from threading import Lock
+from time import thread_time
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from .compressors import Compressor
+from .compressors import compressorByName
+from .compressors import ZlibCompressor
+
+# The codec ID of the frames whose payload is compressed
+COMPRESSED_CODEC_ID = ord('Z')
+
+
+class CompressionEstimate:
+    """
+    The running compression ratio and CPU cost of one compressor on one
+    kind of payload
+    """
+
+    def __init__(self, weight: float = .2):
+        """
+        :param weight: the weight of the latest sample in the averages
+        """
+        self.weight = weight
+        self.ratio = 1.
+        self.cpuPerByte = .0
+        self.samples = 0
+
+    def update(self, ratio: float, cpuPerByte: float):
+        if not self.samples:
+            self.ratio = ratio
+            self.cpuPerByte = cpuPerByte
+        else:
+            self.ratio += self.weight * (ratio - self.ratio)
+            self.cpuPerByte += self.weight * (cpuPerByte - self.cpuPerByte)
+        self.samples += 1
+
+    def secondsSavedPerByte(self, bandwidth: float) -> float:
+        """
+        :param bandwidth: bytes per second of the link
+        :return: the sending time saved minus the time spent compressing
+        """
+        return (1 - self.ratio) / bandwidth - self.cpuPerByte
+
+
+class CompressionStats:
+    """
+    What the compression of the connections of one component has saved
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._compressed: Dict[str, Dict[str, int]] = {}
+        self.uncompressed = 0
+
+    def recordCompressed(self, name: str, size: int, compressedSize: int):
+        with self._lock:
+            if name not in self._compressed:
+                self._compressed[name] = {
+                    'frames': 0, 'bytes': 0, 'compressedBytes': 0}
+            stats = self._compressed[name]
+            stats['frames'] += 1
+            stats['bytes'] += size
+            stats['compressedBytes'] += compressedSize
+
+    def recordUncompressed(self):
+        with self._lock:
+            self.uncompressed += 1
+
+    def toDict(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            stats = {
+                name: {**compressed,
+                       'savedBytes': compressed['bytes']
+                                     - compressed['compressedBytes']}
+                for name, compressed in self._compressed.items()}
+            stats['uncompressed'] = {'frames': self.uncompressed}
+        return stats
+
+
+class Compression:
+    """
+    The compression settings of the connections of one component.
+
+    Payloads of at least minSize bytes are compressed when, according to
+    the running estimates of each connection, the time saved on a link of
+    the given bandwidth is more than the CPU time spent compressing.
+    """
+
+    def __init__(
+            self,
+            compressors: Iterable[str] = ('zstd', 'lz4', 'zlib'),
+            minSize: int = 16 * 1024,
+            bandwidth: float = 100,
+            maxRatio: float = .9,
+            probeInterval: int = 32):
+        """
+        :param compressors: the names of the compressors to use, in order
+        of preference, of which the ones not installed are skipped
+        :param minSize: the fewest bytes of a payload to compress
+        :param bandwidth: the megabits per second of the links
+        :param maxRatio: the largest compressed to original size ratio
+        worth sending compressed
+        :param probeInterval: every how many payloads not compressed one is
+        compressed anyway, to follow payloads that change
+        """
+        self.compressors: Dict[str, Compressor] = {
+            name: compressorByName[name] for name in compressors
+            if name in compressorByName}
+        self.minSize = minSize
+        self.bandwidth = bandwidth * 1e6 / 8
+        self.maxRatio = maxRatio
+        self.probeInterval = probeInterval
+        self.stats = CompressionStats()
+
+    def newConnection(self) -> 'ConnectionCompression':
+        return ConnectionCompression(self)
+
+
+class ConnectionCompression:
+    """
+    The compression of one connection. The first frame sent on it tells
+    the peer which compressors are installed here, and until the peer
+    tells the same, only the compressor of the standard library is used.
+    """
+
+    def __init__(self, compression: Compression):
+        self.compression = compression
+        self._lock = Lock()
+        self.peerCompressors: Set[str] = {ZlibCompressor.name}
+        self.isAdvertised = False
+        # By payload kind and compressor name
+        self.estimates: Dict[Tuple[str, str], CompressionEstimate] = {}
+        self.chosen: Dict[str, str] = {}
+        self.uncompressed = 0
+
+    def reset(self):
+        # The peer may have restarted
+        self.peerCompressors = {ZlibCompressor.name}
+        self.isAdvertised = False
+
+    def advertise(self, messageInDict: Dict) -> Dict:
+        if self.isAdvertised:
+            return messageInDict
+        self.isAdvertised = True
+        return {
+            **messageInDict,
+            'compressors': list(self.compression.compressors)}
+
+    def onReceived(self, messageInDict: Dict):
+        compressors = messageInDict.pop('compressors', None)
+        if compressors is not None:
+            self.peerCompressors = set(compressors)
+
+    def compress(
+            self,
+            views: List[memoryview],
+            payloadSize: int,
+            codecID: int,
+            kind: str) -> Union[List[memoryview], None]:
+        """
+        :param views: the encoded payload
+        :param payloadSize: the bytes of the payload
+        :param codecID: the codec the payload is encoded with
+        :param kind: the kind of the payload, e.g., its message type
+        :return: the compressed payload, or None to send it as it is
+        """
+        if payloadSize < self.compression.minSize:
+            return None
+        with self._lock:
+            compressor = self._choose(kind)
+        if compressor is None:
+            self.compression.stats.recordUncompressed()
+            return None
+        startTime = thread_time()
+        compressed = compressor.compress(views)
+        cpuTime = thread_time() - startTime
+        ratio = len(compressed) / payloadSize
+        with self._lock:
+            self.estimates[kind, compressor.name].update(
+                ratio, cpuTime / payloadSize)
+        if ratio > self.compression.maxRatio:
+            self.compression.stats.recordUncompressed()
+            return None
+        self.compression.stats.recordCompressed(
+            compressor.name, payloadSize, len(compressed))
+        header = bytes((compressor.compressorID, codecID))
+        return [memoryview(header), memoryview(compressed)]
+
+    def _choose(self, kind: str) -> Union[Compressor, None]:
+        candidates = [
+            compressor
+            for name, compressor in self.compression.compressors.items()
+            if name in self.peerCompressors]
+        best = None
+        mostSaved = .0
+        for compressor in candidates:
+            key = (kind, compressor.name)
+            if key not in self.estimates:
+                # Each one is tried before it is judged
+                self.estimates[key] = CompressionEstimate()
+                return compressor
+            saved = self.estimates[key].secondsSavedPerByte(
+                self.compression.bandwidth)
+            if saved > mostSaved:
+                best, mostSaved = compressor, saved
+        if best is not None:
+            self.chosen[kind] = best.name
+            return best
+        self.chosen.pop(kind, None)
+        self.uncompressed += 1
+        if not candidates or self.uncompressed % self.compression.probeInterval:
+            return None
+        probe = self.uncompressed // self.compression.probeInterval
+        return candidates[probe % len(candidates)]
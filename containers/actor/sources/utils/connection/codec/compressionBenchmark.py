@@ -0,0 +1,157 @@
+"""
+Benchmark of the compression of the payloads, on synthetic profiles and
+frames.
+
+Run from the sources folder of any component:
+    python -m utils.connection.codec.compressionBenchmark --frames 50
+
+For every installed compressor, reports the compression ratio and the CPU
+time of compressing and decompressing each kind of payload. Then, for links
+of several bandwidths, sends the payloads through the adaptive compression
+and reports which compressor it chose and the bytes and time it saved.
+"""
+import argparse
+from random import Random
+from time import thread_time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from .compression import Compression
+from .compressors import compressorByName
+from .frame import encodeFrame
+from .initCodecByName import initCodecByName
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+component = {
+    'role': 'Master',
+    'componentID': '1',
+    'addr': ['192.168.1.1', 5000],
+    'name': 'Master-1_192.168.1.1-5000',
+    'nameLogPrinting': 'Master-1_192.168.1.1-5000',
+    'nameConsistent': 'Master_192.168.1.1',
+    'hostID': '192.168.1.1'}
+
+
+def message(messageType: str, subType: str, data: Dict) -> Dict:
+    return {
+        'type': messageType,
+        'subType': subType,
+        'subSubType': '',
+        'data': data,
+        'receivedAtLocalTimestamp': .0,
+        'sentAtSourceTimestamp': .0,
+        'destination': component,
+        'source': component}
+
+
+def profiles(hosts: int, random: Random) -> Dict:
+    # Alike LoggerManager.toDict, which the Master uploads periodically
+    images = ['xi0liu/ecv3:%s' % name for name in (
+        'objectDetection', 'user', 'actor', 'taskExecutor', 'remoteLogger')]
+    names = ['Actor-%d_192.168.1.%d-5000' % (i, i % 250) for i in range(hosts)]
+    allResources = {}
+    for name in names:
+        allResources[name] = {
+            'cpuCores': random.randint(1, 16),
+            'cpuUtilization': random.random() * 100,
+            'cpuFrequency': random.random() * 3000,
+            'memoryTotal': 16 * 1024,
+            'memoryUtilization': random.random() * 100,
+            'disk': random.random() * 1024,
+            'totalCPUCores': 8,
+            'totalMemory': 16 * 1024,
+            'totalDisk': 512 * 1024}
+    return message('log', 'allResourcesProfiles', {
+        'allImages': {name: images for name in names},
+        'allResources': allResources,
+        'allRunningContainers': {
+            name: [images[i % len(images)]] for i, name in enumerate(names)},
+        'allSystemPerformance': {
+            'delays': {name: {other: random.random() for other in names[:20]}
+                       for name in names}}})
+
+
+def frame(side: int, isSmooth: bool, random: Random) -> Dict:
+    if numpy is None:
+        image = bytes(random.getrandbits(8) for _ in range(side * side * 3))
+    elif isSmooth:
+        # A camera frame is mostly gradients, with some sensor noise
+        row = numpy.linspace(0, 200, side, dtype=numpy.float32)
+        image = (row[None, :, None] + row[:, None, None] / 4
+                 + numpy.random.randint(0, 4, (side, side, 3)))
+        image = image.astype(numpy.uint8)
+    else:
+        image = numpy.random.randint(0, 255, (side, side, 3), dtype=numpy.uint8)
+    return message('data', 'sensoryData', {'image': image, 'frame_count': 1})
+
+
+def payloads(hosts: int, frameSide: int) -> List[Tuple[str, Dict]]:
+    random = Random(0)
+    return [
+        ('profiles', profiles(hosts, random)),
+        ('smooth frame', frame(frameSide, True, random)),
+        ('random frame', frame(frameSide, False, random))]
+
+
+def compressors(name: str, messageInDict: Dict, codecName: str, runs: int):
+    codec = initCodecByName(codecName)
+    views = [memoryview(part).cast('B') for part in codec.encode(messageInDict)]
+    size = sum(view.nbytes for view in views)
+    for compressor in compressorByName.values():
+        startTime = thread_time()
+        for _ in range(runs):
+            compressed = compressor.compress(views)
+        compressTime = (thread_time() - startTime) / runs
+        startTime = thread_time()
+        for _ in range(runs):
+            compressor.decompress(memoryview(compressed))
+        decompressTime = (thread_time() - startTime) / runs
+        print('%-13s %-5s %9.1f KB  ratio %5.3f  '
+              'compress %7.2f ms  decompress %7.2f ms' % (
+                  name, compressor.name, size / 1024, len(compressed) / size,
+                  compressTime * 1000, decompressTime * 1000))
+
+
+def adaptive(name: str, messageInDict: Dict, codecName: str, frames: int,
+             bandwidth: float):
+    codec = initCodecByName(codecName)
+    compression = Compression(bandwidth=bandwidth)
+    connection = compression.newConnection()
+    connection.peerCompressors = set(compression.compressors)
+    size = encodeFrame(codec, messageInDict)[1] * frames
+    sentSize = 0
+    startTime = thread_time()
+    for _ in range(frames):
+        sentSize += encodeFrame(codec, messageInDict, connection)[1]
+    cpuTime = thread_time() - startTime
+    savedTime = (size - sentSize) / (bandwidth * 1e6 / 8)
+    print('%-13s %7.0f Mbps  chose %-5s  sent %5.1f%% of %9.1f KB  '
+          'saved %8.1f ms sending, spent %7.1f ms encoding' % (
+              name, bandwidth,
+              connection.chosen.get(messageInDict['type'], 'none'),
+              sentSize / size * 100, size / 1024,
+              savedTime * 1000, cpuTime * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compression benchmark')
+    parser.add_argument('--frames', type=int, default=50)
+    parser.add_argument('--hosts', type=int, default=200)
+    parser.add_argument('--frameSide', type=int, default=480)
+    parser.add_argument('--codec', default='binary')
+    args = parser.parse_args()
+    print('Installed compressors: %s' % ', '.join(compressorByName))
+    for name, messageInDict in payloads(args.hosts, args.frameSide):
+        compressors(name, messageInDict, args.codec, runs=5)
+    for bandwidth in (10, 100, 1000):
+        for name, messageInDict in payloads(args.hosts, args.frameSide):
+            adaptive(name, messageInDict, args.codec, args.frames, bandwidth)
+
+
+if __name__ == '__main__':
+    main()
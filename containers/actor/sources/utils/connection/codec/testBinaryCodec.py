@@ -0,0 +1,191 @@
+import unittest
+from socket import socketpair
+from threading import Thread
+
+from .binaryCodec import BinaryCodec
+from .frame import encodeFrame
+from .frame import FrameReader
+from .frame import PREFIX_SIZE
+from .frame import SMALL_FRAME_SIZE
+from .frame import sendFrame
+from .initCodecByName import codecByID
+from ...types import Component
+from ...types import ComponentRole
+from ...types import MessageSubSubType
+from ...types import MessageSubType
+from ...types import MessageType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+component = Component(
+    role=ComponentRole.USER, addr=('127.0.0.1', 50101)).toDict()
+
+
+def messageInDict(data: dict):
+    return {
+        'type': MessageType.DATA.value,
+        'subType': MessageSubType.SENSORY_DATA.value,
+        'subSubType': MessageSubSubType.NONE.value,
+        'data': data,
+        'receivedAtLocalTimestamp': .0,
+        'sentAtSourceTimestamp': 1.5,
+        'source': component,
+        'destination': component}
+
+
+class ChunkedSocket:
+    """
+    Gives the data at most chunkSize bytes at a time, as a socket does
+    when a frame arrives in several segments
+    """
+
+    def __init__(self, data: bytes, chunkSize: int):
+        self.data = data
+        self.chunkSize = chunkSize
+        self.offset = 0
+        self.calls = 0
+
+    def recv_into(self, view: memoryview) -> int:
+        self.calls += 1
+        size = min(len(view), self.chunkSize, len(self.data) - self.offset)
+        view[:size] = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return size
+
+
+def frameBytes(message: dict) -> bytes:
+    views, _ = encodeFrame(BinaryCodec(), message)
+    return b''.join(views)
+
+
+class BinaryCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        self.codec = BinaryCodec()
+
+    def roundTrip(self, message: dict) -> dict:
+        a, b = socketpair()
+        reader = FrameReader(b, codecByID)
+        sendFrame(a, self.codec, message)
+        received, _ = reader.readFrame()
+        a.close()
+        b.close()
+        return received
+
+    def testBytesAndTuples(self):
+        message = messageInDict({
+            'image': b'\x00\xff' * 100,
+            'shape': (10, 20, (3,)),
+            'frame_count': 7})
+        message['extraKey'] = ('kept', 1)
+        self.assertEqual(self.roundTrip(message), message)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def testNumpyBuffersAreOutOfBand(self):
+        image = numpy.arange(48 * 64 * 3, dtype=numpy.uint8).reshape(
+            (48, 64, 3))
+        # Every other column, which is not contiguous
+        nonContiguous = image[:, ::2]
+        self.assertFalse(nonContiguous.flags['C_CONTIGUOUS'])
+        transposed = image.T
+        message = messageInDict({
+            'image': image,
+            'nonContiguous': nonContiguous,
+            'transposed': transposed})
+        parts = self.codec.encode(message)
+        # The contiguous array is sent as a raw segment of its own
+        self.assertIn(image.nbytes, [memoryview(p).nbytes for p in parts])
+        received = self.roundTrip(message)['data']
+        for key, array in (('image', image),
+                           ('nonContiguous', nonContiguous),
+                           ('transposed', transposed)):
+            self.assertEqual(received[key].dtype, array.dtype)
+            self.assertEqual(received[key].shape, array.shape)
+            self.assertTrue(numpy.array_equal(received[key], array))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def testReusedBufferIsNotReferred(self):
+        # Small frames share the buffer of the reader, so the arrays decoded
+        # from the first frame must not change when the next one arrives
+        first = numpy.zeros(1024, dtype=numpy.uint8)
+        second = numpy.full(1024, 255, dtype=numpy.uint8)
+        data = frameBytes(messageInDict({'image': first})) \
+            + frameBytes(messageInDict({'image': second}))
+        reader = FrameReader(ChunkedSocket(data, len(data)), codecByID)
+        received = [reader.readFrame()[0] for _ in range(2)]
+        self.assertTrue(
+            numpy.array_equal(received[0]['data']['image'], first))
+        self.assertTrue(
+            numpy.array_equal(received[1]['data']['image'], second))
+
+    def testLargeFrames(self):
+        image = bytes(range(256)) * (SMALL_FRAME_SIZE // 64)
+        message = messageInDict({'image': image, 'frame_count': 1})
+        data = frameBytes(message)
+        self.assertGreater(len(data), 4 * SMALL_FRAME_SIZE)
+        # Blocking, sent while it is received
+        a, b = socketpair()
+        reader = FrameReader(b, codecByID)
+        sender = Thread(target=lambda: [
+            sendFrame(a, self.codec, message) for _ in range(2)])
+        sender.start()
+        for _ in range(2):
+            received, packetSize = reader.readFrame()
+            self.assertEqual(received, message)
+            self.assertEqual(packetSize, len(data) - PREFIX_SIZE)
+        sender.join()
+        a.close()
+        b.close()
+        # Non-blocking, between two small frames
+        small = messageInDict({'frame_count': 2})
+        data = frameBytes(small) + data + frameBytes(small)
+        reader = FrameReader(ChunkedSocket(data, 10000), codecByID)
+        frames = []
+        while len(frames) < 3:
+            frames.extend(m for m, _ in reader.readAvailableFrames())
+        self.assertEqual(frames, [small, message, small])
+        self.assertEqual(reader.pending(), b'')
+
+    def testPartialReads(self):
+        messages = [
+            messageInDict({'frame_count': i, 'image': b'x' * (i * 100)})
+            for i in range(5)]
+        data = b''.join(frameBytes(message) for message in messages)
+        for chunkSize in (1, 3, 7, 64):
+            s = ChunkedSocket(data, chunkSize)
+            reader = FrameReader(s, codecByID, bufferSize=512)
+            received = [reader.readFrame()[0] for _ in messages]
+            self.assertEqual(received, messages)
+            self.assertGreaterEqual(s.calls, len(data) // chunkSize)
+            self.assertEqual(reader.pending(), b'')
+
+    def testBytesPendingAcrossCalls(self):
+        messages = [messageInDict({'frame_count': i}) for i in range(3)]
+        data = b''.join(frameBytes(message) for message in messages)
+        firstSize = len(frameBytes(messages[0]))
+        # Receives the first frame and a few bytes of the second at once
+        s = ChunkedSocket(data, firstSize + 4)
+        reader = FrameReader(s, codecByID)
+        self.assertEqual(reader.readAvailableFrames(), [
+            (messages[0], firstSize - PREFIX_SIZE)])
+        self.assertEqual(reader.pending(), data[firstSize:firstSize + 4])
+        received = []
+        while len(received) < 2:
+            received.extend(m for m, _ in reader.readAvailableFrames())
+        self.assertEqual(received, messages[1:])
+        self.assertEqual(reader.pending(), b'')
+        # A reader started with bytes another reader received before
+        pending = data[:firstSize + 4]
+        reader = FrameReader(
+            ChunkedSocket(data[len(pending):], 2),
+            codecByID,
+            initialBuffer=pending)
+        self.assertEqual(
+            [reader.readFrame()[0] for _ in messages], messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,14 @@
+from enum import Enum
+from enum import unique
+
+
+@unique
+class OverflowPolicy(Enum):
+    # Wait until there is room
+    BLOCK = 'block'
+    # Make room by dropping the item that has waited the longest
+    DROP_OLDEST = 'dropOldest'
+    # Drop the item being put
+    DROP_NEWEST = 'dropNewest'
+    # Drop the item being put and tell its sender with a NACK
+    REJECT = 'reject'
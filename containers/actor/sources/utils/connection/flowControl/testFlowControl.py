@@ -0,0 +1,212 @@
+import threading
+import unittest
+from time import sleep
+from time import time
+
+from .boundedQueue import BoundedQueue
+from .credits import Credits
+from .flowControl import FlowControl
+from .flowControl import isControlMessage
+from .flowControl import laneOf
+from .lane import Lane
+from .lanedQueue import LanedQueue
+from .overflowPolicy import OverflowPolicy
+from ...types import MessageType
+
+DATA = MessageType.DATA.value
+CONTROL = MessageType.PLACEMENT.value
+LOG = MessageType.LOG.value
+
+
+class BoundedQueueTest(unittest.TestCase):
+
+    @staticmethod
+    def fill(policy: OverflowPolicy, onReject=None) -> BoundedQueue:
+        queue = BoundedQueue(
+            bound=3,
+            policy=policy,
+            isUrgent=isControlMessage,
+            onReject=onReject)
+        for i in range(3):
+            queue.put((DATA, i))
+        return queue
+
+    @staticmethod
+    def drain(queue: BoundedQueue):
+        items = []
+        while not queue.empty():
+            items.append(queue.get_nowait()[1])
+        return items
+
+    def testDropOldest(self):
+        queue = self.fill(OverflowPolicy.DROP_OLDEST)
+        self.assertTrue(queue.put((DATA, 3)))
+        self.assertEqual(self.drain(queue), [1, 2, 3])
+        self.assertEqual(queue.stats()['dropped'], 1)
+
+    def testDropNewest(self):
+        queue = self.fill(OverflowPolicy.DROP_NEWEST)
+        self.assertFalse(queue.put((DATA, 3)))
+        self.assertEqual(self.drain(queue), [0, 1, 2])
+        self.assertEqual(queue.stats()['dropped'], 1)
+
+    def testReject(self):
+        rejected = []
+        queue = self.fill(OverflowPolicy.REJECT, onReject=rejected.append)
+        self.assertFalse(queue.put((DATA, 3)))
+        self.assertEqual(rejected, [(DATA, 3)])
+        self.assertEqual(queue.stats()['rejected'], 1)
+
+    def testBlock(self):
+        queue = self.fill(OverflowPolicy.BLOCK)
+        self.assertFalse(queue.put((DATA, 3), timeout=.05))
+        threading.Timer(.05, queue.get).start()
+        self.assertTrue(queue.put((DATA, 3)))
+        self.assertEqual(self.drain(queue), [1, 2, 3])
+
+    def testBlockWithoutBlocking(self):
+        rejected = []
+        queue = self.fill(OverflowPolicy.BLOCK, onReject=rejected.append)
+        startTime = time()
+        self.assertFalse(queue.put_nowait((DATA, 3)))
+        self.assertFalse(queue.put((DATA, 4), block=False, timeout=1))
+        self.assertLess(time() - startTime, .5)
+        self.assertEqual(rejected, [(DATA, 3), (DATA, 4)])
+        self.assertEqual(queue.stats()['rejected'], 2)
+        self.assertTrue(queue.put_nowait((CONTROL, 'c')))
+        self.assertEqual(self.drain(queue), [0, 1, 2, 'c'])
+        self.assertTrue(queue.put_nowait((DATA, 5)))
+
+    def testControlMessagesAreNeverDropped(self):
+        for policy in OverflowPolicy:
+            queue = self.fill(policy)
+            self.assertTrue(queue.put((CONTROL, 'c')))
+            queue.put((DATA, 3), timeout=.01)
+            self.assertIn('c', self.drain(queue))
+        queue = BoundedQueue(
+            bound=1,
+            policy=OverflowPolicy.DROP_OLDEST,
+            isUrgent=isControlMessage)
+        queue.put((CONTROL, 'c'))
+        queue.put((DATA, 0))
+        self.assertEqual(self.drain(queue), ['c', 0])
+
+    def testSlowConsumer(self):
+        queue = FlowControl(
+            connectionQueueSize=16,
+            overflowPolicy=OverflowPolicy.DROP_OLDEST).newConnectionQueue()
+        received = []
+
+        def consume():
+            while True:
+                item = queue.get()[1]
+                if item is None:
+                    return
+                received.append(item)
+                sleep(.001)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(2000):
+            queue.put((DATA, i))
+        # Behind the data, in their lane
+        queue.put((DATA, None))
+        consumer.join()
+        stats = queue.stats()
+        self.assertLessEqual(stats['maxDepth'], 17)
+        self.assertEqual(stats['dropped'] + len(received), 2000)
+        # The latest data are kept
+        self.assertEqual(received[-1], 1999)
+
+
+class LanedQueueTest(unittest.TestCase):
+
+    @staticmethod
+    def newQueue(bound: int = 0) -> LanedQueue:
+        return LanedQueue(
+            laneOf=laneOf,
+            weights={Lane.CONTROL: 16, Lane.DATA: 4, Lane.LOG: 1},
+            bound=bound,
+            policy=OverflowPolicy.BLOCK,
+            isUrgent=isControlMessage)
+
+    def testControlGoesFirst(self):
+        queue = self.newQueue()
+        for item in [(DATA, 0), (LOG, 'l'), (DATA, 1), (CONTROL, 'c')]:
+            queue.put(item)
+        self.assertEqual(
+            BoundedQueueTest.drain(queue), ['c', 0, 1, 'l'])
+
+    def testDataIsNotStarved(self):
+        queue = self.newQueue()
+        for i in range(100):
+            queue.put((CONTROL, 'c'))
+            queue.put((DATA, i))
+            queue.put((LOG, 'l'))
+        firstRound = BoundedQueueTest.drain(queue)[:21]
+        self.assertEqual(firstRound, ['c'] * 16 + [0, 1, 2, 3] + ['l'])
+
+    def testControlLatencyOnSaturatedLink(self):
+        # A link writing one frame every frameTime seconds, with the
+        # queue kept full of frames by a fast producer
+        frameTime = .005
+        queue = self.newQueue(bound=64)
+        latencies = []
+        framesSent = []
+
+        def link():
+            while True:
+                messageType, item = queue.get()
+                if messageType == CONTROL:
+                    if item is None:
+                        return
+                    latencies.append(time() - item)
+                    continue
+                framesSent.append(item)
+                sleep(frameTime)
+
+        def produce():
+            i = 0
+            while len(latencies) < 20:
+                queue.put((DATA, i), timeout=.1)
+                i += 1
+
+        linkThread = threading.Thread(target=link)
+        producer = threading.Thread(target=produce)
+        linkThread.start()
+        producer.start()
+        sleep(.1)
+        for _ in range(20):
+            queue.put((CONTROL, time()))
+            sleep(.01)
+        producer.join()
+        queue.put((CONTROL, None))
+        linkThread.join()
+        self.assertGreaterEqual(queue.stats()['maxDepth'], 64)
+        # One frame being written at most, instead of a full queue
+        self.assertLess(max(latencies), 4 * frameTime)
+        self.assertGreater(len(framesSent), 20)
+
+
+class CreditsTest(unittest.TestCase):
+
+    def testProducerWaitsForResponses(self):
+        credits = Credits(total=2)
+        credits.acquire()
+        credits.acquire()
+        threading.Timer(.05, credits.release).start()
+        startTime = time()
+        credits.acquire()
+        self.assertGreaterEqual(time() - startTime, .04)
+        self.assertEqual(credits.inFlight(), 2)
+
+    def testLostCreditsExpire(self):
+        credits = Credits(total=1, timeout=.05)
+        credits.acquire()
+        credits.acquire()
+        self.assertEqual(credits.expired, 1)
+        self.assertEqual(credits.inFlight(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
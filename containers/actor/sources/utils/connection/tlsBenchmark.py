@@ -0,0 +1,94 @@
+"""
+Accepts per second of a component, with TLS on and off.
+
+Run from the sources folder of any component:
+    python -m utils.connection.tlsBenchmark --certFile server.crt --keyFile server.key
+
+Every connection sends one message, waits for the reply and closes, so the
+accept path, including the TLS handshake, dominates. With TLS on, it runs
+with a context built for every socket as before, with the cached contexts,
+and with the cached contexts plus session resumption.
+"""
+import argparse
+import logging
+from time import time
+
+from .codec import codecByID
+from .codec import FrameReader
+from .codec import sendFrame
+from .loadTest import EchoComponent
+from .messageSender import create_socket
+from .tlsContexts import tlsContexts
+from ..types import Component
+from ..types import ComponentRole
+from ..types import MessageType
+
+
+def connectMany(serverAddr, tlsEnabled: bool, connections: int):
+    me = Component(
+        role=ComponentRole.USER,
+        addr=('127.0.0.1', 10000)).toDict()
+    codec = codecByID[ord(',')]
+    reused = 0
+    startTime = time()
+    for _ in range(connections):
+        s = create_socket(tls_enabled=tlsEnabled, dest_addr=serverAddr)
+        sendFrame(s, codec, {
+            'type': MessageType.EXPERIMENTAL.value,
+            'subType': '',
+            'subSubType': '',
+            'data': {},
+            'receivedAtLocalTimestamp': .0,
+            'sentAtSourceTimestamp': time() * 1000,
+            'source': me,
+            'destination': me})
+        reader = FrameReader(s, codecByID)
+        while reader.readFrame()[0]['type'] != MessageType.EXPERIMENTAL.value:
+            continue
+        if tlsEnabled:
+            tlsContexts.saveSession(serverAddr, s)
+            reused += s.session_reused
+        s.close()
+    return connections / (time() - startTime), reused
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TLS accept benchmark')
+    parser.add_argument('--certFile', type=str, required=True)
+    parser.add_argument('--keyFile', type=str, required=True)
+    parser.add_argument('--connections', type=int, default=500)
+    parser.add_argument('--transport', type=str, default='eventLoop')
+    parser.add_argument('--port', type=int, default=5989)
+    args = parser.parse_args()
+
+    cases = (
+        ('tls off', False, True, True),
+        ('tls, context per socket', True, False, False),
+        ('tls, cached contexts', True, True, False),
+        ('tls, cached contexts, resumption', True, True, True))
+    for i, (name, tlsEnabled, reuseContexts, resumeSessions) in \
+            enumerate(cases):
+        tlsContexts.reuseContexts = reuseContexts
+        tlsContexts.resumeSessions = resumeSessions
+        port = args.port + i
+        echo = EchoComponent(
+            role=ComponentRole.REMOTE_LOGGER,
+            addr=('127.0.0.1', port),
+            logLevel=logging.WARNING,
+            portRange=(port, port + 1),
+            ignoreSocketError=True,
+            enableTLS=tlsEnabled,
+            certFile=args.certFile,
+            keyFile=args.keyFile,
+            transport=args.transport)
+        echo.serveEvent.wait()
+        accepts, reused = connectMany(
+            echo.addr, tlsEnabled, args.connections)
+        print('%-34s %8.1f accepts/s %6d resumed' % (name, accepts, reused))
+
+
+if __name__ == '__main__':
+    main()
+    from ..tools.terminate import terminate
+
+    terminate()
@@ -24,3 +24,6 @@ from .message import Message
 from .message import MessageSubSubType
 from .message import MessageSubType
 from .message import MessageType
+from .statistics import EWMA
+from .statistics import P2Quantile
+from .statistics import WindowMedian
@@ -0,0 +1,89 @@
+import unittest
+from random import Random
+
+from .ewma import EWMA
+from .p2Quantile import P2Quantile
+from .windowMedian import WindowMedian
+from ..basic import PairsMedian
+from ..basic import SequenceMedian
+
+
+class StatisticsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.random = Random(0)
+
+    def testWindowMedian(self):
+        for maxRecordNumber in (1, 2, 3, 10, 100):
+            windowMedian = WindowMedian(maxRecordNumber=maxRecordNumber)
+            window = []
+            self.assertEqual(windowMedian.median(), 0)
+            for _ in range(2000):
+                # Few distinct values, to have many equal ones
+                value = self.random.randint(0, 20)
+                windowMedian.update(value)
+                window = (window + [value])[-maxRecordNumber:]
+                expected = sorted(window)[len(window) >> 1]
+                self.assertEqual(windowMedian.median(), expected)
+                self.assertEqual(len(windowMedian), len(window))
+
+    def testP2Quantile(self):
+        values = [self.random.lognormvariate(3, .5) for _ in range(20000)]
+        sortedValues = sorted(values)
+        for quantile in (.5, .95, .99):
+            estimator = P2Quantile(quantile)
+            for value in values:
+                estimator.update(value)
+            expected = sortedValues[int(quantile * len(values))]
+            self.assertAlmostEqual(
+                estimator.value() / expected, 1, delta=.02)
+
+    def testP2QuantileFewValues(self):
+        estimator = P2Quantile(.5)
+        self.assertEqual(estimator.value(), 0)
+        for value in (5, 1, 3):
+            estimator.update(value)
+        self.assertEqual(estimator.value(), 3)
+        with self.assertRaises(Exception):
+            P2Quantile(1)
+
+    def testEWMA(self):
+        ewma = EWMA(alpha=.5)
+        for value in (4, 8, 0):
+            ewma.update(value)
+        self.assertEqual(ewma.value(), 3)
+
+    def testSequenceMedian(self):
+        sequenceMedian = SequenceMedian(
+            sequence=[3, 1, 2], quantiles=(.99,), withEWMA=True)
+        self.assertEqual(sequenceMedian.median(), 2)
+        self.assertEqual(str(sequenceMedian), '2')
+        for value in range(1000):
+            sequenceMedian.update(value)
+        # The median of the latest 100 values
+        self.assertEqual(sequenceMedian.median(), 950)
+        self.assertGreater(sequenceMedian.quantile(.99), 950)
+        self.assertGreater(sequenceMedian.ewma(), 900)
+        with self.assertRaises(Exception):
+            sequenceMedian.quantile(.9)
+
+    def testOnlyTheMedianByDefault(self):
+        sequenceMedian = SequenceMedian(sequence=[3, 1, 2])
+        self.assertEqual(sequenceMedian.median(), 2)
+        self.assertEqual(sequenceMedian._quantiles, {})
+        self.assertIsNone(sequenceMedian._ewma)
+        with self.assertRaises(Exception):
+            sequenceMedian.quantile(.95)
+        with self.assertRaises(Exception):
+            sequenceMedian.ewma()
+
+    def testPairsMedian(self):
+        pairsMedian = PairsMedian(quantiles=(.95,))
+        for value in range(100):
+            pairsMedian['a'].update(value)
+        self.assertEqual(pairsMedian.calculateAll(), {'a': 50})
+        self.assertGreater(pairsMedian.calculateAll(quantile=.95)['a'], 90)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+from bisect import bisect_left
+from bisect import insort
+from typing import List
+
+
+class WindowMedian:
+    """
+    Exact median of the latest values.
+
+    The window is kept sorted as the values arrive: the value leaving the
+    window is found with a binary search and the new one inserted in place.
+    Each update is O(n), for the values shifted in the list, against
+    O(n log n) to sort the window, and the median is read in O(1).
+    """
+
+    def __init__(self, maxRecordNumber: int = 100):
+        self.maxRecordNumber = maxRecordNumber
+        self._window: List = []
+        self._sorted: List = []
+        self._index = 0
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def update(self, value):
+        if len(self._window) < self.maxRecordNumber:
+            self._window.append(value)
+        else:
+            oldest = self._window[self._index]
+            self._window[self._index] = value
+            self._index = (self._index + 1) % self.maxRecordNumber
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        insort(self._sorted, value)
+
+    def median(self, default=0):
+        """
+        :return: the upper median, as sorted(window)[len(window) >> 1]
+        """
+        if not self._sorted:
+            return default
+        return self._sorted[len(self._sorted) >> 1]
@@ -45,7 +45,12 @@ class Master:
             certFile: str = '',
             keyFile: str = '',
             domainName: str = '',
-            enableOverlay: bool = False):
+            wireCodec: str = 'pickle',
+            transport: str = 'threads',
+            enableOverlay: bool = False,
+            directDataPlane: bool = False,
+            schedulingWorkerNum: int = 2,
+            coalescingWindow: float = .05):
         self.parsedArgs = parsedArgs
 
         self.basicComponent = BasicComponent(
@@ -59,7 +64,9 @@ class Master:
             enableTLS=enableTLS,
             certFile=certFile,
             keyFile=keyFile,
-            domainName=domainName)
+            domainName=domainName,
+            wireCodec=wireCodec,
+            transport=transport)
 
         self.loggerManager = LoggerManager(basicComponent=self.basicComponent)
         self.containerManager = ContainerManager(
@@ -101,7 +108,10 @@ class Master:
             waitTimeout=waitTimeout,
             networkController=self.networkController,
             container_name=self.containerManager.containerName,
-            enableOverlay=self.containerManager.enableOverlay)
+            enableOverlay=self.containerManager.enableOverlay,
+            directDataPlane=directDataPlane,
+            schedulingWorkerNum=schedulingWorkerNum,
+            coalescingWindow=coalescingWindow)
         self.resourcesDiscovery = MasterResourcesDiscovery(
             registry=self.registry,
             basicComponent=self.basicComponent,
@@ -276,6 +286,13 @@ def parseArg():
         default=4,
         type=int,
         help='Estimation thread number')
+    parser.add_argument(
+        '--evaluationPool',
+        metavar='EvaluationPool',
+        nargs='?',
+        default='threads',
+        type=str,
+        help='Run the estimation with threads or processes')
     parser.add_argument(
         '--databaseType',
         metavar='DatabaseType',
@@ -347,6 +364,84 @@ def parseArg():
         default=False,
         type=bool,
         help='Enable docker overlay or not')
+    parser.add_argument(
+        '--wireCodec',
+        metavar='WireCodec',
+        nargs='?',
+        default='pickle',
+        type=str,
+        help='Codec of messages sent by this component, pickle or binary')
+    parser.add_argument(
+        '--transport',
+        metavar='Transport',
+        nargs='?',
+        default='threads',
+        type=str,
+        help='threads to run two threads per connection, '
+             'or eventLoop to drive all connections from one thread')
+    parser.add_argument(
+        '--directDataPlane',
+        metavar='DirectDataPlane',
+        nargs='?',
+        default=False,
+        type=bool,
+        help='Users send data to their task executors directly, '
+             'instead of through Master')
+    parser.add_argument(
+        '--schedulingWorkerNum',
+        metavar='SchedulingWorkerNumber',
+        nargs='?',
+        default=2,
+        type=int,
+        help='How many users, or groups of users, are scheduled at the '
+             'same time')
+    parser.add_argument(
+        '--coalescingWindow',
+        metavar='CoalescingWindow',
+        nargs='?',
+        default=.05,
+        type=float,
+        help='In seconds. Users of the same application and domain '
+             'registering within it are scheduled in one run')
+    parser.add_argument(
+        '--anytimeScheduling',
+        metavar='AnytimeScheduling',
+        nargs='?',
+        default=False,
+        type=bool,
+        help='NSGA schedulers answer with a greedy placement at once and '
+             'keep optimizing it in the background')
+    parser.add_argument(
+        '--migrationCost',
+        metavar='MigrationCost',
+        nargs='?',
+        default=10,
+        type=float,
+        help='In milliseconds. How much lower the estimated cost of a '
+             'placement found in the background must be to migrate to it')
+    parser.add_argument(
+        '--decisionHistory',
+        metavar='DecisionHistory',
+        nargs='?',
+        default='decisionHistory',
+        type=str,
+        help='Folder the scheduling decisions are appended to, so that '
+             'OHNSGA starts from them again after a restart. Empty to keep '
+             'them in memory only')
+    parser.add_argument(
+        '--keptDecisions',
+        metavar='KeptDecisions',
+        nargs='?',
+        default=100,
+        type=int,
+        help='How many of the latest decisions of each application are kept')
+    parser.add_argument(
+        '--decisionRetention',
+        metavar='DecisionRetention',
+        nargs='?',
+        default=0,
+        type=float,
+        help='In seconds. How long a decision is kept, 0 for no limit')
 
     return parser.parse_args()
 
@@ -369,5 +464,10 @@ if __name__ == '__main__':
         certFile=args_.certFile,
         keyFile=args_.keyFile,
         domainName=args_.domainName,
-        enableOverlay=args_.enableOverlay)
+        wireCodec=args_.wireCodec,
+        transport=args_.transport,
+        enableOverlay=args_.enableOverlay,
+        directDataPlane=args_.directDataPlane,
+        schedulingWorkerNum=args_.schedulingWorkerNum,
+        coalescingWindow=args_.coalescingWindow)
     master_.run()
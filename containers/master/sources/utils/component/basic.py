@@ -26,7 +26,9 @@ class BasicComponent(Communicator, ABC):
             enableTLS: bool = False,
             certFile: str = '',
             keyFile: str = '',
-            domainName: str = ''):
+            domainName: str = '',
+            wireCodec: str = 'pickle',
+            transport: str = 'threads'):
         Communicator.__init__(
             self,
             role=role,
@@ -39,7 +41,9 @@ class BasicComponent(Communicator, ABC):
             enableTLS=enableTLS,
             certFile=certFile,
             keyFile=keyFile,
-            domainName=domainName)
+            domainName=domainName,
+            wireCodec=wireCodec,
+            transport=transport)
         self.handleSignal()
         self.serveEvent.wait()
         self.setName(addr=self.addr)
@@ -79,7 +83,11 @@ class BasicComponent(Communicator, ABC):
 
     def uploadMedianReceivedPacketSize(self):
         allSizes = self.receivedPacketSize.calculateAll()
-        data = {'sizes': allSizes}
+        data = {
+            'sizes': allSizes,
+            'flowControl': self.flowControl.stats(),
+            'compression': self.compression.stats.toDict(),
+            'handlers': self.dispatcher.stats()}
         if not len(allSizes):
             return
         self.sendMessage(
@@ -1,4 +1,6 @@
 from .configActor import ConfigActor
+from .configCompression import ConfigCompression
+from .configFlowControl import ConfigFlowControl
 from .configMaster import ConfigMaster
 from .configRemoteLogger import ConfigRemoteLogger
 from .configUser import ConfigUser
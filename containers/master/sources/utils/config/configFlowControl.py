@@ -0,0 +1,32 @@
+from dotenv import dotenv_values
+
+from .base import Config
+
+environment = dotenv_values()
+
+
+def _value(key: str, default):
+    return type(default)(environment.get('FLOW_CONTROL_' + key, default))
+
+
+class ConfigFlowControl(Config):
+    # The most messages in each queue, 0 for no bound
+    sendQueueSize: int = _value('SEND_QUEUE_SIZE', 1024)
+    connectionQueueSize: int = _value('CONNECTION_QUEUE_SIZE', 256)
+    receivedQueueSize: int = _value('RECEIVED_QUEUE_SIZE', 1024)
+    # What to do with a data message put into a full queue:
+    # block, dropOldest, dropNewest or reject
+    overflowPolicy: str = _value('OVERFLOW_POLICY', 'dropOldest')
+    # The most messages of each lane taken from a queue in a round,
+    # control first, then data, then logs
+    controlLaneWeight: int = _value('CONTROL_LANE_WEIGHT', 16)
+    dataLaneWeight: int = _value('DATA_LANE_WEIGHT', 4)
+    logLaneWeight: int = _value('LOG_LANE_WEIGHT', 1)
+    # The most milliseconds a log message waits to be sent with others
+    # to the same destination, 0 for no batching
+    batchLingerTime: float = _value('BATCH_LINGER_TIME', 20.)
+    batchMaxMessages: int = _value('BATCH_MAX_MESSAGES', 64)
+    # The most frames a user has in flight, 0 for no limit
+    userCredits: int = _value('USER_CREDITS', 8)
+    # Seconds after which a frame without result gives its credit back
+    creditTimeout: float = _value('CREDIT_TIMEOUT', 10.)
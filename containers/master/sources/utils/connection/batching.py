@@ -0,0 +1,152 @@
+from threading import Condition
+from threading import Thread
+from time import time
+from traceback import print_exc
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+from ..types import Address
+from ..types import MessageSubSubType
+from ..types import MessageSubType
+from ..types import MessageType
+
+_BatchKey = Tuple[Address, str]
+
+
+class MessageBatcher:
+    """
+    Holds the small messages sent to one destination for at most
+    lingerTime milliseconds, and sends those of the same type together,
+    in one envelope with the source and the destination they share,
+    instead of in one frame and one syscall each.
+
+    A batch is sent as soon as it has maxMessages messages, and a batch
+    of one message is sent as it is.
+    """
+
+    def __init__(
+            self,
+            send: Callable[[Address, Dict], None],
+            lingerTime: float = 20,
+            maxMessages: int = 64,
+            messageTypes: Iterable[MessageType] = (MessageType.LOG,)):
+        """
+        :param send: sends a message in dict to an address
+        :param lingerTime: the most milliseconds a message waits for others,
+        0 to send every message at once
+        :param maxMessages: the most messages in an envelope
+        :param messageTypes: the types of the messages that may wait
+        """
+        self.send = send
+        self.lingerTime = lingerTime
+        self.maxMessages = maxMessages
+        self.messageTypes = {messageType.value for messageType in messageTypes}
+        self.messagesBatched = 0
+        self.envelopesSent = 0
+        self._condition = Condition()
+        self._batches: Dict[_BatchKey, List[Dict]] = {}
+        self._deadlines: Dict[_BatchKey, float] = {}
+        if self.lingerTime <= 0:
+            return
+        Thread(target=self._run, name='MessageBatcher', daemon=True).start()
+
+    def add(self, destAddr: Address, messageInDict: Dict) -> bool:
+        """
+        :return: False if the message is not batched and is to be sent now
+        """
+        if self.lingerTime <= 0 \
+                or messageInDict['type'] not in self.messageTypes:
+            return False
+        key = (destAddr, messageInDict['type'])
+        with self._condition:
+            if key not in self._batches:
+                self._batches[key] = []
+                self._deadlines[key] = time() + self.lingerTime / 1000
+                self._condition.notify()
+            batch = self._batches[key]
+            batch.append(messageInDict)
+            if len(batch) < self.maxMessages:
+                return True
+            del self._batches[key]
+            del self._deadlines[key]
+        self._flush(destAddr, batch)
+        return True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._deadlines:
+                    self._condition.wait()
+                timeout = min(self._deadlines.values()) - time()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+                currentTime = time()
+                due = [key for key, deadline in self._deadlines.items()
+                       if deadline <= currentTime]
+                batches = [(key[0], self._batches.pop(key)) for key in due]
+                for key in due:
+                    del self._deadlines[key]
+            for destAddr, batch in batches:
+                self._flush(destAddr, batch)
+
+    def _flush(self, destAddr: Address, batch: List[Dict]):
+        try:
+            if len(batch) == 1:
+                self.send(destAddr, batch[0])
+                return
+            self.send(destAddr, packBatch(batch))
+            self.messagesBatched += len(batch)
+            self.envelopesSent += 1
+        except Exception:
+            print_exc()
+
+
+def packBatch(batch: List[Dict]) -> Dict:
+    """
+    :param batch: messages in dict of the same type, source and destination
+    address
+    :return: the envelope holding them
+    """
+    first = batch[0]
+    # The time they leave, so that the waiting is not taken as network delay
+    sentAtSourceTimestamp = time() * 1000
+    messages = []
+    for messageInDict in batch:
+        message = {
+            key: value for key, value in messageInDict.items()
+            if key != 'source'}
+        if message['destination'] == first['destination']:
+            del message['destination']
+        message['sentAtSourceTimestamp'] = sentAtSourceTimestamp
+        messages.append(message)
+    return {
+        'type': first['type'],
+        'subType': MessageSubType.BATCH.value,
+        'subSubType': MessageSubSubType.NONE.value,
+        'data': {'messages': messages},
+        'receivedAtLocalTimestamp': .0,
+        'sentAtSourceTimestamp': sentAtSourceTimestamp,
+        'source': first['source'],
+        'destination': first['destination']}
+
+
+def unpackBatch(
+        messageInDict: Dict,
+        packetSize: int) -> List[Tuple[Dict, int]]:
+    """
+    :return: the messages in an envelope, each with its share of the packet
+    size, or the message itself if it is not an envelope
+    """
+    if messageInDict['subType'] != MessageSubType.BATCH.value:
+        return [(messageInDict, packetSize)]
+    messages = messageInDict['data']['messages']
+    packetSize //= len(messages)
+    for message in messages:
+        message['source'] = messageInDict['source']
+        if 'destination' not in message:
+            message['destination'] = messageInDict['destination']
+    return [(message, packetSize) for message in messages]
@@ -0,0 +1,17 @@
+from typing import Dict
+
+from .base import Codec
+from .binaryCodec import BinaryCodec
+from .pickleCodec import PickleCodec
+
+# Every component decodes every known codec, whichever it sends with
+codecByID: Dict[int, Codec] = {
+    PickleCodec.codecID: PickleCodec(),
+    BinaryCodec.codecID: BinaryCodec()}
+
+
+def initCodecByName(codecName: str) -> Codec:
+    for codec in codecByID.values():
+        if codec.name == codecName:
+            return codec
+    raise Exception('Unknown wire codec: %s' % codecName)
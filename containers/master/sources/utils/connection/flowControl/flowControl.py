@@ -0,0 +1,147 @@
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from weakref import WeakSet
+
+from .boundedQueue import BoundedQueue
+from .lane import Lane
+from .lanedQueue import LanedQueue
+from .overflowPolicy import OverflowPolicy
+from ...types import MessageType
+
+
+def _typeValue(item: Any) -> str:
+    # Items are a message, its dict or its type value, or a tuple
+    # starting with either
+    if isinstance(item, tuple):
+        item = item[0]
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        return item.get('type')
+    messageType = getattr(item, 'type', None)
+    if messageType is None:
+        return None
+    return messageType.value
+
+
+def isControlMessage(item: Any) -> bool:
+    """
+    Whether an item of a message queue is exempt from the overflow policy.
+    Only data messages are dropped, the rest are small and are needed to
+    keep the components working.
+    :param item: a message, its dict or its type value, or a tuple
+    starting with either
+    """
+    return _typeValue(item) != MessageType.DATA.value
+
+
+def laneOf(item: Any) -> Lane:
+    """
+    :param item: a message, its dict or its type value, or a tuple
+    starting with either
+    :return: the lane the item is queued in
+    """
+    typeValue = _typeValue(item)
+    if typeValue == MessageType.DATA.value:
+        return Lane.DATA
+    if typeValue == MessageType.LOG.value:
+        return Lane.LOG
+    return Lane.CONTROL
+
+
+class FlowControl:
+    """
+    The bounds, the overflow policy and the lane weights of the message
+    queues of one component, and their depth and drop counters
+    """
+
+    def __init__(
+            self,
+            sendQueueSize: int = 1024,
+            connectionQueueSize: int = 256,
+            receivedQueueSize: int = 1024,
+            overflowPolicy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+            laneWeights: Dict[Lane, int] = None,
+            batchLingerTime: float = 20,
+            batchMaxMessages: int = 64):
+        """
+        :param sendQueueSize: the most messages waiting for a sender thread
+        :param connectionQueueSize: the most messages waiting to be written
+        to each connection
+        :param receivedQueueSize: the most messages waiting to be handled
+        :param overflowPolicy: what to do with a data message put into a
+        full queue
+        :param laneWeights: the most messages of each lane taken from a
+        queue in a round, in the order the lanes are served
+        :param batchLingerTime: the most milliseconds a log message waits
+        to be sent with others to the same destination, 0 for no batching
+        :param batchMaxMessages: the most messages sent together
+        """
+        self.sendQueueSize = sendQueueSize
+        self.connectionQueueSize = connectionQueueSize
+        self.receivedQueueSize = receivedQueueSize
+        self.overflowPolicy = overflowPolicy
+        if laneWeights is None:
+            laneWeights = {Lane.CONTROL: 16, Lane.DATA: 4, Lane.LOG: 1}
+        self.laneWeights = laneWeights
+        self.batchLingerTime = batchLingerTime
+        self.batchMaxMessages = batchMaxMessages
+        self.nacksReceived = 0
+        self._lock = Lock()
+        self._queues: Dict[str, BoundedQueue] = {}
+        # Connections come and go
+        self._connectionQueues: WeakSet = WeakSet()
+
+    def newQueue(
+            self,
+            name: str,
+            bound: int,
+            policy: OverflowPolicy = None,
+            onReject: Callable[[Any], None] = None) -> BoundedQueue:
+        if policy is None:
+            policy = self.overflowPolicy
+        queue = LanedQueue(
+            laneOf=laneOf,
+            weights=self.laneWeights,
+            bound=bound,
+            policy=policy,
+            isUrgent=isControlMessage,
+            onReject=onReject)
+        with self._lock:
+            self._queues[name] = queue
+        return queue
+
+    def newConnectionQueue(self) -> BoundedQueue:
+        queue = LanedQueue(
+            laneOf=laneOf,
+            weights=self.laneWeights,
+            bound=self.connectionQueueSize,
+            policy=self.overflowPolicy,
+            isUrgent=isControlMessage)
+        with self._lock:
+            self._connectionQueues.add(queue)
+        return queue
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            queues = dict(self._queues)
+            connectionQueues = list(self._connectionQueues)
+        stats = {name: queue.stats() for name, queue in queues.items()}
+        connections = {
+            'count': len(connectionQueues),
+            'depth': 0,
+            'maxDepth': 0,
+            'dropped': 0,
+            'rejected': 0}
+        for queue in connectionQueues:
+            queueStats = queue.stats()
+            connections['depth'] += queueStats['depth']
+            connections['maxDepth'] = max(
+                connections['maxDepth'], queueStats['maxDepth'])
+            connections['dropped'] += queueStats['dropped']
+            connections['rejected'] += queueStats['rejected']
+        stats['connections'] = connections
+        stats['nacks'] = {'received': self.nacksReceived}
+        return stats
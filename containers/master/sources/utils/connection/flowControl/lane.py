@@ -0,0 +1,13 @@
+from enum import Enum
+from enum import unique
+
+
+@unique
+class Lane(Enum):
+    # Registration, placement, acknowledgements, scaling, profiling and
+    # the rest of the messages that keep the components working
+    CONTROL = 'control'
+    # Sensory data, intermediate data and results
+    DATA = 'data'
+    # Log forwarding
+    LOG = 'log'
@@ -33,6 +33,16 @@ class AllSystemPerformance(AutoDictionary, SerializableDictionary):
             {} if processingTime is None else processingTime
         self.responseTime: AllResponseTime = \
             {} if responseTime is None else responseTime
+        # Counts the changes, so that what was worked out from the profiles
+        # can tell it is stale
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def changed(self):
+        self._version += 1
 
     @staticmethod
     def fromDict(inDict: Dict):
@@ -1,11 +1,14 @@
+from .tools import dataRoutesMessage
 from .tools import terminateMessage
 from .tools.waitMessage import waitMessage
 from ..registry.base import Registry
 from ..registry.roles.taskExecutor import TaskExecutor
 from ..registry.roles.user import User
+from ..registry.types import TaskLabeled
 from ...component import BasicComponent
 from ...connection import HandlerReturn
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import ComponentRole
 from ...types import MessageSubType
 from ...types import MessageType
@@ -21,6 +24,7 @@ class AcknowledgementHandler:
         self.registry = registry
         self.basicComponent = basicComponent
 
+    @handles(MessageType.ACKNOWLEDGEMENT, MessageSubType.READY)
     def handleReady(self, message: MessageReceived) -> HandlerReturn:
         source = message.source
         if source.role is not ComponentRole.TASK_EXECUTOR:
@@ -42,7 +46,20 @@ class AcknowledgementHandler:
         user: User = self.registry.registeredManager.users[userID]
 
         user.lock.acquire()
-        user.taskNameToExecutor[taskExecutor.task.nameLabeled] = taskExecutor
+        taskNameLabeled = taskExecutor.task.nameLabeled
+        hostID = user.taskNameToHostID.get(
+            taskNameLabeled, taskExecutor.hostID)
+        if taskExecutor.hostID != hostID:
+            # Started before the task was migrated
+            self.retire(taskExecutor)
+            user.lock.release()
+            return
+        previousExecutor = user.taskNameToExecutor.get(taskNameLabeled)
+        user.taskNameToExecutor[taskNameLabeled] = taskExecutor
+        if previousExecutor is not None \
+                and previousExecutor is not taskExecutor:
+            self.redirectParents(user, taskExecutor)
+            self.retire(previousExecutor)
         if not len(user.taskNameToExecutor) == len(user.taskNameList):
             user.lock.release()
             return
@@ -52,9 +69,16 @@ class AcknowledgementHandler:
                 user.lock.release()
                 return
         if user.isReady:
+            # A task executor has been replaced
+            if self.registry.directDataPlane:
+                self.basicComponent.sendMessage(
+                    messageToSend=dataRoutesMessage(user))
             user.lock.release()
             return
         user.isReady = True
+        if self.registry.directDataPlane:
+            self.basicComponent.sendMessage(
+                messageToSend=dataRoutesMessage(user))
         self.basicComponent.sendMessage(
             messageType=MessageType.ACKNOWLEDGEMENT,
             messageSubType=MessageSubType.SERVICE_READY,
@@ -65,6 +89,51 @@ class AcknowledgementHandler:
         user.lock.release()
         return
 
+    def redirectParents(self, user: User, taskExecutor: TaskExecutor):
+        """
+        Tells the task executors of the parent tasks, which looked the
+        task executor of the task up once when they registered, to send
+        to the one replacing it
+        """
+        application = user.application
+        task = application.tasksWithDependency[taskExecutor.task.name]
+        taskExecutors = self.registry.registeredManager.taskExecutors
+        for parent in task.parents:
+            parentNameLabeled = TaskLabeled(
+                name=parent.name,
+                token='',
+                label=application.label).nameLabeled
+            # Both the ones running and the ones replacing them
+            for parentExecutor in taskExecutors.find(
+                    'task', parentNameLabeled):
+                if parentExecutor.userID != user.componentID:
+                    continue
+                self.basicComponent.sendMessage(
+                    messageType=MessageType.PLACEMENT,
+                    messageSubType=MessageSubType.LOOKUP,
+                    data={
+                        'taskExecutorAddr': list(taskExecutor.addr),
+                        'taskToken': taskExecutor.task.token},
+                    destination=parentExecutor)
+                self.basicComponent.debugLogger.debug(
+                    'Redirect %s to %s',
+                    parentExecutor.nameLogPrinting,
+                    taskExecutor.nameLogPrinting)
+
+    def retire(self, taskExecutor: TaskExecutor):
+        """
+        Stops a task executor replaced by another, which is ready. It is
+        deregistered first, so that its exit does not deregister the user
+        """
+        taskExecutors = self.registry.registeredManager.taskExecutors
+        if taskExecutor.componentID in taskExecutors:
+            del taskExecutors[taskExecutor.componentID]
+        self.basicComponent.sendMessage(
+            messageToSend=terminateMessage(taskExecutor, reason='Migrated'))
+        self.basicComponent.debugLogger.debug(
+            'Retire %s', taskExecutor.nameLogPrinting)
+
+    @handles(MessageType.ACKNOWLEDGEMENT, MessageSubType.WAITING)
     def handleTaskExecutorWaiting(
             self, message: MessageReceived) -> HandlerReturn:
         source = message.source
@@ -75,18 +144,6 @@ class AcknowledgementHandler:
         actorID = taskExecutor.actorID
         if actorID not in registeredManager.actors:
             return
-        actor = registeredManager.actors[actorID]
-        actorHostId = actor.hostID
-        coolTaskExecutors = registeredManager.coolTaskExecutors
-
-        if actorHostId not in coolTaskExecutors:
-            coolTaskExecutors[actorHostId] = {}
-
-        taskNameLabeled = taskExecutor.task.nameLabeled
-
-        if taskNameLabeled not in coolTaskExecutors[actorHostId]:
-            coolTaskExecutors[actorHostId][taskNameLabeled] = set([])
-
-        coolTaskExecutors[actorHostId][taskNameLabeled].add(taskExecutor)
+        registeredManager.taskExecutors.addCool(taskExecutor)
         self.basicComponent.debugLogger.debug(
             'Cool off %s', taskExecutor.nameLogPrinting)
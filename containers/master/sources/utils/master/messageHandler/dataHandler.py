@@ -4,6 +4,7 @@ from ..registry.roles import User
 from ...component import BasicComponent
 from ...connection import HandlerReturn
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import MessageSubType
 from ...types import MessageType
 
@@ -17,6 +18,7 @@ class DataHandler:
         self.basicComponent = basicComponent
         self.registry = registry
 
+    @handles(MessageType.DATA, MessageSubType.SENSORY_DATA)
     def handleSensoryData(self,
                           message: MessageReceived) -> HandlerReturn:
         data = message.data
@@ -48,6 +50,7 @@ class DataHandler:
                     data=data,
                     destination=taskExecutor)
 
+    @handles(MessageType.DATA, MessageSubType.FINAL_RESULT)
     def handleResult(self,
                      message: MessageReceived) -> HandlerReturn:
         source = message.source
@@ -2,6 +2,7 @@ from ..registry.base import Registry
 from ...connection import HandlerReturn
 from ...connection import MessageReceived
 from ...connection import MessageToSend
+from ...connection import handles
 from ...types import MessageSubType
 from ...types import MessageType
 
@@ -11,6 +12,7 @@ class ExperimentalHandler:
     def __init__(self, registry: Registry):
         self.registry = registry
 
+    @handles(MessageType.EXPERIMENTAL, MessageSubType.ACTORS_COUNT)
     def handleActorsCount(self, message: MessageReceived) -> HandlerReturn:
         source = message.source
         data = {'actorsCount': len(self.registry.registeredManager.actors)}
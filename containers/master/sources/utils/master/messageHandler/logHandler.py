@@ -1,6 +1,9 @@
 from ..logger import LoggerManager
 from ...connection import HandlerReturn
 from ...connection import MessageReceived
+from ...connection import handles
+from ...types import MessageSubType
+from ...types import MessageType
 
 
 class LogHandler:
@@ -8,6 +11,7 @@ class LogHandler:
     def __init__(self, loggerManager: LoggerManager):
         self.loggerManager = loggerManager
 
+    @handles(MessageType.LOG, MessageSubType.ALL_RESOURCES_PROFILES)
     def handleProfiles(self, message: MessageReceived) -> HandlerReturn:
         profiles = message.data['profiles']
         imagesToMerge = {message.source.nameConsistent: profiles}
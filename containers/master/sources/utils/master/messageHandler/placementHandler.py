@@ -1,5 +1,6 @@
 from ..registry.base import Registry
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import MessageSubType
 from ...types import MessageType
 
@@ -8,6 +9,7 @@ class PlacementHandler:
     def __init__(self, registry: Registry):
         self.registry = registry
 
+    @handles(MessageType.PLACEMENT, MessageSubType.LOOKUP)
     def handleLookup(self, message: MessageReceived):
         source = message.source
         data = message.data
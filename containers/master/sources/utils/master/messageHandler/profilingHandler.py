@@ -9,6 +9,7 @@ from pythonping import ping as testLatency
 from ..profiler.base import MasterProfiler
 from ...component import BasicComponent
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import Component
 from ...types import MessageSubSubType
 from ...types import MessageSubType
@@ -27,6 +28,10 @@ class ProfilingHandler:
         self._runningIperfClient = Lock()
         self._runningIperfServer = Lock()
 
+    @handles(
+        MessageType.PROFILING,
+        MessageSubType.DATA_RATE_TEST,
+        MessageSubSubType.RECEIVE)
     def handleDataRateReceive(self, message: MessageReceived):
         data = message.data
         sourceAddr = data['sourceAddr']
@@ -45,9 +50,17 @@ class ProfilingHandler:
             self.basicComponent.addr[0])
         self.runDataRateReceive(sourceHostID)
 
+    @handles(
+        MessageType.PROFILING,
+        MessageSubType.DATA_RATE_TEST,
+        MessageSubSubType.SEND)
     def handleDataRateSend(self, message: MessageReceived):
         self.runDataRateSend(message)
 
+    @handles(
+        MessageType.PROFILING,
+        MessageSubType.DATA_RATE_TEST,
+        MessageSubSubType.RESULT)
     def handleDataRateResult(self, message: MessageReceived):
         data = message.data
         sourceHostID = data['sourceHostID']
@@ -59,12 +72,17 @@ class ProfilingHandler:
                 sourceHostID] = {}
         self.profiler.loggerManager.systemPerformance.dataRate[sourceHostID][
             targetHostID] = dataRateResult
+        self.profiler.loggerManager.systemPerformance.changed()
         self.profiler.dataRateTestEvents[sourceHostID][targetHostID].set()
         self.debugLogger.info(
             'Received BPS result from %s to %s',
             sourceHostID,
             targetHostID)
 
+    @handles(
+        MessageType.PROFILING,
+        MessageSubType.LATENCY_TEST,
+        MessageSubSubType.RESULT)
     def handleLatencyResult(self, message: MessageReceived):
         data = message.data
         sourceHostID = data['sourceHostID']
@@ -76,6 +94,7 @@ class ProfilingHandler:
                 sourceHostID] = {}
         self.profiler.loggerManager.systemPerformance.latency[sourceHostID][
             targetHostID] = latencyResult
+        self.profiler.loggerManager.systemPerformance.changed()
         self.profiler.latencyTestEvents[sourceHostID][targetHostID].set()
         self.debugLogger.info(
             'Received Ping result from %s to %s',
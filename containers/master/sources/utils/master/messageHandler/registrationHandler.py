@@ -2,6 +2,9 @@ from ..profiler.base import MasterProfiler
 from ..registry.base import Registry
 from ...component import BasicComponent
 from ...connection import MessageReceived
+from ...connection import handles
+from ...types import MessageSubType
+from ...types import MessageType
 from ...types.component.role import ComponentRole
 
 
@@ -17,6 +20,7 @@ class RegistrationHandler:
         self.registry = registry
         self.debugLogger = self.basicComponent.debugLogger
 
+    @handles(MessageType.REGISTRATION, MessageSubType.REGISTER)
     def handleRegister(self, message: MessageReceived):
         source = message.source
         if source.role is ComponentRole.USER:
@@ -1,6 +1,7 @@
 from ..resourcesDiscovery import MasterResourcesDiscovery
 from ...component import BasicComponent
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import MessageSubType
 from ...types import MessageType
 
@@ -14,6 +15,9 @@ class ResourcesDiscoveryHandler:
         self.basicComponent = basicComponent
         self.resourcesDiscovery = resourcesDiscovery
 
+    @handles(
+        MessageType.RESOURCE_DISCOVERY,
+        MessageSubType.REQUEST_ACTORS_INFO)
     def handleActorsAddr(self, message: MessageReceived):
         """
         :param message:
@@ -36,6 +40,7 @@ class ResourcesDiscoveryHandler:
             source.nameLogPrinting,
             pformat(data))
 
+    @handles(MessageType.RESOURCE_DISCOVERY, MessageSubType.ACTORS_INFO)
     def handleActorsAddrResult(self, message: MessageReceived):
         actorsAddr = message.data['actorsAddrResult']
         for addr in actorsAddr:
@@ -1,6 +1,7 @@
 from ..profiler.base import MasterProfiler
 from ...component import BasicComponent
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import MessageSubType
 from ...types import MessageType
 
@@ -13,6 +14,7 @@ class ScalingHandler:
         self.profiler = profiler
         self.basicComponent = basicComponent
 
+    @handles(MessageType.SCALING, MessageSubType.GET_PROFILES)
     def handleGetProfiler(self, message: MessageReceived):
         source = message.source
         data = {'allProfiles': self.profiler.loggerManager.toDict()}
@@ -22,6 +24,7 @@ class ScalingHandler:
             data=data,
             destination=source)
 
+    @handles(MessageType.SCALING, MessageSubType.PROFILES_INFO)
     def handleProfilerInfo(self, message: MessageReceived):
         data = message.data
         profiles = data['allProfiles']
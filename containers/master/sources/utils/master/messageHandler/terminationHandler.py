@@ -4,7 +4,10 @@ from ..registry.base import Registry
 from ...component.basic import BasicComponent
 from ...connection import HandlerReturn
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import ComponentRole
+from ...types import MessageSubType
+from ...types import MessageType
 
 
 class TerminationHandler:
@@ -18,6 +21,7 @@ class TerminationHandler:
         self.registry = registry
         self.acknowledgementHandler = acknowledgementHandler
 
+    @handles(MessageType.TERMINATION, MessageSubType.EXIT)
     def handleExit(self, message: MessageReceived) -> HandlerReturn:
         data = message.data
         source = message.source
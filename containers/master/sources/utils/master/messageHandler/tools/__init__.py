@@ -1,2 +1,3 @@
+from .dataRoutesMessage import dataRoutesMessage
 from .terminateMessage import terminateMessage
 from .waitMessage import waitMessage
@@ -0,0 +1,38 @@
+from ...registry.roles.user import User
+
+from ....connection import MessageToSend
+from ....types import MessageSubType
+from ....types import MessageType
+
+
+def dataRoutesMessage(user: User, direct: bool = True) -> MessageToSend:
+    """
+    Tell the user to send its sensory data to the entry task executors and
+    to accept the final results from the exit task executors, so that the
+    data plane bypasses the master
+    :param user: the user of which every task executor is ready
+    :param direct: False to send the data through the master again
+    """
+    data = {'direct': direct}
+    if direct:
+        application = user.application
+        entries = [
+            user.taskNameToExecutor[taskName].addr
+            for taskName in application.entryTaskNameList]
+        exits = []
+        for taskExecutor in user.taskNameToExecutor.values():
+            task = application.tasksWithDependency[taskExecutor.task.name]
+            childrenNames = {child.name for child in task.children}
+            if childrenNames - {'Actuator'}:
+                continue
+            exits.append(taskExecutor.addr)
+        data['entries'] = entries
+        data['exits'] = exits
+        # The same as DataHandler.handleSensoryData
+        data['roundRobin'] = application.name.startswith('ObjectDetection')
+    messageToSend = MessageToSend(
+        messageType=MessageType.PLACEMENT,
+        messageSubType=MessageSubType.DATA_ROUTES,
+        data=data,
+        destination=user)
+    return messageToSend
@@ -1,63 +1,39 @@
-import json
-import os
-from collections import defaultdict
-from typing import DefaultDict
-from typing import Dict
+from time import time
 from typing import List
 from typing import Tuple
 
+from ..scheduler.decisionHistory import DecisionHistory
+from ..scheduler.decisionHistory import PastDecision
+
 
 class Decisions:
 
     def __init__(
             self,
-            keptDecisionsCount: int = 100):
-        self.decision: Dict[str, List[Tuple[List[int], List[str]]]] = {}
-        self.__filename = 'decisions.json'
-        self._keptDecisionCount = keptDecisionsCount
-        self._requestedAppCount: DefaultDict[str, int] = defaultdict(lambda: 0)
-        self._loadFromFile()
+            keptDecisionsCount: int = 100,
+            folder: str = 'decisions'):
+        """
+        :param keptDecisionsCount: how many of the latest decisions of each
+        application are kept
+        :param folder: where the decisions are appended, see DecisionHistory
+        """
+        self._history = DecisionHistory(
+            folder=folder, maxDecisionsPerKey=keptDecisionsCount)
 
     def update(
             self,
             appName,
             machinesIndex: List[int],
             indexToMachine: List[str]):
-        self._requestedAppCount[appName] += 1
-        if appName not in self.decision:
-            self.decision[appName] = []
-        indexes = [int(i) for i in machinesIndex]
-        machines = indexToMachine
-        self.decision[appName].append((indexes, machines))
-        self._clean()
-        self.localLogger_saveToFile()
-
-    def _clean(self):
-        totalRequest = sum(self._requestedAppCount.values())
-        if totalRequest < self._keptDecisionCount // 2:
-            return
-        factor = self._keptDecisionCount / totalRequest
-        for appName, decisions in self.decision.items():
-            count = round(factor * self._requestedAppCount[appName])
-            if count < len(self.decision[appName]):
-                self.decision[appName] = self.decision[appName][:count]
-
-    def good(self, appName):
-        if appName not in self.decision:
-            return []
-        return self.decision[appName]
-
-    def localLogger_saveToFile(self):
-        f = open(self.__filename, 'w+')
-        json.dump(self.decision, f)
-        f.close()
-
-    def _loadFromFile(self):
-        if os.path.exists(self.__filename):
-            f = open(self.__filename, 'r')
-            content = json.load(f)
-            f.close()
-            self.decision = defaultdict(List[List[int]], content)
-            for appName, records in self.decision.items():
-                self._requestedAppCount[appName] = len(records)
-            self._clean()
+        self._history.appendPast(PastDecision(
+            key=appName,
+            hostIDSequence=list(indexToMachine),
+            indexSequence=[int(i) for i in machinesIndex],
+            cost=-1,
+            schedulingTime=-1,
+            timestamp=time()))
+
+    def good(self, appName) -> List[Tuple[List[int], List[str]]]:
+        return [
+            (pastDecision.indexSequence, pastDecision.hostIDSequence)
+            for pastDecision in self._history.get(appName)]
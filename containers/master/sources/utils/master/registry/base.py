@@ -21,12 +21,13 @@ from .types import TaskLabeled
 from ..application.base import Application
 from ..application.manager import ApplicationManager
 from ..logger.allSystemPerformance import AllSystemPerformance
+from ..messageHandler.tools.dataRoutesMessage import dataRoutesMessage
 from ..messageHandler.tools.terminateMessage import terminateMessage
 from ..messageHandler.tools.waitMessage import waitMessage
 from ..profiler.base import MasterProfiler
 from ..profiler.decisions import Decisions
 from ..scheduler.base import BaseScheduler
-from ..scheduler.policies.nsga.base import BaseNSGA
+from ..scheduler.schedulingQueue import SchedulingQueue
 from ..scheduler.types import Decision
 from ..networkController.networks import NetworkController
 from ...component import BasicComponent
@@ -52,7 +53,10 @@ class Registry(ABC):
             container_name: str,
             waitTimeout: int = 0,
             networkController: NetworkController = None,
-            enableOverlay: bool = False):
+            enableOverlay: bool = False,
+            directDataPlane: bool = False,
+            schedulingWorkerNum: int = 2,
+            coalescingWindow: float = .05):
         self.profiler = profiler
         self.systemPerformance = systemPerformance
         self.applicationManager = applicationManager
@@ -64,8 +68,16 @@ class Registry(ABC):
         self.registeredManager = RegisteredManager()
 
         self.scheduler = scheduler
+        self.scheduler.handleRefinedDecision = self.migrate
         self.decisionsQueue: Queue[Decision] = Queue()
         self.decisionHandlerThreadPool()
+        # Users registering do not wait for the scheduler
+        self.schedulingQueue = SchedulingQueue(
+            scheduleUsers=self.scheduleUsers,
+            workerNum=schedulingWorkerNum,
+            coalescingWindow=coalescingWindow)
+        # The users placed with the decision of another, by its userID
+        self.coalescedUsers: Dict[str, List[User]] = {}
 
         self.decisions = Decisions()
         self.__schedulingNum = 0
@@ -81,6 +93,8 @@ class Registry(ABC):
         self.is_container_mode = True if len(container_name) else False
         self.container_name = container_name
         self.enableOverlay = enableOverlay
+        # Users send data to their task executors directly
+        self.directDataPlane = directDataPlane
 
     def registerClient(self,
                        message: MessageReceived):
@@ -236,27 +250,54 @@ class Registry(ABC):
             application=applicationCopy,
             domainName=domainName)
         self.registeredManager.users[user] = user
+        self.schedulingQueue.put(user)
+
+    def scheduleUsers(self,
+                      users: List[User]):
+        """
+        Places users of the same application and domain, called by the
+        workers of the scheduling queue
+        """
+        # The users deregistered while waiting are not placed
+        users = [
+            user for user in users
+            if user.componentID in self.registeredManager.users]
+        if not len(users):
+            return
         try:
-            schedulingSuccess = self.scheduler.schedule(
-                user=user,
+            scheduledUsers = self.scheduler.scheduleUsers(
+                users=users,
                 registeredManager=self.registeredManager,
                 resources=self.profiler.me.resources,
                 systemPerformance=self.systemPerformance,
                 basicComponent=self.basicComponent,
                 decisionsQueue=self.decisionsQueue)
-            if not schedulingSuccess:
-                return
-            if self.is_container_mode and self.enableOverlay:
-                network = self.networkController.create_network_for_request(user.nameConsistent)
-                self.networkController.connect_container_to_network(self.container_name, network.name)
-                self.debugLogger.info(f'{self.container_name} joined network {network.name}')
-            self.checkTaskExecutorForUser(user=user)
         except Exception as e:
             print_exc()
-            if isinstance(self.scheduler, BaseNSGA):
-                self.scheduler.lock.release()
-                self.scheduler.leaveWaiting()
-            return terminateMessage(component=user, reason=str(e))
+            for user in users:
+                self.basicComponent.sendMessage(
+                    messageToSend=terminateMessage(
+                        component=user, reason=str(e)))
+            return
+        self.debugLogger.debug(
+            'Scheduled %d users in one run: %s',
+            len(scheduledUsers),
+            self.schedulingQueue.stats())
+        if len(scheduledUsers) > 1:
+            self.coalescedUsers[scheduledUsers[0].componentID] = \
+                scheduledUsers[1:]
+        for user in scheduledUsers:
+            try:
+                if self.is_container_mode and self.enableOverlay:
+                    network = self.networkController.create_network_for_request(user.nameConsistent)
+                    self.networkController.connect_container_to_network(self.container_name, network.name)
+                    self.debugLogger.info(f'{self.container_name} joined network {network.name}')
+                self.checkTaskExecutorForUser(user=user)
+            except Exception as e:
+                print_exc()
+                self.basicComponent.sendMessage(
+                    messageToSend=terminateMessage(
+                        component=user, reason=str(e)))
 
     @SynchronizedAttribute
     def _registerTaskExecutor(self,
@@ -349,6 +390,7 @@ class Registry(ABC):
                 self.debugLogger.debug('Deregister: %s', taskExecutor.nameLogPrinting)
             self.basicComponent.sendMessage(messageToSend=message)
         del self.registeredManager.users[source.componentID]
+        self.coalescedUsers.pop(source.componentID, None)
 
     @SynchronizedAttribute
     def _deregisterTaskExecutor(
@@ -362,6 +404,10 @@ class Registry(ABC):
             del self.registeredManager.taskExecutors[source.componentID]
             return terminateMessage(source, reason='Deregister')
         user = self.registeredManager.users[taskExecutor.userID]
+        if self.directDataPlane:
+            # Take the data plane back before the task executors stop
+            self.basicComponent.sendMessage(
+                messageToSend=dataRoutesMessage(user, direct=False))
         self._deregisterUser(self, source=user, attributeName='registeredUser')
         return terminateMessage(source, reason='Deregister')
 
@@ -398,20 +444,59 @@ class Registry(ABC):
     def handleDecision(self):
         while True:
             decision = self.decisionsQueue.get()
+            self.place(decision)
+
+    def place(self,
+              decision: Decision):
+        self.printDecision(decision)
+        hostIDSequence = decision.hostIDSequence()
+        user = decision.user
+        for i, hostID in enumerate(hostIDSequence):
+            actor = self.registeredManager.actors[hostID]
+            taskNameLabeled = user.application.taskNameList[i]
+            taskToken = user.taskNameToToken[taskNameLabeled]
+            childrenTaskTokens = self.findChildrenTaskTokens(
+                taskNameLabeled=taskNameLabeled, user=user)
+            user.assignTask(
+                actor=actor,
+                taskNameLabeled=taskNameLabeled,
+                taskToken=taskToken,
+                childrenTaskTokens=childrenTaskTokens)
+        self.resourcePlace(user=user)
+
+    def migrate(self,
+                previous: Decision,
+                refined: Decision):
+        """
+        Moves the tasks of the users placed with a decision to where a
+        better one places them. The task executors replaced keep running
+        until the new ones are ready, then the task executors sending to
+        them are redirected and they are stopped
+        """
+        users = [previous.user] + self.coalescedUsers.pop(
+            previous.user.componentID, [])
+        movedIndexes = [
+            i for i, (hostID, refinedHostID) in enumerate(
+                zip(previous.hostIDSequence(), refined.hostIDSequence()))
+            if hostID != refinedHostID]
+        for user in users:
+            if user.componentID not in self.registeredManager.users:
+                continue
+            decision = refined.forUser(user)
             self.printDecision(decision)
             hostIDSequence = decision.hostIDSequence()
-            user = decision.user
-            for i, hostID in enumerate(hostIDSequence):
-                actor = self.registeredManager.actors[hostID]
+            for i in movedIndexes:
+                actor = self.registeredManager.actors[hostIDSequence[i]]
                 taskNameLabeled = user.application.taskNameList[i]
-                taskToken = user.taskNameToToken[taskNameLabeled]
-                childrenTaskTokens = self.findChildrenTaskTokens(
-                    taskNameLabeled=taskNameLabeled, user=user)
-                user.assignTask(
+                user.moveTask(
                     actor=actor,
                     taskNameLabeled=taskNameLabeled,
-                    taskToken=taskToken,
-                    childrenTaskTokens=childrenTaskTokens)
+                    taskToken=user.taskNameToToken[taskNameLabeled],
+                    childrenTaskTokens=self.findChildrenTaskTokens(
+                        taskNameLabeled=taskNameLabeled, user=user))
+            self.debugLogger.info(
+                'Migrate %d tasks of %s', len(movedIndexes),
+                user.nameLogPrinting)
             self.resourcePlace(user=user)
 
     def printDecision(self,
@@ -464,19 +549,18 @@ class Registry(ABC):
         user.lock.acquire()
         for compactedKey in user.unclaimedTasks:
             hostID, taskNameLabeled, taskToken = compactedKey
-            coolTaskExecutors = self.registeredManager.coolTaskExecutors
             childrenTaskTokens = user.unclaimedTasks[compactedKey]
 
-            if hostID in coolTaskExecutors:
-                if taskNameLabeled in coolTaskExecutors[hostID]:
-                    if len(coolTaskExecutors[hostID][taskNameLabeled]):
-                        self.sendReuseTaskExecutorMsg(
-                            hostID=hostID,
-                            user=user,
-                            taskNameLabeled=taskNameLabeled,
-                            taskToken=taskToken,
-                            childrenTaskTokens=childrenTaskTokens)
-                        continue
+            taskExecutor = self.registeredManager.taskExecutors.popCool(
+                hostID, taskNameLabeled)
+            if taskExecutor is not None:
+                self.sendReuseTaskExecutorMsg(
+                    taskExecutor=taskExecutor,
+                    user=user,
+                    taskNameLabeled=taskNameLabeled,
+                    taskToken=taskToken,
+                    childrenTaskTokens=childrenTaskTokens)
+                continue
             if self.is_container_mode and self.enableOverlay:
                 networkName = self.networkController.generate_network_name(user.nameConsistent)
             else:
@@ -492,15 +576,12 @@ class Registry(ABC):
 
     def sendReuseTaskExecutorMsg(
             self,
-            hostID: str,
+            taskExecutor: TaskExecutor,
             user: User,
             taskNameLabeled: str,
             taskToken: str,
             childrenTaskTokens: List[str]):
         taskName = taskNameLabeled[:taskNameLabeled.find('-')]
-        coolTaskExecutors = self.registeredManager.coolTaskExecutors
-        coolingSet = coolTaskExecutors[hostID][taskNameLabeled]
-        taskExecutor = coolingSet.pop()
         data = {
             'taskName': taskName,
             'taskToken': taskToken,
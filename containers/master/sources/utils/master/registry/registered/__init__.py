@@ -1,5 +1,6 @@
 from .actors import RegisteredActors
 from .base import Registered
+from .base import RegisteredSnapshot
 from .manager import RegisteredManager
 from .masters import RegisteredMasters
 from .taskExecutors import RegisteredTaskExecutors
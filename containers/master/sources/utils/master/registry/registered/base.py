@@ -1,36 +1,133 @@
 from threading import Lock
+from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Hashable
+from typing import Iterator
 from typing import List
+from typing import Set
 from typing import Tuple
-from typing import Union
 
-from ....types import Address
 from ....types import Component
 
-MapUnion = Union[str, str, Address]
-MapTuple = Tuple[str, str, Address]
+# The name of a secondary index to how it gets its value of a component
+IndexFunctions = Dict[str, Callable[[Any], Hashable]]
+
+
+class RegisteredSnapshot:
+    """
+    The components registered at one moment, with their secondary
+    indexes. It does not change when components register or deregister
+    afterwards, so readers needing several indexes at the same moment can
+    use it without locks.
+    """
+
+    def __init__(
+            self,
+            version: int,
+            items: FrozenSet,
+            indexes: Dict[str, Dict[Hashable, FrozenSet]]):
+        self.version = version
+        self.items = items
+        self.indexes = indexes
+
+    def find(self, index: str, value: Hashable) -> FrozenSet:
+        """
+        :return: the components whose value of the index is value
+        """
+        return self.indexes[index].get(value, frozenset())
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+
+    def __contains__(self, component) -> bool:
+        return component in self.items
 
 
 class Registered:
+    """
+    The components registered, looked up by any of their keys, e.g.,
+    componentID, nameConsistent and addr.
+
+    Lookups by a key or by the value of an index read dicts and sets
+    without any lock, as reading one key of a dict or copying a set is
+    atomic, so they never wait for registrations. Registrations and
+    deregistrations, which change several keys and the secondary indexes,
+    are serialized by a lock. Readers needing several indexes at the same
+    moment read a snapshot.
+    """
+    # Secondary indexes of every kind of component
+    indexFunctions: IndexFunctions = {
+        'domain': lambda component: component.domainName,
+        'hostID': lambda component: component.hostID}
 
     def __init__(self):
-        self.lock: Lock = Lock()
-        self.len = 0
-        self.dict = {}
-        self.allItems = set()
-        self.keyMap: Dict[MapUnion, MapTuple] = {}
+        self._writeLock: Lock = Lock()
+        # Any key of each component to it
+        self._components: Dict[Hashable, Any] = {}
+        # The keys each component was registered with, which its
+        # attributes may no longer give when it is deregistered
+        self._keysOf: Dict[Any, Tuple] = {}
+        self._indexes: Dict[str, Dict[Hashable, Set]] = {
+            index: {} for index in self.indexFunctions}
+        # The values of the indexes changed since the last snapshot,
+        # the others are shared with it
+        self._changed: Set[Tuple[str, Hashable]] = set()
+        self._indexValuesOf: Dict[Any, Dict[str, Hashable]] = {}
+        self._version = 0
+        self._snapshot = RegisteredSnapshot(
+            version=0,
+            items=frozenset(),
+            indexes={index: {} for index in self.indexFunctions})
+
+    def keysOf(self, component) -> Tuple:
+        return component.componentID, component.nameConsistent, component.addr
+
+    def snapshot(self) -> RegisteredSnapshot:
+        """
+        :return: the components registered and their indexes, all at the
+        same moment
+        """
+        snapshot = self._snapshot
+        if snapshot.version == self._version:
+            return snapshot
+        with self._writeLock:
+            if self._snapshot.version == self._version:
+                return self._snapshot
+            indexes = {
+                index: dict(byValue)
+                for index, byValue in self._snapshot.indexes.items()}
+            for index, value in self._changed:
+                if value in self._indexes[index]:
+                    indexes[index][value] = frozenset(
+                        self._indexes[index][value])
+                    continue
+                indexes[index].pop(value, None)
+            self._changed = set()
+            self._snapshot = RegisteredSnapshot(
+                version=self._version,
+                items=frozenset(self._keysOf),
+                indexes=indexes)
+            return self._snapshot
+
+    def find(self, index: str, value: Hashable) -> FrozenSet:
+        """
+        :return: the components whose value of the index is value now
+        """
+        return frozenset(self._indexes[index].get(value, ()))
 
     def copyAll(self) -> List:
-        return list(self.allItems)
+        return list(self._keysOf)
 
     def filter_by_domain(self, domainName: str) -> List:
-        self.lock.acquire()
-        ret = [x for x in self.allItems if x.domainName == domainName]
-        self.lock.release()
-        return ret
+        return list(self.find('domain', domainName))
 
     def __len__(self):
-        return self._len()
+        return len(self._keysOf)
 
     def __setitem__(self, key, component):
         self._setitem(key=key, component=component)
@@ -44,72 +141,102 @@ class Registered:
     def __contains__(self, component) -> bool:
         return self._contains(component)
 
-    def _len(self):
-        self.lock.acquire()
-        ret = len(self.allItems)
-        self.lock.release()
-        return ret
+    def _lookup(self, key: Hashable):
+        return self._components.get(key)
 
     def _setitem(self, key, component):
-        self.lock.acquire()
-        componentID = component.componentID
-        nameConsistent = component.nameConsistent
-        addr = component.addr
-        self.dict.__setitem__(componentID, component)
-        self.dict.__setitem__(nameConsistent, component)
-        self.dict.__setitem__(addr, component)
-        t = (componentID, nameConsistent, addr)
-        self.keyMap[componentID] = t
-        self.keyMap[nameConsistent] = t
-        self.keyMap[addr] = t
-        self.allItems.add(component)
-        self.lock.release()
+        # Worked out before acquiring the lock to keep writers short
+        keys = self._keysToRegister(component)
+        indexValues = self._indexValues(component)
+        with self._writeLock:
+            self._register(component, keys, indexValues)
+            self._version += 1
+
+    def _keysToRegister(self, component) -> Tuple:
+        return tuple(
+            key for key in self.keysOf(component) if key not in {None, ''})
+
+    def _indexValues(self, component) -> Dict[str, Hashable]:
+        return {
+            index: function(component)
+            for index, function in self.indexFunctions.items()}
+
+    def _register(
+            self,
+            component,
+            keys: Tuple,
+            indexValues: Dict[str, Hashable]):
+        # Called with the write lock acquired
+        if component in self._keysOf:
+            self._unregister(component)
+        # The components registered before with the same keys,
+        # e.g., the same addr, are replaced
+        for key in keys:
+            previous = self._components.get(key)
+            if previous is None or previous is component:
+                continue
+            if self._evicts(previous, component):
+                self._unregister(previous)
+        for key in keys:
+            self._components[key] = component
+        self._keysOf[component] = keys
+        for index, value in indexValues.items():
+            self._addToIndex(index, value, component)
+        self._indexValuesOf[component] = indexValues
+
+    def _evicts(self, previous, component) -> bool:
+        """
+        :return: whether the component registering replaces the one
+        registered before with one of the same keys. If not, the key
+        leads to the new one, and the other keys still lead to the one
+        before until it is deregistered
+        """
+        return True
 
     def _getitem(self, key):
-        try:
-            self.lock.acquire()
-            component = self.dict[key]
-            self.lock.release()
-            return component
-        except KeyError:
-            self.lock.release()
-            raise KeyError
+        component = self._lookup(key)
+        if component is None:
+            raise KeyError(key)
+        return component
 
     def _delitem(self, key):
-        self.lock.acquire()
-        if key not in self.dict:
-            self.lock.release()
+        with self._writeLock:
+            component = self._components.get(key)
+            if component is None:
+                return
+            self._unregister(component)
+            self._version += 1
+
+    def _unregister(self, component):
+        # Called with the write lock acquired
+        for key in self._keysOf.pop(component):
+            if self._components.get(key) is component:
+                del self._components[key]
+        for index, value in self._indexValuesOf.pop(component).items():
+            self._removeFromIndex(index, value, component)
+
+    def _addToIndex(self, index: str, value: Hashable, component):
+        byValue = self._indexes[index]
+        if value not in byValue:
+            byValue[value] = set()
+        byValue[value].add(component)
+        self._changed.add((index, value))
+
+    def _removeFromIndex(self, index: str, value: Hashable, component):
+        byValue = self._indexes[index]
+        if value not in byValue:
             return
-        componentID, nameConsistent, addr = self.keyMap[key]
-        component = self.dict[key]
-        self.allItems.remove(component)
-        try:
-            del self.dict[componentID]
-            del self.dict[nameConsistent]
-            del self.dict[addr]
-            del self.keyMap[componentID]
-            del self.keyMap[nameConsistent]
-            del self.keyMap[addr]
-        except KeyError:
-            pass
-        self.lock.release()
+        byValue[value].discard(component)
+        if not byValue[value]:
+            del byValue[value]
+        self._changed.add((index, value))
 
     def _contains(self, component) -> bool:
-        ret = False
-        self.lock.acquire()
         if isinstance(component, str):
-            if component in self.dict:
-                ret = True
-            self.lock.release()
-            return ret
+            return self._lookup(component) is not None
         if not isinstance(component, Component):
-            self.lock.release()
             return False
-        elif component.componentID in self.dict:
-            ret = True
-        elif component.nameConsistent in self.dict:
-            ret = True
-        elif component.addr in self.dict:
-            ret = True
-        self.lock.release()
-        return ret
+        for key in self.keysOf(component):
+            if key is not None and self._lookup(key) is not None:
+                return True
+        return False
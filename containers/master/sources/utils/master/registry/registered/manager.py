@@ -1,11 +1,7 @@
-from typing import Dict
-from typing import Set
-
 from .actors import RegisteredActors
 from .masters import RegisteredMasters
 from .taskExecutors import RegisteredTaskExecutors
 from .users import RegisteredUsers
-from ..roles.taskExecutor import TaskExecutor
 
 
 class RegisteredManager:
@@ -14,5 +10,3 @@ class RegisteredManager:
         self.users = RegisteredUsers()
         self.taskExecutors = RegisteredTaskExecutors()
         self.masters = RegisteredMasters()
-        # TODO: Thread Safe
-        self.coolTaskExecutors: Dict[str, Dict[str, Set[TaskExecutor]]] = {}
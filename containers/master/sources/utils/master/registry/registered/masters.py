@@ -7,7 +7,6 @@ MasterKey = Union[Master, str]
 
 
 class RegisteredMasters(Registered):
-    pass
 
     def __setitem__(self, key, master: Master):
         return self._setitem(key=key, component=master)
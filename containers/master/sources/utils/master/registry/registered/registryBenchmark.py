@@ -0,0 +1,154 @@
+"""
+Benchmark of the registry of the Master under a registration storm,
+before and after lookups stopped waiting for registrations.
+
+Run from the sources folder of the Master:
+    python -m utils.master.registry.registered.registryBenchmark
+
+Writer threads register and deregister actors as fast as they can while
+reader threads look actors up by hostID and a scheduler thread lists the
+actors of a domain. Before, every index was behind one lock and listing a
+domain scanned all the actors. Reports the registrations and lookups per
+second and the p50 and p99 of the lookups and of listing a domain.
+"""
+import argparse
+from threading import Event
+from threading import Lock
+from threading import Thread
+from time import perf_counter
+from time import sleep
+from typing import List
+
+from .actors import RegisteredActors
+from ..roles import Actor
+
+domains = ('fogbus2', 'edge', 'cloud')
+
+
+class OneLockActors:
+    """
+    The registered actors as they were, every index behind one lock
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.dict = {}
+        self.allItems = set()
+        self.keyMap = {}
+
+    def __setitem__(self, key, actor: Actor):
+        self.lock.acquire()
+        t = (actor.hostID, actor.componentID, actor.nameConsistent, actor.addr)
+        for key_ in t:
+            self.dict[key_] = actor
+            self.keyMap[key_] = t
+        self.allItems.add(actor)
+        self.lock.release()
+
+    def __getitem__(self, key) -> Actor:
+        self.lock.acquire()
+        try:
+            return self.dict[key]
+        finally:
+            self.lock.release()
+
+    def __delitem__(self, key):
+        self.lock.acquire()
+        if key in self.dict:
+            self.allItems.remove(self.dict[key])
+            for key_ in self.keyMap[key]:
+                del self.dict[key_]
+                del self.keyMap[key_]
+        self.lock.release()
+
+    def filter_by_domain(self, domainName: str) -> List[Actor]:
+        self.lock.acquire()
+        ret = [x for x in self.allItems if x.domainName == domainName]
+        self.lock.release()
+        return ret
+
+
+def newActor(i: int) -> Actor:
+    return Actor(
+        addr=('10.%d.%d.%d' % (i // 62500, i // 250 % 250, i % 250), 5000),
+        hostID='host%d' % i,
+        componentID=str(i),
+        nameConsistent='Actor_%d' % i,
+        domainName=domains[i % len(domains)])
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return .0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] * 1e6
+
+
+def run(name: str, actors, stable: int, writers: int, readers: int,
+        seconds: float):
+    for i in range(stable):
+        actors[newActor(i)] = newActor(i)
+    stop = Event()
+    registrations = [0] * writers
+    lookupTimes: List[List[float]] = [[] for _ in range(readers)]
+    listTimes: List[float] = []
+
+    def churn(writer: int):
+        i = stable + writer
+        while not stop.is_set():
+            actor = newActor(i)
+            actors[actor] = actor
+            del actors[actor.hostID]
+            registrations[writer] += 1
+            i += writers
+
+    def lookUp(reader: int):
+        times = lookupTimes[reader]
+        i = reader
+        while not stop.is_set():
+            startTime = perf_counter()
+            _ = actors['host%d' % (i % stable)]
+            times.append(perf_counter() - startTime)
+            i += 7
+
+    def schedule():
+        while not stop.is_set():
+            startTime = perf_counter()
+            actors.filter_by_domain('edge')
+            listTimes.append(perf_counter() - startTime)
+            sleep(.001)
+
+    threads = [Thread(target=churn, args=(i,)) for i in range(writers)]
+    threads += [Thread(target=lookUp, args=(i,)) for i in range(readers)]
+    threads.append(Thread(target=schedule))
+    for thread in threads:
+        thread.start()
+    sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    lookups = [t for times in lookupTimes for t in times]
+    print('%-8s %8.0f registrations/s %9.0f lookups/s  '
+          'lookup p50 %6.1f us  p99 %7.1f us  '
+          'domain list p50 %7.1f us  p99 %7.1f us' % (
+              name, sum(registrations) / seconds, len(lookups) / seconds,
+              percentile(lookups, .5), percentile(lookups, .99),
+              percentile(listTimes, .5), percentile(listTimes, .99)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Registry benchmark')
+    parser.add_argument('--actors', type=int, default=5000,
+                        help='the actors registered all along')
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+    run('before', OneLockActors(),
+        args.actors, args.writers, args.readers, args.seconds)
+    run('after', RegisteredActors(),
+        args.actors, args.writers, args.readers, args.seconds)
+
+
+if __name__ == '__main__':
+    main()
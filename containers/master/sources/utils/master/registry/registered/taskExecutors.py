@@ -1,110 +1,112 @@
-from typing import Dict
-from typing import Set
 from typing import Tuple
 from typing import Union
 
 from .base import Registered
 from ..roles import TaskExecutor
-from ....types import Address
 
-MapUnion = Union[str, str, str, Address]
-MapTuple = Tuple[str, str, str, Address]
+# The host of the actor and the task of the task executors waiting to be
+# reused, the index of the ones in cool-off
+COOL_OFF = 'coolOff'
 
 
 class RegisteredTaskExecutors(Registered):
+    indexFunctions = {
+        **Registered.indexFunctions,
+        'user': lambda taskExecutor: taskExecutor.userID,
+        'task': lambda taskExecutor: taskExecutor.task.nameLabeled}
 
     def __init__(self):
         Registered.__init__(self)
-        self.keyMap: Dict[MapUnion, MapTuple] = {}
-        self.inCoolOffPeriod: Dict[str, Set[TaskExecutor]] = {}
+        self._indexes[COOL_OFF] = {}
+        self._snapshot.indexes[COOL_OFF] = {}
 
     def __setitem__(self, key, taskExecutor: TaskExecutor):
-        self._setitem(key=key, taskExecutor=taskExecutor)
+        self._setitem(key=key, component=taskExecutor)
 
     def __delitem__(self, key):
         self._delitem(key)
 
     def __contains__(self, taskExecutor: TaskExecutor) -> bool:
-        return self._contains(taskExecutor=taskExecutor)
+        return self._contains(taskExecutor)
 
     def __getitem__(self, key) -> TaskExecutor:
         return self._getitem(key)
 
-    def _setitem(self, key, taskExecutor):
-        self.lock.acquire()
-        componentID = taskExecutor.componentID
-        nameConsistent = taskExecutor.nameConsistent
-        task = taskExecutor.task
-        addr = taskExecutor.addr
-        self.dict.__setitem__(componentID, taskExecutor)
-        self.dict.__setitem__(nameConsistent, taskExecutor)
-        self.dict.__setitem__(task.token, taskExecutor)
-        self.dict.__setitem__(addr, taskExecutor)
-        t = (componentID, nameConsistent, task.token, addr)
-        self.keyMap[componentID] = t
-        self.keyMap[nameConsistent] = t
-        self.keyMap[task.token] = t
-        self.keyMap[addr] = t
-        self.lock.release()
-
-    def _getitem(self, key) -> TaskExecutor:
-        self.lock.acquire()
-        taskExecutor = self.dict[key]
-        self.lock.release()
-        return taskExecutor
-
-    def _delitem(self, key):
-        self.lock.acquire()
-        componentID, nameConsistent, taskToken, addr = self.keyMap[key]
-        try:
-            del self.dict[componentID]
-            del self.dict[nameConsistent]
-            del self.dict[taskToken]
-            del self.dict[addr]
-            del self.keyMap[componentID]
-            del self.keyMap[nameConsistent]
-            del self.keyMap[taskToken]
-            del self.keyMap[addr]
-        except KeyError:
-            pass
-        self.lock.release()
-
-    def _contains(self, taskExecutor: TaskExecutor) -> bool:
-        self.lock.acquire()
-        ret = False
-        if isinstance(taskExecutor, str):
-            if taskExecutor in self.dict:
-                ret = True
-            self.lock.release()
-            return ret
-        if not isinstance(taskExecutor, TaskExecutor):
-            self.lock.release()
-            return False
-        elif taskExecutor.componentID in self.dict:
-            ret = True
-        elif taskExecutor.nameConsistent in self.dict:
-            ret = True
-        elif taskExecutor.task.token in self.dict:
-            ret = True
-        elif taskExecutor.addr in self.dict:
-            ret = True
-        self.lock.release()
-        return ret
+    def keysOf(self, taskExecutor: TaskExecutor) -> Tuple:
+        return (
+            taskExecutor.componentID,
+            taskExecutor.nameConsistent,
+            taskExecutor.task.token,
+            taskExecutor.addr)
+
+    def _evicts(
+            self,
+            previous: TaskExecutor,
+            taskExecutor: TaskExecutor) -> bool:
+        # The task executor of a task migrated to another actor has the
+        # token of the task executor it replaces, which keeps running and
+        # registered until the new one is ready
+        return previous.addr == taskExecutor.addr \
+            or previous.userID != taskExecutor.userID \
+            or previous.task.token != taskExecutor.task.token
 
     def coolOff(self, taskExecutor: TaskExecutor):
-        if not self.__contains__(taskExecutor):
-            return
-        taskExecutor.lock.acquire()
-        taskExecutor.task.token = ''
-        taskExecutor.waiting = True
-        nameConsistent = taskExecutor.nameConsistent
-        if nameConsistent not in self.inCoolOffPeriod:
-            self.inCoolOffPeriod[taskExecutor.nameConsistent] = set()
-        self.inCoolOffPeriod[taskExecutor.nameConsistent].add(taskExecutor)
-        taskExecutor.lock.release()
-
-    def getFromCoolOff(self, nameConsistent: str):
-        if nameConsistent not in self.inCoolOffPeriod:
-            return
-        taskExecutor = self.inCoolOffPeriod[nameConsistent].pop()
-        return taskExecutor
+        """
+        Takes the task of the task executor back, so that it can be
+        reused by another user once it is waiting
+        """
+        with self._writeLock:
+            if taskExecutor not in self._keysOf:
+                return
+            self._unregister(taskExecutor)
+            taskExecutor.lock.acquire()
+            taskExecutor.task.token = ''
+            taskExecutor.waiting = True
+            taskExecutor.lock.release()
+            # Without the token of the task
+            self._register(
+                taskExecutor,
+                self._keysToRegister(taskExecutor),
+                self._indexValues(taskExecutor))
+            self._version += 1
+
+    def addCool(self, taskExecutor: TaskExecutor):
+        """
+        Makes the task executor, which is waiting, reusable
+        """
+        with self._writeLock:
+            if taskExecutor not in self._keysOf:
+                return
+            self._addToIndex(
+                COOL_OFF,
+                (taskExecutor.hostID, taskExecutor.task.nameLabeled),
+                taskExecutor)
+            self._version += 1
+
+    def hasCool(self, hostID: str, taskNameLabeled: str) -> bool:
+        with self._writeLock:
+            return (hostID, taskNameLabeled) in self._indexes[COOL_OFF]
+
+    def popCool(
+            self,
+            hostID: str,
+            taskNameLabeled: str) -> Union[TaskExecutor, None]:
+        """
+        :return: a task executor of the task on the host waiting to be
+        reused, None if there is none
+        """
+        with self._writeLock:
+            key = (hostID, taskNameLabeled)
+            if key not in self._indexes[COOL_OFF]:
+                return None
+            taskExecutor = next(iter(self._indexes[COOL_OFF][key]))
+            self._removeFromIndex(COOL_OFF, key, taskExecutor)
+            self._version += 1
+            return taskExecutor
+
+    def _unregister(self, taskExecutor: TaskExecutor):
+        Registered._unregister(self, taskExecutor)
+        self._removeFromIndex(
+            COOL_OFF,
+            (taskExecutor.hostID, taskExecutor.task.nameLabeled),
+            taskExecutor)
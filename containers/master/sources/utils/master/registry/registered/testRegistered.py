@@ -0,0 +1,186 @@
+import unittest
+from random import Random
+from threading import Event
+from threading import Thread
+from time import perf_counter
+from typing import List
+
+from .actors import RegisteredActors
+from .base import RegisteredSnapshot
+from .taskExecutors import RegisteredTaskExecutors
+from ..roles import Actor
+from ..roles import TaskExecutor
+from ..types import TaskLabeled
+
+domains = ('fogbus2', 'edge', 'cloud')
+
+
+def newActor(i: int) -> Actor:
+    return Actor(
+        addr=('10.0.%d.%d' % (i // 250, i % 250), 5000),
+        hostID='host%d' % i,
+        componentID=str(i),
+        nameConsistent='Actor_%d' % i,
+        domainName=domains[i % len(domains)])
+
+
+def newTaskExecutor(i: int, hostID: str = 'host0') -> TaskExecutor:
+    return TaskExecutor(
+        actorID='0',
+        userID=str(i % 10),
+        task=TaskLabeled(name='ObjectDetection', token='token%d' % i),
+        addr=('10.1.%d.%d' % (i // 250, i % 250), 6000),
+        hostID=hostID,
+        componentID=str(i),
+        nameConsistent='TaskExecutor_%d' % i)
+
+
+def assertConsistent(test: unittest.TestCase, snapshot: RegisteredSnapshot):
+    # Every component is in exactly one set of each index
+    for index, byValue in snapshot.indexes.items():
+        if index == 'coolOff':
+            continue
+        indexed = [c for components in byValue.values() for c in components]
+        test.assertEqual(len(indexed), len(snapshot))
+        test.assertEqual(set(indexed), set(snapshot.items))
+
+
+class RegisteredTest(unittest.TestCase):
+
+    def testComponentsAreFoundByAnyKey(self):
+        actors = RegisteredActors()
+        actor = newActor(1)
+        actors[actor] = actor
+        for key in ('host1', '1', 'Actor_1'):
+            self.assertIs(actors[key], actor)
+            self.assertIn(key, actors)
+        self.assertIn(actor, actors)
+        self.assertEqual(actors.filter_by_domain('edge'), [actor])
+        self.assertEqual(actors.snapshot().find('hostID', 'host1'), {actor})
+        del actors['Actor_1']
+        self.assertNotIn('host1', actors)
+        self.assertNotIn(actor, actors)
+        self.assertEqual(len(actors), 0)
+        self.assertEqual(actors.filter_by_domain('edge'), [])
+        with self.assertRaises(KeyError):
+            _ = actors['1']
+        # Deleting what is not registered does nothing
+        del actors['1']
+
+    def testSameAddrReplacesComponent(self):
+        taskExecutors = RegisteredTaskExecutors()
+        old = newTaskExecutor(1)
+        taskExecutors[old] = old
+        new = newTaskExecutor(2)
+        new.addr = old.addr
+        taskExecutors[new] = new
+        self.assertNotIn('1', taskExecutors)
+        self.assertNotIn('token1', taskExecutors)
+        self.assertIs(taskExecutors[old.addr], new)
+        self.assertEqual(taskExecutors.copyAll(), [new])
+
+    def testSnapshotDoesNotChange(self):
+        actors = RegisteredActors()
+        for i in range(6):
+            actors[newActor(i)] = newActor(i)
+        snapshot = actors.snapshot()
+        self.assertIs(actors.snapshot(), snapshot)
+        del actors['host0']
+        actors[newActor(6)] = newActor(6)
+        self.assertEqual(len(snapshot), 6)
+        self.assertEqual(len(snapshot.find('domain', 'fogbus2')), 2)
+        latest = actors.snapshot()
+        self.assertEqual(
+            {actor.hostID for actor in latest},
+            {'host%d' % i for i in range(1, 7)})
+        assertConsistent(self, latest)
+
+    def testCoolOff(self):
+        taskExecutors = RegisteredTaskExecutors()
+        taskExecutor = newTaskExecutor(1)
+        taskExecutors[taskExecutor] = taskExecutor
+        taskExecutors.coolOff(taskExecutor)
+        # The token may be given to another task executor
+        self.assertNotIn('token1', taskExecutors)
+        self.assertIn('1', taskExecutors)
+        self.assertFalse(taskExecutors.hasCool('host0', 'ObjectDetection'))
+        taskExecutors.addCool(taskExecutor)
+        self.assertEqual(
+            taskExecutors.snapshot().find(
+                'coolOff', ('host0', 'ObjectDetection')),
+            {taskExecutor})
+        self.assertIs(
+            taskExecutors.popCool('host0', 'ObjectDetection'), taskExecutor)
+        self.assertIsNone(taskExecutors.popCool('host0', 'ObjectDetection'))
+        # Deregistered ones are not reused
+        taskExecutors.addCool(taskExecutor)
+        del taskExecutors['1']
+        self.assertFalse(taskExecutors.hasCool('host0', 'ObjectDetection'))
+
+    def testConcurrentRegistrationAndLookup(self):
+        actors = RegisteredActors()
+        count = 2000
+        # Half of them stay registered all along
+        for i in range(0, count, 2):
+            actors[newActor(i)] = newActor(i)
+        done = Event()
+        errors: List[BaseException] = []
+        lookupTimes: List[float] = []
+
+        def churn(start: int):
+            # Registers and deregisters the others over and over
+            try:
+                for _ in range(5):
+                    for i in range(start, count, 8):
+                        actor = newActor(i)
+                        actors[actor] = actor
+                    for i in range(start, count, 8):
+                        del actors['host%d' % i]
+            except BaseException as e:
+                errors.append(e)
+
+        def lookUp(seed: int):
+            random = Random(seed)
+            try:
+                while not done.is_set():
+                    i = random.randrange(0, count, 2)
+                    startTime = perf_counter()
+                    actor = actors['host%d' % i]
+                    lookupTimes.append(perf_counter() - startTime)
+                    self.assertEqual(actor.componentID, str(i))
+            except BaseException as e:
+                errors.append(e)
+
+        def takeSnapshots():
+            try:
+                while not done.is_set():
+                    assertConsistent(self, actors.snapshot())
+            except BaseException as e:
+                errors.append(e)
+
+        writers = [Thread(target=churn, args=(start,))
+                   for start in range(1, 8, 2)]
+        readers = [Thread(target=lookUp, args=(seed,)) for seed in range(4)]
+        readers.append(Thread(target=takeSnapshots))
+        for thread in writers + readers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(actors), count // 2)
+        snapshot = actors.snapshot()
+        assertConsistent(self, snapshot)
+        self.assertEqual(
+            {actor.hostID for actor in snapshot},
+            {'host%d' % i for i in range(0, count, 2)})
+        lookupTimes.sort()
+        self.assertGreater(len(lookupTimes), 0)
+        # Generous, lookups do not wait for registrations
+        self.assertLess(lookupTimes[int(.99 * len(lookupTimes))], .01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,9 @@ UserKey = Union[User, str]
 
 
 class RegisteredUsers(Registered):
-    pass
+    indexFunctions = {
+        **Registered.indexFunctions,
+        'application': lambda user: user.application.name}
 
     def __setitem__(self, key, user: User):
         return self._setitem(key=key, component=user)
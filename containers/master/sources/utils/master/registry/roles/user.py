@@ -47,6 +47,8 @@ class User(Component):
             self.taskNameToExecutor: Dict[str, TaskExecutor] = {}
 
         self.unclaimedTasks: Dict[Tuple[str, str, str], List[str]] = {}
+        # Where each task is placed now, which may change after a migration
+        self.taskNameToHostID: Dict[str, str] = {}
         self.lock: Lock = Lock()
         self.isReady = False
 
@@ -65,6 +67,26 @@ class User(Component):
         compactedKey = (actor.hostID, taskNameLabeled, taskToken)
         self.lock.acquire()
         self.unclaimedTasks[compactedKey] = childrenTaskTokens
+        self.taskNameToHostID[taskNameLabeled] = actor.hostID
+        self.lock.release()
+
+    def moveTask(
+            self,
+            actor: Actor,
+            taskNameLabeled: str,
+            taskToken: str,
+            childrenTaskTokens: List[str]):
+        """
+        Places a task on another actor. A task executor started for the
+        previous placement can no longer claim the task
+        """
+        self.lock.acquire()
+        previousHostID = self.taskNameToHostID.get(taskNameLabeled)
+        self.unclaimedTasks.pop(
+            (previousHostID, taskNameLabeled, taskToken), None)
+        self.unclaimedTasks[actor.hostID, taskNameLabeled, taskToken] = \
+            childrenTaskTokens
+        self.taskNameToHostID[taskNameLabeled] = actor.hostID
         self.lock.release()
 
     def claimTask(self, hostID: str, taskNameLabeled: str, taskToken: str) \
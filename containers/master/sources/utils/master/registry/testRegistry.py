@@ -0,0 +1,237 @@
+import logging
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from typing import List
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from .base import Registry
+from .roles import Actor
+from .roles import Master
+from .roles import TaskExecutor
+from .roles import User
+from ..application.base import Application
+from ..application.task.base import Task
+from ..application.task.dependency.base import TaskWithDependency
+from ..logger.allSystemPerformance import AllSystemPerformance
+from ..messageHandler.acknowledgementHandler import AcknowledgementHandler
+from ..messageHandler.dataHandler import DataHandler
+from ..scheduler.types import Decision
+from ...connection import MessageReceived
+from ...types import Component
+from ...types import ComponentRole
+from ...types import MessageSubSubType
+from ...types import MessageSubType
+from ...types import MessageType
+
+
+class BasicComponentStandIn:
+
+    def __init__(self, keyFile: str):
+        self.me = Master(addr=('127.0.0.1', 5001), hostID='master')
+        self.debugLogger = logging.getLogger('RegistryTest')
+        self.nameLogPrinting = 'Master'
+        self.key_file = keyFile
+        self.sent = []
+
+    def sendMessage(
+            self,
+            messageToSend=None,
+            messageType: MessageType = None,
+            messageSubType: MessageSubType = None,
+            data: dict = None,
+            destination: Component = None,
+            **kwargs):
+        if messageToSend is not None:
+            messageType = messageToSend.type
+            messageSubType = messageToSend.subType
+            data = messageToSend.data
+            destination = messageToSend.destination
+        self.sent.append((destination, messageType, messageSubType, data))
+
+
+class SchedulerStandIn:
+    name = 'StandIn'
+
+
+class RegistryStandIn(Registry):
+
+    def decisionHandlerThreadPool(self):
+        # Decisions are placed by the test
+        pass
+
+
+def chainApplication() -> Application:
+    """
+    Detect sends to Track, which sends to the Actuator
+    """
+    detect = TaskWithDependency('Detect')
+    track = TaskWithDependency('Track')
+    detect.children.add(Task('Track'))
+    track.parents.add(Task('Detect'))
+    track.children.add(Task('Actuator'))
+    return Application(
+        name='Chain',
+        tasksWithDependency={'Detect': detect, 'Track': track},
+        entryTasks=[detect],
+        label='480')
+
+
+class RegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        keyFile = os.path.join(self.directory.name, 'key.pem')
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        with open(keyFile, 'wb') as file:
+            file.write(key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()))
+        self.basicComponent = BasicComponentStandIn(keyFile)
+        self.registry = RegistryStandIn(
+            basicComponent=self.basicComponent,
+            applicationManager=None,
+            scheduler=SchedulerStandIn(),
+            systemPerformance=AllSystemPerformance(),
+            profiler=None,
+            container_name='')
+        self.acknowledgementHandler = AcknowledgementHandler(
+            registry=self.registry,
+            basicComponent=self.basicComponent)
+        self.dataHandler = DataHandler(
+            basicComponent=self.basicComponent,
+            registry=self.registry)
+        registeredManager = self.registry.registeredManager
+        for i in range(3):
+            actor = Actor(
+                addr=('10.0.0.%d' % i, 50000),
+                hostID='actor%d' % i,
+                componentID=str(i),
+                domainName='edge')
+            registeredManager.actors[actor] = actor
+        self.user = User(
+            application=chainApplication(),
+            addr=('10.0.1.1', 40000),
+            componentID='1',
+            hostID='user1',
+            domainName='edge')
+        registeredManager.users[self.user] = self.user
+        self.executorPort = 60000
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def sentOf(
+            self,
+            messageType: MessageType,
+            messageSubType: MessageSubType) -> List:
+        sent = [
+            (destination, data)
+            for destination, type_, subType, data in self.basicComponent.sent
+            if type_ is messageType and subType is messageSubType]
+        return sent
+
+    def decision(self, hostIDs: List[str]) -> Decision:
+        return Decision(
+            user=self.user,
+            indexSequence=[0] * len(hostIDs),
+            indexToHostID=hostIDs,
+            schedulingTime=0)
+
+    def runTaskExecutors(self) -> List[TaskExecutor]:
+        """
+        Registers a task executor for each one the actors were asked to run
+        """
+        registeredManager = self.registry.registeredManager
+        taskExecutors = []
+        for actor, data in self.sentOf(
+                MessageType.PLACEMENT, MessageSubType.RUN_TASK_EXECUTOR):
+            self.executorPort += 1
+            taskName = data['taskName']
+            message = MessageReceived(
+                messageType=MessageType.REGISTRATION,
+                messageSubType=MessageSubType.REGISTER,
+                messageSubSubType=MessageSubSubType.NONE,
+                data={
+                    'userID': data['userID'],
+                    'actorID': data['actorID'],
+                    'taskName': taskName[:taskName.find('-')],
+                    'taskToken': data['taskToken']},
+                source=Component(
+                    role=ComponentRole.TASK_EXECUTOR,
+                    addr=(actor.addr[0], self.executorPort)))
+            self.registry.registerTaskExecutor(message)
+            taskExecutors.append(registeredManager.taskExecutors[
+                (actor.addr[0], self.executorPort)])
+        self.basicComponent.sent.clear()
+        return taskExecutors
+
+    def ready(self, taskExecutor: TaskExecutor):
+        self.acknowledgementHandler.handleReady(MessageReceived(
+            messageType=MessageType.ACKNOWLEDGEMENT,
+            messageSubType=MessageSubType.READY,
+            messageSubSubType=MessageSubSubType.NONE,
+            data={},
+            source=taskExecutor))
+
+    def testMigrate(self):
+        taskExecutors = self.registry.registeredManager.taskExecutors
+        previous = self.decision(['actor0', 'actor1'])
+        self.registry.place(previous)
+        detect, track = self.runTaskExecutors()
+        self.assertEqual(detect.hostID, 'actor0')
+        self.assertEqual(track.hostID, 'actor1')
+        self.ready(detect)
+        self.ready(track)
+        self.assertTrue(self.user.isReady)
+        self.basicComponent.sent.clear()
+
+        self.registry.migrate(previous, self.decision(['actor0', 'actor2']))
+        runs = self.sentOf(
+            MessageType.PLACEMENT, MessageSubType.RUN_TASK_EXECUTOR)
+        self.assertEqual(
+            [(actor.hostID, data['taskToken']) for actor, data in runs],
+            [('actor2', track.task.token)])
+        movedTrack, = self.runTaskExecutors()
+        # The one replaced keeps running and receiving until it is ready
+        self.assertIn(track.componentID, taskExecutors)
+        self.assertIs(taskExecutors[track.addr], track)
+        self.assertIs(taskExecutors[track.task.token], movedTrack)
+        self.dataHandler.handleResult(MessageReceived(
+            messageType=MessageType.DATA,
+            messageSubType=MessageSubType.FINAL_RESULT,
+            messageSubSubType=MessageSubSubType.NONE,
+            data={'frame': 1},
+            source=track))
+        self.assertEqual(
+            self.sentOf(MessageType.DATA, MessageSubType.FINAL_RESULT),
+            [(self.user, {'frame': 1})])
+        self.basicComponent.sent.clear()
+
+        self.ready(movedTrack)
+        self.assertEqual(
+            self.sentOf(MessageType.PLACEMENT, MessageSubType.LOOKUP),
+            [(detect, {
+                'taskExecutorAddr': list(movedTrack.addr),
+                'taskToken': track.task.token})])
+        stopped = self.sentOf(MessageType.TERMINATION, MessageSubType.STOP)
+        self.assertEqual(len(stopped), 1)
+        self.assertIs(stopped[0][0], track)
+        self.assertEqual(stopped[0][1]['reason'], 'Migrated')
+        self.assertNotIn(track.componentID, taskExecutors)
+        self.assertNotIn(track.addr, taskExecutors)
+        self.assertIn(detect.componentID, taskExecutors)
+        self.assertIs(
+            self.user.taskNameToExecutor[track.task.nameLabeled], movedTrack)
+        # Not announced to the user twice
+        self.assertEqual(
+            self.sentOf(
+                MessageType.ACKNOWLEDGEMENT, MessageSubType.SERVICE_READY),
+            [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Places a trace of users with OHNSGA, blocking until the genetic algorithm
+finishes and anytime, where the users are placed with the greedy heuristic
+at once and migrated when the genetic algorithm finds a better placement.
+
+Run from the sources folder of the Master:
+    python -m utils.master.scheduler.anytimeBenchmark
+
+Reports the time to placement, after which the user can start streaming,
+and the estimated response time of the placement the user ends up with.
+"""
+import argparse
+import os
+from random import Random
+from tempfile import TemporaryDirectory
+from threading import Lock
+from time import sleep
+from time import time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from .estimator import MatrixEstimator
+from .placementCache import PlacementCache
+from .placementCacheBenchmark import BasicComponentStandIn
+from .placementCacheBenchmark import application
+from .placementCacheBenchmark import cluster
+from .placementCacheBenchmark import percentile
+from .policies.nsga.ohnsga import OHNSGA
+from .types import Decision
+from ..registry.roles import User
+
+
+def replay(
+        scheduler: OHNSGA,
+        registrations: int,
+        actorNum: int,
+        seed: int) -> Tuple[List[float], List[float], int]:
+    """
+    :return: the time to placement and the estimated cost of the final
+    placement of each registration, and how many were migrated
+    """
+    random = Random(seed)
+    master, actors, systemPerformance = cluster(actorNum, random)
+    applications = [
+        application('Detection', 4),
+        application('Tracking', 6),
+        application('Analytics', 8)]
+    finalDecisions: Dict[User, Decision] = {}
+    migrated = 0
+    lock = Lock()
+
+    def migrate(previous: Decision, refined: Decision):
+        nonlocal migrated
+        with lock:
+            finalDecisions[previous.user] = refined
+            migrated += 1
+
+    scheduler.handleRefinedDecision = migrate
+    times = []
+    for i in range(registrations):
+        user = User(
+            application=random.choice(applications).copy(withLabel=str(i)),
+            componentID=str(i),
+            hostID='user%d' % i,
+            domainName='edge')
+        startTime = time()
+        decision = scheduler._schedule(
+            user=user,
+            master=master,
+            allActors=actors,
+            systemPerformance=systemPerformance,
+            isContainerMode=False)
+        times.append(time() - startTime)
+        with lock:
+            finalDecisions.setdefault(user, decision)
+    # The runs in the background
+    while scheduler.readWaitingCount():
+        sleep(.1)
+    costs = []
+    for user, decision in finalDecisions.items():
+        estimator = MatrixEstimator(
+            user=user,
+            master=master,
+            allActors=actors,
+            systemPerformance=systemPerformance,
+            isContainerMode=False)
+        indexSequence = estimator.mapHostIDSequenceToIndexSequence(
+            decision.hostIDSequence())
+        costs.append(estimator.estimateCost(indexSequence + [0, 0]))
+    return times, costs, migrated
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Anytime scheduling benchmark')
+    parser.add_argument('--registrations', type=int, default=20)
+    parser.add_argument('--actors', type=int, default=10)
+    parser.add_argument('--populationSize', type=int, default=100)
+    parser.add_argument('--generationNum', type=int, default=50)
+    parser.add_argument('--migrationCost', type=float, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    for name, anytime in (('blocking', False), ('anytime', True)):
+        scheduler = OHNSGA(
+            knownMasters=set(),
+            minimumActors=1,
+            generationNum=args.generationNum,
+            populationSize=args.populationSize,
+            basicComponent=BasicComponentStandIn(),
+            estimationThreadNum=1,
+            isContainerMode=False)
+        # Every user is optimized
+        scheduler.placementCache = PlacementCache(maxEntriesPerKey=0)
+        scheduler.anytime = anytime
+        scheduler.migrationCost = args.migrationCost
+        sources = os.getcwd()
+        # OHNSGA writes record.json in the working directory
+        with TemporaryDirectory() as workingDirectory:
+            os.chdir(workingDirectory)
+            try:
+                times, costs, migrated = replay(
+                    scheduler=scheduler,
+                    registrations=args.registrations,
+                    actorNum=args.actors,
+                    seed=args.seed)
+            finally:
+                os.chdir(sources)
+        scheduler.evaluationPool.shutdown()
+        print('%-8s time to placement p50 %7.1f ms, p99 %7.1f ms, '
+              'estimated response time mean %7.1f ms, p99 %7.1f ms, '
+              'migrated %2d' % (
+                  name, percentile(times, .5) * 1000,
+                  percentile(times, .99) * 1000, sum(costs) / len(costs),
+                  percentile(costs, .99), migrated))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 from abc import abstractmethod
 from queue import Queue
 from threading import Lock
+from typing import Callable
+from typing import List
 from typing import Union
 
 from .baseScaler.base import Scaler
@@ -29,6 +31,11 @@ class BaseScheduler:
         self._waitingCountLock = Lock()
         self._waitingCount = 0
         self.scaler: Scaler = None
+        # Called with the decision a user was placed with and a better one
+        # found after, by the schedulers that keep optimizing in the
+        # background
+        self.handleRefinedDecision: Callable[[Decision, Decision], None] = \
+            None
 
     @staticmethod
     def filter_actor(
@@ -51,25 +58,54 @@ class BaseScheduler:
             decisionsQueue: Queue[Decision],
             *args,
             **kwargs) -> bool:
-        allActors = registeredManager.actors.filter_by_domain(user.domainName)
+        scheduledUsers = self.scheduleUsers(
+            users=[user],
+            registeredManager=registeredManager,
+            resources=resources,
+            systemPerformance=systemPerformance,
+            basicComponent=basicComponent,
+            decisionsQueue=decisionsQueue,
+            *args,
+            **kwargs)
+        return len(scheduledUsers) > 0
+
+    def scheduleUsers(
+            self,
+            users: List[User],
+            registeredManager: RegisteredManager,
+            resources: Resources,
+            systemPerformance: AllSystemPerformance,
+            basicComponent: BasicComponent,
+            decisionsQueue: Queue[Decision],
+            *args,
+            **kwargs) -> List[User]:
+        """
+        Schedules users of the same application and domain in one run. The
+        placement is optimized for the first user and given to all of them
+
+        :return: the users scheduled
+        """
+        domainName = users[0].domainName
+        allActors = registeredManager.actors.filter_by_domain(domainName)
         allActors = allActors.copy()
         from pprint import pformat
         basicComponent.debugLogger.debug(pformat(allActors))
         if not len(allActors):
             basicComponent.debugLogger.warning(
-                'No %s to schedule in domain %s', ComponentRole.ACTOR.value, user.domainName)
-            basicComponent.sendMessage(
-                messageType=MessageType.ACKNOWLEDGEMENT,
-                messageSubType=MessageSubType.NO_ACTOR,
-                data={'domainName': user.domainName},
-                destination=user)
-            basicComponent.debugLogger.debug(
-                'Warn %s there is no %s: %s in %s',
-                ComponentRole.USER.value,
-                ComponentRole.ACTOR.value,
-                user.nameLogPrinting,
-                user.domainName)
-            return False
+                'No %s to schedule in domain %s', ComponentRole.ACTOR.value, domainName)
+            for user in users:
+                basicComponent.sendMessage(
+                    messageType=MessageType.ACKNOWLEDGEMENT,
+                    messageSubType=MessageSubType.NO_ACTOR,
+                    data={'domainName': domainName},
+                    destination=user)
+                basicComponent.debugLogger.debug(
+                    'Warn %s there is no %s: %s in %s',
+                    ComponentRole.USER.value,
+                    ComponentRole.ACTOR.value,
+                    user.nameLogPrinting,
+                    domainName)
+            return []
 
         # TODO: Uncomment this
         # if resources.cpu.utilization > .8:
@@ -94,27 +130,28 @@ class BaseScheduler:
         #         return False
 
         decision = self._schedule(
-            user=user,
+            user=users[0],
             master=basicComponent.me,
             allActors=allActors,
             systemPerformance=systemPerformance,
             isContainerMode=self.isContainerMode,
             *args,
             **kwargs)
-        decisionsQueue.put(decision)
-        data = {
-            'userID': user.componentID,
-            'name': user.name,
-            'nameLogPrinting': user.nameLogPrinting,
-            'nameConsistent': user.nameConsistent}
-
-        basicComponent.sendMessage(
-            messageType=MessageType.REGISTRATION,
-            messageSubType=MessageSubType.REGISTERED,
-            data=data,
-            destination=user)
-        basicComponent.debugLogger.debug('Registered: %s', user.nameLogPrinting)
-        return True
+        for user in users:
+            decisionsQueue.put(decision.forUser(user))
+            data = {
+                'userID': user.componentID,
+                'name': user.name,
+                'nameLogPrinting': user.nameLogPrinting,
+                'nameConsistent': user.nameConsistent}
+
+            basicComponent.sendMessage(
+                messageType=MessageType.REGISTRATION,
+                messageSubType=MessageSubType.REGISTERED,
+                data=data,
+                destination=user)
+            basicComponent.debugLogger.debug('Registered: %s', user.nameLogPrinting)
+        return users
 
     @abstractmethod
     def _schedule(self,
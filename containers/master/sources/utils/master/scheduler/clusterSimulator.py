@@ -0,0 +1,334 @@
+"""
+A synthetic cluster to drive any scheduler with, in process: actors with
+different CPUs spread over a few regions, the latencies, data rates and
+packet sizes between the hosts, and applications of a few shapes.
+
+The users of an application are profiled as a Master would have profiled
+them, so that the estimated processing time of a task depends on the CPU
+of the actor it is placed on.
+"""
+import logging
+from argparse import Namespace
+from math import hypot
+from queue import Queue
+from random import Random
+from time import time
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from .base import BaseScheduler
+from .estimator import MatrixEstimator
+from .placementCache import PlacementCache
+from .placementCacheBenchmark import application as chainApplication
+from .tools.initSchedulerByName import initSchedulerByName
+from .types import Decision
+from ..application.base import Application
+from ..application.task.base import Task
+from ..application.task.dependency.base import TaskWithDependency
+from ..logger.allSystemPerformance import AllSystemPerformance
+from ..registry.registered import RegisteredManager
+from ..registry.roles import Actor
+from ..registry.roles import Master
+from ..registry.roles import User
+from ..registry.roles.nameFactory import NameFactory
+from ...types import ActorResources
+from ...types import CPU
+from ...types import Memory
+from ...types.hostProfiles.processingTime import ProcessingTime
+from ...types.hostProfiles.resources import Resources
+
+# The CPU the processing times are profiled on
+referenceCPU = CPU(cores=4, frequency=2400)
+
+
+class SimulatedBasicComponent:
+    """
+    What the schedulers use of the BasicComponent of the Master
+    """
+
+    def __init__(self, master: Master):
+        self.me = master
+        self.debugLogger = logging.getLogger('ClusterSimulator')
+        self.sent = 0
+
+    def sendMessage(self, **kwargs):
+        self.sent += 1
+
+
+def objectDetection(taskNum: int) -> Application:
+    """
+    As registered by the Master, parallel detections on the frames
+    """
+    tasks = {}
+    for i in range(taskNum):
+        taskName = 'ObjectDetectionYolov7#%d' % i
+        tasks[taskName] = TaskWithDependency(taskName)
+    return Application(
+        name='ObjectDetection%dTasks' % taskNum,
+        tasksWithDependency=tasks,
+        entryTasks=list(tasks.values()))
+
+
+def trafficLightStatus() -> Application:
+    """
+    As registered by the Master, one task
+    """
+    task = TaskWithDependency('TrafficLightStatus')
+    return Application(
+        name='TrafficLightStatus',
+        tasksWithDependency={task.name: task},
+        entryTasks=[task])
+
+
+def randomDAG(taskNum: int, random: Random) -> Application:
+    """
+    Each task depends on one or two of the tasks before it. The tasks
+    nothing depends on send to the Actuator
+    """
+    taskNames = ['Task%d' % i for i in range(taskNum)]
+    tasks = {taskName: TaskWithDependency(taskName) for taskName in taskNames}
+    for i, taskName in enumerate(taskNames[1:], start=1):
+        parentNum = min(i, random.randint(1, 2))
+        parentNames = random.sample(taskNames[:i], parentNum)
+        for parentName in parentNames:
+            tasks[parentName].children.add(Task(taskName))
+            tasks[taskName].parents.add(Task(parentName))
+    for task in tasks.values():
+        if not len(task.children):
+            task.children.add(Task('Actuator'))
+    return Application(
+        name='DAG%dTasks' % taskNum,
+        tasksWithDependency=tasks,
+        entryTasks=[task for task in tasks.values() if not len(task.parents)])
+
+
+def application(shape: str, taskNum: int, random: Random) -> Application:
+    """
+    :param shape: one of applicationShapes
+    :param taskNum: how many tasks, but for TrafficLightStatus
+    """
+    if shape == 'ObjectDetection':
+        return objectDetection(taskNum)
+    if shape == 'TrafficLightStatus':
+        return trafficLightStatus()
+    if shape == 'Chain':
+        return chainApplication('Chain', taskNum)
+    if shape == 'DAG':
+        return randomDAG(taskNum, random)
+    raise Exception('Unknown application shape: %s' % shape)
+
+
+applicationShapes = ('ObjectDetection', 'TrafficLightStatus', 'Chain', 'DAG')
+
+
+class SimulatedCluster:
+    """
+    The Master and hostNum actors, in regionNum regions on a plane. The
+    latency between two hosts grows with the distance between them, and the
+    data rate is higher within a region than across regions
+    """
+
+    def __init__(
+            self,
+            hostNum: int,
+            seed: int = 0,
+            regionNum: int = 4,
+            domainName: str = 'edge'):
+        self.random = Random(seed)
+        self.domainName = domainName
+        self.master = Master(addr=('10.0.0.1', 5001), hostID='master')
+        self.actors = [self.newActor(i) for i in range(hostNum)]
+        self.registeredManager = RegisteredManager()
+        for actor in self.actors:
+            self.registeredManager.actors[actor] = actor
+        centres = [
+            (self.random.random(), self.random.random())
+            for _ in range(regionNum)]
+        hostIDs = [self.master.hostID] + [a.hostID for a in self.actors]
+        regions = [self.random.randrange(regionNum) for _ in hostIDs]
+        positions = [
+            (centres[region][0] + self.random.gauss(0, .05),
+             centres[region][1] + self.random.gauss(0, .05))
+            for region in regions]
+        latency = {}
+        dataRate = {}
+        packetSize = {}
+        for i, source in enumerate(hostIDs):
+            latency[source] = {}
+            dataRate[source] = {}
+            packetSize[source] = {}
+            for j, dest in enumerate(hostIDs):
+                distance = hypot(
+                    positions[i][0] - positions[j][0],
+                    positions[i][1] - positions[j][1])
+                latency[source][dest] = \
+                    1 + 100 * distance + self.random.expovariate(1)
+                if regions[i] == regions[j]:
+                    dataRate[source][dest] = self.random.uniform(5e7, 1e8)
+                else:
+                    dataRate[source][dest] = self.random.uniform(1e6, 2e7)
+                packetSize[source][dest] = self.random.randint(1e3, 1e5)
+        self.systemPerformance = AllSystemPerformance(
+            latency=latency,
+            dataRate=dataRate,
+            packetSize=packetSize)
+        self.basicComponent = SimulatedBasicComponent(self.master)
+        self.userNum = 0
+
+    def newActor(self, i: int) -> Actor:
+        return Actor(
+            addr=(
+                '10.%d.%d.%d' % (1 + (i >> 16), (i >> 8) & 255, i & 255),
+                50000),
+            hostID='actor%d' % i,
+            componentID=str(i),
+            domainName=self.domainName,
+            actorResources=ActorResources(
+                cpu=CPU(
+                    cores=self.random.choice((1, 2, 4, 8, 16)),
+                    frequency=self.random.choice((1500, 2400, 3000))),
+                memory=Memory(
+                    maximum=self.random.choice((2, 4, 8, 16)) * 1024)))
+
+    def newUser(self, application: Application, label: str = None) -> User:
+        """
+        :param label: the label the user registers with, by default one of
+        its own, so that it is placed apart from the other users
+        :return: a user of the application, with the processing time of
+        each of its tasks profiled on referenceCPU
+        """
+        self.userNum += 1
+        if label is None:
+            label = str(self.userNum)
+        user = User(
+            application=application.copy(withLabel=label),
+            componentID=str(self.userNum),
+            hostID='user%d' % self.userNum,
+            domainName=self.domainName)
+        for taskName in application.tasksWithDependency:
+            if taskName in {'Sensor', 'Actuator'}:
+                continue
+            if taskName.startswith('ObjectDetectionYolov7'):
+                workload = self.random.uniform(200, 400)
+            else:
+                workload = self.random.uniform(5, 100)
+            name = NameFactory.taskExecutorName(Task(taskName), user)
+            self.systemPerformance.processingTime[name] = ProcessingTime(
+                taskExecutorName=name,
+                processingTime=workload,
+                resources=Resources(cpu=referenceCPU))
+        return user
+
+    def placementCost(self, user: User, hostIDSequence: List[str]) -> float:
+        """
+        :return: the estimated response time of the placement, whichever
+        scheduler made it
+        """
+        estimator = MatrixEstimator(
+            user=user,
+            master=self.master,
+            allActors=self.actors,
+            systemPerformance=self.systemPerformance,
+            isContainerMode=False)
+        indexSequence = estimator.mapHostIDSequenceToIndexSequence(
+            hostIDSequence)
+        return float(estimator.estimateCost(indexSequence + [0, 0]))
+
+    def schedule(self, scheduler: BaseScheduler, user: User) \
+            -> Tuple[Decision, float]:
+        """
+        Places the user as the Master does
+
+        :return: the decision and the seconds it took
+        """
+        decisionsQueue: Queue[Decision] = Queue()
+        startTime = time()
+        scheduled = scheduler.schedule(
+            user=user,
+            registeredManager=self.registeredManager,
+            resources=None,
+            systemPerformance=self.systemPerformance,
+            basicComponent=self.basicComponent,
+            decisionsQueue=decisionsQueue)
+        wallTime = time() - startTime
+        if not scheduled:
+            raise Exception('%s did not place %s' % (
+                scheduler.name, user.application.nameWithLabel))
+        return decisionsQueue.get(), wallTime
+
+
+def createScheduler(
+        cluster: SimulatedCluster,
+        schedulerName: str,
+        populationSize: int = 100,
+        generationNum: int = 100,
+        maxTime: float = None,
+        placementCache: bool = True,
+        parsedArgs: Namespace = None) -> BaseScheduler:
+    """
+    :param maxTime: seconds a run of the genetic algorithms may take, None
+    to keep the default
+    :param placementCache: whether the placements are cached, so that the
+    users of an application placed before are not optimized again
+    :param parsedArgs: the options of the Master the scheduler reads
+    """
+    scheduler = initSchedulerByName(
+        knownMasters=set(),
+        minimumActors=1,
+        schedulerName=schedulerName,
+        basicComponent=cluster.basicComponent,
+        isContainerMode=False,
+        parsedArgs=parsedArgs,
+        populationSize=populationSize,
+        generationNum=generationNum)
+    if scheduler is None:
+        raise Exception('Unknown scheduler: %s' % schedulerName)
+    if maxTime is not None and hasattr(scheduler, 'maxTime'):
+        scheduler.maxTime = maxTime
+    if not placementCache and hasattr(scheduler, 'placementCache'):
+        # Keeps nothing, so that every lookup misses
+        scheduler.placementCache = PlacementCache(maxEntriesPerKey=0)
+    return scheduler
+
+
+def closeScheduler(scheduler: BaseScheduler):
+    if hasattr(scheduler, 'evaluationPool'):
+        scheduler.evaluationPool.shutdown()
+    if hasattr(scheduler, 'decisionHistory'):
+        scheduler.decisionHistory.close()
+
+
+def simulate(
+        scheduler: BaseScheduler,
+        cluster: SimulatedCluster,
+        applicationFactory: Callable[[], Application],
+        userNum: int = 1,
+        label: str = None) -> List[Dict]:
+    """
+    Places userNum users, one after the other
+
+    :param label: the label all the users register with, None for a label
+    of their own
+
+    :return: for each user, the estimated response time of its placement
+    in ms, the seconds it took and the evaluations the scheduler made
+    """
+    results = []
+    for _ in range(userNum):
+        user = cluster.newUser(applicationFactory(), label=label)
+        evaluated = 0
+        if hasattr(scheduler, 'evaluationPool'):
+            evaluated = scheduler.evaluationPool.stats()['evaluated']
+        decision, wallTime = cluster.schedule(scheduler, user)
+        if hasattr(scheduler, 'evaluationPool'):
+            evaluated = scheduler.evaluationPool.stats()['evaluated'] \
+                        - evaluated
+        hostIDSequence = decision.hostIDSequence()
+        results.append({
+            'cost': cluster.placementCost(user, hostIDSequence),
+            'wallTime': wallTime,
+            'evaluated': evaluated,
+            'hostIDSequence': list(hostIDSequence)})
+    return results
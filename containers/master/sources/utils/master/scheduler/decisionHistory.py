@@ -0,0 +1,336 @@
+import json
+import os
+from collections import OrderedDict
+from collections import deque
+from threading import Lock
+from threading import Thread
+from time import time
+from traceback import print_exc
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import TextIO
+from typing import Union
+
+from .types import Decision
+
+
+class PastDecision:
+
+    def __init__(
+            self,
+            key: str,
+            hostIDSequence: List[str],
+            indexSequence: List[int],
+            cost: float,
+            schedulingTime: float,
+            timestamp: float):
+        self.key = key
+        self.hostIDSequence = hostIDSequence
+        self.indexSequence = indexSequence
+        self.cost = cost
+        self.schedulingTime = schedulingTime
+        self.timestamp = timestamp
+
+    @staticmethod
+    def fromDecision(key: str, decision: Decision) -> 'PastDecision':
+        return PastDecision(
+            key=key,
+            hostIDSequence=list(decision.hostIDSequence()),
+            indexSequence=[int(i) for i in decision.indexSequence],
+            cost=float(decision.cost),
+            schedulingTime=float(decision.schedulingTime),
+            timestamp=time())
+
+
+class Segment:
+    """
+    A log file of decisions, one JSON value per line. A string line adds
+    to the strings of the segment, which the decisions refer to by index,
+    so that host IDs and keys are written once per segment
+    """
+
+    def __init__(self, filename: str, mode: str = 'a'):
+        self.filename = filename
+        self.file: TextIO = open(filename, mode)
+        self.stringIndexes: Dict[str, int] = {}
+        self.recordNum = 0
+
+    def indexOf(self, string: str) -> int:
+        if string not in self.stringIndexes:
+            self.stringIndexes[string] = len(self.stringIndexes)
+            self.file.write(json.dumps(string) + '\n')
+        return self.stringIndexes[string]
+
+    def write(self, pastDecision: PastDecision):
+        record = [
+            round(pastDecision.timestamp, 3),
+            self.indexOf(pastDecision.key),
+            [self.indexOf(hostID) for hostID in pastDecision.hostIDSequence],
+            pastDecision.indexSequence,
+            pastDecision.cost,
+            pastDecision.schedulingTime]
+        self.file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self.recordNum += 1
+
+    def close(self):
+        self.file.close()
+
+    @staticmethod
+    def read(filename: str) -> List[PastDecision]:
+        strings = []
+        pastDecisions = []
+        with open(filename) as f:
+            for line in f:
+                try:
+                    value = json.loads(line)
+                except ValueError:
+                    # The last line written before a crash
+                    break
+                if isinstance(value, str):
+                    strings.append(value)
+                    continue
+                timestamp, keyIndex, hostIndexes, indexSequence, cost, \
+                    schedulingTime = value
+                pastDecisions.append(PastDecision(
+                    key=strings[keyIndex],
+                    hostIDSequence=[strings[i] for i in hostIndexes],
+                    indexSequence=indexSequence,
+                    cost=cost,
+                    schedulingTime=schedulingTime,
+                    timestamp=timestamp))
+        return pastDecisions
+
+
+class DecisionHistory:
+    """
+    The decisions made, by key, e.g., the application. At most
+    maxDecisionsPerKey of the latest decisions of at most maxKeys of the
+    keys used latest are kept, and none older than retention seconds.
+
+    If a folder is given, every decision is appended to a log segment in
+    it, so that the history is loaded again after a restart. Once the
+    segments hold compactionRatio times as many decisions as are kept, the
+    decisions kept are written into one segment in the background, which
+    replaces the ones before
+    """
+
+    def __init__(
+            self,
+            folder: str = None,
+            maxDecisionsPerKey: int = 100,
+            maxKeys: int = 1000,
+            retention: float = 0,
+            segmentSize: int = 10000,
+            compactionRatio: float = 2):
+        """
+        :param folder: where the segments are, None to keep the history in
+        memory only
+        :param retention: seconds a decision is kept, 0 to keep it until
+        newer ones replace it
+        :param segmentSize: how many decisions a segment holds before the
+        next one is started
+        """
+        self.folder = folder
+        self.maxDecisionsPerKey = maxDecisionsPerKey
+        self.maxKeys = maxKeys
+        self.retention = retention
+        self.segmentSize = segmentSize
+        self.compactionRatio = compactionRatio
+        self._lock = Lock()
+        self._decisions: OrderedDict[str, Deque[PastDecision]] = \
+            OrderedDict()
+        self._segment: Union[Segment, None] = None
+        self._segmentIndex = 0
+        # Decisions in each segment closed, including the ones no longer
+        # kept
+        self._recordNums: Dict[int, int] = {}
+        self._compacting = False
+        self._compaction: Union[Thread, None] = None
+        self.compactions = 0
+        if folder is not None and os.path.isdir(folder):
+            self._load()
+
+    def segmentFilename(self, index: int, compacted: bool = False) -> str:
+        if compacted:
+            return os.path.join(self.folder, '%08d.compacted.jsonl' % index)
+        return os.path.join(self.folder, '%08d.jsonl' % index)
+
+    def segmentIndexes(self) -> Dict[int, List[str]]:
+        """
+        :return: the filenames of the segments, by index
+        """
+        segments = {}
+        for filename in os.listdir(self.folder):
+            if not filename.endswith('.jsonl'):
+                continue
+            index = int(filename[:filename.find('.')])
+            segments.setdefault(index, []).append(
+                os.path.join(self.folder, filename))
+        return segments
+
+    def _load(self):
+        for filename in os.listdir(self.folder):
+            # Left by a compaction that was stopped
+            if filename.endswith('.tmp'):
+                os.remove(os.path.join(self.folder, filename))
+        segments = self.segmentIndexes()
+        compactedIndexes = [
+            index for index, filenames in segments.items()
+            if self.segmentFilename(index, compacted=True) in filenames]
+        # A compaction replaces everything up to its index. The ones it
+        # replaced may be left if it was stopped before removing them
+        start = max(compactedIndexes, default=-1)
+        for index in sorted(segments):
+            filenames = segments[index]
+            if index < start:
+                for filename in filenames:
+                    os.remove(filename)
+                continue
+            if index == start:
+                filenames = [self.segmentFilename(index, compacted=True)]
+                plain = self.segmentFilename(index)
+                if plain in segments[index]:
+                    os.remove(plain)
+            self._recordNums[index] = 0
+            for filename in filenames:
+                for pastDecision in Segment.read(filename):
+                    self._keep(pastDecision)
+                    self._recordNums[index] += 1
+        self._segmentIndex = max(segments, default=-1) + 1
+
+    def _expired(self, pastDecision: PastDecision, now: float) -> bool:
+        return self.retention > 0 \
+               and now - pastDecision.timestamp > self.retention
+
+    def _keep(self, pastDecision: PastDecision):
+        if self._expired(pastDecision, time()):
+            return
+        key = pastDecision.key
+        if key not in self._decisions:
+            self._decisions[key] = deque(maxlen=self.maxDecisionsPerKey)
+        self._decisions[key].append(pastDecision)
+        self._decisions.move_to_end(key)
+        while len(self._decisions) > self.maxKeys:
+            self._decisions.popitem(last=False)
+
+    def append(self, key: str, decision: Decision):
+        self.appendPast(PastDecision.fromDecision(key, decision))
+
+    def appendPast(self, pastDecision: PastDecision):
+        with self._lock:
+            self._keep(pastDecision)
+            if self.folder is None:
+                return
+            if self._segment is None:
+                os.makedirs(self.folder, exist_ok=True)
+                self._segment = Segment(
+                    self.segmentFilename(self._segmentIndex))
+                self._segmentIndex += 1
+            self._segment.write(pastDecision)
+            self._segment.file.flush()
+            if self._segment.recordNum < self.segmentSize:
+                return
+            # Started again with the next decision
+            self._segment.close()
+            self._recordNums[self._segmentIndex - 1] = self._segment.recordNum
+            self._segment = None
+            if self._compacting:
+                return
+            recordNum = sum(self._recordNums.values())
+            if recordNum < self.compactionRatio * self.count():
+                return
+            self._compacting = True
+            kept = [
+                pastDecision
+                for pastDecisions in self._decisions.values()
+                for pastDecision in pastDecisions]
+            index = self._segmentIndex - 1
+            self._compaction = Thread(
+                target=self._compact,
+                args=(kept, index),
+                name='DecisionHistoryCompaction',
+                daemon=True)
+            self._compaction.start()
+
+    def _compact(self, kept: List[PastDecision], index: int):
+        """
+        Replaces the segments up to index with one holding the decisions
+        kept when the segment at index was closed
+        """
+        try:
+            compactedFilename = self.segmentFilename(index, compacted=True)
+            segment = Segment(compactedFilename + '.tmp', mode='w')
+            now = time()
+            for pastDecision in kept:
+                if self._expired(pastDecision, now):
+                    continue
+                segment.write(pastDecision)
+            segment.file.flush()
+            os.fsync(segment.file.fileno())
+            segment.close()
+            os.replace(compactedFilename + '.tmp', compactedFilename)
+            for segmentIndex, filenames in self.segmentIndexes().items():
+                if segmentIndex > index:
+                    continue
+                for filename in filenames:
+                    if filename != compactedFilename:
+                        os.remove(filename)
+            with self._lock:
+                for segmentIndex in list(self._recordNums):
+                    if segmentIndex <= index:
+                        del self._recordNums[segmentIndex]
+                self._recordNums[index] = segment.recordNum
+                self.compactions += 1
+        except Exception:
+            print_exc()
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    def hostIDSequences(self, key: str) -> List[List[str]]:
+        """
+        :return: the placements kept for the key, the oldest first
+        """
+        with self._lock:
+            if key not in self._decisions:
+                return []
+            now = time()
+            pastDecisions = self._decisions[key]
+            while len(pastDecisions) and self._expired(pastDecisions[0], now):
+                pastDecisions.popleft()
+            return [
+                pastDecision.hostIDSequence for pastDecision in pastDecisions]
+
+    def get(self, key: str) -> List[PastDecision]:
+        with self._lock:
+            if key not in self._decisions:
+                return []
+            return list(self._decisions[key])
+
+    def count(self) -> int:
+        return sum(len(d) for d in self._decisions.values())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            recordNum = sum(self._recordNums.values())
+            if self._segment is not None:
+                recordNum += self._segment.recordNum
+            return {
+                'kept': self.count(),
+                'keys': len(self._decisions),
+                'onDisk': recordNum,
+                'compactions': self.compactions}
+
+    def close(self):
+        """
+        Closes the segment written to, once the compaction running if any
+        has finished
+        """
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
@@ -0,0 +1,139 @@
+"""
+Appends decisions to a DecisionHistory kept in a folder, then loads it
+again as a restarted Master would.
+
+Run from the sources folder of the Master:
+    python -m utils.master.scheduler.decisionHistoryBenchmark
+
+Reports the latency of an append, the size of the folder and the time to
+load it, with and without compaction, and the time to rewrite a JSON file
+of the decisions kept on every decision, as profiler.Decisions did.
+"""
+import argparse
+import json
+import os
+from math import inf
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from time import time
+from typing import List
+
+from .decisionHistory import DecisionHistory
+from .decisionHistory import PastDecision
+from .placementCacheBenchmark import percentile
+
+
+def decisions(
+        num: int,
+        applicationNum: int,
+        hostNum: int,
+        taskNum: int,
+        random: Random) -> List[PastDecision]:
+    hostIDs = ['%064x' % random.getrandbits(256) for _ in range(hostNum)]
+    pastDecisions = []
+    for i in range(num):
+        indexSequence = [random.randrange(hostNum) for _ in range(taskNum)]
+        pastDecisions.append(PastDecision(
+            key='Application%d-480' % random.randrange(applicationNum),
+            hostIDSequence=[hostIDs[index] for index in indexSequence],
+            indexSequence=indexSequence + [0, 1],
+            cost=random.uniform(10, 500),
+            schedulingTime=random.uniform(1, 5000),
+            timestamp=time()))
+    return pastDecisions
+
+
+def folderSize(folder: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(folder, filename))
+        for filename in os.listdir(folder))
+
+
+def appendAndLoad(
+        pastDecisions: List[PastDecision],
+        compactionRatio: float,
+        keptDecisions: int) -> str:
+    with TemporaryDirectory() as directory:
+        folder = os.path.join(directory, 'decisionHistory')
+        history = DecisionHistory(
+            folder=folder,
+            maxDecisionsPerKey=keptDecisions,
+            compactionRatio=compactionRatio)
+        latencies = []
+        startTime = perf_counter()
+        for pastDecision in pastDecisions:
+            appendStartTime = perf_counter()
+            history.appendPast(pastDecision)
+            latencies.append(perf_counter() - appendStartTime)
+        history.close()
+        totalTime = perf_counter() - startTime
+        stats = history.stats()
+        size = folderSize(folder)
+        startTime = perf_counter()
+        loaded = DecisionHistory(folder=folder, maxDecisionsPerKey=keptDecisions)
+        loadTime = perf_counter() - startTime
+        assert loaded.count() == history.count()
+        return 'append p50 %5.1f us, p99 %5.1f us, p99.9 %6.1f us, ' \
+               'max %6.1f ms, %7.0f appends/s, %3d compactions, ' \
+               '%8d decisions in %5.1f MB, loaded in %7.1f ms' % (
+                   percentile(latencies, .5) * 1e6,
+                   percentile(latencies, .99) * 1e6,
+                   percentile(latencies, .999) * 1e6,
+                   max(latencies) * 1e3,
+                   len(pastDecisions) / totalTime,
+                   stats['compactions'],
+                   stats['onDisk'],
+                   size / 1e6,
+                   loadTime * 1e3)
+
+
+def rewriteEachTime(pastDecisions: List[PastDecision], keptDecisions: int) \
+        -> str:
+    with TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'decisions.json')
+        content = {}
+        latencies = []
+        for pastDecision in pastDecisions:
+            startTime = perf_counter()
+            kept = content.setdefault(pastDecision.key, [])
+            kept.append(
+                (pastDecision.indexSequence, pastDecision.hostIDSequence))
+            del kept[:-keptDecisions]
+            with open(filename, 'w+') as f:
+                json.dump(content, f)
+            latencies.append(perf_counter() - startTime)
+        return 'append p50 %5.1f us, p99 %5.1f us, %7.0f appends/s' % (
+            percentile(latencies, .5) * 1e6,
+            percentile(latencies, .99) * 1e6,
+            len(pastDecisions) / sum(latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Decision history benchmark')
+    parser.add_argument('--decisions', type=int, default=1000000)
+    parser.add_argument('--applications', type=int, default=50)
+    parser.add_argument('--hosts', type=int, default=30)
+    parser.add_argument('--tasks', type=int, default=8)
+    parser.add_argument('--keptDecisions', type=int, default=100)
+    parser.add_argument('--rewrittenDecisions', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    pastDecisions = decisions(
+        num=args.decisions,
+        applicationNum=args.applications,
+        hostNum=args.hosts,
+        taskNum=args.tasks,
+        random=Random(args.seed))
+    print('compacted     %s' % appendAndLoad(
+        pastDecisions, compactionRatio=2, keptDecisions=args.keptDecisions))
+    print('not compacted %s' % appendAndLoad(
+        pastDecisions, compactionRatio=inf, keptDecisions=args.keptDecisions))
+    print('rewritten     %s (first %d decisions)' % (
+        rewriteEachTime(
+            pastDecisions[:args.rewrittenDecisions], args.keptDecisions),
+        args.rewrittenDecisions))
+
+
+if __name__ == '__main__':
+    main()
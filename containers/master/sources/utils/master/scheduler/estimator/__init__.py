@@ -1 +1,4 @@
+from .costCache import CostCache
 from .estimator import Estimator
+from .matrixEstimator import CostMatrices
+from .matrixEstimator import MatrixEstimator
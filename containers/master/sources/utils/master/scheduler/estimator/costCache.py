@@ -0,0 +1,101 @@
+from typing import Dict
+from typing import Hashable
+from typing import Tuple
+from typing import Union
+
+from ...logger.allSystemPerformance import AllSystemPerformance
+
+# The source task and host, and the dest task and host of a step
+StepKey = Tuple[Union[str, None], str, str, str]
+
+
+class CostCache:
+    """
+    The costs an Estimator worked out during one scheduling request.
+
+    The cost of a step, from a task on a host to a task on another host,
+    is the same for every individual placing the two tasks there. The cost
+    of the routes reaching a task only depends on where the task and the
+    tasks before it are placed, so the individuals sharing that part of a
+    placement share it too. Everything is dropped when the profiles the
+    costs were worked out from change
+    """
+
+    def __init__(
+            self,
+            maxStepCosts: int = 100000,
+            maxRouteCosts: int = 100000):
+        """
+        :param maxStepCosts: how many step costs are kept before starting
+        again, 0 to keep none
+        :param maxRouteCosts: how many route costs are kept before starting
+        again, 0 to keep none
+        """
+        self.maxStepCosts = maxStepCosts
+        self.maxRouteCosts = maxRouteCosts
+        self._stepCosts: Dict[StepKey, float] = {}
+        self._routeCosts: Dict[Hashable, float] = {}
+        self._systemPerformance: Union[AllSystemPerformance, None] = None
+        self._version = 0
+        self.stepHits = 0
+        self.stepMisses = 0
+        self.routeHits = 0
+        self.routeMisses = 0
+        self.invalidated = 0
+
+    def validate(self, systemPerformance: AllSystemPerformance):
+        """
+        Drops the costs if they were worked out from other profiles, or
+        from the same ones before they changed
+        """
+        if systemPerformance is self._systemPerformance \
+                and systemPerformance.version == self._version:
+            return
+        if self._systemPerformance is not None:
+            self.invalidated += 1
+        self._systemPerformance = systemPerformance
+        self._version = systemPerformance.version
+        self._stepCosts.clear()
+        self._routeCosts.clear()
+
+    def getStep(self, key: StepKey) -> Union[float, None]:
+        cost = self._stepCosts.get(key)
+        if cost is None:
+            self.stepMisses += 1
+        else:
+            self.stepHits += 1
+        return cost
+
+    def putStep(self, key: StepKey, cost: float):
+        if len(self._stepCosts) >= self.maxStepCosts:
+            self._stepCosts.clear()
+        if self.maxStepCosts:
+            self._stepCosts[key] = cost
+
+    def getRoute(self, key: Hashable) -> Union[float, None]:
+        cost = self._routeCosts.get(key)
+        if cost is None:
+            self.routeMisses += 1
+        else:
+            self.routeHits += 1
+        return cost
+
+    def putRoute(self, key: Hashable, cost: float):
+        if len(self._routeCosts) >= self.maxRouteCosts:
+            self._routeCosts.clear()
+        if self.maxRouteCosts:
+            self._routeCosts[key] = cost
+
+    @staticmethod
+    def hitRate(hits: int, misses: int) -> float:
+        if not hits + misses:
+            return .0
+        return hits / (hits + misses)
+
+    def stats(self) -> Dict:
+        return {
+            'stepHitRate': self.hitRate(self.stepHits, self.stepMisses),
+            'routeHitRate': self.hitRate(self.routeHits, self.routeMisses),
+            'steps': len(self._stepCosts),
+            'routes': len(self._routeCosts),
+            'invalidated': self.invalidated}
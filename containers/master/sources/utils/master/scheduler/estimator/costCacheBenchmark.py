@@ -0,0 +1,110 @@
+"""
+Estimates the individuals of a genetic algorithm run with the Estimator,
+without and with the cost cache, and with the MatrixEstimator.
+
+Run from the sources folder of the Master:
+    python -m utils.master.scheduler.estimator.costCacheBenchmark
+
+Each generation is made from the one before by crossover and mutation,
+so the individuals share most of their placement, as they do in NSGA.
+Reports the evaluations per second and the hit rates of the cache on the
+simulated ObjectDetection application and on a DAG.
+"""
+import argparse
+from random import Random
+from time import perf_counter
+from typing import List
+
+import numpy as np
+
+from .costCache import CostCache
+from .estimator import Estimator
+from .matrixEstimator import MatrixEstimator
+from ..clusterSimulator import SimulatedCluster
+from ..clusterSimulator import application
+
+
+def generations(
+        estimator: Estimator,
+        populationSize: int,
+        generationNum: int,
+        random: Random) -> List[np.ndarray]:
+    choices = [len(estimator.actorsByTaskName[taskName])
+               for taskName in estimator.taskList]
+    population = [
+        [random.randrange(choice) for choice in choices] + [0, 0]
+        for _ in range(populationSize)]
+    populations = [np.asarray(population)]
+    for _ in range(generationNum - 1):
+        offspring = []
+        for _ in range(populationSize):
+            father, mother = random.sample(population, 2)
+            cut = random.randrange(len(choices) + 1)
+            child = father[:cut] + mother[cut:]
+            mutated = random.randrange(len(choices))
+            child[mutated] = random.randrange(choices[mutated])
+            offspring.append(child)
+        population = offspring
+        populations.append(np.asarray(population))
+    return populations
+
+
+def run(
+        estimator: Estimator,
+        populations: List[np.ndarray],
+        vectorized: bool = False) -> float:
+    """
+    :return: the evaluations per second
+    """
+    startTime = perf_counter()
+    for population in populations:
+        if vectorized:
+            estimator.estimateCosts(population)
+            continue
+        for indexSequence in population:
+            estimator.estimateCost(indexSequence)
+    return sum(len(p) for p in populations) / (perf_counter() - startTime)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cost cache benchmark')
+    parser.add_argument('--hosts', type=int, default=50)
+    parser.add_argument('--tasks', type=int, default=8)
+    parser.add_argument('--populationSize', type=int, default=100)
+    parser.add_argument('--generationNum', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    random = Random(args.seed)
+    cluster = SimulatedCluster(hostNum=args.hosts, seed=args.seed)
+    for shape in ('ObjectDetection', 'DAG'):
+        user = cluster.newUser(application(shape, args.tasks, random))
+        estimator = Estimator(
+            user=user,
+            master=cluster.master,
+            allActors=cluster.actors,
+            systemPerformance=cluster.systemPerformance,
+            isContainerMode=False)
+        populations = generations(
+            estimator, args.populationSize, args.generationNum, random)
+        estimator.costCache = CostCache(maxStepCosts=0, maxRouteCosts=0)
+        withoutCache = run(estimator, populations)
+        estimator.costCache = CostCache()
+        withCache = run(estimator, populations)
+        stats = estimator.costCache.stats()
+        matrixEstimator = MatrixEstimator(
+            user=user,
+            master=cluster.master,
+            allActors=cluster.actors,
+            systemPerformance=cluster.systemPerformance,
+            isContainerMode=False)
+        vectorized = run(matrixEstimator, populations, vectorized=True)
+        print('%-15s Estimator without cache %7.0f evaluations/s, '
+              'with cache %7.0f evaluations/s, step hit rate %3.0f%%, '
+              'route hit rate %3.0f%%; MatrixEstimator %8.0f evaluations/s' % (
+                  shape, withoutCache, withCache,
+                  stats['stepHitRate'] * 100, stats['routeHitRate'] * 100,
+                  vectorized))
+
+
+if __name__ == '__main__':
+    main()
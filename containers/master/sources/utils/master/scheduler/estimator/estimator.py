@@ -1,10 +1,10 @@
-from functools import lru_cache
 from random import randint
 from typing import Dict
 from typing import List
 from typing import Tuple
 from typing import Union
 
+from .costCache import CostCache
 from ...application.task.base import Task
 from ...application.task.dependency.base import TaskWithDependency
 from ...logger.allSystemPerformance import AllSystemPerformance
@@ -35,6 +35,16 @@ class Estimator:
         self.allActors = allActors
         self.actorsByTaskName = self.filterActors(allActors)
         self.baseCostForNormalizing = None
+        self.costCache = CostCache()
+        self.topologicalOrder = self.sortTasks()
+        self.entryNames = {task.name for task in user.application.entryTasks}
+        # The tasks each task is a child of, the tasks the routes end at,
+        # and the indexes of an individual the cost of the routes reaching
+        # each task depends on
+        self.parentNames: Dict[str, List[str]] = {}
+        self.routeEnds: List[str] = []
+        self.routeIndexes: Dict[str, Tuple[int, ...]] = {}
+        self.prepareRoutes()
 
     def filterActors(self, allActors: List[Actor]) -> Dict[str, List[Actor]]:
         """
@@ -69,22 +79,131 @@ class Estimator:
         :return: Estimated total cost of the input indexSequence
         """
         individual = self.mapIndexSequenceToActorSequence(indexSequence[:-2])
+        placement = tuple(int(index) for index in indexSequence[:-2])
+        self.costCache.validate(self.systemPerformance)
         # For an application, there may be multiple tasks at the entry
-        entryCostList = self.entryCost(individual)
-        entryCostList = [[cost] for cost in entryCostList]
-        for costIndex, task in enumerate(self.user.application.entryTasks):
-            # The dependency of an application can be considered as a graph
-            # For each entry, use deep first search to find the maximum cost
-            # among all the routes
-            self.elseCostDFS(
-                sourceTask=task,
-                individual=individual,
-                entryCost=entryCostList,
-                currentCost=entryCostList[costIndex][0],
-                costIndex=costIndex)
-        # find the maximum cost among all the entries
-        maximums = [max(costs) for costs in entryCostList]
-        return max(maximums)
+        costs = self.entryCost(individual)
+        # The dependency of an application can be considered as a graph.
+        # Find the maximum cost among all the routes, from any entry to the
+        # actuator or to a task without children
+        for taskName in self.routeEnds:
+            costs.append(self.routeCost(taskName, individual, placement))
+        return max(costs)
+
+    def routeCost(
+            self,
+            taskName: str,
+            individual: List[Actor],
+            placement: Tuple[int, ...]) -> float:
+        """
+        The maximum cost of the routes from any entry to the task, taken
+        from the cost cache if the task and the tasks before it were placed
+        the same before
+        :param placement: the index sequence without the factors
+        """
+        key = (taskName,) + tuple(
+            placement[i] for i in self.routeIndexes[taskName])
+        cost = self.costCache.getRoute(key)
+        if cost is not None:
+            return cost
+        costs = []
+        if taskName in self.entryNames:
+            costs.append(self.stepCost(None, taskName, individual))
+        for parentName in self.parentNames[taskName]:
+            costs.append(
+                self.routeCost(parentName, individual, placement)
+                + self.stepCost(parentName, taskName, individual))
+        cost = max(costs)
+        self.costCache.putRoute(key, cost)
+        return cost
+
+    def stepCost(
+            self,
+            sourceName: Union[str, None],
+            destName: str,
+            individual: List[Actor]) -> float:
+        """
+        The cost of sending from the source task to the dest task and of
+        running the dest task, taken from the cost cache if the two tasks
+        were on the same hosts before
+        :param sourceName: None if sending from the master to an entry
+        """
+        key = (
+            sourceName, self.hostIDOf(sourceName, individual),
+            destName, self.hostIDOf(destName, individual))
+        cost = self.costCache.getStep(key)
+        if cost is not None:
+            return cost
+        if sourceName is None:
+            sourceComponent = self.master
+        else:
+            sourceComponent, _ = self.convertTask(individual, Task(sourceName))
+        destComponent, destActor = self.convertTask(individual, Task(destName))
+        cost = self.sourceToDestCost(
+            sourceComponent=sourceComponent,
+            destComponent=destComponent,
+            destActor=destActor)
+        self.costCache.putStep(key, cost)
+        return cost
+
+    def hostIDOf(
+            self, taskName: Union[str, None], individual: List[Actor]) -> str:
+        if taskName is None or taskName in {'Actuator', 'Sensor'}:
+            return self.master.hostID
+        return individual[self.taskNameToIndex[taskName]].hostID
+
+    def prepareRoutes(self):
+        for taskName in self.topologicalOrder:
+            self.parentNames.setdefault(taskName, [])
+            childrenNames = self.childrenOf(taskName)
+            if not childrenNames:
+                self.routeEnds.append(taskName)
+            for childName in childrenNames:
+                self.parentNames.setdefault(childName, []).append(taskName)
+        for taskName in self.topologicalOrder:
+            indexes = set()
+            if taskName not in {'Actuator', 'Sensor'}:
+                indexes.add(self.taskNameToIndex[taskName])
+            for parentName in self.parentNames[taskName]:
+                indexes.update(self.routeIndexes[parentName])
+            self.routeIndexes[taskName] = tuple(sorted(indexes))
+
+    def sortTasks(self) -> List[str]:
+        """
+        Topologically sort the tasks reachable from the entries
+        :return: the task names, parents before children
+        """
+        reachable = []
+        parentsNum = {}
+        toVisit = [task.name for task in self.user.application.entryTasks]
+        while toVisit:
+            taskName = toVisit.pop()
+            if taskName in parentsNum:
+                continue
+            parentsNum[taskName] = 0
+            reachable.append(taskName)
+            toVisit.extend(self.childrenOf(taskName))
+        for taskName in reachable:
+            for childName in self.childrenOf(taskName):
+                parentsNum[childName] += 1
+        topologicalOrder = [
+            taskName for taskName in reachable if not parentsNum[taskName]]
+        for taskName in topologicalOrder:
+            for childName in self.childrenOf(taskName):
+                parentsNum[childName] -= 1
+                if not parentsNum[childName]:
+                    topologicalOrder.append(childName)
+        if len(topologicalOrder) != len(reachable):
+            raise Exception(
+                'Dependency of %s has a cycle' % self.user.application.name)
+        return topologicalOrder
+
+    def childrenOf(self, taskName: str) -> List[str]:
+        # The route ends at the actuator, or at a task without children
+        if taskName == 'Actuator':
+            return []
+        task = self.user.application.tasksWithDependency[taskName]
+        return list({childTask.name for childTask in task.children})
 
     def edgeCost(self, sourceComponent: Component, destComponent: Component) \
             -> float:
@@ -122,7 +241,6 @@ class Estimator:
         actor = individual[taskIndex]
         return actor
 
-    @lru_cache(maxsize=128)
     def sourceToDestCost(
             self,
             sourceComponent: Component,
@@ -136,15 +254,9 @@ class Estimator:
         return edgeCost + computingCost
 
     def entryCost(self, individual: List[Actor]) -> List[float]:
-        entryCostList = []
-        for task in self.user.application.entryTasks:
-            destComponent, actor = self.convertTask(individual, task)
-            stepCost = self.sourceToDestCost(
-                sourceComponent=self.master,
-                destComponent=destComponent,
-                destActor=actor)
-            entryCostList.append(stepCost)
-        return entryCostList
+        return [
+            self.stepCost(None, task.name, individual)
+            for task in self.user.application.entryTasks]
 
     def convertTask(
             self, individual: List[Actor], task: TaskWithDependency) \
@@ -162,51 +274,6 @@ class Estimator:
             user=self.user, actor=actor, task=task)
         return taskExecutor, actor
 
-    def elseCostDFS(
-            self,
-            sourceTask: Task,
-            individual: List[Actor],
-            currentCost: float,
-            entryCost: List[List[float]],
-            costIndex: int):
-        """
-        A recursive function to find the maximum cost of a graph
-        :param sourceTask: the previous task
-        :param individual: the chromosome, list of int
-        :param currentCost: cost of current recursion
-        :param entryCost: a two dimensions list. x is the number of entries,
-        y is the cost of each step
-        :param costIndex: x
-        :return: tail recursion, see www.geeksforgeeks.org/tail-recursion/
-        """
-        if sourceTask.name == 'Actuator':
-            # if this is the end of current route
-            entryCost[costIndex].append(currentCost)
-            return
-        application = self.user.application
-        # get sourceTask object
-        sourceTask = application.tasksWithDependency[sourceTask.name]
-        if not len(sourceTask.children):
-            # if there is no more task
-            entryCost[costIndex].append(currentCost)
-            return
-        sourceComponent, actor = self.convertTask(individual, sourceTask)
-        for childTask in sourceTask.children:
-            # for each child, estimate the cost of this step
-            destComponent, destActor = self.convertTask(individual, childTask)
-            stepCost = self.sourceToDestCost(
-                sourceComponent=sourceComponent,
-                destComponent=destComponent,
-                destActor=destActor)
-            costIncreased = currentCost + stepCost
-            # estimate the rest
-            self.elseCostDFS(
-                sourceTask=childTask,
-                individual=individual,
-                currentCost=costIncreased,
-                entryCost=entryCost,
-                costIndex=costIndex)
-
     def estimateEdgeCost(self, source: Component, dest: Component) -> float:
         """
         estimate the edge cost
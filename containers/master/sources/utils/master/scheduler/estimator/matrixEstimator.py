@@ -0,0 +1,221 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from .estimator import Estimator
+from ...logger.allSystemPerformance import AllSystemPerformance
+from ...registry.roles import Actor
+from ...registry.roles import Master
+from ...registry.roles import User
+from ....types import Component
+
+
+class CostMatrices:
+    """
+    Everything MatrixEstimator needs to score a population, without any
+    component, so that it can be sent to another process
+    """
+
+    def __init__(
+            self,
+            taskNum: int,
+            taskIndexes: Dict[str, Union[int, None]],
+            topologicalOrder: List[str],
+            children: Dict[str, List[str]],
+            entryCosts: List[Tuple[str, np.ndarray]],
+            edgeCosts: Dict[Tuple[str, str], np.ndarray]):
+        self.taskNum = taskNum
+        # None for the tasks which do not depend on the individual
+        self.taskIndexes = taskIndexes
+        self.topologicalOrder = topologicalOrder
+        self.children = children
+        self.entryCosts = entryCosts
+        self.edgeCosts = edgeCosts
+
+    def actorIndexes(self, taskName: str, indexes: np.ndarray) -> np.ndarray:
+        taskIndex = self.taskIndexes[taskName]
+        if taskIndex is None:
+            return np.zeros(len(indexes), dtype=int)
+        return indexes[:, taskIndex]
+
+    def estimateCosts(self, indexSequences) -> np.ndarray:
+        indexes = np.asarray(indexSequences)[:, :-2].astype(int)
+        if indexes.shape[1] != self.taskNum:
+            raise Exception(
+                'Individual length (%d) is not correct (%d)' % (
+                    indexes.shape[1], self.taskNum))
+        populationSize = len(indexes)
+        # The maximum cost of the routes from any entry to each task
+        routeCosts: Dict[str, np.ndarray] = {}
+        totalCosts = np.full(populationSize, -np.inf)
+        for taskName, entryCost in self.entryCosts:
+            cost = entryCost[self.actorIndexes(taskName, indexes)]
+            totalCosts = np.maximum(totalCosts, cost)
+            if taskName in routeCosts:
+                cost = np.maximum(routeCosts[taskName], cost)
+            routeCosts[taskName] = cost
+        for taskName in self.topologicalOrder:
+            routeCost = routeCosts[taskName]
+            childrenNames = self.children[taskName]
+            if not childrenNames:
+                totalCosts = np.maximum(totalCosts, routeCost)
+                continue
+            sourceIndexes = self.actorIndexes(taskName, indexes)
+            for childName in childrenNames:
+                edgeCost = self.edgeCosts[taskName, childName][
+                    sourceIndexes, self.actorIndexes(childName, indexes)]
+                cost = routeCost + edgeCost
+                if childName in routeCosts:
+                    cost = np.maximum(routeCosts[childName], cost)
+                routeCosts[childName] = cost
+        return totalCosts
+
+
+class MatrixEstimator(Estimator):
+    """
+    Estimates the cost of a whole population at once.
+
+    The cost of every edge of the task graph, for every pair of actors the
+    two tasks may be placed on, is computed once into a matrix. A population
+    is then scored with numpy, walking the tasks in topological order. The
+    results are the same as the ones of Estimator.estimateCost.
+    """
+
+    def __init__(
+            self,
+            user: User,
+            master: Master,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance,
+            isContainerMode: bool):
+        Estimator.__init__(
+            self,
+            user=user,
+            master=master,
+            allActors=allActors,
+            systemPerformance=systemPerformance,
+            isContainerMode=isContainerMode)
+        self.taskComponents: Dict[
+            str, Tuple[List[Component], List[Union[Actor, None]]]] = {}
+        self.hostIndex: Dict[str, int] = {}
+        self.hostEdgeCost: np.ndarray = None
+        self.costMatrices: CostMatrices = self.prepareCostMatrices()
+
+    def prepareCostMatrices(self) -> CostMatrices:
+        """
+        Compute everything that does not depend on the individual.
+        Called once for each scheduling request
+        """
+        topologicalOrder = self.topologicalOrder
+        for taskName in topologicalOrder:
+            self.taskComponents[taskName] = self.componentsOf(taskName)
+        self.prepareHostEdgeCost()
+        entryCosts = []
+        masterComponents = [self.master], [None]
+        for task in self.user.application.entryTasks:
+            entryCost = self.costMatrix(
+                masterComponents, self.taskComponents[task.name])
+            entryCosts.append((task.name, entryCost[0]))
+        children = {}
+        edgeCosts = {}
+        for taskName in topologicalOrder:
+            children[taskName] = self.childrenOf(taskName)
+            for childName in children[taskName]:
+                edgeCosts[taskName, childName] = self.costMatrix(
+                    self.taskComponents[taskName],
+                    self.taskComponents[childName])
+        taskIndexes = {
+            taskName: None if taskName in {'Actuator', 'Sensor'}
+            else self.taskNameToIndex[taskName]
+            for taskName in topologicalOrder}
+        return CostMatrices(
+            taskNum=len(self.taskList),
+            taskIndexes=taskIndexes,
+            topologicalOrder=topologicalOrder,
+            children=children,
+            entryCosts=entryCosts,
+            edgeCosts=edgeCosts)
+
+    def componentsOf(self, taskName: str) \
+            -> Tuple[List[Component], List[Union[Actor, None]]]:
+        """
+        Simulate this task on each of its available actors
+        :param taskName: name of the task
+        :return: simulated TaskExecutors and the Actors, in the order of
+        the indexes of an individual
+        """
+        if taskName in {'Actuator', 'Sensor'}:
+            return [self.master], [None]
+        task = self.user.application.tasksWithDependency[taskName]
+        actors = self.actorsByTaskName[taskName]
+        taskExecutors = [
+            self.createTaskExecutor(user=self.user, actor=actor, task=task)
+            for actor in actors]
+        return taskExecutors, actors
+
+    def prepareHostEdgeCost(self):
+        """
+        Estimate the edge cost between every two hosts, used when the
+        delay between two components has not been measured
+        """
+        hostComponents = {}
+        components = [self.master]
+        for taskExecutors, _ in self.taskComponents.values():
+            components.extend(taskExecutors)
+        for component in components:
+            if component.hostID in hostComponents:
+                continue
+            hostComponents[component.hostID] = component
+        self.hostIndex = {
+            hostID: i for i, hostID in enumerate(hostComponents.keys())}
+        hostNum = len(hostComponents)
+        self.hostEdgeCost = np.zeros((hostNum, hostNum))
+        for i, source in enumerate(hostComponents.values()):
+            for j, dest in enumerate(hostComponents.values()):
+                self.hostEdgeCost[i, j] = self.estimateEdgeCost(source, dest)
+
+    def costMatrix(
+            self,
+            sources: Tuple[List[Component], List[Union[Actor, None]]],
+            dests: Tuple[List[Component], List[Union[Actor, None]]]) \
+            -> np.ndarray:
+        """
+        The same as sourceToDestCost, for every pair of source and dest
+        :return: a matrix, x is the index of the source, y of the dest
+        """
+        sourceComponents, _ = sources
+        destComponents, destActors = dests
+        sourceHosts = [self.hostIndex[c.hostID] for c in sourceComponents]
+        destHosts = [self.hostIndex[c.hostID] for c in destComponents]
+        costs = self.hostEdgeCost[np.ix_(sourceHosts, destHosts)]
+        delay = self.systemPerformance.delay
+        for i, sourceComponent in enumerate(sourceComponents):
+            if sourceComponent.nameConsistent not in delay:
+                continue
+            measured = delay[sourceComponent.nameConsistent]
+            for j, destComponent in enumerate(destComponents):
+                if destComponent.nameConsistent not in measured:
+                    continue
+                costs[i, j] = measured[destComponent.nameConsistent]
+        if destActors[0] is None:
+            return costs
+        computingCosts = np.asarray([
+            self.computingCost(taskExecutor=taskExecutor, actor=actor)
+            for taskExecutor, actor in zip(destComponents, destActors)],
+            dtype=float)
+        return costs + computingCosts
+
+    def estimateCosts(self, indexSequences) -> np.ndarray:
+        """
+        Estimate the total cost of each chromosome of a population
+        :param indexSequences: a two dimensions array, each row is an
+        index sequence as in estimateCost
+        :return: Estimated total cost of each row
+        """
+        return self.costMatrices.estimateCosts(indexSequences)
+
+    def estimateCost(self, indexSequence: List[int]):
+        return float(self.estimateCosts([indexSequence])[0])
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from . import testMatrixEstimator
+from .costCache import CostCache
+from .matrixEstimator import MatrixEstimator
+
+
+class CostCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.inputs = testMatrixEstimator.MatrixEstimatorTest()
+        self.inputs.setUp()
+        self.estimator, self.matrixEstimator = self.inputs.estimators(12, 10)
+        self.population = self.inputs.population(self.estimator, 50)
+
+    def testSharedPlacementsHit(self):
+        expected = self.matrixEstimator.estimateCosts(self.population)
+        costs = [self.estimator.estimateCost(row) for row in self.population]
+        self.assertEqual(costs, list(expected))
+        # The same individuals, but for the task placed last in each
+        mutated = self.population.copy()
+        mutated[:, len(self.estimator.taskList) - 1] = 0
+        self.estimator.costCache.routeHits = 0
+        self.estimator.costCache.routeMisses = 0
+        costs = [self.estimator.estimateCost(row) for row in mutated]
+        self.assertEqual(
+            costs, list(self.matrixEstimator.estimateCosts(mutated)))
+        stats = self.estimator.costCache.stats()
+        self.assertGreater(stats['stepHitRate'], .5)
+        self.assertGreater(stats['routeHitRate'], .5)
+        # Without the cache
+        self.estimator.costCache = CostCache(maxStepCosts=0, maxRouteCosts=0)
+        costs = [self.estimator.estimateCost(row) for row in mutated]
+        self.assertEqual(
+            costs, list(self.matrixEstimator.estimateCosts(mutated)))
+        self.assertEqual(self.estimator.costCache.stats()['stepHitRate'], 0)
+
+    def testInvalidatedWhenProfilesChange(self):
+        indexSequence = self.population[0]
+        cost = self.estimator.estimateCost(indexSequence)
+        systemPerformance = self.estimator.systemPerformance
+        for fromSource in systemPerformance.latency.values():
+            for dest in fromSource:
+                fromSource[dest] += 10
+        systemPerformance.changed()
+        changedCost = self.estimator.estimateCost(indexSequence)
+        self.assertGreater(changedCost, cost)
+        matrixEstimator = MatrixEstimator(
+            user=self.estimator.user,
+            master=self.estimator.master,
+            allActors=self.estimator.allActors,
+            systemPerformance=systemPerformance,
+            isContainerMode=False)
+        self.assertEqual(
+            changedCost,
+            matrixEstimator.estimateCosts(np.asarray([indexSequence]))[0])
+        self.assertEqual(self.estimator.costCache.stats()['invalidated'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+from random import choice
+from random import randint
+from random import random
+from random import seed
+from typing import List
+
+import numpy as np
+
+from .estimator import Estimator
+from .matrixEstimator import MatrixEstimator
+from ...application.base import Application
+from ...application.task.base import Task
+from ...application.task.dependency.base import TaskWithDependency
+from ...logger.allSystemPerformance import AllSystemPerformance
+from ...registry.roles import Actor
+from ...registry.roles import Master
+from ...registry.roles import User
+from ....types import ActorResources
+from ....types import CPU
+from ....types import ProcessingTime
+
+
+class MatrixEstimatorTest(unittest.TestCase):
+
+    def setUp(self):
+        seed(0)
+        np.random.seed(0)
+
+    @staticmethod
+    def application(taskNum: int) -> Application:
+        """
+        A random DAG. Sensor is the entry, every task has a parent with
+        a smaller index, and the tasks without children go to Actuator
+        """
+        taskNames = ['Task%d' % i for i in range(taskNum)]
+        tasks = {
+            name: TaskWithDependency(name) for name in ['Sensor'] + taskNames}
+        for i, name in enumerate(taskNames):
+            parents = {choice(['Sensor'] + taskNames[:i])}
+            if i > 1 and random() < .5:
+                parents.add(choice(taskNames[:i]))
+            for parentName in parents:
+                tasks[parentName].children.add(Task(name))
+                tasks[name].parents.add(Task(parentName))
+        for name in taskNames:
+            if not tasks[name].children:
+                tasks[name].children.add(Task('Actuator'))
+        return Application(
+            name='Synthetic',
+            tasksWithDependency=tasks,
+            entryTasks=[tasks['Sensor'], tasks['Task0']],
+            label='480')
+
+    @staticmethod
+    def systemPerformance(
+            master: Master,
+            actors: List[Actor],
+            estimator: Estimator) -> AllSystemPerformance:
+        hostIDs = [master.hostID, ''] + [actor.hostID for actor in actors]
+        latency = {
+            source: {dest: random() for dest in hostIDs}
+            for source in hostIDs}
+        dataRate = {
+            source: {dest: choice([0, random() * 100]) for dest in hostIDs}
+            for source in hostIDs}
+        packetSize = {
+            source: {dest: randint(0, 4096) for dest in hostIDs}
+            for source in hostIDs}
+        del latency[''], dataRate[hostIDs[2]]
+        # Measured for some of the task executors only
+        delay = {}
+        processingTime = {}
+        for taskName in estimator.taskList:
+            task = estimator.user.application.tasksWithDependency[taskName]
+            for actor in actors:
+                taskExecutor = estimator.createTaskExecutor(
+                    user=estimator.user, actor=actor, task=task)
+                if random() < .5:
+                    processingTime[taskExecutor.nameConsistent] = \
+                        ProcessingTime(
+                            taskExecutorName=taskExecutor.name,
+                            processingTime=random() * 100)
+                elif random() < .5:
+                    processingTime[taskExecutor.name] = ProcessingTime(
+                        taskExecutorName=taskExecutor.name,
+                        processingTime=random() * 100)
+                if random() < .3:
+                    delay.setdefault(master.nameConsistent, {})[
+                        taskExecutor.nameConsistent] = random()
+                if random() < .3:
+                    delay[taskExecutor.nameConsistent] = {
+                        master.nameConsistent: random()}
+        return AllSystemPerformance(
+            dataRate=dataRate,
+            delay=delay,
+            latency=latency,
+            packetSize=packetSize,
+            processingTime=processingTime)
+
+    def estimators(self, taskNum: int, actorNum: int):
+        master = Master(addr=('192.168.0.1', 5001))
+        actors = [
+            Actor(
+                addr=('192.168.1.%d' % i, 50000),
+                actorResources=ActorResources(
+                    cpu=CPU(cores=randint(0, 8), frequency=random() * 3000)))
+            for i in range(actorNum)]
+        user = User(
+            application=self.application(taskNum),
+            addr=('192.168.0.2', 50101))
+        estimator = Estimator(
+            user=user,
+            master=master,
+            allActors=actors,
+            systemPerformance=AllSystemPerformance(),
+            isContainerMode=False)
+        systemPerformance = self.systemPerformance(master, actors, estimator)
+        estimator.systemPerformance = systemPerformance
+        matrixEstimator = MatrixEstimator(
+            user=user,
+            master=master,
+            allActors=actors,
+            systemPerformance=systemPerformance,
+            isContainerMode=False)
+        return estimator, matrixEstimator
+
+    @staticmethod
+    def population(estimator: Estimator, populationSize: int) -> np.ndarray:
+        columns = [
+            np.random.randint(0, len(estimator.actorsByTaskName[name]),
+                              populationSize)
+            for name in estimator.taskList]
+        columns.append(np.random.random(populationSize))
+        columns.append(np.random.random(populationSize))
+        return np.stack(columns, axis=1)
+
+    def testSameCost(self):
+        for taskNum, actorNum in ((1, 1), (5, 3), (12, 10), (30, 25)):
+            estimator, matrixEstimator = self.estimators(taskNum, actorNum)
+            population = self.population(estimator, 50)
+            costs = matrixEstimator.estimateCosts(population)
+            for indexSequence, cost in zip(population, costs):
+                self.assertEqual(estimator.estimateCost(indexSequence), cost)
+                self.assertEqual(
+                    matrixEstimator.estimateCost(indexSequence), cost)
+
+    def testWrongLength(self):
+        estimator, matrixEstimator = self.estimators(5, 3)
+        population = self.population(estimator, 10)
+        with self.assertRaises(Exception):
+            matrixEstimator.estimateCosts(population[:, 1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
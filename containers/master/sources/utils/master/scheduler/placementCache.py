@@ -0,0 +1,225 @@
+from collections import OrderedDict
+from math import inf
+from math import log
+from threading import Lock
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from .types import Decision
+from ..application.base import Application
+from ..logger.allSystemPerformance import AllSystemPerformance
+from ..registry.roles import Actor
+from ..registry.roles import Master
+
+# What the placement depends on, e.g., ('latency', hostA, hostB), to its
+# value quantized
+Profile = Dict[Tuple, Hashable]
+# The kinds of values compared as they are, not as buckets
+EXACT_KINDS = {'images'}
+
+
+class CachedPlacement:
+
+    def __init__(
+            self,
+            hostIDSequence: List[str],
+            indexSequence: List[int],
+            cost: float,
+            profile: Profile):
+        self.hostIDSequence = hostIDSequence
+        self.indexSequence = indexSequence
+        self.cost = cost
+        self.profile = profile
+
+    def hostIDs(self) -> Set[str]:
+        return set(self.hostIDSequence)
+
+
+class PlacementCache:
+    """
+    The placements found before, by labelled application, domain and a
+    fingerprint of the cluster. The fingerprint is made of the hosts
+    available, their resources, and the latencies and data rates between
+    them. Each value is quantized into buckets, so that small changes give
+    the same fingerprint.
+
+    An exact hit can be used at once. A near hit, whose buckets are within
+    staleBuckets of the ones now, is a good start for the scheduler. The
+    placements whose profiles drifted further are dropped.
+    """
+
+    def __init__(
+            self,
+            ratio: float = 1.25,
+            utilizationStep: float = .1,
+            staleBuckets: int = 2,
+            maxEntriesPerKey: int = 8):
+        """
+        :param ratio: how many times larger a latency, data rate or
+        computing power is in the next bucket
+        :param utilizationStep: the width of the buckets of CPU and memory
+        utilization
+        :param staleBuckets: how many buckets a value may drift before the
+        placements found with it are dropped
+        :param maxEntriesPerKey: how many placements are kept for each
+        labelled application and domain, the least recently used are
+        dropped
+        """
+        self._logRatio = log(ratio)
+        self.utilizationStep = utilizationStep
+        self.staleBuckets = staleBuckets
+        self.maxEntriesPerKey = maxEntriesPerKey
+        self._lock = Lock()
+        self._entries: Dict[
+            Tuple[str, str], OrderedDict[int, CachedPlacement]] = {}
+        self.hits = 0
+        self.nearHits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    @staticmethod
+    def keyOf(application: Application, domainName: str) -> Tuple[str, str]:
+        return application.nameWithLabel, domainName
+
+    @staticmethod
+    def fingerprint(profile: Profile) -> int:
+        return hash(frozenset(profile.items()))
+
+    def bucket(self, value: float) -> Union[int, None]:
+        if value <= 0:
+            return None
+        return round(log(value) / self._logRatio)
+
+    def profileOf(
+            self,
+            master: Master,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance) -> Profile:
+        profile = {}
+        hostIDs = [master.hostID]
+        for actor in allActors:
+            hostIDs.append(actor.hostID)
+            resources = actor.actorResources
+            cpu = resources.cpu
+            profile['cpu', actor.hostID] = self.bucket(
+                cpu.cores * cpu.frequency)
+            profile['cpuUtilization', actor.hostID] = round(
+                cpu.utilization / self.utilizationStep)
+            profile['memoryUtilization', actor.hostID] = round(
+                resources.memory.utilization / self.utilizationStep)
+            profile['images', actor.hostID] = frozenset(resources.images)
+        for kind, measured in (
+                ('latency', systemPerformance.latency),
+                ('dataRate', systemPerformance.dataRate)):
+            for source in hostIDs:
+                if source not in measured:
+                    continue
+                fromSource = measured[source]
+                for dest in hostIDs:
+                    if dest not in fromSource:
+                        continue
+                    profile[kind, source, dest] = self.bucket(
+                        fromSource[dest])
+        return profile
+
+    @staticmethod
+    def availableHostIDs(profile: Profile) -> Set[str]:
+        return {key[1] for key in profile if key[0] == 'cpu'}
+
+    @staticmethod
+    def drift(cached: Profile, profile: Profile) -> float:
+        """
+        :return: the most buckets any value known in both moved
+        """
+        maxDrift = 0
+        for key, value in cached.items():
+            if key not in profile:
+                continue
+            now = profile[key]
+            if now == value:
+                continue
+            if key[0] in EXACT_KINDS or now is None or value is None:
+                return inf
+            maxDrift = max(maxDrift, abs(now - value))
+        return maxDrift
+
+    def get(
+            self,
+            application: Application,
+            domainName: str,
+            profile: Profile) -> Tuple[Union[CachedPlacement, None], bool]:
+        """
+        :return: the closest placement found before, if any, and whether
+        it was found with the same fingerprint
+        """
+        with self._lock:
+            entries = self._entries.get(self.keyOf(application, domainName))
+            if not entries:
+                self.misses += 1
+                return None, False
+            fingerprint = self.fingerprint(profile)
+            if fingerprint in entries and \
+                    entries[fingerprint].profile == profile:
+                entries.move_to_end(fingerprint)
+                self.hits += 1
+                return entries[fingerprint], True
+            availableHostIDs = self.availableHostIDs(profile)
+            closest = None
+            closestDrift = inf
+            for cachedFingerprint, placement in list(entries.items()):
+                drift = self.drift(placement.profile, profile)
+                if drift > self.staleBuckets:
+                    del entries[cachedFingerprint]
+                    self.invalidated += 1
+                    continue
+                if not placement.hostIDs() <= availableHostIDs:
+                    continue
+                if drift < closestDrift:
+                    closest = placement
+                    closestDrift = drift
+            if closest is None:
+                self.misses += 1
+                return None, False
+            self.nearHits += 1
+            return closest, False
+
+    def put(
+            self,
+            application: Application,
+            domainName: str,
+            profile: Profile,
+            decision: Decision):
+        placement = CachedPlacement(
+            hostIDSequence=list(decision.hostIDSequence()),
+            indexSequence=list(decision.indexSequence),
+            cost=decision.cost,
+            profile=profile)
+        key = self.keyOf(application, domainName)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = OrderedDict()
+            entries = self._entries[key]
+            entries[self.fingerprint(profile)] = placement
+            entries.move_to_end(self.fingerprint(profile))
+            while len(entries) > self.maxEntriesPerKey:
+                entries.popitem(last=False)
+
+    def hitRate(self) -> float:
+        with self._lock:
+            lookups = self.hits + self.nearHits + self.misses
+            if not lookups:
+                return .0
+            return self.hits / lookups
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'nearHits': self.nearHits,
+                'misses': self.misses,
+                'invalidated': self.invalidated,
+                'entries': sum(len(e) for e in self._entries.values())}
@@ -0,0 +1,186 @@
+"""
+Replays a trace of user registrations against OHNSGA, without and with
+the placement cache.
+
+Run from the sources folder of the Master:
+    python -m utils.master.scheduler.placementCacheBenchmark
+
+The users register one of a few applications on a cluster whose profiles
+drift: the latencies change a little now and then, a lot once, and an
+actor leaves. Reports the exact and near hits of the cache and the time
+to placement.
+"""
+import argparse
+import logging
+import os
+from random import Random
+from tempfile import TemporaryDirectory
+from time import time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from .policies.nsga.ohnsga import OHNSGA
+from .placementCache import PlacementCache
+from ..application.base import Application
+from ..application.task.base import Task
+from ..application.task.dependency.base import TaskWithDependency
+from ..logger.allSystemPerformance import AllSystemPerformance
+from ..registry.roles import Actor
+from ..registry.roles import Master
+from ..registry.roles import User
+from ...types import ActorResources
+from ...types import CPU
+
+
+class BasicComponentStandIn:
+
+    def __init__(self):
+        self.debugLogger = logging.getLogger('PlacementCacheBenchmark')
+
+
+def application(name: str, taskNum: int) -> Application:
+    """
+    A chain of tasks from Sensor to Actuator
+    """
+    taskNames = ['Sensor'] + ['%s%d' % (name, i) for i in range(taskNum)]
+    tasks = {taskName: TaskWithDependency(taskName) for taskName in taskNames}
+    for parentName, childName in zip(taskNames, taskNames[1:]):
+        tasks[parentName].children.add(Task(childName))
+        tasks[childName].parents.add(Task(parentName))
+    tasks[taskNames[-1]].children.add(Task('Actuator'))
+    return Application(
+        name=name,
+        tasksWithDependency=tasks,
+        entryTasks=[tasks['Sensor'], tasks[taskNames[1]]])
+
+
+def cluster(actorNum: int, random: Random) \
+        -> Tuple[Master, List[Actor], AllSystemPerformance]:
+    master = Master(addr=('192.168.0.1', 5001), hostID='master')
+    actors = [
+        Actor(
+            addr=('192.168.1.%d' % i, 50000),
+            hostID='actor%d' % i,
+            componentID=str(i),
+            domainName='edge',
+            actorResources=ActorResources(
+                cpu=CPU(cores=random.randint(1, 8),
+                        frequency=random.choice((1500, 2400, 3000)))))
+        for i in range(actorNum)]
+    hostIDs = [master.hostID] + [actor.hostID for actor in actors]
+    systemPerformance = AllSystemPerformance(
+        latency={
+            source: {dest: random.uniform(1, 50) for dest in hostIDs}
+            for source in hostIDs},
+        dataRate={
+            source: {dest: random.uniform(1e6, 1e8) for dest in hostIDs}
+            for source in hostIDs},
+        packetSize={
+            source: {dest: random.randint(1e3, 1e6) for dest in hostIDs}
+            for source in hostIDs})
+    return master, actors, systemPerformance
+
+
+def scale(latency: Dict, hostIDs: List[str], factor: float):
+    for source, fromSource in latency.items():
+        for dest in fromSource:
+            if source in hostIDs or dest in hostIDs:
+                fromSource[dest] *= factor
+
+
+def replay(
+        scheduler: OHNSGA,
+        registrations: int,
+        actorNum: int,
+        seed: int) -> List[float]:
+    """
+    :return: the time to placement of each registration
+    """
+    random = Random(seed)
+    master, actors, systemPerformance = cluster(actorNum, random)
+    applications = [
+        application('Detection', 4),
+        application('Tracking', 6),
+        application('Analytics', 8)]
+    # Users of an application with different labels are placed apart
+    labels = ('480', '720')
+    times = []
+    for i in range(registrations):
+        if i and i % 15 == 0:
+            # The latencies of a few hosts change a little
+            scale(systemPerformance.latency,
+                  random.sample([a.hostID for a in actors], 2), 1.1)
+        if i == registrations // 2:
+            # The network changes a lot
+            scale(systemPerformance.latency,
+                  [a.hostID for a in actors[:actorNum // 2]], 3)
+        if i == registrations * 3 // 4:
+            actors = actors[1:]
+        user = User(
+            application=random.choice(applications).copy(
+                withLabel=random.choice(labels)),
+            componentID=str(i),
+            hostID='user%d' % i,
+            domainName='edge')
+        startTime = time()
+        scheduler._schedule(
+            user=user,
+            master=master,
+            allActors=actors,
+            systemPerformance=systemPerformance,
+            isContainerMode=False)
+        times.append(time() - startTime)
+    return times
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Placement cache benchmark')
+    parser.add_argument('--registrations', type=int, default=60)
+    parser.add_argument('--actors', type=int, default=10)
+    parser.add_argument('--populationSize', type=int, default=100)
+    parser.add_argument('--generationNum', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    for name, placementCache in (
+            # Keeps nothing, so that every lookup misses
+            ('without', PlacementCache(maxEntriesPerKey=0)),
+            ('with', PlacementCache())):
+        scheduler = OHNSGA(
+            knownMasters=set(),
+            minimumActors=1,
+            generationNum=args.generationNum,
+            populationSize=args.populationSize,
+            basicComponent=BasicComponentStandIn(),
+            estimationThreadNum=1,
+            isContainerMode=False)
+        scheduler.placementCache = placementCache
+        sources = os.getcwd()
+        # OHNSGA writes record.json in the working directory
+        with TemporaryDirectory() as workingDirectory:
+            os.chdir(workingDirectory)
+            try:
+                times = replay(
+                    scheduler=scheduler,
+                    registrations=args.registrations,
+                    actorNum=args.actors,
+                    seed=args.seed)
+            finally:
+                os.chdir(sources)
+        scheduler.evaluationPool.shutdown()
+        stats = placementCache.stats()
+        print('%-7s cache: hit rate %3.0f%%, near hits %2d, invalidated %2d, '
+              'time to placement p50 %6.1f ms, p99 %6.1f ms, '
+              'total %5.1f s' % (
+                  name, placementCache.hitRate() * 100, stats['nearHits'],
+                  stats['invalidated'], percentile(times, .5) * 1000,
+                  percentile(times, .99) * 1000, sum(times)))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,9 @@ import os
 from abc import abstractmethod
 from random import randint
 from threading import Lock
+from threading import Thread
 from time import time
-from typing import Dict
+from traceback import print_exc
 from typing import List
 from typing import Set
 from typing import Tuple
@@ -20,11 +21,17 @@ from pymoo.model.mutation import Mutation
 from pymoo.model.selection import Selection
 from pymoo.optimize import minimize as geneticMinimize
 
+from .geneticProblem import EvaluationPool
 from .geneticProblem import GeneticProblem
 from .scaler.base import NSGAScaler
 from .selections.tournament import TournamentSelection
 from .termination import TimeBasedSingleObjectiveDefaultTermination
+from .tools.greedyPlacement import greedyPlacement
 from ...base import BaseScheduler
+from ...decisionHistory import DecisionHistory
+from ...estimator import MatrixEstimator
+from ...placementCache import PlacementCache
+from ...placementCache import Profile
 from ...types import Decision
 from ....logger.allSystemPerformance import AllSystemPerformance
 from ....registry.roles import User
@@ -47,7 +54,8 @@ class BaseNSGA(BaseScheduler):
             populationSize: int,
             basicComponent: BasicComponent,
             estimationThreadNum: int,
-            isContainerMode: bool):
+            isContainerMode: bool,
+            evaluationPoolMode: str = 'threads'):
         BaseScheduler.__init__(
             self, schedulerName=schedulerName, isContainerMode=isContainerMode)
         self.scaler = NSGAScaler
@@ -56,11 +64,26 @@ class BaseNSGA(BaseScheduler):
         self.basicComponent = basicComponent
         self.generationNum = generationNum
         self.populationSize = populationSize
-        self.decisionHistory: Dict[str, List[Decision]] = {}
+        # The placements made, by application, which OHNSGA starts from
+        self.decisionHistory = DecisionHistory()
         self.geneticAlgorithm: GeneticAlgorithm = None
         self.geneticProblem: GeneticProblem = None
         self.estimationThreadNum = estimationThreadNum
+        self.evaluationPool = EvaluationPool(
+            workerNum=estimationThreadNum, mode=evaluationPoolMode)
         self.lock = Lock()
+        # The placements found before, the closest one to the cluster now
+        # is where the next run starts from
+        self.placementCache = PlacementCache()
+        self.seedHostIDSequences: List[List[str]] = []
+        # Seconds a run may take, and one starting from a near hit
+        self.maxTime = 5
+        self.nearHitMaxTime = 1
+        # Place users at once and keep optimizing in the background,
+        # migrating if the estimated cost drops by more than migrationCost
+        # milliseconds
+        self.anytime = False
+        self.migrationCost = 10
 
     def _schedule(
             self,
@@ -69,8 +92,87 @@ class BaseNSGA(BaseScheduler):
             allActors: List[Actor],
             systemPerformance: AllSystemPerformance,
             isContainerMode: bool) -> Decision:
+        if self.anytime:
+            return self.scheduleAnytime(
+                user=user,
+                master=master,
+                allActors=allActors,
+                systemPerformance=systemPerformance,
+                isContainerMode=isContainerMode)
         self.joinWaiting()
         self.lock.acquire()
+        # Released even if the run fails, so that others can still run
+        try:
+            lookupStartTime = time() * 1000
+            profile = self.placementCache.profileOf(
+                master=master,
+                allActors=allActors,
+                systemPerformance=systemPerformance)
+            decision, seedHostIDSequences = self.lookUp(
+                user=user, profile=profile, startTime=lookupStartTime)
+            if decision is None:
+                maxTime = self.maxTime
+                if len(seedHostIDSequences):
+                    maxTime = self.nearHitMaxTime
+                decision = self.optimize(
+                    user=user,
+                    master=master,
+                    allActors=allActors,
+                    systemPerformance=systemPerformance,
+                    isContainerMode=isContainerMode,
+                    profile=profile,
+                    seedHostIDSequences=seedHostIDSequences,
+                    maxTime=maxTime)
+        finally:
+            self.leaveWaiting()
+            self.lock.release()
+        return decision
+
+    def lookUp(
+            self,
+            user: User,
+            profile: Profile,
+            startTime: float) -> Tuple[Union[Decision, None], List[List[str]]]:
+        """
+        :return: the placement found before with the same profile if any,
+        otherwise the placements to start from
+        """
+        placement, isExact = self.placementCache.get(
+            application=user.application,
+            domainName=user.domainName,
+            profile=profile)
+        if placement is None:
+            return None, []
+        if not isExact:
+            return None, [placement.hostIDSequence]
+        decision = Decision(
+            user=user,
+            indexSequence=placement.indexSequence,
+            cost=placement.cost,
+            indexToHostID=list(placement.hostIDSequence),
+            schedulingTime=time() * 1000 - startTime)
+        self.basicComponent.debugLogger.debug(
+            'Placement cache hit: %s', self.placementCache.stats())
+        self.recordDecision(decision)
+        return decision, []
+
+    def optimize(
+            self,
+            user: User,
+            master: Master,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance,
+            isContainerMode: bool,
+            profile: Profile,
+            seedHostIDSequences: List[List[str]],
+            maxTime: float) -> Decision:
+        """
+        Runs the genetic algorithm, holding the lock
+        :param seedHostIDSequences: the placements to start from
+        :param maxTime: seconds the run may take
+        :return: the best placement found
+        """
+        self.seedHostIDSequences = seedHostIDSequences
         self.geneticProblem = self.prepareGeneticProblem(
             user=user,
             master=master,
@@ -83,14 +185,14 @@ class BaseNSGA(BaseScheduler):
         self.basicComponent.debugLogger.debug(
             'Scheduling using: %s', self.name)
         termination = TimeBasedSingleObjectiveDefaultTermination(
-            maxTime=5,
+            maxTime=maxTime,
             x_tol=1e-8,
             cv_tol=1e-6,
             f_tol=1e-6,
             nth_gen=5,
-            n_last=self.generationNum % 10,
+            n_last=20,
             n_max_gen=self.generationNum,
-            n_max_evals=self.generationNum >> 1)
+            n_max_evals=self.generationNum * self.populationSize)
         startTime = time() * 1000
         result = geneticMinimize(
             problem=self.geneticProblem,
@@ -98,12 +200,118 @@ class BaseNSGA(BaseScheduler):
             seed=randint(0, 100),
             termination=termination)
         schedulingTime = time() * 1000 - startTime
+        self.basicComponent.debugLogger.debug(
+            'Evaluation pool: %s', self.evaluationPool.stats())
         decision = self.handleNSGAResult(
             user=user, result=result, schedulingTime=schedulingTime)
-        self.leaveWaiting()
-        self.lock.release()
+        self.placementCache.put(
+            application=user.application,
+            domainName=user.domainName,
+            profile=profile,
+            decision=decision)
         return decision
 
+    def scheduleAnytime(
+            self,
+            user: User,
+            master: Master,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance,
+            isContainerMode: bool) -> Decision:
+        """
+        Places the user at once, with the greedy placement or the one found
+        before if it is estimated to be better, without waiting for the
+        lock. The genetic algorithm then runs in the background from it
+        """
+        startTime = time() * 1000
+        profile = self.placementCache.profileOf(
+            master=master,
+            allActors=allActors,
+            systemPerformance=systemPerformance)
+        decision, seedHostIDSequences = self.lookUp(
+            user=user, profile=profile, startTime=startTime)
+        if decision is not None:
+            return decision
+        estimator = MatrixEstimator(
+            user=user,
+            master=master,
+            allActors=allActors,
+            systemPerformance=systemPerformance,
+            isContainerMode=isContainerMode)
+        candidates = [greedyPlacement(estimator) + [0, 0]]
+        for hostIDSequence in seedHostIDSequences:
+            candidates.append(
+                estimator.mapHostIDSequenceToIndexSequence(hostIDSequence)
+                + [0, 0])
+        costs = estimator.estimateCosts(candidates)
+        indexSequence = candidates[int(np.argmin(costs))]
+        decision = Decision(
+            user=user,
+            indexSequence=indexSequence,
+            cost=float(np.min(costs)),
+            indexToHostID=estimator.mapIndexSequenceToHostIDSequence(
+                indexSequence),
+            schedulingTime=time() * 1000 - startTime)
+        self.recordDecision(decision)
+        # Counted from now, so that the waiting count covers it at once
+        self.joinWaiting()
+        Thread(
+            target=self.refine,
+            args=(decision, master, allActors, systemPerformance,
+                  isContainerMode, profile, seedHostIDSequences),
+            name='Refine-%s' % user.nameLogPrinting,
+            daemon=True).start()
+        return decision
+
+    def refine(
+            self,
+            previous: Decision,
+            master: Master,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance,
+            isContainerMode: bool,
+            profile: Profile,
+            seedHostIDSequences: List[List[str]]):
+        """
+        Runs the genetic algorithm from the placement the user was given,
+        and hands the placement found to handleRefinedDecision if it is
+        estimated to save more than migrationCost
+        """
+        user = previous.user
+        self.lock.acquire()
+        try:
+            refined = self.optimize(
+                user=user,
+                master=master,
+                allActors=allActors,
+                systemPerformance=systemPerformance,
+                isContainerMode=isContainerMode,
+                profile=profile,
+                seedHostIDSequences=[previous.hostIDSequence()]
+                                    + seedHostIDSequences,
+                maxTime=self.maxTime)
+            # The cost of a decision of the genetic algorithm is its
+            # fitness, so both are estimated again
+            estimator = self.geneticProblem.estimator
+            previousCost = estimator.estimateCost(
+                estimator.mapHostIDSequenceToIndexSequence(
+                    previous.hostIDSequence()) + [0, 0])
+            refinedCost = estimator.estimateCost(refined.indexSequence)
+        except Exception:
+            print_exc()
+            return
+        finally:
+            self.leaveWaiting()
+            self.lock.release()
+        self.basicComponent.debugLogger.debug(
+            'Refined %s: %.2f ms -> %.2f ms',
+            user.nameLogPrinting, previousCost, refinedCost)
+        if previousCost - refinedCost <= self.migrationCost:
+            return
+        if self.handleRefinedDecision is None:
+            return
+        self.handleRefinedDecision(previous, refined)
+
     def prepareGeneticProblem(
             self,
             user: User,
@@ -119,7 +327,7 @@ class BaseNSGA(BaseScheduler):
             systemPerformance=systemPerformance,
             allActors=allActors,
             populationSize=self.populationSize,
-            threadNum=self.estimationThreadNum,
+            evaluationPool=self.evaluationPool,
             isContainerMode=isContainerMode)
         return geneticProblem
 
@@ -162,11 +370,23 @@ class BaseNSGA(BaseScheduler):
             indexToHostID=indexToHostID,
             schedulingTime=schedulingTime,
             evaluationRecord=self.geneticProblem.evaluationRecords)
-        if user.application.nameWithLabel not in self.decisionHistory:
-            self.decisionHistory[user.application.nameWithLabel] = []
-        self.decisionHistory[user.application.nameWithLabel].append(decision)
+        self.recordDecision(decision)
         return decision
 
+    def recordDecision(self, decision: Decision):
+        self.decisionHistory.append(
+            decision.user.application.nameWithLabel, decision)
+
+    def seedIndexSequences(self) -> List[List[int]]:
+        """
+        :return: the placements to start from, as index sequences of the
+        genetic problem now
+        """
+        estimator = self.geneticProblem.estimator
+        return [
+            estimator.mapHostIDSequenceToIndexSequence(hostIDSequence)
+            for hostIDSequence in self.seedHostIDSequences]
+
     @staticmethod
     def getDefaultTriple() -> Tuple[Selection, Crossover, Mutation]:
         selection = TournamentSelection()
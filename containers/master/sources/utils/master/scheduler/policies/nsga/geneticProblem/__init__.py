@@ -1 +1,2 @@
+from .evaluationPool import EvaluationPool
 from .geneticProblem import GeneticProblem
@@ -0,0 +1,93 @@
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import time
+from typing import Dict
+from typing import Union
+
+import numpy as np
+
+from ....estimator import CostMatrices
+
+
+def estimateChunk(costMatrices: CostMatrices, indexSequences: np.ndarray) \
+        -> np.ndarray:
+    # Module level, so that processes can unpickle it
+    return costMatrices.estimateCosts(indexSequences)
+
+
+class EvaluationPool:
+    """
+    Workers shared by every scheduling request of the scheduler.
+
+    Created once with the scheduler and kept for the whole process.
+    A population is split into chunks which are estimated by the workers,
+    either threads, or processes to avoid the GIL.
+    """
+
+    def __init__(
+            self,
+            workerNum: int = 4,
+            mode: str = 'threads',
+            chunkSize: int = 50):
+        if mode not in {'threads', 'processes'}:
+            raise Exception('Evaluation pool mode is invalid: %s' % mode)
+        self.workerNum = workerNum
+        self.mode = mode
+        self.chunkSize = chunkSize
+        self.executor: Executor = self.createExecutor()
+        self._lock = Lock()
+        self._pendingChunks = 0
+        self._evaluated = 0
+        self._evaluatingTime = .0
+
+    def createExecutor(self) -> Union[ThreadPoolExecutor, ProcessPoolExecutor]:
+        if self.mode == 'processes':
+            return ProcessPoolExecutor(max_workers=self.workerNum)
+        return ThreadPoolExecutor(
+            max_workers=self.workerNum,
+            thread_name_prefix='Evaluation')
+
+    def evaluate(
+            self,
+            costMatrices: CostMatrices,
+            indexSequences: np.ndarray) -> np.ndarray:
+        """
+        Estimate the cost of every individual of a population
+        :param costMatrices: cost model of the current scheduling request
+        :param indexSequences: the population, each row is an individual
+        :return: Estimated total cost of each row
+        """
+        chunkNum = max(1, -(-len(indexSequences) // self.chunkSize))
+        chunks = np.array_split(indexSequences, chunkNum)
+        with self._lock:
+            self._pendingChunks += len(chunks)
+        startTime = time()
+        try:
+            futures = [
+                self.executor.submit(estimateChunk, costMatrices, chunk)
+                for chunk in chunks]
+            costs = np.concatenate([future.result() for future in futures])
+        finally:
+            with self._lock:
+                self._pendingChunks -= len(chunks)
+        with self._lock:
+            self._evaluated += len(costs)
+            self._evaluatingTime += time() - startTime
+        return costs
+
+    def stats(self) -> Dict:
+        with self._lock:
+            evaluationsPerSecond = .0
+            if self._evaluatingTime:
+                evaluationsPerSecond = self._evaluated / self._evaluatingTime
+            return {
+                'mode': self.mode,
+                'workerNum': self.workerNum,
+                'queueDepth': self._pendingChunks,
+                'evaluated': self._evaluated,
+                'evaluationsPerSecond': evaluationsPerSecond}
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
@@ -1,14 +1,12 @@
-from queue import Queue
-from threading import Event
-from threading import Thread
 from typing import Dict
 from typing import List
-from typing import Tuple
+from typing import Union
 
 import numpy as np
 from pymoo.model.problem import Problem
 
-from ....estimator import Estimator
+from .evaluationPool import EvaluationPool
+from ....estimator import MatrixEstimator
 from .....logger.allSystemPerformance import AllSystemPerformance
 from .....registry.roles import Actor
 from .....registry.roles import Master
@@ -26,16 +24,13 @@ class GeneticProblem(Problem):
             allActors: List[Actor],
             isContainerMode: bool,
             populationSize: int,
-            threadNum: int = 4):
-        self.threadNum = threadNum
+            evaluationPool: Union[EvaluationPool, None] = None):
+        self.evaluationPool = evaluationPool
         self.populationSize = populationSize
-        self.individualEvents = [Event() for _ in range(self.populationSize)]
-        self.individualQueue: Queue[Tuple[int, List[int], Event]] = Queue()
         self.result = np.asarray([.0 for _ in range(self.populationSize)])
         self.resultAB = np.asarray([.0 for _ in range(self.populationSize)])
-        self.runEvaluationThreadPool(threadNum=threadNum)
 
-        self.estimator = Estimator(
+        self.estimator = MatrixEstimator(
             user=user,
             master=master,
             systemPerformance=systemPerformance,
@@ -74,48 +69,22 @@ class GeneticProblem(Problem):
             i += 1
         return choicesEachVariable
 
-    def runEvaluationThreadPool(self, threadNum: int = 4):
-        for i in range(threadNum):
-            Thread(target=self.estimationThread).start()
-
-    def estimationThread(self):
-        while True:
-            i, individual, event = self.individualQueue.get()
-            self.result[i] = self.estimator.estimateCost(individual)
-            event.set()
-
     def _evaluate(self, indexSequenceList, out, *args, **kwargs):
-        for i in range(len(indexSequenceList)):
-            for j in range(len(indexSequenceList[i][:-2])):
-                indexSequenceList[i][j] = int(indexSequenceList[i][j])
-
-        for i, indexSequence in enumerate(indexSequenceList):
-            self.individualQueue.put(
-                (i, indexSequence, self.individualEvents[i]))
-        for event in self.individualEvents:
-            event.wait()
-            event.clear()
-
-        max_cost = max(self.result)
-
-        N = 3
-        M = len(indexSequenceList[0]) - 2
-        for i in range(len(self.result)):
-            a = indexSequenceList[i][-2]
-            b = indexSequenceList[i][-1]
-            normalized = self.result[i] / max_cost
-            right = 0
-            for x in indexSequenceList[i][:-2]:
-                x = int(x)
-                if x < 1:
-                    right += 1
-                elif x < 2:
-                    right += 0.5
-                else:
-                    right += 0.01
-            right /= M
-            self.resultAB[i] = a * normalized + b * right
-            print(self.resultAB[i], a, normalized, b, right)
+        indexSequenceList[:, :-2] = indexSequenceList[:, :-2].astype(int)
+
+        if self.evaluationPool is None:
+            self.result = self.estimator.estimateCosts(indexSequenceList)
+        else:
+            self.result = self.evaluationPool.evaluate(
+                self.estimator.costMatrices, indexSequenceList)
+
+        normalized = self.result / max(self.result)
+        indexes = indexSequenceList[:, :-2]
+        right = np.where(indexes < 1, 1, np.where(indexes < 2, 0.5, 0.01))
+        right = right.sum(axis=1) / indexes.shape[1]
+        a = indexSequenceList[:, -2]
+        b = indexSequenceList[:, -1]
+        self.resultAB = a * normalized + b * right
 
         # out['F'] = self.result
         out['F'] = self.resultAB
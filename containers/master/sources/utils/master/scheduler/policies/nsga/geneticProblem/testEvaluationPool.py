@@ -0,0 +1,61 @@
+import threading
+import unittest
+
+import numpy as np
+
+from .evaluationPool import EvaluationPool
+from .geneticProblem import GeneticProblem
+from ....estimator import testMatrixEstimator
+
+
+class EvaluationPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        inputs = testMatrixEstimator.MatrixEstimatorTest()
+        inputs.setUp()
+        self.estimator, self.matrixEstimator = inputs.estimators(12, 10)
+        self.population = inputs.population(self.estimator, 200)
+
+    def geneticProblem(self, evaluationPool: EvaluationPool) \
+            -> GeneticProblem:
+        return GeneticProblem(
+            user=self.estimator.user,
+            master=self.estimator.master,
+            systemPerformance=self.estimator.systemPerformance,
+            allActors=self.estimator.allActors,
+            isContainerMode=False,
+            populationSize=len(self.population),
+            evaluationPool=evaluationPool)
+
+    def testSameCost(self):
+        expected = self.matrixEstimator.estimateCosts(self.population)
+        for mode in ('threads', 'processes'):
+            evaluationPool = EvaluationPool(workerNum=3, mode=mode)
+            costs = evaluationPool.evaluate(
+                self.matrixEstimator.costMatrices, self.population)
+            self.assertTrue(np.array_equal(expected, costs))
+            stats = evaluationPool.stats()
+            self.assertEqual(stats['evaluated'], len(self.population))
+            self.assertEqual(stats['queueDepth'], 0)
+            self.assertGreater(stats['evaluationsPerSecond'], 0)
+            evaluationPool.shutdown()
+
+    def testInvalidMode(self):
+        with self.assertRaises(Exception):
+            EvaluationPool(mode='fibers')
+
+    def testThreadNumIsFlat(self):
+        threadNum = threading.active_count()
+        evaluationPool = EvaluationPool(workerNum=4)
+        for _ in range(1000):
+            geneticProblem = self.geneticProblem(evaluationPool)
+            geneticProblem.evaluate(self.population.copy())
+        # The workers are started once, on demand
+        self.assertLessEqual(
+            threading.active_count(), threadNum + evaluationPool.workerNum)
+        self.assertEqual(evaluationPool.stats()['evaluated'], 1000 * 200)
+        evaluationPool.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,8 @@ class NSGA2(BaseNSGA):
             basicComponent: BasicComponent,
             estimationThreadNum: int,
             isContainerMode: bool,
-            historyRatio: float = .5, ):
+            historyRatio: float = .5,
+            evaluationPoolMode: str = 'threads'):
         BaseNSGA.__init__(
             self,
             knownMasters=knownMasters,
@@ -32,7 +33,8 @@ class NSGA2(BaseNSGA):
             populationSize=populationSize,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            evaluationPoolMode=evaluationPoolMode)
         self.historyRatio = historyRatio
 
     def prepareGeneticAlgorithm(
@@ -58,4 +60,6 @@ class NSGA2(BaseNSGA):
             upperBounds=upperBounds,
             variableNum=variableNum,
             populationSize=self.populationSize)
+        for i, indexSequence in enumerate(self.seedIndexSequences()):
+            initPopulation[i, :variableNum] = indexSequence
         return initPopulation
@@ -23,7 +23,8 @@ class NSGA3(BaseNSGA):
             basicComponent: BasicComponent,
             estimationThreadNum: int,
             isContainerMode: bool,
-            historyRatio: float = .5, ):
+            historyRatio: float = .5,
+            evaluationPoolMode: str = 'threads'):
         BaseNSGA.__init__(
             self,
             knownMasters=knownMasters,
@@ -33,7 +34,8 @@ class NSGA3(BaseNSGA):
             populationSize=populationSize,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            evaluationPoolMode=evaluationPoolMode)
         self.historyRatio = historyRatio
 
     def prepareGeneticAlgorithm(
@@ -61,4 +63,6 @@ class NSGA3(BaseNSGA):
             upperBounds=upperBounds,
             variableNum=variableNum,
             populationSize=self.populationSize)
+        for i, indexSequence in enumerate(self.seedIndexSequences()):
+            initPopulation[i, :variableNum] = indexSequence
         return initPopulation
@@ -30,7 +30,8 @@ class OHNSGA(BaseNSGA):
             isContainerMode: bool,
             historyRatio: float = .5,
             A: Tuple[float, float] = (0.1, 1),
-            B: Tuple[float, float] = (0.1, 1)):
+            B: Tuple[float, float] = (0.1, 1),
+            evaluationPoolMode: str = 'threads'):
         BaseNSGA.__init__(
             self,
             knownMasters=knownMasters,
@@ -40,7 +41,8 @@ class OHNSGA(BaseNSGA):
             populationSize=populationSize,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            evaluationPoolMode=evaluationPoolMode)
         self.historyRatio = historyRatio
         self.A = A
         self.B = B
@@ -62,29 +64,30 @@ class OHNSGA(BaseNSGA):
 
     def generateInitPopulation(
             self, application: Application, estimator: Estimator):
-        if application.nameWithLabel not in self.decisionHistory:
-            decisionHistory = []
-        else:
-            decisionHistory = self.decisionHistory[application.nameWithLabel]
-        numDecisionHistory = len(decisionHistory)
+        hostIDSequences = self.decisionHistory.hostIDSequences(
+            application.nameWithLabel)
+        numDecisionHistory = len(hostIDSequences)
         numDecisionToUse = int(numDecisionHistory * self.historyRatio)
-        decisionHistory = decisionHistory[-numDecisionToUse:]
+        hostIDSequences = hostIDSequences[-numDecisionToUse:]
         indexSequences = self.understandHistory(
-            decisionHistory=decisionHistory,
+            hostIDSequences=hostIDSequences,
             estimator=estimator)
-        initPopulation = self.fillWithRandomIndexSequence(indexSequences)
+        initPopulation = self.fillWithRandomIndexSequence(
+            indexSequences, seeds=self.seedIndexSequences())
         return initPopulation
 
     @staticmethod
-    def understandHistory(decisionHistory, estimator):
-        indexSequences = [[] for _ in range(len(decisionHistory))]
-        for i, decision in enumerate(decisionHistory):
-            hostIDSequence = decision.hostIDSequence()
+    def understandHistory(hostIDSequences, estimator):
+        indexSequences = [[] for _ in range(len(hostIDSequences))]
+        for i, hostIDSequence in enumerate(hostIDSequences):
             indexSequences[i] = \
                 estimator.mapHostIDSequenceToIndexSequence(hostIDSequence)
         return indexSequences
 
-    def fillWithRandomIndexSequence(self, indexSequences: List[List[int]]):
+    def fillWithRandomIndexSequence(
+            self,
+            indexSequences: List[List[int]],
+            seeds: List[List[int]] = None):
         upperBounds = self.geneticProblem.upperBound
         upperBounds.extend([self.A[1], self.B[1]])
         lowerBounds = [0 for _ in range(len(upperBounds))]
@@ -100,6 +103,13 @@ class OHNSGA(BaseNSGA):
             indexSequence.extend([self.A[0], self.B[0]])
             random.shuffle(indexSequence)
             indexSequencesRandom[i] = indexSequence
+        # Unlike the history, the seeds are not shuffled
+        if seeds is None:
+            seeds = []
+        for i, indexSequence in enumerate(seeds, start=len(indexSequences)):
+            if i >= len(indexSequencesRandom):
+                break
+            indexSequencesRandom[i] = indexSequence + [self.A[0], self.B[0]]
         population = Population.new("X", indexSequencesRandom)
         Evaluator_().eval(self.geneticProblem, population)
         for i in range(len(population)):
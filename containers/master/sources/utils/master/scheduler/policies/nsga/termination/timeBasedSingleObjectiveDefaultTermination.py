@@ -15,4 +15,4 @@ class TimeBasedSingleObjectiveDefaultTermination(
     def do_continue(self, algorithm):
         if time() - self.startTime > self.maxTime:
             return False
-        self.do_continueTemp(self, algorithm)
+        return self.do_continueTemp(self, algorithm)
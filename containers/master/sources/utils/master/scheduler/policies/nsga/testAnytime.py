@@ -0,0 +1,87 @@
+import os
+import unittest
+from math import inf
+from queue import Queue
+from random import Random
+from tempfile import TemporaryDirectory
+from time import sleep
+from time import time
+
+from .ohnsga import OHNSGA
+from ...placementCache import PlacementCache
+from ...placementCacheBenchmark import BasicComponentStandIn
+from ...placementCacheBenchmark import application
+from ...placementCacheBenchmark import cluster
+from ....registry.roles import User
+
+
+class AnytimeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sources = os.getcwd()
+        # OHNSGA writes record.json in the working directory
+        self.workingDirectory = TemporaryDirectory()
+        os.chdir(self.workingDirectory.name)
+        self.master, self.actors, self.systemPerformance = cluster(
+            8, Random(0))
+        self.scheduler = OHNSGA(
+            knownMasters=set(),
+            minimumActors=1,
+            generationNum=20,
+            populationSize=50,
+            basicComponent=BasicComponentStandIn(),
+            estimationThreadNum=1,
+            isContainerMode=False)
+        self.scheduler.placementCache = PlacementCache(maxEntriesPerKey=0)
+        self.scheduler.anytime = True
+        self.scheduler.maxTime = 1
+        self.refined = Queue()
+        self.scheduler.handleRefinedDecision = \
+            lambda previous, refined: self.refined.put((previous, refined))
+
+    def tearDown(self):
+        self.scheduler.evaluationPool.shutdown()
+        os.chdir(self.sources)
+        self.workingDirectory.cleanup()
+
+    def schedule(self, i: int):
+        user = User(
+            application=application('Detection', 4).copy(withLabel=str(i)),
+            componentID=str(i),
+            domainName='edge')
+        return self.scheduler._schedule(
+            user=user,
+            master=self.master,
+            allActors=self.actors,
+            systemPerformance=self.systemPerformance,
+            isContainerMode=False)
+
+    def testPlacedBeforeOptimizing(self):
+        self.scheduler.migrationCost = -inf
+        startTime = time()
+        decision = self.schedule(0)
+        self.assertLess(time() - startTime, self.scheduler.maxTime)
+        self.assertEqual(
+            len(decision.hostIDSequence()),
+            len(decision.user.application.taskNameList))
+        self.assertEqual(self.scheduler.readWaitingCount(), 1)
+        previous, refined = self.refined.get(timeout=30)
+        self.assertIs(previous, decision)
+        self.assertIs(refined.user, decision.user)
+        self.assertEqual(self.scheduler.readWaitingCount(), 0)
+
+    def testNotMigratedUnlessWorthIt(self):
+        self.scheduler.migrationCost = inf
+        self.schedule(0)
+        self.schedule(1)
+        startTime = time()
+        while self.scheduler.readWaitingCount() and time() - startTime < 30:
+            sleep(.1)
+        self.assertEqual(self.scheduler.readWaitingCount(), 0)
+        self.assertTrue(self.refined.empty())
+        # Both the greedy and the refined decisions are recorded
+        self.assertEqual(self.scheduler.decisionHistory.count(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+from typing import List
+
+import numpy as np
+
+from ....estimator import MatrixEstimator
+
+
+def greedyPlacement(
+        estimator: MatrixEstimator,
+        maxRounds: int = 3) -> List[int]:
+    """
+    Places one task at a time on the actor giving the lowest estimated
+    cost, the other tasks staying where they are, until no task moves
+    :param estimator: the estimator of the scheduling request
+    :param maxRounds: how many times each task may be moved at most
+    :return: the index sequence, without the two factors of the genetic
+    problem
+    """
+    taskNum = len(estimator.taskList)
+    choices = [
+        len(estimator.actorsByTaskName[taskName])
+        for taskName in estimator.taskList]
+    # Round-robin to start with
+    indexSequence = np.asarray(
+        [i % choices[i] for i in range(taskNum)], dtype=float)
+    bestCost = estimator.estimateCosts(
+        np.append(indexSequence, [0, 0])[None, :])[0]
+    for _ in range(maxRounds):
+        moved = False
+        for i in range(taskNum):
+            # Every actor of the task, the others unchanged
+            candidates = np.tile(np.append(indexSequence, [0, 0]),
+                                 (choices[i], 1))
+            candidates[:, i] = np.arange(choices[i])
+            costs = estimator.estimateCosts(candidates)
+            best = int(np.argmin(costs))
+            if costs[best] < bestCost:
+                bestCost = costs[best]
+                indexSequence[i] = best
+                moved = True
+        if not moved:
+            break
+    return [int(index) for index in indexSequence]
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from .greedyPlacement import greedyPlacement
+from ....estimator import testMatrixEstimator
+
+
+class GreedyPlacementTest(unittest.TestCase):
+
+    def setUp(self):
+        self.inputs = testMatrixEstimator.MatrixEstimatorTest()
+        self.inputs.setUp()
+
+    def testNoSingleMoveIsBetter(self):
+        for taskNum, actorNum in ((1, 1), (5, 3), (12, 10)):
+            estimator, matrixEstimator = self.inputs.estimators(
+                taskNum, actorNum)
+            indexSequence = greedyPlacement(matrixEstimator, maxRounds=100)
+            self.assertEqual(len(indexSequence), len(estimator.taskList))
+            cost = matrixEstimator.estimateCost(indexSequence + [0, 0])
+            for i in range(len(indexSequence)):
+                for index in range(actorNum):
+                    moved = list(indexSequence)
+                    moved[i] = index
+                    self.assertGreaterEqual(
+                        matrixEstimator.estimateCost(moved + [0, 0]), cost)
+
+    def testBetterThanRandomPlacements(self):
+        estimator, matrixEstimator = self.inputs.estimators(12, 10)
+        indexSequence = greedyPlacement(matrixEstimator)
+        cost = matrixEstimator.estimateCost(indexSequence + [0, 0])
+        population = self.inputs.population(estimator, 200)
+        self.assertLessEqual(
+            cost, np.median(matrixEstimator.estimateCosts(population)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,14 +39,14 @@ class SchedulerRandomPolicy(SchedulerPolicy):
         actorsNum = len(allActors)
         startTime = time()
         indexSequence = ['' for _ in range(len(taskNameList))]
-        indexToHostID = {}
+        indexToHostID = ['' for _ in range(len(taskNameList))]
         # Randomly assign Actors
         for i, task in enumerate(taskNameList):
-            randomActorIndex = randint(0, actorsNum)
+            randomActorIndex = randint(0, actorsNum - 1)
             indexSequence[i] = str(randomActorIndex)
 
             actor = allActors[randomActorIndex]
-            indexToHostID[str(randomActorIndex)] = actor.hostID
+            indexToHostID[i] = actor.hostID
         schedulingTime = (time() - startTime) * 1000
 
         # Create a decision object and return
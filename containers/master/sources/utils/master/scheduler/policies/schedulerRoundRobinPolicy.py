@@ -40,13 +40,13 @@ class SchedulerRoundRobinPolicy(SchedulerPolicy):
         actorsNum = len(allActors)
         startTime = time()
         indexSequence = ['' for _ in range(len(taskNameList))]
-        indexToHostID = {}
+        indexToHostID = ['' for _ in range(len(taskNameList))]
         # Assign in Round-robin style
         for i, _ in enumerate(indexSequence):
             actorIndex = i % actorsNum
             indexSequence[i] = str(actorIndex)
             actor = allActors[actorIndex]
-            indexToHostID[str(actorIndex)] = actor.hostID
+            indexToHostID[i] = actor.hostID
         schedulingTime = (time() - startTime) * 1000
 
         # Create a decision object and return
@@ -79,6 +79,8 @@ class SchedulerRoundRobinPolicy(SchedulerPolicy):
             allActors=allActors,
             isContainerMode=isContainerMode)
         indexSequence = [int(i) for i in decision.indexSequence]
+        # The estimator takes the two factors of the genetic problem too
+        indexSequence.extend([0, 0])
         # Estimate the cost
         estimatedCost = estimator.estimateCost(indexSequence)
         return estimatedCost
@@ -0,0 +1,160 @@
+"""
+Places users of the applications on simulated clusters of 5 to 1,000
+hosts with each scheduler.
+
+Run from the sources folder of the Master:
+    python -m utils.master.scheduler.schedulerBenchmark --output results.jsonl
+
+Each case runs in a process of its own, so that its peak memory is its
+own. Prints one JSON line per case, and appends it to the output if any,
+with the estimated response time of the placements, the seconds to
+placement, the evaluations per second and the memory, so that runs at
+different commits can be compared.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from tempfile import TemporaryDirectory
+from time import time
+from typing import Dict
+
+from .clusterSimulator import SimulatedCluster
+from .clusterSimulator import application
+from .clusterSimulator import applicationShapes
+from .clusterSimulator import closeScheduler
+from .clusterSimulator import createScheduler
+from .clusterSimulator import simulate
+from .placementCacheBenchmark import percentile
+
+
+def peakMemory() -> float:
+    """
+    :return: the peak resident memory of this process in MB
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def revision() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def runCase(case: Dict) -> Dict:
+    baseMemory = peakMemory()
+    startTime = time()
+    cluster = SimulatedCluster(hostNum=case['hosts'], seed=case['seed'])
+    clusterTime = time() - startTime
+    random = Random(case['seed'])
+    sources = os.getcwd()
+    # OHNSGA writes record.json in the working directory
+    with TemporaryDirectory() as workingDirectory:
+        os.chdir(workingDirectory)
+        scheduler = createScheduler(
+            cluster=cluster,
+            schedulerName=case['scheduler'],
+            populationSize=case['populationSize'],
+            generationNum=case['generationNum'],
+            maxTime=case['maxTime'],
+            placementCache=case['placementCache'],
+            parsedArgs=Namespace(
+                estimationThreadNum=case['estimationThreadNum'],
+                evaluationPool=case['evaluationPool'],
+                decisionHistory=''))
+        try:
+            results = simulate(
+                scheduler=scheduler,
+                cluster=cluster,
+                applicationFactory=lambda: application(
+                    case['application'], case['tasks'], random),
+                userNum=case['users'],
+                # The placement cache is by labelled application
+                label='N/A' if case['placementCache'] else None)
+        finally:
+            closeScheduler(scheduler)
+            os.chdir(sources)
+    costs = [result['cost'] for result in results]
+    wallTimes = [result['wallTime'] for result in results]
+    evaluated = sum(result['evaluated'] for result in results)
+    return {
+        'costMean': sum(costs) / len(costs),
+        'costP99': percentile(costs, .99),
+        'wallTimeMean': sum(wallTimes) / len(wallTimes),
+        'wallTimeP99': percentile(wallTimes, .99),
+        'evaluated': evaluated,
+        'evaluationsPerSecond': evaluated / sum(wallTimes),
+        'clusterTime': clusterTime,
+        'peakMemoryMB': peakMemory(),
+        'memoryMB': peakMemory() - baseMemory}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scheduler benchmark')
+    parser.add_argument(
+        '--schedulers', type=str,
+        default='OHNSGA,NSGA2,NSGA3,Random,RoundRobin')
+    parser.add_argument('--hosts', type=str, default='5,10,50,100,500,1000')
+    parser.add_argument(
+        '--applications', type=str, default=','.join(applicationShapes))
+    parser.add_argument('--tasks', type=int, default=8)
+    parser.add_argument('--users', type=int, default=3)
+    parser.add_argument('--populationSize', type=int, default=100)
+    parser.add_argument('--generationNum', type=int, default=100)
+    parser.add_argument(
+        '--maxTime', type=float, default=5,
+        help='Seconds a run of the genetic algorithms may take')
+    parser.add_argument(
+        '--placementCache', action='store_true',
+        help='Cache the placements, so that only the first user of an '
+             'application is optimized')
+    parser.add_argument('--estimationThreadNum', type=int, default=1)
+    parser.add_argument('--evaluationPool', type=str, default='threads')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--output', type=str, default='',
+        help='JSON lines file the results are appended to')
+    args = parser.parse_args()
+    commit = revision()
+    for hostNum in [int(h) for h in args.hosts.split(',')]:
+        for applicationShape in args.applications.split(','):
+            for schedulerName in args.schedulers.split(','):
+                case = {
+                    'scheduler': schedulerName,
+                    'hosts': hostNum,
+                    'application': applicationShape,
+                    'tasks': args.tasks,
+                    'users': args.users,
+                    'populationSize': args.populationSize,
+                    'generationNum': args.generationNum,
+                    'maxTime': args.maxTime,
+                    'placementCache': args.placementCache,
+                    'estimationThreadNum': args.estimationThreadNum,
+                    'evaluationPool': args.evaluationPool,
+                    'seed': args.seed}
+                # The workers may start processes of their own, for the
+                # evaluation pool
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    result = executor.submit(runCase, case).result()
+                result = {
+                    'commit': commit,
+                    'timestamp': time(),
+                    **case,
+                    **result}
+                line = json.dumps(result)
+                print(line, flush=True)
+                if args.output == '':
+                    continue
+                with open(args.output, 'a') as f:
+                    f.write(line + '\n')
+
+
+if __name__ == '__main__':
+    main()
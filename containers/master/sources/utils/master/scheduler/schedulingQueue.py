@@ -0,0 +1,108 @@
+from collections import deque
+from queue import Queue
+from threading import Lock
+from threading import Thread
+from time import sleep
+from time import time
+from traceback import print_exc
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Tuple
+
+from ..registry.roles import User
+
+
+class SchedulingQueue:
+    """
+    The users waiting to be scheduled, so that registering a user does not
+    wait for the scheduler. Workers take the users from the queue, and the
+    users of the same application, with the same label, and domain arriving
+    within the coalescing window are scheduled in one run.
+    """
+
+    def __init__(
+            self,
+            scheduleUsers: Callable[[List[User]], None],
+            workerNum: int = 2,
+            coalescingWindow: float = .05,
+            keptPlacementTimes: int = 1000):
+        """
+        :param scheduleUsers: schedules users of the same labelled
+        application and domain at once
+        :param workerNum: how many runs of the scheduler at the same time
+        :param coalescingWindow: how many seconds the first user waits for
+        others of the same labelled application and domain
+        :param keptPlacementTimes: how many of the latest times to
+        placement are kept for the stats
+        """
+        self.scheduleUsers = scheduleUsers
+        self.coalescingWindow = coalescingWindow
+        self._lock = Lock()
+        # When each user waiting arrived, by labelled application and domain
+        self._waiting: Dict[Hashable, List[Tuple[float, User]]] = {}
+        self._keys: Queue[Hashable] = Queue()
+        self.runs = 0
+        self.scheduledUsers = 0
+        # Seconds from the arrival of a user to the end of its run
+        self.placementTimes: Deque[float] = deque(maxlen=keptPlacementTimes)
+        for i in range(workerNum):
+            Thread(
+                target=self._work,
+                name='Scheduling-%d' % i,
+                daemon=True).start()
+
+    @staticmethod
+    def coalescingKey(user: User) -> Hashable:
+        return user.application.nameWithLabel, user.domainName
+
+    def put(self, user: User):
+        key = self.coalescingKey(user)
+        with self._lock:
+            if key in self._waiting:
+                self._waiting[key].append((time(), user))
+                return
+            self._waiting[key] = [(time(), user)]
+        self._keys.put(key)
+
+    def waitingCount(self) -> int:
+        with self._lock:
+            return sum(len(waiting) for waiting in self._waiting.values())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            placementTimes = sorted(self.placementTimes)
+            stats = {
+                'runs': self.runs,
+                'scheduledUsers': self.scheduledUsers}
+        if not placementTimes:
+            return stats
+        stats['placementTimeP50'] = \
+            placementTimes[len(placementTimes) // 2] * 1000
+        stats['placementTimeP99'] = \
+            placementTimes[int(len(placementTimes) * .99)] * 1000
+        return stats
+
+    def _work(self):
+        while True:
+            key = self._keys.get()
+            with self._lock:
+                firstArrival = self._waiting[key][0][0]
+            delay = firstArrival + self.coalescingWindow - time()
+            if delay > 0:
+                sleep(delay)
+            # The users arriving from now on wait for the next run
+            with self._lock:
+                waiting = self._waiting.pop(key)
+            try:
+                self.scheduleUsers([user for _, user in waiting])
+            except Exception:
+                print_exc()
+            endTime = time()
+            with self._lock:
+                self.runs += 1
+                self.scheduledUsers += len(waiting)
+                for arrival, _ in waiting:
+                    self.placementTimes.append(endTime - arrival)
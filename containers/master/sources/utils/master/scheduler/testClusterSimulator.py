@@ -0,0 +1,75 @@
+import os
+import unittest
+from random import Random
+from tempfile import TemporaryDirectory
+
+from .clusterSimulator import SimulatedCluster
+from .clusterSimulator import application
+from .clusterSimulator import applicationShapes
+from .clusterSimulator import closeScheduler
+from .clusterSimulator import createScheduler
+from .clusterSimulator import simulate
+
+
+class ClusterSimulatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sources = os.getcwd()
+        # OHNSGA writes record.json in the working directory
+        self.workingDirectory = TemporaryDirectory()
+        os.chdir(self.workingDirectory.name)
+        self.cluster = SimulatedCluster(hostNum=6, seed=0)
+
+    def tearDown(self):
+        os.chdir(self.sources)
+        self.workingDirectory.cleanup()
+
+    def testApplicationShapes(self):
+        random = Random(0)
+        for shape in applicationShapes:
+            user = self.cluster.newUser(application(shape, 5, random))
+            taskNum = len(user.application.taskNameList)
+            hostIDs = [actor.hostID for actor in self.cluster.actors]
+            cost = self.cluster.placementCost(user, hostIDs[:taskNum])
+            self.assertGreater(cost, 0)
+        # Slower on a slower CPU
+        user = self.cluster.newUser(
+            application('TrafficLightStatus', 1, random))
+        actors = sorted(
+            self.cluster.actors,
+            key=lambda a: a.actorResources.cpu.cores
+                          * a.actorResources.cpu.frequency)
+        costs = [
+            self.cluster.placementCost(user, [actor.hostID])
+            - self.cluster.systemPerformance.latency[
+                self.cluster.master.hostID][actor.hostID]
+            for actor in (actors[0], actors[-1])]
+        self.assertGreater(costs[0], costs[1])
+
+    def testEverySchedulerPlaces(self):
+        hostIDs = {actor.hostID for actor in self.cluster.actors}
+        schedulerNames = ('OHNSGA', 'NSGA2', 'NSGA3', 'Random', 'RoundRobin')
+        for schedulerName in schedulerNames:
+            scheduler = createScheduler(
+                cluster=self.cluster,
+                schedulerName=schedulerName,
+                populationSize=20,
+                generationNum=5,
+                maxTime=1)
+            try:
+                results = simulate(
+                    scheduler=scheduler,
+                    cluster=self.cluster,
+                    applicationFactory=lambda: application(
+                        'DAG', 4, Random(0)),
+                    userNum=2)
+            finally:
+                closeScheduler(scheduler)
+            for result in results:
+                self.assertEqual(len(result['hostIDSequence']), 4)
+                self.assertTrue(set(result['hostIDSequence']) <= hostIDs)
+                self.assertGreater(result['cost'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
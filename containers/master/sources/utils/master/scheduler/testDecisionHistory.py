@@ -0,0 +1,112 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from time import time
+
+from .decisionHistory import DecisionHistory
+from .decisionHistory import PastDecision
+
+
+def pastDecision(key: str, i: int, timestamp: float = None) -> PastDecision:
+    if timestamp is None:
+        timestamp = time()
+    return PastDecision(
+        key=key,
+        hostIDSequence=['%064d' % (i % 3), '%064d' % (i % 5)],
+        indexSequence=[i % 3, i % 5],
+        cost=float(i),
+        schedulingTime=1.5,
+        timestamp=timestamp)
+
+
+class DecisionHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.folder = os.path.join(self.directory.name, 'decisionHistory')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testBounded(self):
+        history = DecisionHistory(maxDecisionsPerKey=3, maxKeys=2)
+        for i in range(10):
+            history.appendPast(pastDecision('A', i))
+        history.appendPast(pastDecision('B', 0))
+        history.appendPast(pastDecision('A', 10))
+        history.appendPast(pastDecision('C', 0))
+        # B is the key used the longest ago
+        self.assertEqual(history.get('B'), [])
+        self.assertEqual([d.cost for d in history.get('A')], [8, 9, 10])
+        self.assertEqual(history.count(), 4)
+        self.assertFalse(os.path.exists(self.folder))
+
+    def testLoadedAfterRestart(self):
+        history = DecisionHistory(folder=self.folder)
+        for i in range(20):
+            history.appendPast(pastDecision('A' if i % 2 else 'B', i))
+        history.close()
+        loaded = DecisionHistory(folder=self.folder)
+        self.assertEqual(
+            loaded.hostIDSequences('A'), history.hostIDSequences('A'))
+        self.assertEqual(
+            [d.indexSequence for d in loaded.get('B')],
+            [d.indexSequence for d in history.get('B')])
+        # Appended after the ones loaded
+        loaded.appendPast(pastDecision('A', 20))
+        loaded.close()
+        self.assertEqual(
+            DecisionHistory(folder=self.folder).get('A')[-1].cost, 20)
+
+    def testCompaction(self):
+        history = DecisionHistory(
+            folder=self.folder,
+            maxDecisionsPerKey=5,
+            segmentSize=10,
+            compactionRatio=2)
+        for i in range(100):
+            history.appendPast(pastDecision('A', i))
+        history.close()
+        stats = history.stats()
+        self.assertGreater(stats['compactions'], 0)
+        self.assertLess(stats['onDisk'], 100)
+        self.assertEqual(
+            len(os.listdir(self.folder)),
+            stats['onDisk'] // 10 + 1)
+        loaded = DecisionHistory(folder=self.folder, maxDecisionsPerKey=5)
+        self.assertEqual(
+            [d.cost for d in loaded.get('A')], [95, 96, 97, 98, 99])
+
+    def testStoppedCompactionAndWrite(self):
+        history = DecisionHistory(folder=self.folder, segmentSize=4)
+        for i in range(8):
+            history.appendPast(pastDecision('A', i))
+        history.close()
+        # Stopped after the compacted segment replaced the first two, and
+        # while writing a decision
+        compacted = history.segmentFilename(1, compacted=True)
+        with open(compacted, 'w') as f:
+            f.write('"A"\n"%064d"\n[%f,0,[1,1],[0,0],7.0,1.5]\n' % (0, time()))
+        with open(compacted + '.tmp', 'w') as f:
+            f.write('"A"\n')
+        with open(history.segmentFilename(2), 'w') as f:
+            f.write('"A"\n"%064d"\n[%f,0,[1,1],[0,0],8.0,1.5]\n[1' % (
+                0, time()))
+        loaded = DecisionHistory(folder=self.folder)
+        self.assertEqual([d.cost for d in loaded.get('A')], [7, 8])
+        self.assertEqual(
+            sorted(os.listdir(self.folder)),
+            ['00000001.compacted.jsonl', '00000002.jsonl'])
+
+    def testRetention(self):
+        history = DecisionHistory(folder=self.folder, retention=60)
+        history.appendPast(pastDecision('A', 0, timestamp=time() - 120))
+        history.appendPast(pastDecision('A', 1, timestamp=time() - 30))
+        self.assertEqual(len(history.hostIDSequences('A')), 1)
+        history.close()
+        loaded = DecisionHistory(folder=self.folder, retention=20)
+        self.assertEqual(loaded.get('A'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+
+from .placementCache import PlacementCache
+from .placementCacheBenchmark import application
+from .placementCacheBenchmark import scale
+from .types import Decision
+from ..logger.allSystemPerformance import AllSystemPerformance
+from ..registry.roles import Actor
+from ..registry.roles import Master
+from ..registry.roles import User
+from ...types import ActorResources
+from ...types import CPU
+
+
+class PlacementCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = PlacementCache()
+        self.master = Master(addr=('192.168.0.1', 5001), hostID='master')
+        self.actors = [
+            Actor(
+                addr=('192.168.1.%d' % i, 50000),
+                hostID='actor%d' % i,
+                domainName='edge',
+                actorResources=ActorResources(
+                    cpu=CPU(cores=4, frequency=2400, utilization=.3)))
+            for i in range(3)]
+        hostIDs = [self.master.hostID] + [a.hostID for a in self.actors]
+        self.systemPerformance = AllSystemPerformance(
+            latency={
+                source: {dest: 10. for dest in hostIDs}
+                for source in hostIDs})
+        self.application = application('Detection', 2)
+        self.user = User(application=self.application, domainName='edge')
+
+    def profile(self):
+        return self.cache.profileOf(
+            master=self.master,
+            allActors=self.actors,
+            systemPerformance=self.systemPerformance)
+
+    def putPlacement(self, hostIDSequence):
+        decision = Decision(
+            user=self.user,
+            indexSequence=[0, 1],
+            indexToHostID=hostIDSequence,
+            schedulingTime=500,
+            cost=1.5)
+        self.cache.put(self.application, 'edge', self.profile(), decision)
+
+    def get(self, application=None, domainName='edge'):
+        if application is None:
+            application = self.application
+        return self.cache.get(application, domainName, self.profile())
+
+    def testExactHit(self):
+        self.assertEqual(self.get(), (None, False))
+        self.putPlacement(['actor0', 'actor1'])
+        # Changes smaller than a bucket give the same fingerprint
+        self.actors[0].actorResources.cpu.utilization = .32
+        scale(self.systemPerformance.latency, ['actor1'], 1.02)
+        placement, isExact = self.get()
+        self.assertTrue(isExact)
+        self.assertEqual(placement.hostIDSequence, ['actor0', 'actor1'])
+        self.assertEqual(placement.cost, 1.5)
+        # Only for the same application and domain
+        self.assertEqual(self.get(domainName='cloud'), (None, False))
+        self.assertEqual(
+            self.get(application('Tracking', 2)), (None, False))
+        self.assertAlmostEqual(self.cache.hitRate(), 1 / 4)
+
+    def testLabelsDoNotShareEntries(self):
+        self.application = application('Detection', 2).copy(withLabel='480')
+        self.putPlacement(['actor0', 'actor1'])
+        self.assertTrue(self.get()[1])
+        # Users with another label are placed apart
+        otherLabel = application('Detection', 2).copy(withLabel='720')
+        self.assertEqual(self.get(otherLabel), (None, False))
+        self.application = otherLabel
+        self.putPlacement(['actor2', 'actor1'])
+        placement, isExact = self.get()
+        self.assertTrue(isExact)
+        self.assertEqual(placement.hostIDSequence, ['actor2', 'actor1'])
+        self.assertEqual(self.cache.stats()['entries'], 2)
+
+    def testNearHit(self):
+        self.putPlacement(['actor0', 'actor1'])
+        scale(self.systemPerformance.latency, ['actor2'], 1.3)
+        placement, isExact = self.get()
+        self.assertFalse(isExact)
+        self.assertEqual(placement.hostIDSequence, ['actor0', 'actor1'])
+        self.assertEqual(self.cache.stats()['nearHits'], 1)
+
+    def testStalePlacementsAreDropped(self):
+        self.putPlacement(['actor0', 'actor1'])
+        scale(self.systemPerformance.latency, ['actor2'], 3)
+        self.assertEqual(self.get(), (None, False))
+        stats = self.cache.stats()
+        self.assertEqual(stats['invalidated'], 1)
+        self.assertEqual(stats['entries'], 0)
+        # The images an actor has are compared as they are
+        self.putPlacement(['actor0', 'actor1'])
+        self.actors[2].actorResources.images = {'fogbus2-sensor:1.0'}
+        self.assertEqual(self.get(), (None, False))
+        self.assertEqual(self.cache.stats()['invalidated'], 2)
+
+    def testPlacementOnHostGoneIsNotUsed(self):
+        self.putPlacement(['actor0', 'actor1'])
+        self.actors = self.actors[1:]
+        self.assertEqual(self.get(), (None, False))
+        # Still good once the host is back
+        self.assertEqual(self.cache.stats()['invalidated'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+import logging
+import unittest
+from queue import Queue
+from threading import Barrier
+from threading import Event
+from threading import Lock
+from threading import Thread
+from time import sleep
+from time import time
+from typing import List
+
+from .base import BaseScheduler
+from .schedulingQueue import SchedulingQueue
+from .types import Decision
+from ..application.base import Application
+from ..application.task.dependency.base import TaskWithDependency
+from ..registry.registered import RegisteredManager
+from ..registry.roles import Actor
+from ..registry.roles import Master
+from ..registry.roles import User
+
+
+class SlowScheduler(BaseScheduler):
+    """
+    Takes runTime seconds for each run, one run at a time, like NSGA
+    """
+
+    def __init__(self, runTime: float):
+        BaseScheduler.__init__(
+            self, schedulerName='Slow', isContainerMode=False)
+        self.runTime = runTime
+        self.lock = Lock()
+        self.runs = 0
+
+    def _schedule(
+            self,
+            user: User,
+            allActors: List[Actor],
+            *args,
+            **kwargs) -> Decision:
+        with self.lock:
+            sleep(self.runTime)
+            self.runs += 1
+        return Decision(
+            user=user,
+            indexSequence=[0],
+            indexToHostID=[allActors[0].hostID],
+            schedulingTime=self.runTime * 1000)
+
+
+class BasicComponentStandIn:
+
+    def __init__(self):
+        self.me = Master(addr=('127.0.0.1', 5001), hostID='master')
+        self.debugLogger = logging.getLogger('SchedulingQueueTest')
+        self.sent = Queue()
+
+    def sendMessage(self, destination, **kwargs):
+        self.sent.put((destination, kwargs['messageSubType']))
+
+
+def newUser(
+        i: int,
+        applicationName: str = 'App',
+        label: str = '480') -> User:
+    task = TaskWithDependency('Task')
+    application = Application(
+        name=applicationName,
+        tasksWithDependency={'Task': task},
+        entryTasks=[task],
+        label=label)
+    return User(
+        application=application,
+        componentID=str(i),
+        hostID='user%d' % i,
+        domainName='edge')
+
+
+class SchedulingQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registeredManager = RegisteredManager()
+        actor = Actor(hostID='actor0', componentID='0', domainName='edge')
+        self.registeredManager.actors[actor] = actor
+        self.basicComponent = BasicComponentStandIn()
+        self.decisionsQueue: Queue[Decision] = Queue()
+
+    def schedulingQueue(
+            self,
+            scheduler: BaseScheduler,
+            placed: Queue,
+            workerNum: int = 2,
+            coalescingWindow: float = .05) -> SchedulingQueue:
+
+        def scheduleUsers(users: List[User]):
+            scheduledUsers = scheduler.scheduleUsers(
+                users=users,
+                registeredManager=self.registeredManager,
+                resources=None,
+                systemPerformance=None,
+                basicComponent=self.basicComponent,
+                decisionsQueue=self.decisionsQueue)
+            for user in scheduledUsers:
+                placed.put((user, time()))
+
+        return SchedulingQueue(
+            scheduleUsers=scheduleUsers,
+            workerNum=workerNum,
+            coalescingWindow=coalescingWindow)
+
+    def testSimultaneousRegistrations(self):
+        userNum = 50
+        runTime = .2
+        scheduler = SlowScheduler(runTime=runTime)
+        placed = Queue()
+        schedulingQueue = self.schedulingQueue(scheduler, placed)
+        users = [newUser(i) for i in range(userNum)]
+        arrivals = {}
+        putTimes = []
+        barrier = Barrier(userNum)
+
+        def register(user: User):
+            barrier.wait()
+            arrivals[user] = time()
+            schedulingQueue.put(user)
+            putTimes.append(time() - arrivals[user])
+
+        threads = [Thread(target=register, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        timesToPlacement = []
+        for _ in range(userNum):
+            user, placedAt = placed.get(timeout=10)
+            timesToPlacement.append(placedAt - arrivals[user])
+        timesToPlacement.sort()
+        p50 = timesToPlacement[userNum // 2]
+        p99 = timesToPlacement[int(userNum * .99)]
+        print('%d registrations: %d scheduler runs, put p99 %.2f ms, '
+              'time to placement p50 %.0f ms and p99 %.0f ms, '
+              '%.0f ms one run after another' % (
+                  userNum, scheduler.runs,
+                  sorted(putTimes)[int(userNum * .99)] * 1000,
+                  p50 * 1000, p99 * 1000, userNum * runTime * 1000))
+        # Registering does not wait for the scheduler
+        self.assertLess(max(putTimes), runTime / 2)
+        self.assertLessEqual(scheduler.runs, 3)
+        self.assertLess(p99, userNum * runTime / 4)
+        decisions = [self.decisionsQueue.get() for _ in range(userNum)]
+        self.assertEqual({d.user for d in decisions}, set(users))
+        for decision in decisions:
+            self.assertEqual(decision.hostIDSequence(), ['actor0'])
+        self.assertEqual(schedulingQueue.waitingCount(), 0)
+
+    def testOnlySameLabelledApplicationAndDomainAreCoalesced(self):
+        scheduler = SlowScheduler(runTime=.01)
+        placed = Queue()
+        schedulingQueue = self.schedulingQueue(
+            scheduler, placed, coalescingWindow=.2)
+        users = [
+            newUser(0),
+            newUser(1),
+            newUser(2, applicationName='Other'),
+            newUser(4, label='720')]
+        otherDomain = newUser(3)
+        otherDomain.domainName = 'cloud'
+        users.append(otherDomain)
+        for user in users:
+            schedulingQueue.put(user)
+        for _ in range(4):
+            placed.get(timeout=5)
+        # No actors in cloud
+        destination, subType = self.basicComponent.sent.get(timeout=5)
+        while destination is not otherDomain:
+            destination, subType = self.basicComponent.sent.get(timeout=5)
+        self.assertEqual(subType.value, 'noActor')
+        self.assertEqual(scheduler.runs, 3)
+
+    def testWorkersSurviveFailingRuns(self):
+        failed = Event()
+
+        def scheduleUsers(users: List[User]):
+            if not failed.is_set():
+                failed.set()
+                raise ValueError('Failed run')
+            placed.put(users)
+
+        placed = Queue()
+        schedulingQueue = SchedulingQueue(
+            scheduleUsers=scheduleUsers, workerNum=1, coalescingWindow=0)
+        schedulingQueue.put(newUser(0))
+        schedulingQueue.put(newUser(1, applicationName='Other'))
+        self.assertEqual(len(placed.get(timeout=5)), 1)
+        self.assertTrue(failed.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@ from typing import Set
 from typing import Union
 
 from ..base import BaseScheduler
+from ..decisionHistory import DecisionHistory
+from ..policies.nsga.base import BaseNSGA
 from ..policies.nsga.nsga2 import NSGA2
 from ..policies.nsga.nsga3 import NSGA3
 from ..policies.nsga.ohnsga import OHNSGA
@@ -23,6 +25,9 @@ def initSchedulerByName(
         estimationThreadNum = 4
         if parsedArgs is not None and 'estimationThreadNum' in parsedArgs:
             estimationThreadNum = parsedArgs.estimationThreadNum
+        evaluationPoolMode = 'threads'
+        if parsedArgs is not None and 'evaluationPool' in parsedArgs:
+            evaluationPoolMode = parsedArgs.evaluationPool
         scheduler = OHNSGA(
             knownMasters=knownMasters,
             minimumActors=minimumActors,
@@ -30,7 +35,10 @@ def initSchedulerByName(
             generationNum=generationNum,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            evaluationPoolMode=evaluationPoolMode)
+        setAnytime(scheduler, parsedArgs)
+        setDecisionHistory(scheduler, parsedArgs)
         return scheduler
     elif schedulerName == 'NSGA2':
         populationSize = kwargs['populationSize']
@@ -38,6 +46,9 @@ def initSchedulerByName(
         estimationThreadNum = 4
         if parsedArgs is not None and 'estimationThreadNum' in parsedArgs:
             estimationThreadNum = parsedArgs.estimationThreadNum
+        evaluationPoolMode = 'threads'
+        if parsedArgs is not None and 'evaluationPool' in parsedArgs:
+            evaluationPoolMode = parsedArgs.evaluationPool
         scheduler = NSGA2(
             knownMasters=knownMasters,
             minimumActors=minimumActors,
@@ -45,7 +56,10 @@ def initSchedulerByName(
             generationNum=generationNum,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            evaluationPoolMode=evaluationPoolMode)
+        setAnytime(scheduler, parsedArgs)
+        setDecisionHistory(scheduler, parsedArgs)
         return scheduler
     elif schedulerName == 'NSGA3':
         populationSize = kwargs['populationSize']
@@ -53,6 +67,9 @@ def initSchedulerByName(
         estimationThreadNum = 4
         if parsedArgs is not None and 'estimationThreadNum' in parsedArgs:
             estimationThreadNum = parsedArgs.estimationThreadNum
+        evaluationPoolMode = 'threads'
+        if parsedArgs is not None and 'evaluationPool' in parsedArgs:
+            evaluationPoolMode = parsedArgs.evaluationPool
         scheduler = NSGA3(
             knownMasters=knownMasters,
             minimumActors=minimumActors,
@@ -60,7 +77,10 @@ def initSchedulerByName(
             generationNum=generationNum,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            evaluationPoolMode=evaluationPoolMode)
+        setAnytime(scheduler, parsedArgs)
+        setDecisionHistory(scheduler, parsedArgs)
         return scheduler
     elif schedulerName == 'Random':
         from ..policies.schedulerRandomPolicy import \
@@ -73,3 +93,28 @@ def initSchedulerByName(
         scheduler = SchedulerRoundRobinPolicy(isContainerMode=isContainerMode)
         return scheduler
     return None
+
+
+def setAnytime(scheduler: BaseNSGA, parsedArgs):
+    if parsedArgs is not None and 'anytimeScheduling' in parsedArgs:
+        scheduler.anytime = parsedArgs.anytimeScheduling
+    if parsedArgs is not None and 'migrationCost' in parsedArgs:
+        scheduler.migrationCost = parsedArgs.migrationCost
+
+
+def setDecisionHistory(scheduler: BaseNSGA, parsedArgs):
+    if parsedArgs is None or 'decisionHistory' not in parsedArgs:
+        return
+    folder = parsedArgs.decisionHistory
+    if folder == '':
+        folder = None
+    maxDecisionsPerKey = 100
+    if 'keptDecisions' in parsedArgs:
+        maxDecisionsPerKey = parsedArgs.keptDecisions
+    retention = 0
+    if 'decisionRetention' in parsedArgs:
+        retention = parsedArgs.decisionRetention
+    scheduler.decisionHistory = DecisionHistory(
+        folder=folder,
+        maxDecisionsPerKey=maxDecisionsPerKey,
+        retention=retention)
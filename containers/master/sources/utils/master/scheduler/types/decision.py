@@ -39,6 +39,20 @@ class Decision(SerializableDictionary):
     def hostIDSequence(self) -> List[str]:
         return self.indexToHostID
 
+    def forUser(self, user: User) -> 'Decision':
+        """
+        :return: the same placement for another user of the application
+        """
+        if user is self.user:
+            return self
+        return Decision(
+            user=user,
+            indexSequence=self.indexSequence,
+            indexToHostID=self.indexToHostID,
+            schedulingTime=self.schedulingTime,
+            cost=self.cost,
+            evaluationRecord=self.evaluationRecord)
+
     @staticmethod
     def fromDict(inDict: Dict):
         decision = Decision(
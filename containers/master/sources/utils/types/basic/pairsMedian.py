@@ -1,15 +1,32 @@
+from typing import Tuple
+
 from .sequenceMedian import SequenceMedian
 
 
 class PairsMedian(dict):
 
+    def __init__(self, quantiles: Tuple[float, ...] = ()):
+        """
+        :param quantiles: the quantiles estimated for every pair, besides
+        the median
+        """
+        dict.__init__(self)
+        self.quantiles = quantiles
+
     def __missing__(self, key):
-        self.__setitem__(key, SequenceMedian())
+        self.__setitem__(key, SequenceMedian(quantiles=self.quantiles))
         return self.__getitem__(key)
 
-    def calculateAll(self):
+    def calculateAll(self, quantile: float = None):
+        """
+        :param quantile: e.g. .95 for the tail, the median if None
+        :return: the statistic of every pair
+        """
         items = self.items()
         logFormat = {}
         for key, sequence in items:
-            logFormat[key] = sequence.median()
+            if quantile is None:
+                logFormat[key] = sequence.median()
+                continue
+            logFormat[key] = sequence.quantile(quantile)
         return logFormat
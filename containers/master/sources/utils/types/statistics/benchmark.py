@@ -0,0 +1,124 @@
+"""
+Benchmark of the statistics kept for every (source, destination) pair.
+
+Run from the sources folder of any component:
+    python -m utils.types.statistics.benchmark --pairs 10000
+
+Reports the memory held, the time to record the updates, and the time of
+one read of every pair, as done by each upload. Compares the sequence
+median used before, the window median with the tail quantiles and the
+moving average, and the window median alone, as kept by default.
+"""
+import argparse
+import tracemalloc
+from random import Random
+from threading import Lock
+from time import time
+from typing import List
+
+from ..basic import PairsMedian
+from ..basic import SequenceMedian
+
+
+class LegacySequenceMedian:
+
+    def __init__(
+            self,
+            sequence: List[int] = None,
+            maxRecordNumber: int = 100):
+        self.__lock = Lock()
+        self.maxRecordNumber = maxRecordNumber
+        if sequence is None:
+            self.index = 0
+            self.sequence: List[int] = [0 for _ in
+                                        range(self.maxRecordNumber)]
+        else:
+            self.index = len(sequence)
+            self.sequence = sequence
+        self._updated = False
+
+    def update(self, value):
+        self.__lock.acquire()
+        self.sequence[self.index] = value
+        self.index += 1
+        if self.index >= self.maxRecordNumber:
+            self.index = 0
+        self._updated = True
+        self.__lock.release()
+
+    def median(self):
+        index = self.index
+        if self.index == 0:
+            if self._updated:
+                index = -1
+            else:
+                return self.sequence[0]
+        sequence = self.sequence[:index]
+        sortedSequence = sorted(sequence)
+        return sortedSequence[len(sortedSequence) >> 1]
+
+
+class LegacyPairsMedian(PairsMedian):
+
+    def __missing__(self, key):
+        self.__setitem__(key, LegacySequenceMedian())
+        return self.__getitem__(key)
+
+
+class StreamingPairsMedian(PairsMedian):
+
+    def __missing__(self, key):
+        self.__setitem__(key, SequenceMedian(
+            quantiles=(.95, .99), withEWMA=True))
+        return self.__getitem__(key)
+
+
+def run(name: str, createPairs, pairNum: int, updateNum: int,
+        readNum: int):
+    random = Random(0)
+    values = [random.lognormvariate(3, .5) for _ in range(997)]
+
+    def update(pairs: PairsMedian, num: int):
+        for i in range(updateNum):
+            for pair in range(num):
+                pairs[pair].update(values[(i * num + pair) % 997])
+
+    pairs = createPairs()
+    startTime = time()
+    update(pairs, pairNum)
+    updateTime = time() - startTime
+    startTime = time()
+    for _ in range(readNum):
+        pairs.calculateAll()
+    readTime = (time() - startTime) / readNum
+    # Tracing slows the updates down, so the memory is measured apart,
+    # on a sample of the pairs
+    sampleNum = min(pairNum, 1000)
+    tracemalloc.start()
+    pairs = createPairs()
+    update(pairs, sampleNum)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('%-10s %8.1f MB %10.2f us/update %10.1f ms/read of all pairs' % (
+        name,
+        memory * pairNum / sampleNum / 1e6,
+        updateTime / (updateNum * pairNum) * 1e6,
+        readTime * 1e3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Statistics benchmark')
+    parser.add_argument('--pairs', type=int, default=10000)
+    parser.add_argument('--updates', type=int, default=200,
+                        help='updates of each pair')
+    parser.add_argument('--reads', type=int, default=5)
+    args = parser.parse_args()
+    for name, createPairs in (
+            ('legacy', LegacyPairsMedian),
+            ('streaming', StreamingPairsMedian),
+            ('median', PairsMedian)):
+        run(name, createPairs, args.pairs, args.updates, args.reads)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+from typing import List
+
+
+class P2Quantile:
+    """
+    Streaming estimation of one quantile with the P-square algorithm of
+    Jain and Chlamtac, 1985.
+
+    Five markers follow the minimum, the quantile, the maximum and the two
+    points halfway between. Each update moves the markers with a parabolic
+    interpolation, in O(1) time and memory, without keeping the values.
+    """
+
+    def __init__(self, quantile: float):
+        if not 0 < quantile < 1:
+            raise Exception('Quantile is not in (0, 1): %s' % str(quantile))
+        self.quantile = quantile
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        # The desired position of marker i is 1 + (count - 1) * increment
+        self._increments = (0, quantile / 2, quantile, (1 + quantile) / 2, 1)
+
+    def update(self, value):
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+        positions = self._positions
+        if value < heights[0]:
+            heights[0] = value
+            k = 1
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 4
+        else:
+            k = 1
+            while value >= heights[k]:
+                k += 1
+        for i in range(k, 5):
+            positions[i] += 1
+        count = self.count - 1
+        for i in (1, 2, 3):
+            d = 1 + count * self._increments[i] - positions[i]
+            if d >= 1 and positions[i + 1] - positions[i] > 1:
+                d = 1
+            elif d <= -1 and positions[i - 1] - positions[i] < -1:
+                d = -1
+            else:
+                continue
+            height = self._parabolic(i, d)
+            if not heights[i - 1] < height < heights[i + 1]:
+                height = self._linear(i, d)
+            heights[i] = height
+            positions[i] += d
+
+    def value(self, default=0):
+        if not self.count:
+            return default
+        if self.count <= 5:
+            # Exact, while every value is kept
+            index = round(self.quantile * (self.count - 1))
+            return self._heights[index]
+        return self._heights[2]
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+                (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def _linear(self, i: int, d: int) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
@@ -22,7 +22,9 @@ class RemoteLogger:
             enableTLS: bool = False,
             certFile: str = '',
             keyFile: str = '',
-            domainName: str = ''):
+            domainName: str = '',
+            wireCodec: str = 'pickle',
+            transport: str = 'threads'):
         self.basicComponent = BasicComponent(
             role=ComponentRole.REMOTE_LOGGER,
             addr=addr,
@@ -34,7 +36,9 @@ class RemoteLogger:
             enableTLS=enableTLS,
             certFile=certFile,
             keyFile=keyFile,
-            domainName=domainName)
+            domainName=domainName,
+            wireCodec=wireCodec,
+            transport=transport)
         self.basicComponent.remoteLogger = self.basicComponent.me
         self.loggerManager = LoggerManager(
             basicComponent=self.basicComponent)
@@ -125,6 +129,21 @@ def parseArg():
         default='fogbus2',
         type=str,
         help='Domain Name')
+    parser.add_argument(
+        '--wireCodec',
+        metavar='WireCodec',
+        nargs='?',
+        default='pickle',
+        type=str,
+        help='Codec of messages sent by this component, pickle or binary')
+    parser.add_argument(
+        '--transport',
+        metavar='Transport',
+        nargs='?',
+        default='threads',
+        type=str,
+        help='threads to run two threads per connection, '
+             'or eventLoop to drive all connections from one thread')
 
     return parser.parse_args()
 
@@ -138,5 +157,7 @@ if __name__ == '__main__':
         enableTLS=args.enableTLS,
         certFile=args.certFile,
         keyFile=args.keyFile,
-        domainName=args.domainName)
+        domainName=args.domainName,
+        wireCodec=args.wireCodec,
+        transport=args.transport)
     remoteLogger_.run()
@@ -6,7 +6,13 @@ from typing import DefaultDict
 from typing import Dict
 from typing import Tuple
 
+from ..config import ConfigCompression
+from ..config import ConfigFlowControl
 from ..connection import BasicMessageHandler
+from ..connection import Compression
+from ..connection import FlowControl
+from ..connection import Lane
+from ..connection import OverflowPolicy
 from ..types import Address
 from ..types import Component
 from ..types import ComponentRole
@@ -29,7 +35,9 @@ class Communicator(BasicMessageHandler, ABC):
             enableTLS: bool = False,
             certFile: str = '',
             keyFile: str = '',
-            domainName: str = ''):
+            domainName: str = '',
+            wireCodec: str = 'pickle',
+            transport: str = 'threads'):
         BasicMessageHandler.__init__(
             self,
             role=role,
@@ -39,7 +47,28 @@ class Communicator(BasicMessageHandler, ABC):
             portRange=portRange,
             enableTLS=enableTLS,
             certFile=certFile,
-            keyFile=keyFile)
+            keyFile=keyFile,
+            wireCodec=wireCodec,
+            transport=transport,
+            flowControl=FlowControl(
+                sendQueueSize=ConfigFlowControl.sendQueueSize,
+                connectionQueueSize=ConfigFlowControl.connectionQueueSize,
+                receivedQueueSize=ConfigFlowControl.receivedQueueSize,
+                overflowPolicy=OverflowPolicy(
+                    ConfigFlowControl.overflowPolicy),
+                laneWeights={
+                    Lane.CONTROL: ConfigFlowControl.controlLaneWeight,
+                    Lane.DATA: ConfigFlowControl.dataLaneWeight,
+                    Lane.LOG: ConfigFlowControl.logLaneWeight},
+                batchLingerTime=ConfigFlowControl.batchLingerTime,
+                batchMaxMessages=ConfigFlowControl.batchMaxMessages),
+            compression=Compression(
+                compressors=[
+                    name for name in ConfigCompression.compressors.split(',')
+                    if name],
+                minSize=ConfigCompression.minSize,
+                bandwidth=ConfigCompression.linkBandwidth,
+                maxRatio=ConfigCompression.maxRatio))
         self.serveEvent.wait()
         self.me = Component(
             hostID=self.hostID,
@@ -0,0 +1,291 @@
+"""
+Benchmark of the batching of the periodic log messages, for a Master
+with many components, on the local host.
+
+Run from the sources folder of any component:
+    python -m utils.connection.batchingBenchmark --components 200
+
+Replays one minute of the periodic uploads of the components, e.g.
+uploadMedianReceivedPacketSize, uploadDelays, the resources of the actors,
+the processing time of the task executors and the response time of the
+users, each component starting at a random time as it registers. The
+components send them to a Master, which forwards them to a RemoteLogger,
+in their own processes. Reports the sends, each a syscall, and the bytes
+written to the sockets in the minute, without and with batching.
+"""
+import argparse
+from multiprocessing import Pipe
+from multiprocessing import Process
+from multiprocessing.connection import Connection as PipeConnection
+from os import _exit
+from queue import Queue
+from random import Random
+from time import sleep
+from time import time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from .basicMessageHandler import BasicMessageHandler
+from .batching import MessageBatcher
+from .flowControl import FlowControl
+from .message import MessageReceived
+from .message import MessageToSend
+from .messageSender import Connection
+from ..types import Address
+from ..types import Component
+from ..types import ComponentRole
+from ..types import MessageSubType
+from ..types import MessageType
+
+portRange = (53000, 54000)
+
+# The subType and the period of the uploads of each role
+uploads = {
+    ComponentRole.ACTOR: [(MessageSubType.HOST_RESOURCES, 60)],
+    ComponentRole.TASK_EXECUTOR: [(MessageSubType.MEDIAN_PROCESSING_TIME, 30)],
+    ComponentRole.USER: [(MessageSubType.RESPONSE_TIME, 10)]}
+basicUploads = [
+    (MessageSubType.MEDIAN_RECEIVED_PACKET_SIZE, 20),
+    (MessageSubType.DELAYS, 20)]
+
+
+class CountingSocket:
+    """
+    Counts the sends and the bytes written to a socket
+    """
+
+    def __init__(self, s):
+        self.socket = s
+        self.sends = 0
+        self.bytes = 0
+
+    def sendall(self, data):
+        self.sends += 1
+        self.bytes += memoryview(data).nbytes
+        return self.socket.sendall(data)
+
+    def sendmsg(self, buffers):
+        self.sends += 1
+        sent = self.socket.sendmsg(buffers)
+        self.bytes += sent
+        return sent
+
+    def __getattr__(self, name):
+        return getattr(self.socket, name)
+
+
+class BenchmarkComponent(BasicMessageHandler):
+
+    def __init__(self, role: ComponentRole, batchLingerTime: float):
+        BasicMessageHandler.__init__(
+            self,
+            role=role,
+            addr=('127.0.0.1', 0),
+            logLevel=40,
+            portRange=portRange,
+            ignoreSocketError=True,
+            flowControl=FlowControl(batchLingerTime=batchLingerTime))
+        self.serveEvent.wait()
+        self.remoteLogger: Component = None
+        self.sockets: List[CountingSocket] = []
+        self.received = 0
+
+    def _newConnection(self, dest_addr: Address) -> Connection:
+        conn = BasicMessageHandler._newConnection(self, dest_addr)
+        conn.socket = CountingSocket(conn.socket)
+        self.sockets.append(conn.socket)
+        return conn
+
+    def handleMessage(self, message: MessageReceived):
+        if not message.typeIs(messageType=MessageType.LOG):
+            return
+        if self.role is ComponentRole.REMOTE_LOGGER:
+            self.received += 1
+            return
+        self.sendMessage(
+            messageType=MessageType.LOG,
+            messageSubType=message.subType,
+            data=message.data,
+            destination=self.remoteLogger)
+
+
+def runComponent(role: ComponentRole, batchLingerTime: float,
+                 pipe: PipeConnection):
+    component = BenchmarkComponent(role=role, batchLingerTime=batchLingerTime)
+    pipe.send(component.addr)
+    while True:
+        request = pipe.recv()
+        if request == 'stats':
+            pipe.send((
+                sum(s.sends for s in component.sockets),
+                sum(s.bytes for s in component.sockets),
+                component.received))
+        elif isinstance(request, tuple):
+            component.remoteLogger = Component(
+                role=ComponentRole.REMOTE_LOGGER, addr=request)
+
+
+def startComponent(role: ComponentRole, batchLingerTime: float) \
+        -> Tuple[Process, PipeConnection, Address]:
+    pipe, childPipe = Pipe()
+    process = Process(
+        target=runComponent,
+        args=(role, batchLingerTime, childPipe),
+        daemon=True)
+    process.start()
+    return process, pipe, pipe.recv()
+
+
+class SimulatedComponent:
+    """
+    The sending side of a component: its connection to the Master and,
+    as in MessageSender, the batching in front of it
+    """
+
+    def __init__(self, role: ComponentRole, port: int, master: Component,
+                 batchLingerTime: float):
+        self.source = Component(role=role, addr=('127.0.0.1', port)).toDict()
+        self.master = master
+        self.conn = Connection(
+            tls_enabled=False,
+            recv_queue=Queue(),
+            send_queue=Queue(),
+            buffer=b'',
+            addr=master.addr)
+        self.socket = CountingSocket(self.conn.socket)
+        self.conn.socket = self.socket
+        self.batcher = MessageBatcher(
+            send=self._send, lingerTime=batchLingerTime)
+
+    def _send(self, destAddr: Address, messageInDict: Dict):
+        self.conn.send_message(messageInDict)
+
+    def sendMessage(self, messageType: MessageType,
+                    messageSubType: MessageSubType, data: Dict):
+        messageToSend = MessageToSend(
+            messageType=messageType,
+            messageSubType=messageSubType,
+            data=data,
+            destination=self.master)
+        messageToSend.sentAtSourceTimestamp = time() * 1000
+        messageInDict = messageToSend.toDict()
+        messageInDict['source'] = self.source
+        if self.batcher.add(self.master.addr, messageInDict):
+            return
+        self._send(self.master.addr, messageInDict)
+
+
+def uploadData(subType: MessageSubType, random: Random) -> Dict:
+    peers = {'Master-1': random.random(), 'RemoteLogger-1': random.random()}
+    if subType is MessageSubType.MEDIAN_RECEIVED_PACKET_SIZE:
+        queueStats = {'depth': 0, 'maxDepth': 3, 'dropped': 0, 'rejected': 0}
+        return {
+            'sizes': peers,
+            'flowControl': {
+                'messagesToSend': queueStats,
+                'messagesReceived': queueStats,
+                'connections': dict(queueStats, count=2),
+                'nacks': {'received': 0}}}
+    if subType is MessageSubType.DELAYS:
+        return {'delays': peers}
+    if subType is MessageSubType.HOST_RESOURCES:
+        return {'actorResources': {
+            key: random.random() for key in (
+                'cpuCores', 'cpuUtilization', 'cpuFrequency', 'memoryTotal',
+                'memoryUtilization', 'disk', 'totalCPUCores',
+                'totalMemory', 'totalDisk')}}
+    if subType is MessageSubType.MEDIAN_PROCESSING_TIME:
+        return {'medianProcessTime': {
+            'processingTime': random.random(),
+            'memory': random.random(),
+            'cpu': random.random()}}
+    return {'responseTime': random.random()}
+
+
+def schedule(components: int, random: Random) \
+        -> List[Tuple[float, int, MessageSubType]]:
+    # Every upload of the minute, as time, component and subType
+    roles = list(uploads)
+    events = []
+    for i in range(components):
+        role = roles[i % len(roles)]
+        registeredAt = random.uniform(0, 20)
+        for subType, period in [*basicUploads, *uploads[role]]:
+            sentAt = registeredAt
+            while sentAt < 60:
+                events.append((sentAt, i, subType))
+                sentAt += period
+    events.sort(key=lambda event: event[0])
+    return events
+
+
+def run(components: int, seconds: float, batchLingerTime: float):
+    remoteLoggerProcess, remoteLoggerPipe, remoteLoggerAddr = startComponent(
+        ComponentRole.REMOTE_LOGGER, batchLingerTime)
+    masterProcess, masterPipe, masterAddr = startComponent(
+        ComponentRole.MASTER, batchLingerTime)
+    masterPipe.send(remoteLoggerAddr)
+    master = Component(role=ComponentRole.MASTER, addr=masterAddr)
+    roles = list(uploads)
+    simulated = []
+    for i in range(components):
+        component = SimulatedComponent(
+            role=roles[i % len(roles)],
+            port=40000 + i,
+            master=master,
+            batchLingerTime=batchLingerTime)
+        # As components register before uploading anything, and as the
+        # Master waits for the first message of a connection it accepts
+        component.sendMessage(
+            MessageType.EXPERIMENTAL, MessageSubType.NONE, {})
+        simulated.append(component)
+    sleep(1)
+    for component in simulated:
+        component.socket.sends = component.socket.bytes = 0
+
+    random = Random(0)
+    events = schedule(components, random)
+    startTime = time()
+    for sentAt, i, subType in events:
+        timeToSleep = startTime + sentAt * seconds / 60 - time()
+        if timeToSleep > 0:
+            sleep(timeToSleep)
+        simulated[i].sendMessage(
+            MessageType.LOG, subType, uploadData(subType, random))
+    sleep(1 + batchLingerTime / 1000)
+
+    masterPipe.send('stats')
+    masterSends, masterBytes, _ = masterPipe.recv()
+    remoteLoggerPipe.send('stats')
+    _, _, received = remoteLoggerPipe.recv()
+    print('%-12s components->master %6d sends %8.1f KB  '
+          'master->remoteLogger %6d sends %8.1f KB  '
+          'delivered %d/%d' % (
+              'batching' if batchLingerTime else 'no batching',
+              sum(c.socket.sends for c in simulated),
+              sum(c.socket.bytes for c in simulated) / 1024,
+              masterSends,
+              masterBytes / 1024,
+              received,
+              len(events)))
+    masterProcess.terminate()
+    remoteLoggerProcess.terminate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batching benchmark')
+    parser.add_argument('--components', type=int, default=200)
+    parser.add_argument('--seconds', type=float, default=60,
+                        help='seconds the minute of uploads is replayed in')
+    parser.add_argument('--batchLingerTime', type=float, default=20)
+    args = parser.parse_args()
+    print('Sends and bytes per minute, %d components' % args.components)
+    for batchLingerTime in (0, args.batchLingerTime):
+        run(args.components, args.seconds, batchLingerTime)
+    # The threads of the connections do not stop by themselves
+    _exit(0)
+
+
+if __name__ == '__main__':
+    main()
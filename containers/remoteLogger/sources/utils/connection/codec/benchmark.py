@@ -0,0 +1,144 @@
+"""
+Micro-benchmark of the wire codecs over a local socket pair.
+
+Run from the sources folder of any component:
+    python -m utils.connection.codec.benchmark --frames 300
+
+Reports throughput and the memory allocated per frame, both for the
+framing used before codecs existed and for every codec.
+"""
+import argparse
+import tracemalloc
+from pickle import dumps
+from pickle import loads
+from socket import socketpair
+from threading import Thread
+from time import time
+
+from .frame import FrameReader
+from .frame import sendFrame
+from .initCodecByName import codecByID
+
+
+def legacySend(s, messageInDict):
+    messageInBytes = dumps(messageInDict)
+    msg_len = len(messageInBytes)
+    messageInBytes = msg_len.to_bytes(4, byteorder='big') + b',' + messageInBytes
+    s.sendall(messageInBytes)
+
+
+def legacyReceive(buffer, clientSocket):
+    while len(buffer) < 5:
+        ret = clientSocket.recv(4096)
+        if not ret:
+            raise Exception('Connection disconnected')
+        buffer += ret
+    msg_len = int.from_bytes(buffer[:4], byteorder='big')
+    m = buffer[5:]
+    if len(m) >= msg_len:
+        return loads(m[:msg_len]), msg_len, m[msg_len:]
+    remaining = msg_len - len(m)
+    buffer = b''
+    while remaining > 0:
+        ret = clientSocket.recv(4096)
+        if not ret:
+            raise Exception('Connection disconnected')
+        if len(ret) > remaining:
+            m += ret[:remaining]
+            buffer = ret[remaining:]
+            break
+        m += ret
+        remaining -= len(ret)
+    return loads(m), msg_len, buffer
+
+
+def sampleMessage(frameSide: int):
+    component = {
+        'role': 'User',
+        'componentID': '1',
+        'addr': ['192.168.1.2', 50101],
+        'name': 'User-1_192.168.1.2-50101',
+        'nameLogPrinting': 'User-1_192.168.1.2-50101',
+        'nameConsistent': 'User_192.168.1.2',
+        'hostID': '192.168.1.2'}
+    try:
+        import numpy
+        image = numpy.random.randint(
+            0, 255, (frameSide, frameSide, 3), dtype=numpy.uint8)
+    except ImportError:
+        image = bytearray(frameSide * frameSide * 3)
+    return {
+        'type': 'data',
+        'subType': 'sensoryData',
+        'subSubType': '',
+        'data': {'image': image, 'frame_count': 1},
+        'receivedAtLocalTimestamp': .0,
+        'sentAtSourceTimestamp': time() * 1000,
+        'destination': component,
+        'source': component}
+
+
+def run(name: str, send, receive, message, frames: int):
+    a, b = socketpair()
+
+    def sender():
+        for _ in range(frames):
+            send(a, message)
+
+    thread = Thread(target=sender)
+    tracemalloc.start()
+    allocatedPerFrame = 0
+    startTime = time()
+    thread.start()
+    for _ in range(frames):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        receive(b)
+        _, peak = tracemalloc.get_traced_memory()
+        allocatedPerFrame += peak - current
+    thread.join()
+    elapsed = time() - startTime
+    tracemalloc.stop()
+    a.close()
+    b.close()
+    print('%-8s %10.1f frames/s %10.1f MB/s %14.1f KB allocated/frame' % (
+        name,
+        frames / elapsed,
+        frames * _frameSize(message) / elapsed / 1e6,
+        allocatedPerFrame / frames / 1024))
+
+
+def _frameSize(message):
+    return len(dumps(message))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Wire codec benchmark')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--frameSide', type=int, default=480)
+    args = parser.parse_args()
+    message = sampleMessage(args.frameSide)
+
+    legacyBuffer = [b'']
+
+    def legacyReceiveOne(s):
+        _, _, legacyBuffer[0] = legacyReceive(legacyBuffer[0], s)
+
+    run('legacy', legacySend, legacyReceiveOne, message, args.frames)
+    for codec in codecByID.values():
+        readers = {}
+
+        def receiveOne(s):
+            if s not in readers:
+                readers[s] = FrameReader(s, codecByID)
+            readers[s].readFrame()
+
+        run(codec.name,
+            lambda s, m, c=codec: sendFrame(s, c, m),
+            receiveOne,
+            message,
+            args.frames)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+"""
+End to end benchmark of the data plane on the local host.
+
+Run from the sources folder of any component:
+    python -m utils.connection.dataPlaneBenchmark --frames 300
+
+Starts a Master and a TaskExecutor in their own processes, on the same
+connection stack as the components, and sends frames from a User in this
+process, one at a time. Through the master, the frames and the results are
+relayed the way DataHandler does. Directly, they go between the User and
+the TaskExecutor, as with Master --directDataPlane. Reports the response
+time seen by the User and the CPU time the Master spent.
+"""
+import argparse
+from multiprocessing import Pipe
+from multiprocessing import Process
+from multiprocessing.connection import Connection
+from os import _exit
+from queue import Queue
+from time import process_time
+from time import time
+from typing import Tuple
+
+from .basicMessageHandler import BasicMessageHandler
+from .message import MessageReceived
+from ..types import Address
+from ..types import Component
+from ..types import ComponentRole
+from ..types import MessageSubType
+from ..types import MessageType
+
+portRange = (52000, 53000)
+
+
+class BenchmarkComponent(BasicMessageHandler):
+
+    def __init__(self, role: ComponentRole, wireCodec: str):
+        BasicMessageHandler.__init__(
+            self,
+            role=role,
+            addr=('127.0.0.1', 0),
+            logLevel=40,
+            portRange=portRange,
+            ignoreSocketError=True,
+            wireCodec=wireCodec)
+        self.serveEvent.wait()
+        self.taskExecutor: Component = None
+        self.user: Component = None
+        self.results: Queue = Queue()
+
+    def handleMessage(self, message: MessageReceived):
+        data = message.data
+        if self.role is ComponentRole.MASTER:
+            if message.typeIs(messageSubType=MessageSubType.SENSORY_DATA):
+                self.user = message.source
+                data['intermediateData'] = data['sensoryData']
+                del data['sensoryData']
+                self.sendMessage(
+                    messageType=MessageType.DATA,
+                    messageSubType=MessageSubType.INTERMEDIATE_DATA,
+                    data=data,
+                    destination=self.taskExecutor)
+            elif message.typeIs(messageSubType=MessageSubType.FINAL_RESULT):
+                self.sendMessage(
+                    messageType=MessageType.DATA,
+                    messageSubType=MessageSubType.FINAL_RESULT,
+                    data=data,
+                    destination=self.user)
+            return
+        if self.role is ComponentRole.TASK_EXECUTOR:
+            image = data['intermediateData']
+            del data['intermediateData']
+            data['finalResult'] = len(image)
+            destination = self.master
+            if 'userAddr' in data:
+                addr = data['userAddr']
+                destination = Component(addr=(addr[0], addr[1]))
+            self.sendMessage(
+                messageType=MessageType.DATA,
+                messageSubType=MessageSubType.FINAL_RESULT,
+                data=data,
+                destination=destination)
+            return
+        self.results.put(data['finalResult'])
+
+
+def runComponent(role: ComponentRole, wireCodec: str, pipe: Connection,
+                 masterAddr: Address = None):
+    component = BenchmarkComponent(role=role, wireCodec=wireCodec)
+    if masterAddr is not None:
+        component.master = Component(role=ComponentRole.MASTER, addr=masterAddr)
+    pipe.send(component.addr)
+    while True:
+        request = pipe.recv()
+        if request == 'cpu':
+            pipe.send(process_time())
+        elif isinstance(request, tuple):
+            component.taskExecutor = Component(
+                role=ComponentRole.TASK_EXECUTOR, addr=request)
+
+
+def startComponent(role: ComponentRole, wireCodec: str,
+                   masterAddr: Address = None) \
+        -> Tuple[Process, Connection, Address]:
+    pipe, childPipe = Pipe()
+    process = Process(
+        target=runComponent,
+        args=(role, wireCodec, childPipe, masterAddr),
+        daemon=True)
+    process.start()
+    return process, pipe, pipe.recv()
+
+
+def percentile(sortedValues, p: float) -> float:
+    return sortedValues[min(len(sortedValues) - 1, int(p * len(sortedValues)))]
+
+
+def run(name: str, user: BenchmarkComponent, master: Component,
+        masterPipe: Connection, taskExecutor: Component, frames: int,
+        frame: bytes, direct: bool):
+    responseTimes = []
+    masterPipe.send('cpu')
+    masterCPU = masterPipe.recv()
+    startTime = time()
+    for _ in range(frames):
+        sentTime = time()
+        if direct:
+            data = {
+                'userID': '1',
+                'userAddr': user.addr,
+                'intermediateData': frame}
+            user.sendMessage(
+                messageType=MessageType.DATA,
+                messageSubType=MessageSubType.INTERMEDIATE_DATA,
+                data=data,
+                destination=taskExecutor)
+        else:
+            data = {'userID': '1', 'sensoryData': frame}
+            user.sendMessage(
+                messageType=MessageType.DATA,
+                messageSubType=MessageSubType.SENSORY_DATA,
+                data=data,
+                destination=master)
+        user.results.get()
+        responseTimes.append((time() - sentTime) * 1000)
+    elapsed = time() - startTime
+    masterPipe.send('cpu')
+    masterCPU = masterPipe.recv() - masterCPU
+    responseTimes.sort()
+    print('%-14s %8.2f ms p50 %8.2f ms p95 %8.1f frames/s '
+          '%8.3f ms master CPU/frame' % (
+              name,
+              percentile(responseTimes, .5),
+              percentile(responseTimes, .95),
+              frames / elapsed,
+              masterCPU / frames * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Data plane benchmark')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--frameKB', type=int, default=200)
+    parser.add_argument('--wireCodec', type=str, default='pickle')
+    args = parser.parse_args()
+    masterProcess, masterPipe, masterAddr = startComponent(
+        ComponentRole.MASTER, args.wireCodec)
+    taskExecutorProcess, _, taskExecutorAddr = startComponent(
+        ComponentRole.TASK_EXECUTOR, args.wireCodec, masterAddr=masterAddr)
+    masterPipe.send(taskExecutorAddr)
+    user = BenchmarkComponent(role=ComponentRole.USER, wireCodec=args.wireCodec)
+    master = Component(role=ComponentRole.MASTER, addr=masterAddr)
+    taskExecutor = Component(
+        role=ComponentRole.TASK_EXECUTOR, addr=taskExecutorAddr)
+    frame = bytes(args.frameKB * 1024)
+    # Warm the connections up
+    run('warm up', user, master, masterPipe, taskExecutor, 10, frame, False)
+    run('warm up', user, master, masterPipe, taskExecutor, 10, frame, True)
+    for direct in (False, True):
+        run('direct' if direct else 'through master',
+            user, master, masterPipe, taskExecutor, args.frames, frame, direct)
+    masterProcess.terminate()
+    taskExecutorProcess.terminate()
+    # The threads of the connections do not stop by themselves
+    _exit(0)
+
+
+if __name__ == '__main__':
+    main()
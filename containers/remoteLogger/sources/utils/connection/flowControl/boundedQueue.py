@@ -0,0 +1,113 @@
+from queue import Queue
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from .overflowPolicy import OverflowPolicy
+
+
+class BoundedQueue(Queue):
+    """
+    A Queue of at most bound items, where the policy decides what happens
+    to an item put into it when it is full.
+
+    Urgent items, such as the control messages, are always queued and
+    never dropped, so that a queue full of data neither holds them back
+    nor loses them. They still count towards the bound.
+    """
+
+    def __init__(
+            self,
+            bound: int = 0,
+            policy: OverflowPolicy = OverflowPolicy.BLOCK,
+            isUrgent: Callable[[Any], bool] = None,
+            onReject: Callable[[Any], None] = None):
+        """
+        :param bound: the most items, 0 for no bound
+        :param policy: what to do with an item put into a full queue
+        :param isUrgent: whether an item is queued even if the queue is full
+        :param onReject: called with each item the REJECT policy drops, or
+        that a put without blocking finds no room for with the BLOCK policy
+        """
+        # The bound is kept here instead of by Queue, to apply the policy
+        Queue.__init__(self)
+        self.bound = bound
+        self.policy = policy
+        self.isUrgent = isUrgent
+        self.onReject = onReject
+        self.maxDepth = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    def put(self, item, block: bool = True, timeout: float = None) -> bool:
+        """
+        :param block: whether to wait for room with the BLOCK policy. If
+        not, the item is rejected at once when the queue is full
+        :return: False if the item was dropped or rejected
+        """
+        with self.not_full:
+            isAccepted = self._makeRoom(item, block, timeout)
+            if isAccepted:
+                self._put(item)
+                self.unfinished_tasks += 1
+                self.maxDepth = max(self.maxDepth, self._qsize())
+                self.not_empty.notify()
+        if not isAccepted and self._rejects(block) \
+                and self.onReject is not None:
+            self.onReject(item)
+        return isAccepted
+
+    def _isFull(self) -> bool:
+        return 0 < self.bound <= self._qsize()
+
+    def _rejects(self, block: bool) -> bool:
+        if self.policy is OverflowPolicy.BLOCK:
+            return not block
+        return self.policy is OverflowPolicy.REJECT
+
+    def _makeRoom(self, item, block: bool, timeout: float) -> bool:
+        if not self._isFull():
+            return True
+        if self.isUrgent is not None and self.isUrgent(item):
+            return True
+        if self.policy is OverflowPolicy.BLOCK and block:
+            return self.not_full.wait_for(
+                lambda: not self._isFull(), timeout=timeout)
+        if self.policy is OverflowPolicy.DROP_OLDEST:
+            if self._dropOldest():
+                self.dropped += 1
+                # The dropped item will never be done
+                self.unfinished_tasks -= 1
+            # Otherwise only urgent items are queued
+            return True
+        if self.policy is OverflowPolicy.DROP_NEWEST:
+            self.dropped += 1
+            return False
+        # The REJECT policy, or the BLOCK policy without blocking
+        self.rejected += 1
+        return False
+
+    def _dropOldest(self) -> bool:
+        for i, queued in enumerate(self.queue):
+            if self.isUrgent is not None and self.isUrgent(queued):
+                continue
+            del self.queue[i]
+            return True
+        return False
+
+    def _clear(self):
+        self.queue.clear()
+
+    def clear(self):
+        with self.mutex:
+            self.unfinished_tasks -= self._qsize()
+            self._clear()
+            self.not_full.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        with self.mutex:
+            return {
+                'depth': self._qsize(),
+                'maxDepth': self.maxDepth,
+                'dropped': self.dropped,
+                'rejected': self.rejected}
@@ -0,0 +1,52 @@
+from collections import deque
+from threading import Condition
+from time import time
+from typing import Deque
+
+
+class Credits:
+    """
+    Credit based flow control of a producer. Each item sent takes a credit
+    and each response gives one back, so that no more than total items
+    are in flight and the producer waits when the receivers fall behind.
+
+    A credit not given back within timeout seconds, because its item or
+    response was dropped on the way, is taken back.
+    """
+
+    def __init__(self, total: int, timeout: float = 10):
+        """
+        :param total: the most items in flight, 0 for no limit
+        :param timeout: seconds after which an unanswered item is lost
+        """
+        self.total = total
+        self.timeout = timeout
+        self.expired = 0
+        self._condition = Condition()
+        # When each credit in use was taken, the oldest first
+        self._taken: Deque[float] = deque()
+
+    def acquire(self):
+        if self.total <= 0:
+            return
+        with self._condition:
+            while len(self._taken) >= self.total:
+                waitFor = self._taken[0] + self.timeout - time()
+                if waitFor <= 0:
+                    self._taken.popleft()
+                    self.expired += 1
+                    break
+                self._condition.wait(waitFor)
+            self._taken.append(time())
+
+    def release(self):
+        if self.total <= 0:
+            return
+        with self._condition:
+            if self._taken:
+                self._taken.popleft()
+            self._condition.notify()
+
+    def inFlight(self) -> int:
+        with self._condition:
+            return len(self._taken)
@@ -0,0 +1,92 @@
+from collections import deque
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+
+from .boundedQueue import BoundedQueue
+from .lane import Lane
+from .overflowPolicy import OverflowPolicy
+
+
+class LanedQueue(BoundedQueue):
+    """
+    A BoundedQueue with one FIFO per lane, so that control messages are
+    not held back behind the data queued before them.
+
+    Items are taken by weighted round robin: a lane gives at most its
+    weight items in a round, the lanes earlier in the weights first, and
+    a round ends once no lane with items has weight left. Control is
+    served first as long as it has weight left, and a flood of control
+    messages still lets weight data messages through in each round.
+    """
+
+    def __init__(
+            self,
+            laneOf: Callable[[Any], Lane],
+            weights: Dict[Lane, int],
+            bound: int = 0,
+            policy: OverflowPolicy = OverflowPolicy.BLOCK,
+            isUrgent: Callable[[Any], bool] = None,
+            onReject: Callable[[Any], None] = None):
+        """
+        :param laneOf: the lane of an item
+        :param weights: the most items of each lane in a round, in the
+        order the lanes are served
+        """
+        for lane in Lane:
+            if weights.get(lane, 0) < 1:
+                raise Exception('Weight of %s lane is not positive' % lane.value)
+        self.laneOf = laneOf
+        self.weights = weights
+        self.lanesInOrder = list(weights)
+        BoundedQueue.__init__(
+            self,
+            bound=bound,
+            policy=policy,
+            isUrgent=isUrgent,
+            onReject=onReject)
+
+    def _init(self, maxsize: int):
+        self.queue: Dict[Lane, Deque] = {lane: deque() for lane in Lane}
+        self.size = 0
+        self.weightLeft: Dict[Lane, int] = dict(self.weights)
+
+    def _qsize(self) -> int:
+        return self.size
+
+    def _put(self, item):
+        self.queue[self.laneOf(item)].append(item)
+        self.size += 1
+
+    def _get(self):
+        for lane in self.lanesInOrder:
+            if self.queue[lane] and self.weightLeft[lane]:
+                return self._take(lane)
+        # Every lane with items has used its weight, a new round starts
+        self.weightLeft = dict(self.weights)
+        for lane in self.lanesInOrder:
+            if self.queue[lane]:
+                return self._take(lane)
+
+    def _take(self, lane: Lane):
+        self.weightLeft[lane] -= 1
+        self.size -= 1
+        return self.queue[lane].popleft()
+
+    def _dropOldest(self) -> bool:
+        for lane in self.lanesInOrder:
+            queue = self.queue[lane]
+            for i, queued in enumerate(queue):
+                if self.isUrgent is not None and self.isUrgent(queued):
+                    continue
+                del queue[i]
+                self.size -= 1
+                return True
+        return False
+
+    def _clear(self):
+        for queue in self.queue.values():
+            queue.clear()
+        self.size = 0
+
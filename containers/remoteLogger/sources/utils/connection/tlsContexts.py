@@ -0,0 +1,105 @@
+import os
+import ssl
+from threading import Lock
+from time import time
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+from ..types import Address
+
+
+class TLSContexts:
+    """
+    TLS contexts shared by every connection of the process.
+
+    The server context is built once and rebuilt only when the cert or key
+    file changes. Keeping it also keeps its session ticket keys, which is
+    what lets a client resume a session. The client context is built once,
+    and the last session to every destination is kept to resume the next
+    connection to it without a full handshake.
+    """
+
+    def __init__(self, checkInterval: float = 1.0):
+        self.checkInterval = checkInterval
+        self._lock = Lock()
+        self._serverContexts: Dict[
+            Tuple[str, str], Tuple[ssl.SSLContext, Tuple, float]] = {}
+        self._clientContext: Union[ssl.SSLContext, None] = None
+        self._sessions: Dict[Address, ssl.SSLSession] = {}
+        # set to False to build a context for every socket, as before
+        self.reuseContexts = True
+        self.resumeSessions = True
+
+    def serverContext(self, certFile: str, keyFile: str) -> ssl.SSLContext:
+        if not self.reuseContexts:
+            return self._newServerContext(certFile, keyFile)
+        key = (certFile, keyFile)
+        with self._lock:
+            cached = self._serverContexts.get(key)
+            now = time()
+            if cached is not None:
+                context, signature, checkedAt = cached
+                if now - checkedAt < self.checkInterval:
+                    return context
+                if self._signature(certFile, keyFile) == signature:
+                    self._serverContexts[key] = (context, signature, now)
+                    return context
+            signature = self._signature(certFile, keyFile)
+            context = self._newServerContext(certFile, keyFile)
+            self._serverContexts[key] = (context, signature, now)
+            return context
+
+    def clientContext(self) -> ssl.SSLContext:
+        if not self.reuseContexts:
+            return self._newClientContext()
+        with self._lock:
+            if self._clientContext is None:
+                self._clientContext = self._newClientContext()
+            return self._clientContext
+
+    def wrapClientSocket(self, s, dest_addr: Address) -> ssl.SSLSocket:
+        session = None
+        if self.resumeSessions:
+            session = self._sessions.get(dest_addr)
+        context = self.clientContext()
+        try:
+            return context.wrap_socket(
+                s, server_hostname=dest_addr[0], session=session)
+        except ValueError:
+            # The session belongs to a context that has been replaced
+            self._sessions.pop(dest_addr, None)
+            return context.wrap_socket(s, server_hostname=dest_addr[0])
+
+    def saveSession(self, dest_addr: Address, s):
+        # With TLS 1.3 the tickets arrive after the handshake, so this is
+        # called again once something has been received
+        if not self.resumeSessions or not isinstance(s, ssl.SSLSocket):
+            return
+        session = s.session
+        if session is None or not session.has_ticket and not session.id:
+            return
+        self._sessions[dest_addr] = session
+
+    @staticmethod
+    def _signature(certFile: str, keyFile: str) -> Tuple:
+        certStat = os.stat(certFile)
+        keyStat = os.stat(keyFile)
+        return (certStat.st_mtime_ns, certStat.st_size,
+                keyStat.st_mtime_ns, keyStat.st_size)
+
+    @staticmethod
+    def _newServerContext(certFile: str, keyFile: str) -> ssl.SSLContext:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certFile, keyFile)
+        return context
+
+    @staticmethod
+    def _newClientContext() -> ssl.SSLContext:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+
+
+tlsContexts = TLSContexts()
@@ -28,6 +28,30 @@ class BaseDatabase:
         conn.commit()
         connCursorQueue.put((conn, cursor))
 
+    @staticmethod
+    def threadSafeWriteMany(
+            connCursorQueue: ConnCursorQueue,
+            statements: List[Tuple[str, List[Tuple]]],
+            batchSize: int):
+        """
+        Write the rows of every statement in one transaction
+        :param connCursorQueue: connections of the database to write
+        :param statements: parameterized sql and the rows to run it with
+        :param batchSize: the maximum rows sent in one round trip
+        :return:
+        """
+        conn, cursor = connCursorQueue.get()
+        try:
+            for sql, rows in statements:
+                for i in range(0, len(rows), batchSize):
+                    cursor.executemany(sql, rows[i:i + batchSize])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            connCursorQueue.put((conn, cursor))
+
     @staticmethod
     def threadSafeRead(connCursorQueue: ConnCursorQueue, sql: str) \
             -> List[List[Any]]:
@@ -135,6 +159,24 @@ class BaseDatabase:
     def readResponseTime(self, nameConsistent: str, ) -> float:
         raise NotImplementedError
 
+    @abstractmethod
+    def writeAllImages(self, images: AllImages):
+        raise NotImplementedError
+
+    @abstractmethod
+    def writeAllRunningContainers(
+            self, runningContainers: AllRunningContainers):
+        raise NotImplementedError
+
+    @abstractmethod
+    def writeAllResources(self, resources: AllResources):
+        raise NotImplementedError
+
+    @abstractmethod
+    def writeAllSystemPerformance(
+            self, systemPerformance: AllSystemPerformance):
+        raise NotImplementedError
+
     @abstractmethod
     def readAllImages(self) -> AllImages:
         raise NotImplementedError
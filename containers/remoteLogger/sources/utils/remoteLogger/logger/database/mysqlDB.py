@@ -2,7 +2,9 @@ from abc import ABC
 from json import dumps
 from json import loads
 from typing import Dict
+from typing import List
 from typing import Set
+from typing import Tuple
 from typing import Union
 
 from .base import BaseDatabase
@@ -36,8 +38,10 @@ class MySQLDatabase(BaseDatabase, ABC):
             dbImages: str = 'fogbus2_images',
             dbResources: str = 'fogbus2_resources',
             dbSystemPerformance: str = 'fogbus2_systemperformance',
+            batchSize: int = 1000,
             **kwargs):
         BaseDatabase.__init__(self)
+        self.batchSize = batchSize
         self.connImages = self.connectionsPool(
             host=host,
             port=port,
@@ -353,6 +357,106 @@ class MySQLDatabase(BaseDatabase, ABC):
         runningContainers = self.readHostIDImages('runningContainers', hostID)
         return set(loads(runningContainers))
 
+    @staticmethod
+    def upsertSQL(tableName: str, keys: List[str], columns: List[str]) -> str:
+        allColumns = keys + columns
+        sql = 'INSERT INTO %s (%s) ' \
+              'VALUES(%s) ' \
+              'ON DUPLICATE KEY ' \
+              'UPDATE %s' \
+              % (
+                  tableName,
+                  ','.join(allColumns),
+                  ','.join(['%s'] * len(allColumns)),
+                  ','.join(['%s=VALUES(%s)' % (column, column)
+                            for column in columns]))
+        return sql
+
+    def writeAllImages(self, images: AllImages):
+        rows = [
+            (hostID, dumps(list(hostImages)))
+            for hostID, hostImages in images.items()]
+        statements = [(self.upsertSQL('hosts', ['hostID'], ['images']), rows)]
+        self.threadSafeWriteMany(self.connImages, statements, self.batchSize)
+
+    def writeAllRunningContainers(
+            self, runningContainers: AllRunningContainers):
+        rows = [
+            (hostID, dumps(list(containers)))
+            for hostID, containers in runningContainers.items()
+            if isinstance(containers, set) and len(containers) > 0]
+        statements = [(
+            self.upsertSQL('hosts', ['hostID'], ['runningContainers']), rows)]
+        self.threadSafeWriteMany(self.connImages, statements, self.batchSize)
+
+    def writeAllResources(self, resources: AllResources):
+        columns = [
+            'cpuCores', 'cpuFrequency', 'cpuUtilization', 'cpuUtilizationPeak',
+            'memoryMaximum', 'memoryUtilization', 'memoryUtilizationPeak',
+            'platform']
+        rows = [(
+            hostID,
+            hostResources.cpu.cores,
+            hostResources.cpu.frequency,
+            hostResources.cpu.utilization,
+            hostResources.cpu.utilizationPeak,
+            hostResources.memory.maximum,
+            hostResources.memory.utilization,
+            hostResources.memory.utilizationPeak,
+            dumps(hostResources.platform.toDict()))
+            for hostID, hostResources in resources.items()]
+        statements = [(self.upsertSQL('hosts', ['hostID'], columns), rows)]
+        self.threadSafeWriteMany(
+            self.connResources, statements, self.batchSize)
+
+    def writeAllSystemPerformance(
+            self, systemPerformance: AllSystemPerformance):
+        """
+        Write every table of system performance in one transaction
+        :param systemPerformance: what to write
+        :return:
+        """
+        statements = []
+        for tableName in ['dataRate', 'delay', 'latency']:
+            rows = self.sourceDestinationRows(
+                getattr(systemPerformance, tableName))
+            statements.append((
+                self.upsertSQL(tableName, ['source', 'destination'],
+                               [tableName]),
+                rows))
+        # Swapped, the same as writePacketSize
+        rows = [
+            (destination, source, data)
+            for source, destination, data in self.sourceDestinationRows(
+                systemPerformance.packetSize)]
+        statements.append((
+            self.upsertSQL('packetSize', ['source', 'destination'],
+                           ['packetSize']),
+            rows))
+        rows = [
+            (nameConsistent, dumps(processingTime.toDict()))
+            for nameConsistent, processingTime in
+            systemPerformance.processingTime.items()]
+        statements.append((
+            self.upsertSQL('processingTime', ['nameConsistent'],
+                           ['processingTime']),
+            rows))
+        rows = list(systemPerformance.responseTime.items())
+        statements.append((
+            self.upsertSQL('responseTime', ['nameConsistent'],
+                           ['responseTime']),
+            rows))
+        self.threadSafeWriteMany(
+            self.connSystemPerformance, statements, self.batchSize)
+
+    @staticmethod
+    def sourceDestinationRows(allSourceDestination: Dict[str, Dict]) \
+            -> List[Tuple[str, str, Union[float, int]]]:
+        return [
+            (source, destination, data)
+            for source, destinations in allSourceDestination.items()
+            for destination, data in destinations.items()]
+
     def readAllImages(self) -> AllImages:
         sql = 'SELECT hostID,images ' \
               'FROM hosts'
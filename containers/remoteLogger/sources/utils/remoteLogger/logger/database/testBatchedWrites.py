@@ -0,0 +1,236 @@
+import re
+import sqlite3
+import unittest
+from queue import Queue
+from random import randint
+from random import random
+from typing import Dict
+
+from .mysqlDB import MySQLDatabase
+from ..allSystemPerformance import AllSystemPerformance
+from ....types import ActorResources
+from ....types import ProcessingTime
+
+schemas = {
+    'fogbus2_images': [
+        'CREATE TABLE hosts (hostID TEXT PRIMARY KEY, images TEXT,'
+        ' runningContainers TEXT)'],
+    'fogbus2_resources': [
+        'CREATE TABLE hosts (hostID TEXT PRIMARY KEY,'
+        ' cpuCores INTEGER, cpuFrequency REAL, cpuUtilization REAL,'
+        ' cpuUtilizationPeak REAL, memoryMaximum REAL,'
+        ' memoryUtilization REAL, memoryUtilizationPeak REAL,'
+        ' platform TEXT)'],
+    'fogbus2_systemperformance': [
+        'CREATE TABLE %s (source TEXT, destination TEXT, %s REAL,'
+        ' PRIMARY KEY (source, destination))' % (name, name)
+        for name in ('dataRate', 'delay', 'latency', 'packetSize')] + [
+        'CREATE TABLE processingTime (nameConsistent TEXT PRIMARY KEY,'
+        ' processingTime TEXT)',
+        'CREATE TABLE responseTime (nameConsistent TEXT PRIMARY KEY,'
+        ' responseTime REAL)']}
+
+
+class RoundTrips:
+
+    def __init__(self):
+        self.count = 0
+
+
+class SQLiteCursor:
+    """
+    A cursor with the interface of mysql.connector which runs the sql on
+    SQLite, counting every call as one round trip to the server
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, roundTrips: RoundTrips):
+        self.cursor = cursor
+        self.roundTrips = roundTrips
+
+    @staticmethod
+    def translate(sql: str) -> str:
+        sql = sql.replace('%s', '?')
+        if 'ON DUPLICATE KEY' not in sql:
+            return sql
+        insert, update = re.split(r'ON DUPLICATE KEY\s+UPDATE', sql)
+        update = re.sub(r'VALUES\((\w+)\)', r'excluded.\1', update)
+        return '%s ON CONFLICT DO UPDATE SET %s' % (insert, update)
+
+    def execute(self, sql: str, params=()):
+        self.roundTrips.count += 1
+        self.cursor.execute(self.translate(sql), params)
+
+    def executemany(self, sql: str, rows):
+        # mysql.connector sends all the rows of an insert in one statement
+        self.roundTrips.count += 1
+        self.cursor.executemany(self.translate(sql), rows)
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+
+class SQLiteConnection:
+
+    def __init__(self, conn: sqlite3.Connection, roundTrips: RoundTrips):
+        self.conn = conn
+        self.roundTrips = roundTrips
+
+    def commit(self):
+        self.roundTrips.count += 1
+        self.conn.commit()
+
+    def rollback(self):
+        self.roundTrips.count += 1
+        self.conn.rollback()
+
+
+class SQLiteStandIn(MySQLDatabase):
+
+    def __init__(self, batchSize: int = 1000):
+        self.roundTrips = RoundTrips()
+        MySQLDatabase.__init__(
+            self, user='', password='', batchSize=batchSize)
+
+    def connectionsPool(self, dbName: str, **kwargs):
+        conn = sqlite3.connect(':memory:', check_same_thread=False)
+        for schema in schemas[dbName]:
+            conn.execute(schema)
+        connCursorQueue = Queue()
+        connCursorQueue.put((
+            SQLiteConnection(conn, self.roundTrips),
+            SQLiteCursor(conn.cursor(), self.roundTrips)))
+        return connCursorQueue
+
+
+class BatchedWritesTest(unittest.TestCase):
+    hostNum = 50
+
+    @staticmethod
+    def profile(hostNum: int) -> AllSystemPerformance:
+        """
+        hostNum * hostNum rows for each source destination table,
+        10k rows for 50 hosts
+        """
+        hostIDs = ['HOST_%d' % i for i in range(hostNum)]
+
+        def sourceDestination(generate):
+            return {
+                source: {destination: generate() for destination in hostIDs}
+                for source in hostIDs}
+
+        names = ['TaskExecutor-%d_%s' % (i, hostID)
+                 for hostID in hostIDs for i in range(2)]
+        return AllSystemPerformance(
+            dataRate=sourceDestination(random),
+            delay=sourceDestination(random),
+            latency=sourceDestination(random),
+            packetSize=sourceDestination(lambda: randint(0, 4096)),
+            processingTime={
+                name: ProcessingTime(
+                    taskExecutorName=name, processingTime=random())
+                for name in names},
+            responseTime={name: random() for name in names})
+
+    @staticmethod
+    def writeOneByOne(db: MySQLDatabase, profile: AllSystemPerformance):
+        for name, write in (
+                ('dataRate', db.writeDataRate),
+                ('delay', db.writeDelay),
+                ('latency', db.writeLatency),
+                ('packetSize', db.writePacketSize)):
+            for source, destinations in getattr(profile, name).items():
+                for destination, data in destinations.items():
+                    write(source, destination, data)
+        for name, processingTime in profile.processingTime.items():
+            db.writeProcessingTime(name, processingTime)
+        for name, responseTime in profile.responseTime.items():
+            db.writeResponseTime(name, responseTime)
+
+    def assertSameProfile(self, a: AllSystemPerformance,
+                          b: AllSystemPerformance):
+        for name in ('dataRate', 'delay', 'latency', 'packetSize',
+                     'responseTime'):
+            self.assertSameValues(getattr(a, name), getattr(b, name))
+        self.assertEqual(
+            {k: v.toDict() for k, v in a.processingTime.items()},
+            {k: v.toDict() for k, v in b.processingTime.items()})
+
+    def assertSameValues(self, a: Dict, b: Dict):
+        # SQLite may parse a float written in the text of a statement to
+        # a double one ulp away from the float bound as a parameter
+        self.assertEqual(a.keys(), b.keys())
+        for key, value in a.items():
+            if isinstance(value, dict):
+                self.assertSameValues(value, b[key])
+                continue
+            self.assertAlmostEqual(value, b[key], places=12)
+
+    def testRoundTrips(self):
+        profile = self.profile(self.hostNum)
+        rowNum = 4 * self.hostNum * self.hostNum
+        rowNum += len(profile.processingTime) + len(profile.responseTime)
+
+        oneByOne = SQLiteStandIn()
+        self.writeOneByOne(oneByOne, profile)
+        batched = SQLiteStandIn(batchSize=1000)
+        batched.writeAllSystemPerformance(profile)
+
+        # An execute and a commit for every row, against
+        # a round trip for each batch and one commit
+        self.assertEqual(oneByOne.roundTrips.count, 2 * rowNum)
+        self.assertEqual(batched.roundTrips.count, 4 * 3 + 1 + 1 + 1)
+        self.assertSameProfile(
+            oneByOne.readAllSystemPerformance(),
+            batched.readAllSystemPerformance())
+
+    @staticmethod
+    def stored(profile: AllSystemPerformance) -> AllSystemPerformance:
+        # Packet size is stored with the source and the destination swapped
+        packetSize = {}
+        for source, destinations in profile.packetSize.items():
+            for destination, size in destinations.items():
+                if destination not in packetSize:
+                    packetSize[destination] = {}
+                packetSize[destination][source] = size
+        profile.packetSize = packetSize
+        return profile
+
+    def testBatchSize(self):
+        profile = self.profile(10)
+        db = SQLiteStandIn(batchSize=7)
+        db.writeAllSystemPerformance(profile)
+        # 100 rows for each source destination table, 20 for the others
+        self.assertEqual(db.roundTrips.count, 4 * 15 + 2 * 3 + 1)
+        self.assertSameProfile(
+            self.stored(profile), db.readAllSystemPerformance())
+
+    def testUpdate(self):
+        db = SQLiteStandIn()
+        profile = self.profile(5)
+        db.writeAllSystemPerformance(profile)
+        profile = self.profile(5)
+        db.writeAllSystemPerformance(profile)
+        self.assertSameProfile(
+            self.stored(profile), db.readAllSystemPerformance())
+
+    def testRollback(self):
+        db = SQLiteStandIn()
+        profile = self.profile(5)
+        profile.responseTime['broken'] = object()
+        with self.assertRaises(Exception):
+            db.writeAllSystemPerformance(profile)
+        self.assertEqual(db.readAllLatency(), {})
+
+    def testResourcesAndImages(self):
+        db = SQLiteStandIn()
+        resources = {'HOST_%d' % i: ActorResources() for i in range(20)}
+        db.writeAllResources(resources)
+        db.writeAllImages({'HOST_0': {'a', 'b'}})
+        db.writeAllRunningContainers({'HOST_0': {'c'}, 'HOST_1': set()})
+        self.assertEqual(db.readAllResources().keys(), resources.keys())
+        self.assertEqual(db.readAllImages(), {'HOST_0': {'a', 'b'}})
+        self.assertEqual(db.readAllRunningContainers(), {'HOST_0': {'c'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
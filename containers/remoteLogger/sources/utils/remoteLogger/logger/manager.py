@@ -1,11 +1,12 @@
-from typing import Any
-from typing import Callable
 from typing import Dict
 
 from .allSystemPerformance import AllSystemPerformance
 from .database import MySQLDatabase
+from .types import AllCompression
 from .types import AllDataRate
 from .types import AllDelay
+from .types import AllFlowControl
+from .types import AllHandlers
 from .types import AllImages
 from .types import AllLatency
 from .types import AllPacketSize
@@ -15,7 +16,6 @@ from .types import AllResponseTime
 from .types import AllRunningContainers
 from ..config import MySQLEnvironment
 from ...component.basic import BasicComponent
-from ...types import LoopSourceDestination
 from ...types import ActorResources
 from ...types import SynchronizedAttribute
 
@@ -28,17 +28,23 @@ class LoggerManager:
             password: str = MySQLEnvironment.password,
             host: str = MySQLEnvironment.host,
             port: int = MySQLEnvironment.port,
+            batchSize: int = 1000,
             **kwargs):
         self.images: AllImages = {}
         self.resources: AllResources = {}
         self.systemPerformance = AllSystemPerformance()
         self.runningContainers: AllRunningContainers = {}
+        # Only the latest counters, for monitoring
+        self.flowControl: AllFlowControl = {}
+        self.compression: AllCompression = {}
+        self.handlers: AllHandlers = {}
         self.basicComponent = basicComponent
         self.database = MySQLDatabase(
             user,
             password,
             host,
             port,
+            batchSize=batchSize,
             **kwargs)
 
     def saveAll(self):
@@ -57,48 +63,28 @@ class LoggerManager:
         self._saveResources(self, attributeName='resources')
 
     def saveSystemPerformance(self):
-        self.savePacketSize(self, attributeName='packetSize')
-        self.saveDelay(self, attributeName='delay')
-        self.saveDataRate(self, attributeName='dataRate')
-        self.saveLatency(self, attributeName='latency')
-        self.saveProcessingTime(self, attributeName='processingTime')
-        self.saveResponseTime(self, attributeName='responseTime')
+        # Copied under the lock of each attribute,
+        # then written in one transaction
+        systemPerformance = AllSystemPerformance(
+            dataRate=self._copySystemPerformance(
+                self, attributeName='dataRate'),
+            delay=self._copySystemPerformance(self, attributeName='delay'),
+            latency=self._copySystemPerformance(
+                self, attributeName='latency'),
+            packetSize=self._copySystemPerformance(
+                self, attributeName='packetSize'),
+            processingTime=self._copySystemPerformance(
+                self, attributeName='processingTime'),
+            responseTime=self._copySystemPerformance(
+                self, attributeName='responseTime'))
+        self.database.writeAllSystemPerformance(systemPerformance)
 
     @SynchronizedAttribute
-    def savePacketSize(self, attributeName='packetSize'):
-        self._saveSourceDestination(
-            dictInDict=self.systemPerformance.packetSize,
-            runner=self.database.writePacketSize)
-
-    @SynchronizedAttribute
-    def saveDelay(self, attributeName='delay'):
-        self._saveSourceDestination(
-            dictInDict=self.systemPerformance.delay,
-            runner=self.database.writeDelay)
-
-    @SynchronizedAttribute
-    def saveDataRate(self, attributeName='dataRate'):
-        self._saveSourceDestination(
-            dictInDict=self.systemPerformance.dataRate,
-            runner=self.database.writeDataRate)
-
-    @SynchronizedAttribute
-    def saveLatency(self, attributeName='latency'):
-        self._saveSourceDestination(
-            dictInDict=self.systemPerformance.latency,
-            runner=self.database.writeLatency)
-
-    @SynchronizedAttribute
-    def saveProcessingTime(self, attributeName='processingTime'):
-        for hostID, pTime in \
-                self.systemPerformance.processingTime.items():
-            self.database.writeProcessingTime(hostID, pTime)
-
-    @SynchronizedAttribute
-    def saveResponseTime(self, attributeName='responseTime'):
-        for hostID, responseTime in \
-                self.systemPerformance.responseTime.items():
-            self.database.writeResponseTime(hostID, responseTime)
+    def _copySystemPerformance(self, attributeName: str) -> Dict:
+        attribute = getattr(self.systemPerformance, attributeName)
+        return {
+            key: value.copy() if isinstance(value, dict) else value
+            for key, value in attribute.items()}
 
     def retrieveAll(self):
         self.retrieveImages()
@@ -170,6 +156,24 @@ class LoggerManager:
             self.systemPerformance.packetSize,
             attributeName='packetSize')
 
+    def mergeFlowControl(self, allFlowControl: AllFlowControl):
+        self._mergeFlowControl(
+            self,
+            allFlowControl,
+            attributeName='flowControl')
+
+    def mergeCompression(self, allCompression: AllCompression):
+        self._mergeCompression(
+            self,
+            allCompression,
+            attributeName='compression')
+
+    def mergeHandlers(self, allHandlers: AllHandlers):
+        self._mergeHandlers(
+            self,
+            allHandlers,
+            attributeName='handlers')
+
     def mergeProcessingTime(
             self,
             allProcessingTime: AllProcessingTime):
@@ -192,6 +196,27 @@ class LoggerManager:
         self.systemPerformance.processingTime = {
             **self.systemPerformance.processingTime, **allProcessingTime}
 
+    @SynchronizedAttribute
+    def _mergeFlowControl(
+            self,
+            allFlowControl: AllFlowControl,
+            attributeName='flowControl'):
+        self.flowControl = {**self.flowControl, **allFlowControl}
+
+    @SynchronizedAttribute
+    def _mergeCompression(
+            self,
+            allCompression: AllCompression,
+            attributeName='compression'):
+        self.compression = {**self.compression, **allCompression}
+
+    @SynchronizedAttribute
+    def _mergeHandlers(
+            self,
+            allHandlers: AllHandlers,
+            attributeName='handlers'):
+        self.handlers = {**self.handlers, **allHandlers}
+
     @SynchronizedAttribute
     def _mergeResponseTime(
             self,
@@ -202,31 +227,15 @@ class LoggerManager:
 
     @SynchronizedAttribute
     def _saveRunningContainers(self, attributeName='runningContainers'):
-        for hostID, runningContainers in self.runningContainers.items():
-            self.database.writeRunningContainers(
-                hostID, runningContainers)
+        self.database.writeAllRunningContainers(self.runningContainers)
 
     @SynchronizedAttribute
     def _saveImages(self, attributeName='images'):
-        for hostID, images in self.images.items():
-            self.database.writeImages(hostID, images)
+        self.database.writeAllImages(self.images)
 
     @SynchronizedAttribute
     def _saveResources(self, attributeName='resources'):
-        for hostID, resources in self.resources.items():
-            self._saveResourcesOfHost(hostID, resources)
-
-    def _saveResourcesOfHost(self, hostID: str, actorResources: ActorResources):
-        self.database.writeCPU(hostID, actorResources.cpu)
-        self.database.writeMemory(hostID, actorResources.memory)
-        self.database.writePlatform(hostID, actorResources.platform)
-
-    @LoopSourceDestination
-    def _saveSourceDestination(
-            self,
-            dictInDict: Dict[str, Dict[str, Any]] = None,
-            runner: Callable = None):
-        pass
+        self.database.writeAllResources(self.resources)
 
     @SynchronizedAttribute
     def _mergeSourceDestination(self, objectA, objectB, **kwargs):
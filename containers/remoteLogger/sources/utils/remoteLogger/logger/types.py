@@ -14,3 +14,10 @@ AllLatency = Dict[str, Dict[str, float]]
 AllPacketSize = Dict[str, Dict[str, int]]
 AllProcessingTime = Dict[str, ProcessingTime]
 AllResponseTime = Dict[str, float]
+# Queue name to its depth and drop counters, of each component
+AllFlowControl = Dict[str, Dict[str, Dict[str, int]]]
+# Compressor name to its frames and bytes, of each component
+AllCompression = Dict[str, Dict[str, Dict[str, int]]]
+# Handler name to the messages it handled and how long it took,
+# of each component
+AllHandlers = Dict[str, Dict[str, Dict]]
@@ -1,9 +1,11 @@
 from logging import Logger
+from typing import Dict
 
 from ..logger import LoggerManager
 from ...component import BasicComponent
 from ...connection import HandlerReturn
 from ...connection import MessageReceived
+from ...connection import handles
 from ...types import ComponentRole
 from ...types import MessageSubType
 from ...types import MessageType
@@ -23,6 +25,7 @@ class LogHandler:
         self.debugLogger = debugLogger
         self.loggerManager = loggerManager
 
+    @handles(MessageType.LOG, MessageSubType.HOST_RESOURCES)
     def handleHostResources(self, message: MessageReceived) -> HandlerReturn:
         data = message.data
         hostResources = ActorResources.fromDict(data['actorResources'])
@@ -31,6 +34,9 @@ class LogHandler:
         self.loggerManager.mergeResources(toMerge)
         return None
 
+    @handles(
+        MessageType.LOG,
+        MessageSubType.CONTAINER_IMAGES_AND_RUNNING_CONTAINERS)
     def handleImagesAndRunningContainers(
             self, message: MessageReceived) -> HandlerReturn:
         hostNameConsistent = message.source.nameConsistent
@@ -43,11 +49,13 @@ class LogHandler:
         self.loggerManager.mergeRunningContainers(runningContainersToMerge)
         return None
 
+    @handles(MessageType.LOG, MessageSubType.DATA_RATE_TEST)
     def handleDataRate(self, message: MessageReceived) -> HandlerReturn:
         dataRate = message.data['dataRate']
         self.loggerManager.mergeDataRate(dataRate)
         return None
 
+    @handles(MessageType.LOG, MessageSubType.DELAYS)
     def handleDelays(self, message: MessageReceived) -> HandlerReturn:
         delays = message.data['delays']
         sourceName = message.source.nameConsistent
@@ -55,19 +63,47 @@ class LogHandler:
         self.loggerManager.mergeDelay(toMerge)
         return None
 
+    @handles(MessageType.LOG, MessageSubType.LATENCY)
     def handleLatency(self, message: MessageReceived) -> HandlerReturn:
         latency = message.data['latency']
         self.loggerManager.mergeLatency(latency)
         return None
 
+    @handles(MessageType.LOG, MessageSubType.MEDIAN_RECEIVED_PACKET_SIZE)
     def handleMedianReceivedPacketSize(
             self, message: MessageReceived) -> HandlerReturn:
         sizes = message.data['sizes']
         destName = message.source.nameConsistent
         toMerge = {destName: sizes}
         self.loggerManager.mergePacketSize(toMerge)
+        if 'flowControl' in message.data:
+            self.handleFlowControl(destName, message.data['flowControl'])
+        if 'compression' in message.data:
+            self.loggerManager.mergeCompression(
+                {destName: message.data['compression']})
+        if 'handlers' in message.data:
+            self.loggerManager.mergeHandlers(
+                {destName: message.data['handlers']})
         return None
 
+    def handleFlowControl(self, sourceName: str, flowControl: Dict):
+        previous = self.loggerManager.flowControl.get(sourceName, {})
+        self.loggerManager.mergeFlowControl({sourceName: flowControl})
+        # The counters only grow, so warn about the new drops only
+        dropped = self.countDropped(flowControl) - self.countDropped(previous)
+        if dropped <= 0:
+            return
+        self.debugLogger.warning(
+            '%s dropped %d messages since the last upload: %s',
+            sourceName, dropped, str(flowControl))
+
+    @staticmethod
+    def countDropped(flowControl: Dict) -> int:
+        return sum(
+            queue.get('dropped', 0) + queue.get('rejected', 0)
+            for queue in flowControl.values())
+
+    @handles(MessageType.LOG, MessageSubType.MEDIAN_PROCESSING_TIME)
     def handleMedianProcessingTime(
             self, message: MessageReceived) -> HandlerReturn:
         data = message.data
@@ -80,6 +116,7 @@ class LogHandler:
         self.loggerManager.mergeProcessingTime(toMerge)
         return None
 
+    @handles(MessageType.LOG, MessageSubType.RESPONSE_TIME)
     def handleResponseTime(self, message: MessageReceived) -> HandlerReturn:
         responseTime = message.data['responseTime']
         sourceName = message.source.nameConsistent
@@ -87,6 +124,7 @@ class LogHandler:
         self.loggerManager.mergeResponseTime(toMerge)
         return None
 
+    @handles(MessageType.LOG, MessageSubType.REQUEST_PROFILES)
     def handleRequestProfiles(self, message: MessageReceived):
         self._handleRequestProfiles(
             self, message=message, attributeName='loggerManager')
@@ -103,6 +141,7 @@ class LogHandler:
             data=data,
             destination=message.source)
 
+    @handles(MessageType.LOG, MessageSubType.PROFILES)
     def handleProfiles(self, message: MessageReceived):
         self._handleProfiles(
             self, message=message, attributeName='loggerManager')
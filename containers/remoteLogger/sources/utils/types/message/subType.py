@@ -45,3 +45,6 @@ class MessageSubType(Enum):
     PROBE = 'probe'
     NO_ACTOR = 'noActor'
     PROFILES = 'profiles'
+    DATA_ROUTES = 'dataRoutes'
+    NACK = 'nack'
+    BATCH = 'batch'
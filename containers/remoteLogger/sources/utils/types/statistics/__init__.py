@@ -0,0 +1,3 @@
+from .ewma import EWMA
+from .p2Quantile import P2Quantile
+from .windowMedian import WindowMedian
@@ -38,7 +38,11 @@ class TaskExecutor:
             enableTLS: bool = False,
             certFile: str = '',
             keyFile: str = '',
-            domainName: str = ''):
+            domainName: str = '',
+            wireCodec: str = 'pickle',
+            transport: str = 'threads',
+            maxBatchSize: int = 8,
+            maxBatchDelay: float = 0):
         self.basicComponent = BasicComponent(
             role=ComponentRole.TASK_EXECUTOR,
             addr=addr,
@@ -48,8 +52,13 @@ class TaskExecutor:
             enableTLS=enableTLS,
             certFile=certFile,
             keyFile=keyFile,
-            domainName=domainName)
-        self.task: BaseTask = initTask(taskName)
+            domainName=domainName,
+            wireCodec=wireCodec,
+            transport=transport)
+        self.task: BaseTask = initTask(
+            taskName,
+            maxBatchSize=maxBatchSize,
+            maxBatchDelay=maxBatchDelay)
         if self.task is None:
             self.basicComponent.debugLogger.error(
                 'TaskName invalid: %s', taskName)
@@ -232,6 +241,36 @@ def parseArg():
         default='fogbus2',
         type=str,
         help='Domain Name')
+    parser.add_argument(
+        '--wireCodec',
+        metavar='WireCodec',
+        nargs='?',
+        default='pickle',
+        type=str,
+        help='Codec of messages sent by this component, pickle or binary')
+    parser.add_argument(
+        '--transport',
+        metavar='Transport',
+        nargs='?',
+        default='threads',
+        type=str,
+        help='threads to run two threads per connection, '
+             'or eventLoop to drive all connections from one thread')
+    parser.add_argument(
+        '--maxBatchSize',
+        metavar='MaxBatchSize',
+        nargs='?',
+        default=8,
+        type=int,
+        help='The most frames of concurrent messages to infer together')
+    parser.add_argument(
+        '--maxBatchDelay',
+        metavar='MaxBatchDelay',
+        nargs='?',
+        default=0,
+        type=float,
+        help='The most milliseconds a frame waits for a batch to fill, '
+             'more for throughput, less for latency')
 
     return parser.parse_args()
 
@@ -258,5 +297,9 @@ if __name__ == '__main__':
         enableTLS=args.enableTLS,
         certFile=args.certFile,
         keyFile=args.keyFile,
-        domainName=args.domainName)
+        domainName=args.domainName,
+        wireCodec=args.wireCodec,
+        transport=args.transport,
+        maxBatchSize=args.maxBatchSize,
+        maxBatchDelay=args.maxBatchDelay)
     taskExecutor_.run()
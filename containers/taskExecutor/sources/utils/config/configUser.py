@@ -10,5 +10,28 @@ portRangeStr = environment['USER_PORT_RANGE']
 portRange = portRangeStr.split('-')
 
 
+def _value(key: str, default):
+    return type(default)(environment.get('USER_' + key, default))
+
+
 class ConfigUser(Config):
     portRange: Tuple[int, int] = (int(portRange[0]), int(portRange[1]) + 1)
+    # How ObjectDetection sends its frames: jpeg, webp or raw
+    frameEncoding: str = _value('FRAME_ENCODING', 'jpeg')
+    # The quality of the encoded frames adapts between these
+    frameQuality: int = _value('FRAME_QUALITY', 80)
+    frameMinQuality: int = _value('FRAME_MIN_QUALITY', 30)
+    frameMaxQuality: int = _value('FRAME_MAX_QUALITY', 95)
+    # The quality is lowered while the median response time in
+    # milliseconds or the megabits per second of frames is above these
+    targetResponseTime: float = _value('TARGET_RESPONSE_TIME', 300.)
+    maxFrameDataRate: float = _value('MAX_FRAME_DATA_RATE', 20.)
+    # The rate of the frames sent adapts between these, and frames are
+    # skipped while the response time is above its target or while this
+    # many frames are waiting for their results, 0 for no limit
+    minFrameRate: float = _value('MIN_FRAME_RATE', 1.)
+    maxFrameRate: float = _value('MAX_FRAME_RATE', 30.)
+    maxFramesInFlight: int = _value('MAX_FRAMES_IN_FLIGHT', 4)
+    # The most milliseconds a frame waits for its result to be drawn,
+    # after which it is skipped
+    maxFrameHoldTime: float = _value('MAX_FRAME_HOLD_TIME', 1000.)
@@ -0,0 +1,118 @@
+import zlib
+from abc import ABC
+from abc import abstractmethod
+from threading import local
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+class Compressor(ABC):
+    # One byte written at the start of every compressed payload
+    compressorID: int = 0
+    name: str = ''
+
+    @abstractmethod
+    def compress(self, views: List[memoryview]) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decompress(self, payload: memoryview) -> bytes:
+        raise NotImplementedError
+
+
+class ZlibCompressor(Compressor):
+    # In the standard library, so every component has it
+    compressorID = 1
+    name = 'zlib'
+
+    def __init__(self, level: int = 1):
+        self.level = level
+
+    def compress(self, views: List[memoryview]) -> bytes:
+        # Fed part by part, so the parts are not joined first
+        compressor = zlib.compressobj(self.level)
+        compressed = [compressor.compress(view) for view in views]
+        compressed.append(compressor.flush())
+        return b''.join(compressed)
+
+    def decompress(self, payload: memoryview) -> bytes:
+        return zlib.decompress(payload)
+
+
+class Lz4Compressor(Compressor):
+    compressorID = 2
+    name = 'lz4'
+
+    def __init__(self):
+        import lz4.frame
+        self.lz4Frame = lz4.frame
+
+    def compress(self, views: List[memoryview]) -> bytes:
+        return self.lz4Frame.compress(b''.join(views))
+
+    def decompress(self, payload: memoryview) -> bytes:
+        return self.lz4Frame.decompress(payload)
+
+
+class ZstdCompressor(Compressor):
+    compressorID = 3
+    name = 'zstd'
+
+    def __init__(self, level: int = 3):
+        import zstandard
+        self.zstandard = zstandard
+        self.level = level
+        # A zstandard compressor or decompressor must not be used by two
+        # threads at once, so each thread has its own
+        self.perThread = local()
+
+    def _compressor(self):
+        compressor = getattr(self.perThread, 'compressor', None)
+        if compressor is None:
+            compressor = self.zstandard.ZstdCompressor(level=self.level)
+            self.perThread.compressor = compressor
+        return compressor
+
+    def _decompressor(self):
+        decompressor = getattr(self.perThread, 'decompressor', None)
+        if decompressor is None:
+            decompressor = self.zstandard.ZstdDecompressor()
+            self.perThread.decompressor = decompressor
+        return decompressor
+
+    def compress(self, views: List[memoryview]) -> bytes:
+        return self._compressor().compress(b''.join(views))
+
+    def decompress(self, payload: memoryview) -> bytes:
+        return self._decompressor().decompress(payload)
+
+
+def _installedCompressors() -> Dict[str, Compressor]:
+    compressors = {ZlibCompressor.name: ZlibCompressor()}
+    for compressorClass in (Lz4Compressor, ZstdCompressor):
+        try:
+            compressors[compressorClass.name] = compressorClass()
+        except ImportError:
+            pass
+    return compressors
+
+
+# The compressors whose packages are installed
+compressorByName: Dict[str, Compressor] = _installedCompressors()
+compressorByID: Dict[int, Compressor] = {
+    compressor.compressorID: compressor
+    for compressor in compressorByName.values()}
+
+
+def decompressPayload(payload: memoryview) -> Tuple[memoryview, int]:
+    """
+    :param payload: a compressed payload, starting with the compressor ID
+    and the codec ID of the payload compressed
+    :return: the payload decompressed and its codec ID
+    """
+    compressorID, codecID = payload[0], payload[1]
+    if compressorID not in compressorByID:
+        raise Exception('Unknown compressor ID: %d' % compressorID)
+    decompressed = compressorByID[compressorID].decompress(payload[2:])
+    return memoryview(decompressed), codecID
@@ -0,0 +1,216 @@
+from socket import socket
+from ssl import SSLSocket
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from .base import Buffer
+from .base import Codec
+from .compression import COMPRESSED_CODEC_ID
+from .compression import ConnectionCompression
+from .compressors import decompressPayload
+
+# 4-byte big-endian payload length followed by 1-byte codec ID
+PREFIX_SIZE = 5
+# Frames smaller than this are joined and sent with a single syscall
+SMALL_FRAME_SIZE = 64 * 1024
+
+
+def encodeFrame(
+        codec: Codec,
+        messageInDict: Dict,
+        compression: ConnectionCompression = None) \
+        -> Tuple[List[memoryview], int]:
+    if compression is not None:
+        messageInDict = compression.advertise(messageInDict)
+    parts = codec.encode(messageInDict)
+    views = [memoryview(part).cast('B') for part in parts]
+    payloadSize = sum(view.nbytes for view in views)
+    codecID = codec.codecID
+    if compression is not None:
+        compressed = compression.compress(
+            views, payloadSize, codecID, messageInDict.get('type'))
+        if compressed is not None:
+            views = compressed
+            payloadSize = sum(view.nbytes for view in views)
+            codecID = COMPRESSED_CODEC_ID
+    prefix = payloadSize.to_bytes(4, byteorder='big') + bytes((codecID,))
+    if payloadSize <= SMALL_FRAME_SIZE:
+        return [memoryview(b''.join((prefix, *views)))], payloadSize
+    views.insert(0, memoryview(prefix))
+    return views, payloadSize
+
+
+def sendFrame(
+        s: socket,
+        codec: Codec,
+        messageInDict: Dict,
+        compression: ConnectionCompression = None) -> int:
+    views, payloadSize = encodeFrame(codec, messageInDict, compression)
+    if len(views) == 1:
+        s.sendall(views[0])
+        return payloadSize
+    if isinstance(s, SSLSocket) or not hasattr(s, 'sendmsg'):
+        for view in views:
+            s.sendall(view)
+        return payloadSize
+    # scatter-gather the header and large buffers without joining them
+    _sendmsgAll(s, views)
+    return payloadSize
+
+
+def _sendmsgAll(s: socket, views: List[memoryview]):
+    while views:
+        sent = s.sendmsg(views)
+        while views and sent >= views[0].nbytes:
+            sent -= views[0].nbytes
+            views.pop(0)
+        if sent:
+            views[0] = views[0][sent:]
+
+
+class FrameReader:
+    """
+    Reads length-prefixed frames with recv_into.
+
+    Small frames are received into one preallocated buffer that is reused
+    for all of them. A frame larger than that buffer gets a bytearray of its
+    exact size, which its decoded out-of-band buffers can keep referring to.
+    """
+
+    def __init__(
+            self,
+            s: socket,
+            codecs: Dict[int, Codec],
+            initialBuffer: Buffer = b'',
+            bufferSize: int = SMALL_FRAME_SIZE,
+            compression: ConnectionCompression = None):
+        self.socket = s
+        self.codecs = codecs
+        self.compression = compression
+        bufferSize = max(bufferSize, len(initialBuffer), PREFIX_SIZE)
+        self._buffer = bytearray(bufferSize)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = len(initialBuffer)
+        self._buffer[:self._end] = initialBuffer
+        # a large frame being received by readAvailableFrames
+        self._large: Union[memoryview, None] = None
+        self._largeReceived = 0
+        self._largeCodecID = 0
+
+    def readFrame(self) -> Tuple[Dict, int]:
+        while self._end - self._start < PREFIX_SIZE:
+            self._fill()
+        start = self._start
+        payloadSize = int.from_bytes(
+            self._buffer[start:start + 4], byteorder='big')
+        codecID = self._buffer[start + 4]
+        self._checkCodecID(codecID)
+        self._start += PREFIX_SIZE
+
+        if payloadSize > len(self._buffer):
+            payload = self._readLargePayload(payloadSize)
+            return self._decode(codecID, payload, isOwned=True), payloadSize
+
+        while self._end - self._start < payloadSize:
+            self._fill()
+        payload = self._view[self._start:self._start + payloadSize]
+        self._start += payloadSize
+        return self._decode(codecID, payload, isOwned=False), payloadSize
+
+    def readAvailableFrames(self) -> List[Tuple[Dict, int]]:
+        # For non-blocking sockets: receives once, without waiting,
+        # and decodes every frame that is complete
+        if self._large is not None:
+            received = self.socket.recv_into(self._large[self._largeReceived:])
+            if not received:
+                raise Exception('Connection disconnected')
+            self._largeReceived += received
+        else:
+            self._fill()
+        frames = []
+        while True:
+            if self._large is not None:
+                if self._largeReceived < self._large.nbytes:
+                    break
+                payload, codecID = self._large, self._largeCodecID
+                self._large = None
+                frames.append((
+                    self._decode(codecID, payload, isOwned=True),
+                    payload.nbytes))
+                continue
+            if self._end - self._start < PREFIX_SIZE:
+                break
+            start = self._start
+            payloadSize = int.from_bytes(
+                self._buffer[start:start + 4], byteorder='big')
+            codecID = self._buffer[start + 4]
+            self._checkCodecID(codecID)
+            if PREFIX_SIZE + payloadSize > len(self._buffer):
+                self._start += PREFIX_SIZE
+                self._large = memoryview(bytearray(payloadSize))
+                self._largeCodecID = codecID
+                self._largeReceived = self._end - self._start
+                self._large[:self._largeReceived] = \
+                    self._view[self._start:self._end]
+                self._start = self._end = 0
+                continue
+            if self._end - start - PREFIX_SIZE < payloadSize:
+                if start + PREFIX_SIZE + payloadSize > len(self._buffer):
+                    self._compact()
+                break
+            payload = self._view[start + PREFIX_SIZE:
+                                 start + PREFIX_SIZE + payloadSize]
+            self._start += PREFIX_SIZE + payloadSize
+            frames.append((
+                self._decode(codecID, payload, isOwned=False), payloadSize))
+        if self._start == self._end:
+            self._start = self._end = 0
+        return frames
+
+    def _checkCodecID(self, codecID: int):
+        if codecID != COMPRESSED_CODEC_ID and codecID not in self.codecs:
+            raise Exception('Unknown codec ID: %d' % codecID)
+
+    def _decode(self, codecID: int, payload: memoryview, isOwned: bool) -> Dict:
+        if codecID == COMPRESSED_CODEC_ID:
+            payload, codecID = decompressPayload(payload)
+            if codecID not in self.codecs:
+                raise Exception('Unknown codec ID: %d' % codecID)
+            # Read-only bytes, whose buffers are copied out by the codec
+            isOwned = False
+        messageInDict = self.codecs[codecID].decode(payload, isOwned)
+        if self.compression is not None:
+            self.compression.onReceived(messageInDict)
+        return messageInDict
+
+    def pending(self) -> bytes:
+        return bytes(self._view[self._start:self._end])
+
+    def _fill(self):
+        if self._end == len(self._buffer):
+            self._compact()
+        received = self.socket.recv_into(self._view[self._end:])
+        if not received:
+            raise Exception('Connection disconnected')
+        self._end += received
+
+    def _compact(self):
+        remaining = self._end - self._start
+        self._buffer[:remaining] = self._view[self._start:self._end]
+        self._start = 0
+        self._end = remaining
+
+    def _readLargePayload(self, payloadSize: int) -> memoryview:
+        payload = memoryview(bytearray(payloadSize))
+        received = self._end - self._start
+        payload[:received] = self._view[self._start:self._end]
+        self._start = self._end = 0
+        while received < payloadSize:
+            count = self.socket.recv_into(payload[received:])
+            if not count:
+                raise Exception('Connection disconnected')
+            received += count
+        return payload
@@ -0,0 +1,186 @@
+import unittest
+from os import urandom
+from socket import socketpair
+from threading import Thread
+
+from .compression import COMPRESSED_CODEC_ID
+from .compression import Compression
+from .compressors import compressorByName
+from .compressors import ZstdCompressor
+from .frame import encodeFrame
+from .frame import FrameReader
+from .frame import PREFIX_SIZE
+from .frame import sendFrame
+from .initCodecByName import codecByID
+from .initCodecByName import initCodecByName
+from ...types import Component
+from ...types import ComponentRole
+from ...types import MessageSubSubType
+from ...types import MessageSubType
+from ...types import MessageType
+
+
+component = Component(
+    role=ComponentRole.MASTER, addr=('127.0.0.1', 5000)).toDict()
+
+
+def messageInDict(messageType: MessageType, subType: MessageSubType,
+                  data: dict):
+    return {
+        'type': messageType.value,
+        'subType': subType.value,
+        'subSubType': MessageSubSubType.NONE.value,
+        'data': data,
+        'receivedAtLocalTimestamp': .0,
+        'sentAtSourceTimestamp': .0,
+        'source': component,
+        'destination': component}
+
+
+def profileMessage(hosts: int):
+    # Alike the profiles the Master uploads
+    resources = {
+        'Actor-%d' % i: {
+            'cpuUtilization': 12.5, 'memoryUtilization': 40.,
+            'images': ['xi0liu/ecv3:objectDetection', 'xi0liu/ecv3:user']}
+        for i in range(hosts)}
+    return messageInDict(
+        MessageType.LOG,
+        MessageSubType.ALL_RESOURCES_PROFILES,
+        {'allResources': resources})
+
+
+def installed(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def randomMessage(size: int):
+    return messageInDict(
+        MessageType.DATA,
+        MessageSubType.SENSORY_DATA,
+        {'image': urandom(size)})
+
+
+class CompressionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.compression = Compression(compressors=('zlib',), minSize=1024)
+
+    def testRoundTrip(self):
+        message = profileMessage(hosts=500)
+        for codec in codecByID.values():
+            a, b = socketpair()
+            sender = self.compression.newConnection()
+            receiver = self.compression.newConnection()
+            reader = FrameReader(b, codecByID, compression=receiver)
+            sendFrame(a, codec, message, sender)
+            sendFrame(a, codec, message, sender)
+            for _ in range(2):
+                received, packetSize = reader.readFrame()
+                self.assertEqual(received, message)
+                self.assertLess(packetSize, len(b''.join(codec.encode(message))))
+            a.close()
+            b.close()
+        self.assertEqual(
+            self.compression.stats.toDict()['zlib']['frames'], 4)
+
+    def testCompressorsAreAdvertisedOnce(self):
+        sender = self.compression.newConnection()
+        receiver = self.compression.newConnection()
+        receiver.peerCompressors = set()
+        codec = initCodecByName('pickle')
+        message = messageInDict(MessageType.LOG, MessageSubType.DELAYS, {})
+        a, b = socketpair()
+        reader = FrameReader(b, codecByID, compression=receiver)
+        sendFrame(a, codec, message, sender)
+        sendFrame(a, codec, message, sender)
+        self.assertEqual(reader.readFrame()[0], message)
+        self.assertEqual(receiver.peerCompressors, {'zlib'})
+        self.assertEqual(reader.readFrame()[0], message)
+        a.close()
+        b.close()
+
+    def testSmallPayloadIsNotCompressed(self):
+        connection = self.compression.newConnection()
+        message = messageInDict(MessageType.LOG, MessageSubType.DELAYS, {})
+        views, _ = encodeFrame(initCodecByName('pickle'), message, connection)
+        self.assertNotEqual(views[0][PREFIX_SIZE - 1], COMPRESSED_CODEC_ID)
+
+    def testIncompressiblePayloadIsNotCompressed(self):
+        connection = self.compression.newConnection()
+        codec = initCodecByName('binary')
+        for _ in range(self.compression.probeInterval - 1):
+            views, _ = encodeFrame(codec, randomMessage(64 * 1024), connection)
+            self.assertNotEqual(views[0][PREFIX_SIZE - 1], COMPRESSED_CODEC_ID)
+        self.assertNotIn('data', connection.chosen)
+
+        views, _ = encodeFrame(codec, profileMessage(hosts=500), connection)
+        self.assertEqual(views[0][PREFIX_SIZE - 1], COMPRESSED_CODEC_ID)
+        self.assertEqual(connection.chosen.get('log'), None)
+        encodeFrame(codec, profileMessage(hosts=500), connection)
+        self.assertEqual(connection.chosen['log'], 'zlib')
+
+    def testSlowLinkOnly(self):
+        # On a fast enough link compressing takes longer than sending
+        compression = Compression(
+            compressors=('zlib',), minSize=1024, bandwidth=1e9)
+        connection = compression.newConnection()
+        codec = initCodecByName('binary')
+        encodeFrame(codec, profileMessage(hosts=500), connection)
+        views, _ = encodeFrame(codec, profileMessage(hosts=500), connection)
+        self.assertNotEqual(views[0][PREFIX_SIZE - 1], COMPRESSED_CODEC_ID)
+
+    def testCompressorsFromSeveralThreads(self):
+        # The compressors are shared by every connection of a component,
+        # whose sending and receiving threads use them at once
+        threadNum = 8
+        for name, compressor in compressorByName.items():
+            failures = []
+
+            def roundTrips(i: int):
+                payloads = [
+                    (b'%d-%d ' % (i, j)) * (20000 + 100 * j) + urandom(1000)
+                    for j in range(20)]
+                for payload in payloads:
+                    views = [memoryview(payload[:5000]),
+                             memoryview(payload[5000:])]
+                    try:
+                        compressed = compressor.compress(views)
+                        decompressed = compressor.decompress(
+                            memoryview(compressed))
+                    except Exception as e:
+                        failures.append(repr(e))
+                        return
+                    if decompressed != payload:
+                        failures.append('Thread %d got other data' % i)
+
+            threads = [
+                Thread(target=roundTrips, args=(i,)) for i in range(threadNum)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(failures, [], name)
+
+    @unittest.skipUnless(installed('zstandard'), 'zstandard is not installed')
+    def testZstdInstancesPerThread(self):
+        compressor = ZstdCompressor()
+        compressor.compress([memoryview(b'x' * 100)])
+        instances = []
+
+        def useInOtherThread():
+            compressor.compress([memoryview(b'y' * 100)])
+            instances.append(compressor._compressor())
+
+        thread = Thread(target=useInOtherThread)
+        thread.start()
+        thread.join()
+        self.assertIsNot(instances[0], compressor._compressor())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+"""
+Benchmark of how messages are routed to their handlers, before and after
+the Dispatcher, on the local host.
+
+Run from the sources folder of any component:
+    python -m utils.connection.dispatchBenchmark --messages 200000
+
+Routes the same messages, of the types the Master handles, to handlers
+doing nothing, first through the chain of typeIs comparisons of the
+message handlers before, then through a Dispatcher, which also times
+every handler. Reports the microseconds each message takes to route, for
+all of them and for the ones of the type the chain compares last.
+Then routes them to handlers taking as long as the ones of the Master
+roughly do, from several threads, and reports the slowest handlers.
+"""
+import argparse
+from random import Random
+from threading import Thread
+from time import perf_counter
+from time import sleep
+from typing import Callable
+from typing import List
+
+from .dispatcher import Dispatcher
+from .message import MessageReceived
+from ..types import Component
+from ..types import ComponentRole
+from ..types import MessageSubSubType
+from ..types import MessageSubType
+from ..types import MessageType
+
+NONE = MessageSubSubType.NONE
+
+# The messages the Master handles, with how often it receives them
+# and the milliseconds it roughly takes to handle them
+masterMessages = (
+    (MessageType.ACKNOWLEDGEMENT, MessageSubType.READY, NONE, 2, .2),
+    (MessageType.ACKNOWLEDGEMENT, MessageSubType.WAITING, NONE, 1, .2),
+    (MessageType.DATA, MessageSubType.SENSORY_DATA, NONE, 300, .05),
+    (MessageType.DATA, MessageSubType.FINAL_RESULT, NONE, 300, .05),
+    (MessageType.EXPERIMENTAL, MessageSubType.ACTORS_COUNT, NONE, 1, .01),
+    (MessageType.LOG, MessageSubType.ALL_RESOURCES_PROFILES, NONE, 10, 1.),
+    (MessageType.PLACEMENT, MessageSubType.LOOKUP, NONE, 2, 20.),
+    (MessageType.PROFILING, MessageSubType.DATA_RATE_TEST,
+     MessageSubSubType.RECEIVE, 1, .01),
+    (MessageType.PROFILING, MessageSubType.DATA_RATE_TEST,
+     MessageSubSubType.SEND, 1, .01),
+    (MessageType.PROFILING, MessageSubType.DATA_RATE_TEST,
+     MessageSubSubType.RESULT, 1, .01),
+    (MessageType.PROFILING, MessageSubType.LATENCY_TEST,
+     MessageSubSubType.RESULT, 1, .01),
+    (MessageType.REGISTRATION, MessageSubType.REGISTER, NONE, 2, 5.),
+    (MessageType.RESOURCE_DISCOVERY, MessageSubType.REQUEST_ACTORS_INFO,
+     NONE, 5, .1),
+    (MessageType.RESOURCE_DISCOVERY, MessageSubType.ACTORS_INFO, NONE, 5, .1),
+    (MessageType.SCALING, MessageSubType.GET_PROFILES, NONE, 1, .5),
+    (MessageType.SCALING, MessageSubType.PROFILES_INFO, NONE, 1, .5),
+    (MessageType.TERMINATION, MessageSubType.EXIT, NONE, 1, .1))
+
+source = Component(role=ComponentRole.ACTOR, addr=('127.0.0.1', 5000))
+
+
+def newMessages(count: int) -> List[MessageReceived]:
+    random = Random(0)
+    kinds = random.choices(
+        masterMessages,
+        weights=[weight for *_, weight, _ in masterMessages],
+        k=count)
+    return [
+        MessageReceived(
+            messageType=messageType,
+            messageSubType=messageSubType,
+            messageSubSubType=messageSubSubType,
+            data={},
+            source=source)
+        for messageType, messageSubType, messageSubSubType, _, _ in kinds]
+
+
+def chainHandler(handler: Callable) -> Callable:
+    """
+    :return: the handleMessage of a component before, comparing the type
+    and then the subType of the message with each one handled
+    """
+    byType = {}
+    for messageType, messageSubType, messageSubSubType, _, _ in masterMessages:
+        byType.setdefault(messageType, []).append(
+            (messageSubType, messageSubSubType))
+
+    def handleMessage(message: MessageReceived):
+        for messageType, subTypes in byType.items():
+            if not message.typeIs(messageType):
+                continue
+            for messageSubType, messageSubSubType in subTypes:
+                if messageSubSubType is NONE:
+                    if message.typeIs(messageSubType=messageSubType):
+                        return handler(message)
+                elif message.typeIs(
+                        messageSubType=messageSubType,
+                        messageSubSubType=messageSubSubType):
+                    return handler(message)
+            return
+
+    return handleMessage
+
+
+def newDispatcher(handler: Callable = None) -> Dispatcher:
+    dispatcher = Dispatcher()
+    for messageType, messageSubType, messageSubSubType, _, handlingTime \
+            in masterMessages:
+        if messageSubSubType is NONE:
+            messageSubSubType = None
+        dispatcher.register(
+            handler if handler is not None else costlyHandler(handlingTime),
+            messageType, messageSubType, messageSubSubType)
+    return dispatcher
+
+
+def costlyHandler(handlingTime: float) -> Callable:
+    def handler(_):
+        sleep(handlingTime / 1000)
+
+    return handler
+
+
+def routingTime(handleMessage: Callable, messages: List[MessageReceived],
+                repeat: int = 5) -> float:
+    """
+    :return: the least microseconds one message took to route
+    """
+    times = []
+    for _ in range(repeat):
+        startTime = perf_counter()
+        for message in messages:
+            handleMessage(message)
+        times.append(perf_counter() - startTime)
+    return min(times) / len(messages) * 1e6
+
+
+def runOverhead(messageCount: int):
+    messages = newMessages(messageCount)
+
+    def handler(_):
+        return None
+
+    # The chain compares the type of these with every other type
+    lastMessages = [
+        message for message in messages
+        if message.typeIs(MessageType.TERMINATION)] * 100
+    chain = chainHandler(handler)
+    dispatcher = newDispatcher(handler)
+    print('Routing to handlers doing nothing, per message:')
+    print('  %-14s %10s %10s' % ('', 'all', 'last type'))
+    for name, handleMessage in (
+            ('typeIs chain', chain),
+            ('Dispatcher', dispatcher.dispatch)):
+        print('  %-14s %7.2f us %7.2f us' % (
+            name,
+            routingTime(handleMessage, messages),
+            routingTime(handleMessage, lastMessages)))
+
+
+def runUnderLoad(messageCount: int, threads: int):
+    dispatcher = newDispatcher()
+    messages = newMessages(messageCount)
+
+    def handle(part: List[MessageReceived]):
+        for message in part:
+            dispatcher.dispatch(message)
+
+    workers = [
+        Thread(target=handle, args=(messages[i::threads],))
+        for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    print('Slowest handlers, %d messages from %d threads:'
+          % (messageCount, threads))
+    for name, metrics in dispatcher.slowest(5):
+        stats = metrics.toDict()
+        print('  %-40s %6d messages  mean %7.3f ms  max %7.3f ms' % (
+            name, stats['count'], stats['meanTime'], stats['maxTime']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dispatch benchmark')
+    parser.add_argument('--messages', type=int, default=200000)
+    parser.add_argument('--loadMessages', type=int, default=5000)
+    parser.add_argument('--threads', type=int, default=4)
+    args = parser.parse_args()
+    runOverhead(args.messages)
+    runUnderLoad(args.loadMessages, args.threads)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from .handlerReturn import HandlerReturn
+from .message import MessageReceived
+from ..types import MessageSubSubType
+from ..types import MessageSubType
+from ..types import MessageType
+
+HandlerKey = Tuple[
+    MessageType,
+    Union[MessageSubType, None],
+    Union[MessageSubSubType, None]]
+Handler = Callable[[MessageReceived], HandlerReturn]
+
+# The upper bounds of the buckets of the handling times, in milliseconds
+latencyBuckets = (.01, .1, 1., 10., 100., 1000., 10000.)
+
+
+def handles(
+        messageType: MessageType,
+        messageSubType: MessageSubType = None,
+        messageSubSubType: MessageSubSubType = None):
+    """
+    Marks a method as the handler of the messages of the given types,
+    any subType or subSubType when it is not given. The methods marked
+    are registered by Dispatcher.registerHandlers.
+    """
+
+    def mark(method: Handler) -> Handler:
+        if not hasattr(method, 'handles'):
+            method.handles = []
+        method.handles.append((messageType, messageSubType, messageSubSubType))
+        return method
+
+    return mark
+
+
+class HandlerMetrics:
+    """
+    The messages one handler handled, the errors it raised and how long
+    it took
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.count = 0
+        self.errors = 0
+        self.totalTime = .0
+        self.maxTime = .0
+        self.histogram = [0] * (len(latencyBuckets) + 1)
+
+    def update(self, handlingTime: float, isError: bool):
+        """
+        :param handlingTime: milliseconds
+        :param isError: whether the handler raised an exception
+        """
+        bucket = bisect_left(latencyBuckets, handlingTime)
+        lock = self._lock
+        lock.acquire()
+        self.count += 1
+        self.errors += isError
+        self.totalTime += handlingTime
+        if handlingTime > self.maxTime:
+            self.maxTime = handlingTime
+        self.histogram[bucket] += 1
+        lock.release()
+
+    def meanTime(self) -> float:
+        with self._lock:
+            return self.totalTime / self.count if self.count else .0
+
+    def toDict(self) -> Dict:
+        with self._lock:
+            upperBounds = ['%gms' % bound for bound in latencyBuckets]
+            upperBounds.append('inf')
+            return {
+                'count': self.count,
+                'errors': self.errors,
+                'meanTime': self.totalTime / self.count if self.count else .0,
+                'maxTime': self.maxTime,
+                'histogram': dict(zip(upperBounds, self.histogram))}
+
+
+def keyName(key: HandlerKey) -> str:
+    return '/'.join(part.value for part in key if part is not None)
+
+
+class Dispatcher:
+    """
+    Routes each message to the handler registered for its type, subType
+    and subSubType, with a dict lookup instead of comparing it with every
+    type handled, and times every handler.
+
+    The handler of the most specific key registered is used, e.g., one
+    registered for a type and a subType before one for the type only.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[HandlerKey, Handler] = {}
+        self._metrics: Dict[HandlerKey, HandlerMetrics] = {}
+        # The handler and metrics each kind of message resolves to, by the
+        # ids of its types, which hash faster than the members of Enum do
+        self._resolved: Dict[
+            Tuple[int, int, int],
+            Union[Tuple[Handler, HandlerMetrics], None]] = {}
+        self.unhandled = 0
+
+    def register(
+            self,
+            handler: Handler,
+            messageType: MessageType,
+            messageSubType: MessageSubType = None,
+            messageSubSubType: MessageSubSubType = None):
+        if messageSubType is None and messageSubSubType is not None:
+            raise Exception(
+                'Handler of %s has a subSubType but no subType'
+                % messageType.value)
+        key = (messageType, messageSubType, messageSubSubType)
+        self._handlers[key] = handler
+        if key not in self._metrics:
+            self._metrics[key] = HandlerMetrics()
+        self._resolved = {}
+
+    def registerHandlers(self, owner: object):
+        """
+        Registers every method of owner marked with handles
+        """
+        for name in dir(type(owner)):
+            method = getattr(type(owner), name)
+            if not callable(method) or not hasattr(method, 'handles'):
+                continue
+            for key in method.handles:
+                self.register(getattr(owner, name), *key)
+
+    def dispatch(self, message: MessageReceived) -> HandlerReturn:
+        """
+        :return: what the handler returns, None if there is no handler
+        """
+        ids = (id(message.type), id(message.subType), id(message.subSubType))
+        try:
+            resolved = self._resolved[ids]
+        except KeyError:
+            resolved = self._resolve(message)
+        if resolved is None:
+            self.unhandled += 1
+            return None
+        handler, metrics = resolved
+        startTime = perf_counter()
+        try:
+            messageToRespond = handler(message)
+        except Exception:
+            metrics.update((perf_counter() - startTime) * 1000, True)
+            raise
+        metrics.update((perf_counter() - startTime) * 1000, False)
+        return messageToRespond
+
+    def _resolve(
+            self,
+            message: MessageReceived) -> Tuple[Handler, HandlerMetrics]:
+        resolved = None
+        for key in (
+                (message.type, message.subType, message.subSubType),
+                (message.type, message.subType, None),
+                (message.type, None, None)):
+            if key in self._handlers:
+                resolved = (self._handlers[key], self._metrics[key])
+                break
+        ids = (id(message.type), id(message.subType), id(message.subSubType))
+        self._resolved[ids] = resolved
+        return resolved
+
+    def slowest(self, count: int = 5) -> List[Tuple[str, HandlerMetrics]]:
+        """
+        :return: the names and metrics of the handlers of the longest mean
+        handling times
+        """
+        handled = [
+            (keyName(key), metrics)
+            for key, metrics in self._metrics.items() if metrics.count]
+        handled.sort(key=lambda item: item[1].meanTime(), reverse=True)
+        return handled[:count]
+
+    def stats(self) -> Dict[str, Dict]:
+        stats = {
+            keyName(key): metrics.toDict()
+            for key, metrics in self._metrics.items() if metrics.count}
+        stats['unhandled'] = {'count': self.unhandled}
+        return stats
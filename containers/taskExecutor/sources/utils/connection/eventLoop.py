@@ -0,0 +1,282 @@
+from collections import deque
+from selectors import DefaultSelector
+from selectors import EVENT_READ
+from selectors import EVENT_WRITE
+from socket import socket
+from socket import socketpair
+from ssl import SSLError
+from ssl import SSLSocket
+from ssl import SSLWantReadError
+from ssl import SSLWantWriteError
+from threading import Lock
+from threading import Thread
+from traceback import print_exc
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from .codec import Codec
+from .codec import codecByID
+from .codec import ConnectionCompression
+from .codec import encodeFrame
+from .codec import FrameReader
+from .flowControl import BoundedQueue
+from .tlsContexts import tlsContexts
+from ..debugLogPrinter import DebugLogPrinter
+from ..types import Address
+
+_wouldBlock = (BlockingIOError, InterruptedError, SSLWantReadError, SSLWantWriteError)
+
+
+class EventLoopConnection:
+    """
+    A socket driven by the EventLoop. It has the same interface
+    as Connection, but no thread of its own.
+    """
+
+    def __init__(
+            self,
+            loop: 'EventLoop',
+            socket_obj: socket,
+            codec: Codec,
+            addr: Address = None,
+            buffer: bytes = b'',
+            isAccepted: bool = False,
+            sendQueue: BoundedQueue = None,
+            compression: ConnectionCompression = None):
+        self.loop = loop
+        self.socket = socket_obj
+        self.socket.setblocking(False)
+        self.codec = codec
+        self.compression = compression
+        self.addr = addr
+        self.reader = FrameReader(
+            self.socket, codecByID, initialBuffer=buffer,
+            compression=compression)
+        # Accepted sockets are mapped to the source of their first message
+        self.isAccepted = isAccepted
+        self.isFirstFrame = isAccepted
+        self.isHandshaking = isAccepted and isinstance(socket_obj, SSLSocket)
+        self.isClosed = False
+        self.isSessionSaved = False
+        if sendQueue is None:
+            sendQueue = BoundedQueue()
+        # Frames waiting to be written, by their message type
+        self.sendQueue: BoundedQueue[
+            Tuple[str, List[memoryview]]] = sendQueue
+        # The frame being written
+        self.outgoing: Deque[memoryview] = deque()
+
+    def send_message(self, message: Dict):
+        # Encoded by the calling thread, so the loop only copies bytes
+        views, _ = encodeFrame(self.codec, message, self.compression)
+        if not self.sendQueue.put((message.get('type'), views)):
+            return
+        self.loop.requestWrite(self)
+
+    def hasOutgoing(self) -> bool:
+        return bool(self.outgoing) or not self.sendQueue.empty()
+
+    def flush(self) -> bool:
+        while True:
+            if not self.outgoing:
+                if self.sendQueue.empty():
+                    return True
+                _, views = self.sendQueue.get_nowait()
+                self.outgoing.extend(views)
+            view = self.outgoing[0]
+            try:
+                sent = self.socket.send(view)
+            except _wouldBlock:
+                return False
+            if sent < view.nbytes:
+                self.outgoing[0] = view[sent:]
+                return False
+            self.outgoing.popleft()
+
+    def close(self):
+        self.loop.close(self)
+
+
+class EventLoop:
+    """
+    Drives every socket of a component from one thread with a selector.
+
+    Decoded frames are passed to onFrame, which is expected to hand them
+    over to worker threads instead of handling them in the loop.
+    """
+
+    def __init__(
+            self,
+            onFrame: Callable[[EventLoopConnection, Dict, int], None],
+            onClose: Callable[[EventLoopConnection], None],
+            debugLogPrinter: DebugLogPrinter):
+        self.onFrame = onFrame
+        self.onClose = onClose
+        # The logger of a component is renewed once it knows its name
+        self.debugLogPrinter = debugLogPrinter
+        self.selector = DefaultSelector()
+        self._wakeupReceiver, self._wakeupSender = socketpair()
+        self._wakeupReceiver.setblocking(False)
+        self._wakeupSender.setblocking(False)
+        self.selector.register(self._wakeupReceiver, EVENT_READ, None)
+        self._lock = Lock()
+        self._toRegister: List[EventLoopConnection] = []
+        self._toWrite: Set[EventLoopConnection] = set()
+        self._toClose: List[EventLoopConnection] = []
+        self._accept: Dict[socket, Callable[[socket, Address], None]] = {}
+        self.thread: Union[Thread, None] = None
+
+    def start(self):
+        self.thread = Thread(target=self.run, name='EventLoop')
+        self.thread.start()
+
+    def listen(
+            self,
+            serverSocket: socket,
+            onAccept: Callable[[socket, Address], None]):
+        serverSocket.setblocking(False)
+        self._accept[serverSocket] = onAccept
+        self.selector.register(serverSocket, EVENT_READ, serverSocket)
+
+    def register(self, conn: EventLoopConnection):
+        with self._lock:
+            self._toRegister.append(conn)
+        self._wakeup()
+
+    def requestWrite(self, conn: EventLoopConnection):
+        with self._lock:
+            self._toWrite.add(conn)
+        self._wakeup()
+
+    def close(self, conn: EventLoopConnection):
+        with self._lock:
+            self._toClose.append(conn)
+        self._wakeup()
+
+    def _wakeup(self):
+        try:
+            self._wakeupSender.send(b'\0')
+        except BlockingIOError:
+            # The loop has not woken up for the previous bytes yet
+            pass
+
+    def run(self):
+        while True:
+            for key, mask in self.selector.select():
+                try:
+                    self._dispatch(key, mask)
+                except Exception:
+                    print_exc()
+
+    def _dispatch(self, key, mask):
+        if key.data is None:
+            self._handleRequests()
+            return
+        if isinstance(key.data, EventLoopConnection):
+            conn = key.data
+            try:
+                if conn.isHandshaking:
+                    self._handshake(conn)
+                    return
+                if mask & EVENT_READ:
+                    self._read(conn)
+                if mask & EVENT_WRITE and not conn.isClosed:
+                    self._write(conn)
+            except _wouldBlock:
+                return
+            except Exception as e:
+                self.debugLogPrinter.debugLogger.debug(
+                    'Connection to %s closed: %s', str(conn.addr), e)
+                self._close(conn)
+            return
+        serverSocket = key.data
+        try:
+            clientSocket, clientAddr = serverSocket.accept()
+        except _wouldBlock:
+            return
+        self._accept[serverSocket](clientSocket, clientAddr)
+
+    def _handleRequests(self):
+        try:
+            while self._wakeupReceiver.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        with self._lock:
+            toRegister, self._toRegister = self._toRegister, []
+            toWrite, self._toWrite = self._toWrite, set()
+            toClose, self._toClose = self._toClose, []
+        for conn in toRegister:
+            self.selector.register(conn.socket, EVENT_READ, conn)
+            if conn.isHandshaking:
+                self._handshake(conn)
+        for conn in toWrite:
+            if conn.isClosed or conn.isHandshaking:
+                continue
+            if self.selector.get_key(conn.socket).events & EVENT_WRITE:
+                continue
+            self._write(conn)
+        for conn in toClose:
+            self._close(conn)
+
+    def _handshake(self, conn: EventLoopConnection):
+        try:
+            conn.socket.do_handshake()
+        except SSLWantReadError:
+            self.selector.modify(conn.socket, EVENT_READ, conn)
+            return
+        except SSLWantWriteError:
+            self.selector.modify(conn.socket, EVENT_WRITE, conn)
+            return
+        except (OSError, SSLError) as e:
+            self.debugLogPrinter.debugLogger.error(
+                'Received invalid TLS connection from %s: %s',
+                str(conn.addr), e)
+            self._close(conn)
+            return
+        conn.isHandshaking = False
+        self.selector.modify(conn.socket, EVENT_READ, conn)
+        if conn.hasOutgoing():
+            self._write(conn)
+
+    def _read(self, conn: EventLoopConnection):
+        frames = conn.reader.readAvailableFrames()
+        # Bytes already decrypted by TLS do not wake the selector up again
+        while isinstance(conn.socket, SSLSocket) and conn.socket.pending():
+            frames.extend(conn.reader.readAvailableFrames())
+        if frames and not conn.isAccepted and not conn.isSessionSaved:
+            # TLS 1.3 session tickets are only read with the data
+            tlsContexts.saveSession(conn.addr, conn.socket)
+            conn.isSessionSaved = True
+        for messageInDict, packetSize in frames:
+            self.onFrame(conn, messageInDict, packetSize)
+
+    def _write(self, conn: EventLoopConnection):
+        try:
+            isFlushed = conn.flush()
+        except (OSError, SSLError) as e:
+            self.debugLogPrinter.debugLogger.debug(
+                'Failed to send to %s: %s', str(conn.addr), e)
+            self._close(conn)
+            return
+        events = EVENT_READ if isFlushed else EVENT_READ | EVENT_WRITE
+        if self.selector.get_key(conn.socket).events != events:
+            self.selector.modify(conn.socket, events, conn)
+
+    def _close(self, conn: EventLoopConnection):
+        if conn.isClosed:
+            return
+        conn.isClosed = True
+        try:
+            self.selector.unregister(conn.socket)
+        except (KeyError, ValueError):
+            pass
+        conn.socket.close()
+        conn.outgoing.clear()
+        conn.sendQueue.clear()
+        self.onClose(conn)
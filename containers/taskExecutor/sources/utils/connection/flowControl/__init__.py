@@ -0,0 +1,8 @@
+from .boundedQueue import BoundedQueue
+from .credits import Credits
+from .flowControl import FlowControl
+from .flowControl import isControlMessage
+from .flowControl import laneOf
+from .lane import Lane
+from .lanedQueue import LanedQueue
+from .overflowPolicy import OverflowPolicy
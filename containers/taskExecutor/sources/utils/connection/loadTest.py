@@ -0,0 +1,156 @@
+"""
+Load test of the transports with many simulated peers.
+
+Run from the sources folder of any component:
+    python -m utils.connection.loadTest --transport eventLoop --peers 1000
+    python -m utils.connection.loadTest --transport threads --peers 1000
+
+Every peer connects to an echo component and sends messages to it;
+the round trip time of each message and the thread count of the
+process are reported.
+"""
+import argparse
+import logging
+import threading
+from selectors import DefaultSelector
+from selectors import EVENT_READ
+from socket import create_connection
+from time import sleep
+from time import time
+
+from .basicMessageHandler import BasicMessageHandler
+from .codec import codecByID
+from .codec import FrameReader
+from .codec import initCodecByName
+from .codec import sendFrame
+from .message import MessageReceived
+from ..types import Component
+from ..types import ComponentRole
+from ..types import MessageType
+
+
+class EchoComponent(BasicMessageHandler):
+
+    def handleMessage(self, message: MessageReceived):
+        if not message.typeIs(MessageType.EXPERIMENTAL):
+            return
+        self.sendMessage(
+            messageType=MessageType.EXPERIMENTAL,
+            data=message.data,
+            destination=message.source)
+
+
+def percentile(values, p: float) -> float:
+    if not values:
+        return .0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def runPeers(serverAddr, peers: int, rounds: int, interval: float, codecName: str):
+    codec = initCodecByName(codecName)
+    selector = DefaultSelector()
+
+    def send(s_, me_):
+        sendFrame(s_, codec, {
+            'type': MessageType.EXPERIMENTAL.value,
+            'subType': '',
+            'subSubType': '',
+            'data': {'sentAt': time()},
+            'receivedAtLocalTimestamp': .0,
+            'sentAtSourceTimestamp': time() * 1000,
+            'source': me_,
+            'destination': me_})
+
+    def receive(timeout: float):
+        for key, _ in selector.select(timeout=timeout):
+            for messageInDict, _ in key.data.readAvailableFrames():
+                if messageInDict['type'] != MessageType.EXPERIMENTAL.value:
+                    continue
+                latencies.append(
+                    (time() - messageInDict['data']['sentAt']) * 1000)
+
+    # Like components do, every peer sends right after connecting.
+    # Those first messages only warm the connections up
+    latencies = []
+    sockets = []
+    for i in range(peers):
+        s = create_connection(serverAddr)
+        me = Component(
+            role=ComponentRole.USER,
+            addr=('127.0.0.1', 10000 + i),
+            hostID='peer%d' % i).toDict()
+        sockets.append((s, me))
+        selector.register(s, EVENT_READ, FrameReader(s, codecByID))
+        send(s, me)
+        receive(timeout=0)
+    warmUpStartTime = time()
+    while len(latencies) < peers and time() - warmUpStartTime < 10:
+        receive(timeout=.1)
+    latencies.clear()
+
+    for round_ in range(rounds):
+        roundStartTime = time()
+        for s, me in sockets:
+            send(s, me)
+        target = (round_ + 1) * peers
+        while len(latencies) < target and time() - roundStartTime < 10:
+            receive(timeout=.1)
+        timeToSleep = roundStartTime + interval - time()
+        if timeToSleep > 0:
+            sleep(timeToSleep)
+    expected = peers * rounds
+    return sockets, latencies, expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Transport load test')
+    parser.add_argument('--transport', type=str, default='eventLoop')
+    parser.add_argument('--wireCodec', type=str, default='pickle')
+    parser.add_argument('--peers', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--interval', type=float, default=1.)
+    parser.add_argument('--port', type=int, default=5999)
+    args = parser.parse_args()
+
+    echo = EchoComponent(
+        role=ComponentRole.REMOTE_LOGGER,
+        addr=('127.0.0.1', args.port),
+        logLevel=logging.WARNING,
+        portRange=(args.port, args.port + 1),
+        ignoreSocketError=True,
+        wireCodec=args.wireCodec,
+        transport=args.transport)
+    echo.serveEvent.wait()
+    startTime = time()
+    sockets, latencies, expected = runPeers(
+        serverAddr=echo.addr,
+        peers=args.peers,
+        rounds=args.rounds,
+        interval=args.interval,
+        codecName=args.wireCodec)
+    elapsed = time() - startTime
+    # a moment for the last connections to have their threads started
+    sleep(.5)
+    print('transport=%s peers=%d threads=%d received=%d/%d '
+          'p50=%.2fms p99=%.2fms max=%.2fms elapsed=%.1fs' % (
+              args.transport,
+              args.peers,
+              threading.active_count(),
+              len(latencies),
+              expected,
+              percentile(latencies, .5),
+              percentile(latencies, .99),
+              max(latencies, default=.0),
+              elapsed))
+    for s, _ in sockets:
+        s.close()
+    echo.serverSocket.close()
+
+
+if __name__ == '__main__':
+    main()
+    # the threads of the component never exit by themselves
+    from ..tools.terminate import terminate
+
+    terminate()
@@ -11,10 +11,19 @@ from threading import Event
 from threading import Thread
 from traceback import print_exc
 from typing import Tuple
+from typing import Union
 from time import sleep
 
+from .batching import unpackBatch
+from .codec import Compression
+from .eventLoop import EventLoop
+from .eventLoop import EventLoopConnection
+from .flowControl import FlowControl
+from .flowControl import OverflowPolicy
 from .message import MessageReceived
 from .messageSender import MessageSender, Connection, Connections, receive_message, MessageToSend
+from .messageSender import connect_with_retries
+from .tlsContexts import tlsContexts
 from ..tools.terminate import terminate
 from ..types import Address, ComponentRole, MessageType, MessageSubType
 
@@ -29,13 +38,29 @@ class MessageReceiver(MessageSender):
             logLevel: int,
             ignoreSocketError: bool = False,
             messagesReceivedQueue: Queue[
-                Tuple[MessageReceived, int]] = Queue(),
+                Tuple[MessageReceived, int]] = None,
             threadNumber: int = 8,
             cert_file: str = None,
             key_file: str = None,
-            tls_enabled: bool = False):
+            tls_enabled: bool = False,
+            wireCodec: str = 'pickle',
+            transport: str = 'threads',
+            flowControl: FlowControl = None,
+            compression: Compression = None):
 
         self.conns: Connections[str, Connection] = Connections()
+        if flowControl is None:
+            flowControl = FlowControl()
+        if messagesReceivedQueue is None:
+            policy = flowControl.overflowPolicy
+            if transport == 'eventLoop' and policy is OverflowPolicy.BLOCK:
+                # Blocking the loop would stop the sending as well
+                policy = OverflowPolicy.DROP_OLDEST
+            messagesReceivedQueue = flowControl.newQueue(
+                name='messagesReceived',
+                bound=flowControl.receivedQueueSize,
+                policy=policy,
+                onReject=self._rejectReceived)
         self.messagesReceivedQueue: Queue[
             Tuple[MessageReceived, int]] = messagesReceivedQueue
         MessageSender.__init__(
@@ -45,7 +70,10 @@ class MessageReceiver(MessageSender):
             logLevel=logLevel,
             messagesReceivedQueue=self.messagesReceivedQueue,
             ignoreSocketError=ignoreSocketError,
-            conns=self.conns)
+            conns=self.conns,
+            wireCodec=wireCodec,
+            flowControl=flowControl,
+            compression=compression)
         self.portRange = portRange
         self.serverSocket = socket(
             AF_INET,
@@ -67,10 +95,24 @@ class MessageReceiver(MessageSender):
 
         self.threadsNumber: int = threadNumber
         self.serveEvent: Event = Event()
+        # 'threads' runs two threads per connection,
+        # 'eventLoop' drives all the sockets from one thread
+        self.eventLoop: Union[EventLoop, None] = None
+        if transport == 'eventLoop':
+            self.eventLoop = EventLoop(
+                onFrame=self._onFrame,
+                onClose=self._onClose,
+                debugLogPrinter=self)
+        elif transport != 'threads':
+            self.debugLogger.error('Unknown transport: %s', transport)
+            terminate()
         self.autoListen()
         self.prepareThreadsPool()
 
     def prepareThreadsPool(self):
+        if self.eventLoop is not None:
+            self.prepareEventLoop()
+            return
         j = 0
         for i in range(self.threadsNumber):
             Thread(
@@ -85,6 +127,73 @@ class MessageReceiver(MessageSender):
                 k += 1
         Thread(target=self.serve, name="ConnectionServer").start()
 
+    def prepareEventLoop(self):
+        # Sockets never block these threads, so a few are enough
+        for i in range(2):
+            Thread(
+                target=self.messageSender,
+                name=f'MessageSender{i}').start()
+        for i in range(self.threadsNumber):
+            Thread(
+                target=self.handle,
+                name=f'BasicMessageHandler{i}').start()
+        self.eventLoop.listen(self.serverSocket, self._onAccept)
+        self.eventLoop.start()
+        self.serveEvent.set()
+
+    def _onAccept(self, client_socket: socket, clientAddress: Address):
+        if self.tls_enabled:
+            client_socket = self.wrap_socket_tls(
+                client_socket,
+                server_side=True,
+                do_handshake_on_connect=False)
+        self.debugLogger.info(f'KEEP RECEIVING: {clientAddress}')
+        self.eventLoop.register(EventLoopConnection(
+            loop=self.eventLoop,
+            socket_obj=client_socket,
+            codec=self.codec,
+            addr=clientAddress,
+            isAccepted=True,
+            sendQueue=self.flowControl.newConnectionQueue(),
+            compression=self.compression.newConnection()))
+
+    def _onFrame(self,
+                 conn: EventLoopConnection,
+                 messageInDict: dict,
+                 packetSize: int):
+        isFirstFrame = conn.isFirstFrame
+        for messageInDict, packetSize in unpackBatch(messageInDict, packetSize):
+            message = MessageReceived.fromDict(messageInDict)
+            if conn.isFirstFrame:
+                conn.isFirstFrame = False
+                conn.addr = message.source.addr
+                self.conns.acquire()
+                self.conns[conn.addr] = conn
+                self.conns.release()
+            if isFirstFrame and self.forwardLog(message, messageInDict):
+                continue
+            self.messagesReceivedQueue.put((message, packetSize))
+
+    def _onClose(self, conn: EventLoopConnection):
+        self.conns.acquire()
+        if self.conns.get(conn.addr) is conn:
+            del self.conns[conn.addr]
+        self.conns.release()
+
+    def _newConnection(self, dest_addr: Address):
+        if self.eventLoop is None:
+            return MessageSender._newConnection(self, dest_addr)
+        conn = EventLoopConnection(
+            loop=self.eventLoop,
+            socket_obj=connect_with_retries(
+                tls_enabled=self.tls_enabled, dest_addr=dest_addr),
+            codec=self.codec,
+            addr=dest_addr,
+            sendQueue=self.flowControl.newConnectionQueue(),
+            compression=self.compression.newConnection())
+        self.eventLoop.register(conn)
+        return conn
+
     def autoListen(self):
 
         listenSuccess = self.tryListeningOn(
@@ -105,29 +214,29 @@ class MessageReceiver(MessageSender):
                 if self.tls_enabled:
                     client_socket = self.wrap_socket_tls(client_socket, server_side=True)
                 self.debugLogger.info(f'KEEP RECEIVING: {clientAddress}')
-                messageInDict, packetSize, buffer = receive_message(b'', client_socket)
-                message = MessageReceived.fromDict(messageInDict)
-                source_addr = message.source.addr
+                # The first frame tells the compressors of the peer
+                compression = self.compression.newConnection()
+                messageInDict, packetSize, buffer = receive_message(
+                    b'', client_socket, compression)
+                frames = unpackBatch(messageInDict, packetSize)
+                source_addr = MessageReceived.fromDict(frames[0][0]).source.addr
                 self.conns.acquire()
                 if source_addr not in self.conns or client_socket != self.conns[source_addr].socket:
                     self.conns[source_addr] = Connection(
                         buffer=buffer,
                         tls_enabled=self.tls_enabled,
                         recv_queue=self.messagesReceivedQueue,
-                        send_queue=Queue(),
+                        send_queue=self.flowControl.newConnectionQueue(),
                         socket_obj=client_socket,
-                        addr=source_addr)
+                        addr=source_addr,
+                        codec=self.codec,
+                        compression=compression)
                 self.conns.release()
-                # forward log messages when role is MASTER
-                #  Due to security requirementsUser, actor and task executor do not see RemoteLogger
-                # they send logs to Master and Master forwards them to RemoteLogger.
-                # This will reduce the attack surface.
-                if (self.role == ComponentRole.MASTER and
-                        message.type == MessageType.LOG and
-                        message.type != MessageSubType.ALL_RESOURCES_PROFILES):
-                    self.sendMessage(messageToSend=MessageToSend.fromDict(messageInDict))
-                    continue
-                self.messagesReceivedQueue.put((message, packetSize))
+                for messageInDict, packetSize in frames:
+                    message = MessageReceived.fromDict(messageInDict)
+                    if self.forwardLog(message, messageInDict):
+                        continue
+                    self.messagesReceivedQueue.put((message, packetSize))
                 i += 1
             except ssl.SSLError:
                 self.debugLogger.error(f'Received invalid TLS connection from {clientAddress}')
@@ -140,6 +249,31 @@ class MessageReceiver(MessageSender):
                     terminate()
                 continue
 
+    def _rejectReceived(self, item: Tuple[MessageReceived, int]):
+        message, _ = item
+        data = {
+            'type': message.type.value,
+            'subType': message.subType.value,
+            'reason': 'The messages received are more than %d' %
+                      self.flowControl.receivedQueueSize}
+        self.sendMessage(
+            messageType=MessageType.ACKNOWLEDGEMENT,
+            messageSubType=MessageSubType.NACK,
+            data=data,
+            destination=message.source)
+
+    def forwardLog(self, message: MessageReceived, messageInDict: dict) -> bool:
+        # forward log messages when role is MASTER
+        #  Due to security requirementsUser, actor and task executor do not see RemoteLogger
+        # they send logs to Master and Master forwards them to RemoteLogger.
+        # This will reduce the attack surface.
+        if (self.role == ComponentRole.MASTER and
+                message.type == MessageType.LOG and
+                message.type != MessageSubType.ALL_RESOURCES_PROFILES):
+            self.sendMessage(messageToSend=MessageToSend.fromDict(messageInDict))
+            return True
+        return False
+
     def tryListeningOn(self,
                        addr: Address,
                        portRange: Tuple[int, int]) -> bool:
@@ -174,10 +308,13 @@ class MessageReceiver(MessageSender):
 
     def wrap_socket_tls(self,
                         socket_object,
-                        server_side=True):
-        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-        context.load_cert_chain(self.cert_file, self.key_file)
-        tls_socket = context.wrap_socket(socket_object, server_side=server_side)
+                        server_side=True,
+                        do_handshake_on_connect=True):
+        context = tlsContexts.serverContext(self.cert_file, self.key_file)
+        tls_socket = context.wrap_socket(
+            socket_object,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect)
         return tls_socket
 
     def listenOn(self,
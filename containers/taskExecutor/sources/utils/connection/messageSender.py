@@ -1,7 +1,6 @@
 import ssl
 import socket
 import threading
-from pickle import dumps, loads
 from abc import abstractmethod
 from threading import Lock
 from queue import Queue
@@ -13,7 +12,20 @@ from traceback import print_exc
 from typing import Dict
 from typing import Tuple
 
+from .batching import MessageBatcher
+from .batching import unpackBatch
+from .codec import Codec
+from .codec import codecByID
+from .codec import Compression
+from .codec import ConnectionCompression
+from .codec import FrameReader
+from .codec import initCodecByName
+from .codec import PickleCodec
+from .codec import sendFrame
+from .flowControl import BoundedQueue
+from .flowControl import FlowControl
 from .message import MessageToSend
+from .tlsContexts import tlsContexts
 from ..debugLogPrinter import DebugLogPrinter
 from ..types import Address
 from ..types import Component
@@ -27,40 +39,20 @@ from .message import MessageReceived
 SEP = b','
 
 
-def send_message(s: socket, messageInDict: dict):
-    messageInBytes = dumps(messageInDict)
-    msg_len = len(messageInBytes)
-    messageInBytes = msg_len.to_bytes(4, byteorder='big') + b',' + messageInBytes
-    s.sendall(messageInBytes)
-
-
-def receive_message(buffer, clientSocket: socket):
-    while len(buffer) < 5:
-        ret = clientSocket.recv(4096)
-        if not ret:
-            raise Exception('Connection disconnected')
-        buffer += ret
-    msg_len = int.from_bytes(buffer[:4], byteorder='big')
-    m = buffer[5:]
-
-    if len(m) >= msg_len:
-        messageInDict = loads(m[:msg_len])
-        return messageInDict, msg_len, m[msg_len:]
-
-    remaining = msg_len - len(m)
-    buffer = b''
-    while remaining > 0:
-        ret = clientSocket.recv(4096)
-        if not ret:
-            raise Exception('Connection disconnected')
-        if len(ret) > remaining:
-            m += ret[:remaining]
-            buffer = ret[remaining:]
-            break
-        m += ret
-        remaining -= len(ret)
-    messageInDict = loads(m)
-    return messageInDict, msg_len, buffer
+def send_message(s: socket, messageInDict: dict, codec: Codec = None,
+                 compression: ConnectionCompression = None):
+    if codec is None:
+        codec = codecByID[PickleCodec.codecID]
+    sendFrame(s, codec, messageInDict, compression)
+
+
+def receive_message(buffer, clientSocket: socket,
+                    compression: ConnectionCompression = None):
+    # Reads exactly one frame, returning what was read beyond it
+    reader = FrameReader(
+        clientSocket, codecByID, initialBuffer=buffer, compression=compression)
+    messageInDict, msg_len = reader.readFrame()
+    return messageInDict, msg_len, reader.pending()
 
 
 class Connection:
@@ -72,8 +64,14 @@ class Connection:
                  addr=None,
                  socket_obj=None,
                  max_retries=10,
-                 retry_delay=1):
+                 retry_delay=1,
+                 codec: Codec = None,
+                 compression: ConnectionCompression = None):
         self.tls_enabled = tls_enabled
+        if codec is None:
+            codec = codecByID[PickleCodec.codecID]
+        self.codec = codec
+        self.compression = compression
         self.is_proactive = socket_obj is None
         self.buffer = buffer
         self.addr = addr
@@ -83,6 +81,8 @@ class Connection:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.threads = []
+        self.reader = None
+        self.session_saved = False
 
         if self.is_proactive:
             self._connect_with_retries()
@@ -93,17 +93,17 @@ class Connection:
             self._start_threads()
 
     def _connect_with_retries(self):
-        attempts = 0
-        while attempts < self.max_retries:
-            try:
-                self.socket = create_socket(tls_enabled=self.tls_enabled, dest_addr=self.addr)
-                return
-            except Exception as e:
-                attempts += 1
-                sleep(self.retry_delay)
-        raise Exception(f"Failed to connect to {self.addr} after {self.max_retries} attempts")
+        self.socket = connect_with_retries(
+            tls_enabled=self.tls_enabled,
+            dest_addr=self.addr,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay)
 
     def _start_threads(self):
+        self.reader = FrameReader(
+            self.socket, codecByID, initialBuffer=self.buffer,
+            compression=self.compression)
+        self.buffer = b''
         self.recv_thread = threading.Thread(target=self._recv_task)
         self.send_thread = threading.Thread(target=self._send_task)
         self.recv_thread.daemon = True
@@ -116,11 +116,15 @@ class Connection:
     def _recv_task(self):
         while True:
             try:
-                content, packetSize, buffer = receive_message(self.buffer, self.socket)
-                self.buffer = buffer
+                content, packetSize = self.reader.readFrame()
+                if self.tls_enabled and self.is_proactive and not self.session_saved:
+                    # TLS 1.3 session tickets are only read with the data
+                    tlsContexts.saveSession(self.addr, self.socket)
+                    self.session_saved = True
                 if content:
-                    message = MessageReceived.fromDict(content)
-                    self.recv_queue.put((message, packetSize))
+                    for messageInDict, size in unpackBatch(content, packetSize):
+                        message = MessageReceived.fromDict(messageInDict)
+                        self.recv_queue.put((message, size))
                 else:
                     self._handle_socket_error("Connection closed by the server")
             except Exception as e:
@@ -129,7 +133,9 @@ class Connection:
     def _send_task(self):
         while True:
             messageInDict = self.send_queue.get()
-            send_message(self.socket, messageInDict)
+            send_message(
+                self.socket, messageInDict, codec=self.codec,
+                compression=self.compression)
 
     def _handle_socket_error(self,
                              message,
@@ -137,6 +143,8 @@ class Connection:
         self.socket.close()
         if self.is_proactive:
             self._connect_with_retries()
+            if self.compression is not None:
+                self.compression.reset()
             self._start_threads()
         else:
             if send_data:
@@ -166,16 +174,28 @@ def create_socket(tls_enabled: bool,
                   dest_addr: Address):
     client_socket = socket(AF_INET, SOCK_STREAM)
     if tls_enabled:
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-        client_socket = context.wrap_socket(client_socket,
-                                            server_hostname=dest_addr[0])
+        client_socket = tlsContexts.wrapClientSocket(client_socket, dest_addr)
 
     client_socket.connect(dest_addr)
+    if tls_enabled:
+        tlsContexts.saveSession(dest_addr, client_socket)
     return client_socket
 
 
+def connect_with_retries(tls_enabled: bool,
+                         dest_addr: Address,
+                         max_retries: int = 10,
+                         retry_delay: float = 1):
+    attempts = 0
+    while attempts < max_retries:
+        try:
+            return create_socket(tls_enabled=tls_enabled, dest_addr=dest_addr)
+        except Exception as e:
+            attempts += 1
+            sleep(retry_delay)
+    raise Exception(f"Failed to connect to {dest_addr} after {max_retries} attempts")
+
+
 class Connections(dict):
 
     def __init__(self):
@@ -200,16 +220,31 @@ class MessageSender(Component, DebugLogPrinter):
                 Tuple[MessageReceived, int]],
             conns: Connections[str, Connection],
             ignoreSocketError: bool = False,
-            tls_enabled: bool = False):
+            tls_enabled: bool = False,
+            wireCodec: str = 'pickle',
+            flowControl: FlowControl = None,
+            compression: Compression = None):
         DebugLogPrinter.__init__(self, logLevel)
         Component.__init__(self, role=role, addr=addr)
         self.tls_enabled = tls_enabled
-
-        self.messagesToSendQueue: Queue[
-            Tuple[MessageToSend, bool, bool]] = Queue()
+        self.codec: Codec = initCodecByName(wireCodec)
+        if compression is None:
+            compression = Compression()
+        self.compression = compression
+        if flowControl is None:
+            flowControl = FlowControl()
+        self.flowControl = flowControl
+
+        self.messagesToSendQueue: BoundedQueue[
+            Tuple[MessageToSend, bool, bool]] = flowControl.newQueue(
+            name='messagesToSend', bound=flowControl.sendQueueSize)
         self.messagesReceivedQueue = messagesReceivedQueue
         self.ignoreSocketError = ignoreSocketError
         self.conns = conns
+        self.batcher = MessageBatcher(
+            send=self._sendInDict,
+            lingerTime=flowControl.batchLingerTime,
+            maxMessages=flowControl.batchMaxMessages)
 
     def sendMessage(
             self,
@@ -220,7 +255,10 @@ class MessageSender(Component, DebugLogPrinter):
             messageSubType: MessageSubType = MessageSubType.NONE,
             messageSubSubType: MessageSubSubType = MessageSubSubType.NONE,
             ignoreSocketError: bool = None,
-            showFailure: bool = True):
+            showFailure: bool = True) -> bool:
+        """
+        :return: False if the message was dropped as the queue is full
+        """
 
         if messageToSend is None:
             messageToSend = MessageToSend(
@@ -235,7 +273,7 @@ class MessageSender(Component, DebugLogPrinter):
         component = Component.fromDict(destination.toDict())
         messageToSend.destination = component
 
-        self.messagesToSendQueue.put(
+        return self.messagesToSendQueue.put(
             (messageToSend, ignoreSocketError, showFailure))
 
     @abstractmethod
@@ -244,6 +282,28 @@ class MessageSender(Component, DebugLogPrinter):
                           thread_name: str):
         raise NotImplementedError
 
+    def _newConnection(self, dest_addr: Address) -> Connection:
+        return Connection(
+            buffer=b'',
+            tls_enabled=self.tls_enabled,
+            recv_queue=self.messagesReceivedQueue,
+            send_queue=self.flowControl.newConnectionQueue(),
+            addr=dest_addr,
+            codec=self.codec,
+            compression=self.compression.newConnection())
+
+    def _sendInDict(self, dest_addr: Address, messageInDict: Dict):
+        self.conns.acquire()
+        try:
+            if dest_addr not in self.conns:
+                conn = self._newConnection(dest_addr)
+                self.conns[dest_addr] = conn
+            else:
+                conn = self.conns[dest_addr]
+        finally:
+            self.conns.release()
+        conn.send_message(messageInDict)
+
     def messageSender(self):
         while True:
             try:
@@ -251,19 +311,9 @@ class MessageSender(Component, DebugLogPrinter):
                 messageInDict = messageToSend.toDict()
                 messageInDict['source'] = self.toDict()
                 dest_addr = messageToSend.destination.addr
-                self.conns.acquire()
-                if dest_addr not in self.conns:
-                    conn = Connection(
-                        buffer=b'',
-                        tls_enabled=self.tls_enabled,
-                        recv_queue=self.messagesReceivedQueue,
-                        send_queue=Queue(),
-                        addr=dest_addr)
-                    self.conns[dest_addr] = conn
-                else:
-                    conn = self.conns[dest_addr]
-                self.conns.release()
-                conn.send_message(messageInDict)
+                if self.batcher.add(dest_addr, messageInDict):
+                    continue
+                self._sendInDict(dest_addr, messageInDict)
 
             except Exception:
                 print_exc()
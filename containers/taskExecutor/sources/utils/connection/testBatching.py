@@ -0,0 +1,88 @@
+import unittest
+from threading import Event
+from time import sleep
+
+from .batching import MessageBatcher
+from .batching import unpackBatch
+from .codec import BinaryCodec
+from .codec import PickleCodec
+from ..types import Component
+from ..types import ComponentRole
+from ..types import MessageSubSubType
+from ..types import MessageSubType
+from ..types import MessageType
+
+addr = ('127.0.0.1', 5000)
+source = Component(role=ComponentRole.ACTOR, addr=('127.0.0.1', 6000)).toDict()
+destination = Component(role=ComponentRole.MASTER, addr=addr).toDict()
+
+
+def messageInDict(messageType: MessageType, i: int):
+    return {
+        'type': messageType.value,
+        'subType': MessageSubType.DELAYS.value,
+        'subSubType': MessageSubSubType.NONE.value,
+        'data': {'i': i},
+        'receivedAtLocalTimestamp': .0,
+        'sentAtSourceTimestamp': .0,
+        'source': source,
+        'destination': destination}
+
+
+class MessageBatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sent = []
+        self.isSent = Event()
+
+    def send(self, destAddr, sentInDict):
+        self.sent.append((destAddr, sentInDict))
+        self.isSent.set()
+
+    def testLogMessagesShareOneEnvelope(self):
+        batcher = MessageBatcher(send=self.send, lingerTime=50)
+        for i in range(3):
+            self.assertTrue(batcher.add(addr, messageInDict(MessageType.LOG, i)))
+        self.assertFalse(batcher.add(addr, messageInDict(MessageType.DATA, 3)))
+        self.assertTrue(self.isSent.wait(1))
+        sleep(.01)
+        self.assertEqual(len(self.sent), 1)
+        destAddr, envelope = self.sent[0]
+        self.assertEqual(destAddr, addr)
+        self.assertEqual(envelope['subType'], MessageSubType.BATCH.value)
+        self.assertEqual(batcher.messagesBatched, 3)
+
+        # Decoded the way the receivers do
+        for codec in (PickleCodec(), BinaryCodec()):
+            payload = memoryview(b''.join(codec.encode(envelope)))
+            received = unpackBatch(codec.decode(payload, isOwned=True), 300)
+            self.assertEqual(
+                [message['data']['i'] for message, _ in received], [0, 1, 2])
+            for message, packetSize in received:
+                self.assertEqual(packetSize, 100)
+                self.assertEqual(message['source'], source)
+                self.assertEqual(message['destination'], destination)
+                self.assertEqual(message['type'], MessageType.LOG.value)
+
+    def testFullBatchIsSentAtOnce(self):
+        batcher = MessageBatcher(send=self.send, lingerTime=10000, maxMessages=2)
+        batcher.add(addr, messageInDict(MessageType.LOG, 0))
+        self.assertEqual(self.sent, [])
+        batcher.add(addr, messageInDict(MessageType.LOG, 1))
+        self.assertEqual(len(self.sent), 1)
+
+    def testSingleMessageIsSentAsItIs(self):
+        batcher = MessageBatcher(send=self.send, lingerTime=1)
+        message = messageInDict(MessageType.LOG, 0)
+        batcher.add(addr, message)
+        self.assertTrue(self.isSent.wait(1))
+        self.assertIs(self.sent[0][1], message)
+        self.assertEqual(unpackBatch(message, 10), [(message, 10)])
+
+    def testNoLingerTime(self):
+        batcher = MessageBatcher(send=self.send, lingerTime=0)
+        self.assertFalse(batcher.add(addr, messageInDict(MessageType.LOG, 0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ from time import time
 from ..registration.manager import RegistrationManager
 from ..tasks.base import BaseTask
 from ...component import BasicComponent
+from ...connection.dispatcher import handles
 from ...connection.message.received import MessageReceived
 from ...container.manager import ContainerManager
 from ...types import Component
@@ -25,29 +26,12 @@ class TaskExecutorMessageHandler:
         self.containerManager = containerManager
         self.basicComponent = basicComponent
         self.basicComponent.handleMessage = self.handleMessage
+        self.basicComponent.dispatcher.registerHandlers(self)
 
     def handleMessage(self, message: MessageReceived):
-        if message.typeIs(
-                messageType=MessageType.REGISTRATION,
-                messageSubType=MessageSubType.REGISTERED):
-            self.handleRegistered(message)
-        elif message.typeIs(
-                messageType=MessageType.PLACEMENT,
-                messageSubType=MessageSubType.LOOKUP):
-            self.handleTaskExecutorInfo(message)
-        elif message.typeIs(
-                messageType=MessageType.DATA,
-                messageSubType=MessageSubType.INTERMEDIATE_DATA):
-            self.handleData(message)
-        elif message.typeIs(
-                messageType=MessageType.ACKNOWLEDGEMENT,
-                messageSubType=MessageSubType.WAIT):
-            self.handleWait(message)
-        elif message.typeIs(
-                messageType=MessageType.PLACEMENT,
-                messageSubType=MessageSubType.REUSE):
-            self.reRegister(message)
+        self.basicComponent.dispatcher.dispatch(message)
 
+    @handles(MessageType.REGISTRATION, MessageSubType.REGISTERED)
     def handleRegistered(self, message: MessageReceived):
         source = message.source
         self.basicComponent.master = source
@@ -70,6 +54,7 @@ class TaskExecutorMessageHandler:
         self.registrationManager.lookupChildren()
         self.basicComponent.isRegistered.set()
 
+    @handles(MessageType.PLACEMENT, MessageSubType.LOOKUP)
     def handleTaskExecutorInfo(self, message: MessageReceived):
         data = message.data
         addr = data['taskExecutorAddr']
@@ -84,6 +69,7 @@ class TaskExecutorMessageHandler:
         if childrenCount != gotCount:
             return
 
+    @handles(MessageType.DATA, MessageSubType.INTERMEDIATE_DATA)
     def handleData(self, message: MessageReceived):
 
         data = message.data
@@ -106,13 +92,19 @@ class TaskExecutorMessageHandler:
             return
         del data['intermediateData']
         data['finalResult'] = result
+        destination = self.basicComponent.master
+        if 'userAddr' in data:
+            # The user sent the data directly, reply to it the same way
+            addr = data['userAddr']
+            destination = Component(addr=(addr[0], addr[1]))
         self.basicComponent.sendMessage(
             messageType=MessageType.DATA,
             messageSubType=MessageSubType.FINAL_RESULT,
             data=data,
-            destination=self.basicComponent.master)
+            destination=destination)
         return
 
+    @handles(MessageType.ACKNOWLEDGEMENT, MessageSubType.WAIT)
     def handleWait(self, message: MessageReceived):
         self.basicComponent.isRegistered.clear()
         self.basicComponent.sendMessage(
@@ -142,6 +134,7 @@ class TaskExecutorMessageHandler:
             data=data,
             destination=self.basicComponent.master)
 
+    @handles(MessageType.PLACEMENT, MessageSubType.REUSE)
     def reRegister(self, message: MessageReceived):
         data = message.data
         userID = data['userID']
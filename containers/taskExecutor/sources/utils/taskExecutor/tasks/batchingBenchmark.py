@@ -0,0 +1,89 @@
+"""
+CPU benchmark of the YOLOv7 micro-batching.
+
+Run from the sources folder of the TaskExecutor:
+    python -m utils.taskExecutor.tasks.batchingBenchmark --frames 160
+
+For each max batch size, as many callers as the batch size send frames
+one after another, as concurrent messages of different users would, and
+BatchingInference detects the frames together. Reports the frames per
+second and the latency seen by the callers.
+"""
+import argparse
+import os
+import sys
+from threading import Thread
+from time import time
+from typing import List
+
+import numpy as np
+import torch
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(__file__) + '/yolov7')
+from yolov7 import Yolov7
+from .batchingInference import BatchingInference
+
+
+def percentile(sortedValues, p: float) -> float:
+    return sortedValues[min(len(sortedValues) - 1, int(p * len(sortedValues)))]
+
+
+def run(yolov7: Yolov7, maxBatchSize: int, maxDelay: float, frames: int,
+        images: List[np.ndarray]):
+    batching = BatchingInference(
+        inferBatch=yolov7.detect_batch,
+        maxBatchSize=maxBatchSize,
+        maxDelay=maxDelay)
+    latencies = []
+    framesPerCaller = max(1, frames // maxBatchSize)
+
+    def send(image: np.ndarray):
+        for _ in range(framesPerCaller):
+            sentTime = time()
+            batching.infer(image)
+            latencies.append((time() - sentTime) * 1000)
+
+    callers = [Thread(target=send, args=(images[i % len(images)],))
+               for i in range(maxBatchSize)]
+    startTime = time()
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+    elapsed = time() - startTime
+    latencies.sort()
+    print('batch %2d %8.1f frames/s %8.1f ms p50 %8.1f ms p95 '
+          '%6.2f mean batch' % (
+              maxBatchSize,
+              len(latencies) / elapsed,
+              percentile(latencies, .5),
+              percentile(latencies, .95),
+              batching.meanBatchSize()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YOLOv7 batching benchmark')
+    parser.add_argument('--frames', type=int, default=160)
+    parser.add_argument('--maxDelay', type=float, default=0,
+                        help='milliseconds a frame waits for a batch to fill')
+    parser.add_argument('--threads', type=int, default=0,
+                        help='torch threads, 0 to keep the default')
+    args = parser.parse_args()
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    script_path = os.path.dirname(os.path.abspath(__file__))
+    yolov7 = Yolov7(os.path.join(script_path, 'yolov7/yolov7-tiny.pt'))
+    random = np.random.default_rng(0)
+    images = [
+        random.integers(0, 256, (yolov7.img_size, yolov7.img_size, 3),
+                        dtype=np.uint8)
+        for _ in range(16)]
+    # Warm the model up
+    yolov7.detect_batch(images[:2])
+    for maxBatchSize in (1, 2, 4, 8, 16):
+        run(yolov7, maxBatchSize, args.maxDelay, args.frames, images)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+from concurrent.futures import Future
+from queue import Empty
+from queue import Queue
+from threading import Thread
+from time import time
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+
+class BatchingInference:
+    """
+    Runs the inputs submitted by concurrent callers in batches, from one
+    worker thread, so that the per call overhead of a model is paid once
+    per batch instead of once per input.
+
+    A batch starts with the first waiting input and takes more until it
+    has maxBatchSize inputs or maxDelay milliseconds have passed. With
+    maxDelay 0, a batch takes only the inputs already waiting, which
+    arrived while the previous batch was running, and adds no latency.
+    A larger maxDelay trades latency for larger batches and throughput.
+    """
+
+    def __init__(
+            self,
+            inferBatch: Callable[[List[Any]], List[Any]],
+            maxBatchSize: int = 8,
+            maxDelay: float = 0):
+        """
+        :param inferBatch: returns the result of each input, in order
+        :param maxBatchSize: the most inputs to run together
+        :param maxDelay: the most milliseconds to wait for a batch to fill
+        """
+        if maxBatchSize < 1:
+            raise Exception('Max batch size is not positive: %d' % maxBatchSize)
+        self.inferBatch = inferBatch
+        self.maxBatchSize = maxBatchSize
+        self.maxDelay = maxDelay
+        self.batchCount = 0
+        self.inputCount = 0
+        self._requests: Queue = Queue()
+        self._worker = Thread(
+            target=self._run,
+            name='BatchingInference',
+            daemon=True)
+        self._worker.start()
+
+    def infer(self, inputData: Any) -> Any:
+        """
+        Blocks until the batch holding the input has run
+        :param inputData: one input of inferBatch
+        :return: the result of this input
+        """
+        future = Future()
+        self._requests.put((inputData, future))
+        return future.result()
+
+    def _collect(self) -> List[Tuple[Any, Future]]:
+        batch = [self._requests.get()]
+        deadline = time() + self.maxDelay / 1000
+        while len(batch) < self.maxBatchSize:
+            timeout = deadline - time()
+            try:
+                if timeout > 0:
+                    batch.append(self._requests.get(timeout=timeout))
+                else:
+                    batch.append(self._requests.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            self.batchCount += 1
+            self.inputCount += len(batch)
+            try:
+                results = self.inferBatch([inputData for inputData, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def meanBatchSize(self) -> float:
+        if not self.batchCount:
+            return .0
+        return self.inputCount / self.batchCount
@@ -0,0 +1,40 @@
+from typing import Dict
+
+import cv2
+import numpy as np
+
+# The extension and the quality parameter of cv2 of each encoding
+encodings = {
+    'jpeg': ('.jpg', cv2.IMWRITE_JPEG_QUALITY),
+    'webp': ('.webp', cv2.IMWRITE_WEBP_QUALITY)}
+
+
+def encodeImage(image_bgr: np.ndarray, encoding: str, quality: int) -> bytes:
+    """
+    Encodes a frame as the Users do before sending it
+    :param image_bgr: HxWx3 uint8 array in the channel order of cv2
+    :param encoding: jpeg or webp
+    :param quality: from 0 to 100
+    :return: the encoded frame
+    """
+    extension, qualityParam = encodings[encoding]
+    isEncoded, buffer = cv2.imencode(extension, image_bgr, [qualityParam, quality])
+    if not isEncoded:
+        raise Exception('Failed to encode frame as %s' % encoding)
+    return buffer.tobytes()
+
+
+def decodeImage(input_data: Dict) -> np.ndarray:
+    """
+    :param input_data: the sensory data of a User, in which the image is
+    either the raw RGB array or, when 'encoding' is given, the encoded frame
+    :return: the image as an HxWx3 RGB array
+    """
+    image = input_data['image']
+    if input_data.get('encoding', 'raw') == 'raw':
+        return image
+    image_bgr = cv2.imdecode(
+        np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image_bgr is None:
+        raise Exception('Failed to decode %s frame' % input_data['encoding'])
+    return cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
@@ -0,0 +1,173 @@
+"""
+Benchmark of the encodings of the frames of ObjectDetection.
+
+Run from the sources folder of the TaskExecutor:
+    python -m utils.taskExecutor.tasks.frameCodecBenchmark \
+        --videoPath ../../user/highway-traffic.mp4 --frames 100
+
+Without --videoPath, frames of a synthetic scene are used. For the raw
+frames and each encoding and quality, reports the bytes per frame and the
+CPU time of encoding and decoding one. With --detect, also runs YOLOv7 on
+the raw and on the decoded frames and reports how the detections drift:
+the share of the objects found in the raw frame that are found again,
+with the same class and an IoU of at least 0.5, the objects found only in
+the decoded frame, and the mean change of confidence.
+"""
+import argparse
+import os
+import sys
+from pickle import dumps
+from time import thread_time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+from .frameCodec import decodeImage
+from .frameCodec import encodeImage
+
+targetHeight = 480
+
+
+def readFrames(videoPath: str, frames: int) -> List[np.ndarray]:
+    # Resized as ObjectDetection of the User does
+    sensor = cv2.VideoCapture(videoPath)
+    images = []
+    while len(images) < frames:
+        ret, frame = sensor.read()
+        if not ret:
+            break
+        images.append(cv2.resize(frame, (targetHeight, targetHeight)))
+    sensor.release()
+    if not images:
+        raise Exception('Failed to read frames from %s' % videoPath)
+    return images
+
+
+def syntheticFrames(frames: int) -> List[np.ndarray]:
+    # A road with cars moving along it and some sensor noise
+    random = np.random.default_rng(0)
+    row = np.linspace(60, 200, targetHeight, dtype=np.float32)
+    background = np.stack(
+        [row[:, None].repeat(targetHeight, axis=1)] * 3, axis=2)
+    cars = [(random.integers(0, targetHeight), random.integers(200, 440),
+             random.integers(2, 8), tuple(int(c) for c in random.integers(0, 256, 3)))
+            for _ in range(8)]
+    images = []
+    for i in range(frames):
+        image = background + random.normal(0, 3, background.shape)
+        image = image.clip(0, 255).astype(np.uint8)
+        for x, y, speed, color in cars:
+            x = (x + i * speed) % targetHeight
+            cv2.rectangle(image, (int(x), int(y)), (int(x) + 60, int(y) + 30), color, -1)
+        images.append(image)
+    return images
+
+
+def iou(a: List[float], b: List[float]) -> float:
+    width = max(.0, min(a[2], b[2]) - max(a[0], b[0]))
+    height = max(.0, min(a[3], b[3]) - max(a[1], b[1]))
+    intersection = width * height
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) \
+        - intersection
+    return intersection / union if union > 0 else .0
+
+
+def compare(expected: List[Dict], found: List[Dict]) -> Tuple[int, int, float]:
+    """
+    :return: how many expected objects are found, how many found objects
+    are not expected and the sum of the changes of confidence
+    """
+    unmatched = list(found)
+    matched = 0
+    confidenceChange = .0
+    for objectExpected in expected:
+        best = None
+        bestIoU = .5
+        for objectFound in unmatched:
+            if objectFound['cls'] != objectExpected['cls']:
+                continue
+            overlap = iou(objectExpected['bbox'], objectFound['bbox'])
+            if overlap >= bestIoU:
+                best, bestIoU = objectFound, overlap
+        if best is None:
+            continue
+        unmatched.remove(best)
+        matched += 1
+        confidenceChange += abs(best['conf'] - objectExpected['conf'])
+    return matched, len(unmatched), confidenceChange
+
+
+def run(images: List[np.ndarray], encoding: str, quality: int, yolov7,
+        expected: List[List[Dict]]):
+    size = .0
+    encodeTime = decodeTime = .0
+    decoded = []
+    for image_bgr in images:
+        startTime = thread_time()
+        if encoding == 'raw':
+            input_data = {
+                'image': cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB),
+                'encoding': encoding}
+        else:
+            input_data = {
+                'image': encodeImage(image_bgr, encoding, quality),
+                'encoding': encoding}
+        encodeTime += thread_time() - startTime
+        size += len(dumps(input_data))
+        startTime = thread_time()
+        decoded.append(decodeImage(input_data))
+        decodeTime += thread_time() - startTime
+    line = '%-5s %3s %8.1f KB/frame %7.2f ms encode %7.2f ms decode' % (
+        encoding, quality if encoding != 'raw' else '', size / len(images) / 1024,
+        encodeTime / len(images) * 1000, decodeTime / len(images) * 1000)
+    if yolov7 is not None:
+        matched = extra = total = 0
+        confidenceChange = .0
+        for objectsExpected, image in zip(expected, decoded):
+            result = compare(objectsExpected, yolov7.detect(image))
+            matched += result[0]
+            extra += result[1]
+            confidenceChange += result[2]
+            total += len(objectsExpected)
+        line += ' %6.1f%% found %5d extra %6.3f mean conf change' % (
+            matched / max(total, 1) * 100, extra,
+            confidenceChange / max(matched, 1))
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Frame encoding benchmark')
+    parser.add_argument('--videoPath', type=str, default=None)
+    parser.add_argument('--frames', type=int, default=100)
+    parser.add_argument('--qualities', type=int, nargs='+',
+                        default=[95, 80, 60, 40])
+    parser.add_argument('--detect', action='store_true',
+                        help='measure the drift of the YOLOv7 detections')
+    args = parser.parse_args()
+    if args.videoPath is None:
+        images = syntheticFrames(args.frames)
+    else:
+        images = readFrames(args.videoPath, args.frames)
+    yolov7 = None
+    expected = []
+    if args.detect:
+        sys.path.insert(0, os.path.dirname(__file__))
+        sys.path.insert(0, os.path.dirname(__file__) + '/yolov7')
+        from yolov7 import Yolov7
+        script_path = os.path.dirname(os.path.abspath(__file__))
+        yolov7 = Yolov7(os.path.join(script_path, 'yolov7/yolov7-tiny.pt'))
+        expected = [
+            yolov7.detect(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+            for image in images]
+    print('%d frames of %dx%d' % (len(images), targetHeight, targetHeight))
+    run(images, 'raw', 0, yolov7, expected)
+    for encoding in ('jpeg', 'webp'):
+        for quality in args.qualities:
+            run(images, encoding, quality, yolov7, expected)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,22 +5,46 @@ sys.path.insert(0, os.path.dirname(__file__))
 sys.path.insert(0, os.path.dirname(__file__) + '/yolov7')
 from yolov7 import Yolov7
 from .base import BaseTask
+from .batchingInference import BatchingInference
+from .frameCodec import decodeImage
 
 
 class ObjectDetectionYoloV7(BaseTask):
-    def __init__(self):
+    def __init__(self, maxBatchSize: int = 8, maxBatchDelay: float = 0):
+        """
+        :param maxBatchSize: the most frames of concurrent messages to
+        detect together
+        :param maxBatchDelay: the most milliseconds a frame waits for
+        others to join its batch, more for throughput, less for latency
+        """
         super().__init__(taskID=201, taskName='ObjectDetectionYolov7')
         script_path = os.path.dirname(os.path.abspath(__file__))
         self.yolov7 = Yolov7(os.path.join(script_path, 'yolov7/yolov7-tiny.pt'))
+        self.batching = BatchingInference(
+            inferBatch=self.detectBatch,
+            maxBatchSize=maxBatchSize,
+            maxDelay=maxBatchDelay)
         import warnings
         warnings.filterwarnings("ignore", category=UserWarning)
 
+    def detectBatch(self, images):
+        # Users may resize their frames differently
+        indicesOfShape = {}
+        for i, image in enumerate(images):
+            indicesOfShape.setdefault(image.shape, []).append(i)
+        results = [None] * len(images)
+        for indices in indicesOfShape.values():
+            objectsList = self.yolov7.detect_batch([images[i] for i in indices])
+            for i, objects in zip(indices, objectsList):
+                results[i] = objects
+        return results
+
     def exec(self,
              input_data):
-        image = input_data['image']
-
         start_time = time()
-        objects = self.yolov7.detect(image)
+        # Users may send their frames encoded as jpeg or webp
+        image = decodeImage(input_data)
+        objects = self.batching.infer(image)
         computation_time = (time() - start_time) * 1000
         result = {
             'objects': objects,
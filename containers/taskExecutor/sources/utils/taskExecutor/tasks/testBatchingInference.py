@@ -0,0 +1,58 @@
+import threading
+import unittest
+from time import sleep
+
+from .batchingInference import BatchingInference
+
+
+class BatchingInferenceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.batchSizes = []
+
+    def square(self, batch):
+        self.batchSizes.append(len(batch))
+        # Give the other callers time to queue up
+        sleep(.01)
+        return [value * value for value in batch]
+
+    def inferConcurrently(self, batching: BatchingInference, values):
+        results = {}
+
+        def infer(value):
+            results[value] = batching.infer(value)
+
+        threads = [threading.Thread(target=infer, args=(value,))
+                   for value in values]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def testResultsOfEachCaller(self):
+        batching = BatchingInference(inferBatch=self.square, maxBatchSize=4)
+        results = self.inferConcurrently(batching, range(50))
+        self.assertEqual(results, {value: value * value for value in range(50)})
+        self.assertEqual(sum(self.batchSizes), 50)
+        self.assertLessEqual(max(self.batchSizes), 4)
+        self.assertGreater(batching.meanBatchSize(), 1)
+
+    def testDeadlineFillsBatch(self):
+        batching = BatchingInference(
+            inferBatch=self.square, maxBatchSize=3, maxDelay=500)
+        results = self.inferConcurrently(batching, range(3))
+        self.assertEqual(results, {0: 0, 1: 1, 2: 4})
+        self.assertEqual(self.batchSizes, [3])
+
+    def testException(self):
+        def fail(batch):
+            raise ValueError('Failed: %d' % len(batch))
+
+        batching = BatchingInference(inferBatch=fail)
+        with self.assertRaises(ValueError):
+            batching.infer(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
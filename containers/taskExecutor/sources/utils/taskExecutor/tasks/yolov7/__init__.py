@@ -1,3 +1,4 @@
+import numpy as np
 import torch
 import cv2
 # from time import time
@@ -26,10 +27,18 @@ class Yolov7:
         return ckpt['ema' if ckpt.get('ema') else 'model'].float().fuse().eval()
 
     def detect(self, image_rgb_resized):
-        img = torch.from_numpy(image_rgb_resized).permute(2, 0, 1).to(self.device)
+        return self.detect_batch([image_rgb_resized])[0]
+
+    def detect_batch(self, images_rgb_resized):
+        """
+        Detects the objects of images of the same size with one forward
+        pass and one non_max_suppression
+        :param images_rgb_resized: HxWx3 uint8 arrays of the same shape
+        :return: the objects of each image, in order
+        """
+        img = torch.from_numpy(np.stack(images_rgb_resized)).permute(0, 3, 1, 2).to(self.device)
         img = img.float()
         img /= 255.0
-        img = img.unsqueeze(0)
         # t1 = time()
         with torch.no_grad():
             pred = self.model(img)[0]
@@ -39,8 +48,9 @@ class Yolov7:
         # print(f'Done. ({d:.3f}ms)')
         pred = non_max_suppression(pred, self.threshold)
 
-        objects = []
+        results = []
         for det in pred:
+            objects = []
             if det is not None and len(det):
                 for *xyxy, conf, cls in reversed(det):
                     objects.append({
@@ -49,7 +59,8 @@ class Yolov7:
                         'conf': float(conf),
                         'bbox': [float(xyxy[0]), float(xyxy[1]), float(xyxy[2]), float(xyxy[3])]
                     })
-        return objects
+            results.append(objects)
+        return results
 
 
 if __name__ == '__main__':
@@ -3,7 +3,10 @@ from typing import Union
 from ..tasks.base import BaseTask
 
 
-def initTask(taskName: str) -> Union[BaseTask, None]:
+def initTask(
+        taskName: str,
+        maxBatchSize: int = 8,
+        maxBatchDelay: float = 0) -> Union[BaseTask, None]:
     task = None
     if taskName == 'NaiveFormula0':
         from ..tasks.naiveFormula0 import NaiveFormula0
@@ -19,7 +22,9 @@ def initTask(taskName: str) -> Union[BaseTask, None]:
         task = NaiveFormula3()
     elif taskName.startswith('ObjectDetectionYolov7'):
         from ..tasks.object_detection_yolov7 import ObjectDetectionYoloV7
-        task = ObjectDetectionYoloV7()
+        task = ObjectDetectionYoloV7(
+            maxBatchSize=maxBatchSize,
+            maxBatchDelay=maxBatchDelay)
     elif taskName.startswith('TrafficLightStatus'):
         from ..tasks.trafficLightStatus import TrafficLightStatus
         task = TrafficLightStatus()
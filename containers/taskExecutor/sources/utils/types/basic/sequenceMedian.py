@@ -1,44 +1,79 @@
 from threading import Lock
+from typing import Dict
 from typing import List
+from typing import Tuple
+from typing import Union
+
+from ..statistics import EWMA
+from ..statistics import P2Quantile
+from ..statistics import WindowMedian
 
 
 class SequenceMedian:
+    """
+    Statistics of a sequence of measurements, updated as each value
+    arrives, so that reading them costs O(1).
+
+    median() is exact over the latest maxRecordNumber values, the same
+    as sorting them. quantile() estimates the quantiles asked for when
+    created, e.g. the tail latency, over every value seen. ewma() is the
+    moving average, if asked for. Only the median is kept by default.
+    """
 
     def __init__(
             self,
             sequence: List[int] = None,
-            maxRecordNumber: int = 100):
+            maxRecordNumber: int = 100,
+            quantiles: Tuple[float, ...] = (),
+            withEWMA: bool = False,
+            alpha: float = .1):
+        """
+        :param quantiles: the quantiles estimated, e.g. (.95, .99)
+        :param withEWMA: whether the moving average is kept
+        :param alpha: the weight of a new value in the moving average
+        """
         self.__lock = Lock()
         self.maxRecordNumber = maxRecordNumber
-        if sequence is None:
-            self.index = 0
-            self.sequence: List[int] = [0 for _ in
-                                        range(self.maxRecordNumber)]
-        else:
-            self.index = len(sequence)
-            self.sequence = sequence
-        self._updated = False
+        self._window = WindowMedian(maxRecordNumber=maxRecordNumber)
+        self._quantiles: Dict[float, P2Quantile] = {
+            quantile: P2Quantile(quantile) for quantile in quantiles}
+        self._ewma: Union[EWMA, None] = None
+        if withEWMA:
+            self._ewma = EWMA(alpha=alpha)
+        if sequence is not None:
+            for value in sequence:
+                self.update(value)
 
     def update(self, value):
-        self.__lock.acquire()
-        self.sequence[self.index] = value
-        self.index += 1
-        if self.index >= self.maxRecordNumber:
-            self.index = 0
-        self._updated=True
-        self.__lock.release()
+        with self.__lock:
+            self._window.update(value)
+            for estimator in self._quantiles.values():
+                estimator.update(value)
+            if self._ewma is not None:
+                self._ewma.update(value)
 
     def median(self):
-        index = self.index
-        if self.index == 0:
-            if self._updated:
-                index = -1
-            else:
-                return self.sequence[0]
-        # there is more efficient algorithm to find the median
-        sequence = self.sequence[:index]
-        sortedSequence = sorted(sequence)
-        return sortedSequence[len(sortedSequence) >> 1]
+        with self.__lock:
+            return self._window.median()
+
+    def quantile(self, quantile: float):
+        """
+        :param quantile: one of the quantiles given when created
+        :return: the estimated quantile of every value seen, 0 if none
+        """
+        if quantile not in self._quantiles:
+            raise Exception('Quantile is not tracked: %s' % str(quantile))
+        with self.__lock:
+            return self._quantiles[quantile].value()
+
+    def ewma(self):
+        if self._ewma is None:
+            raise Exception('Moving average is not kept')
+        with self.__lock:
+            return self._ewma.value()
+
+    def __len__(self):
+        return len(self._window)
 
     def __str__(self):
         return str(self.median())
@@ -0,0 +1,23 @@
+class EWMA:
+    """
+    Exponentially weighted moving average, the first value is taken as is
+    """
+
+    def __init__(self, alpha: float = .1):
+        if not 0 < alpha <= 1:
+            raise Exception('Alpha is not in (0, 1]: %s' % str(alpha))
+        self.alpha = alpha
+        self.count = 0
+        self._value = .0
+
+    def update(self, value):
+        if not self.count:
+            self._value = value
+        else:
+            self._value += self.alpha * (value - self._value)
+        self.count += 1
+
+    def value(self, default=0):
+        if not self.count:
+            return default
+        return self._value
@@ -34,7 +34,9 @@ class User:
             enableTLS: bool = False,
             certFile: str = '',
             keyFile: str = '',
-            domainName: str = ''):
+            domainName: str = '',
+            wireCodec: str = 'pickle',
+            transport: str = 'threads'):
         self.containerName = containerName
         self.basicComponent = BasicComponent(
             role=ComponentRole.USER,
@@ -45,7 +47,9 @@ class User:
             enableTLS=enableTLS,
             certFile=certFile,
             keyFile=keyFile,
-            domainName=domainName)
+            domainName=domainName,
+            wireCodec=wireCodec,
+            transport=transport)
         self.resourcesDiscovery = ResourcesDiscovery(
             basicComponent=self.basicComponent)
         self.discoverIfUnset()
@@ -224,6 +228,21 @@ def parseArg():
         default=2,
         type=int,
         help='Task count')
+    parser.add_argument(
+        '--wireCodec',
+        metavar='WireCodec',
+        nargs='?',
+        default='pickle',
+        type=str,
+        help='Codec of messages sent by this component, pickle or binary')
+    parser.add_argument(
+        '--transport',
+        metavar='Transport',
+        nargs='?',
+        default='threads',
+        type=str,
+        help='threads to run two threads per connection, '
+             'or eventLoop to drive all connections from one thread')
 
     return parser.parse_args()
 
@@ -240,6 +259,8 @@ if __name__ == "__main__":
         certFile=args.certFile,
         keyFile=args.keyFile,
         domainName=args.domainName,
+        wireCodec=args.wireCodec,
+        transport=args.transport,
         windowHeight=args.windowHeight,
         videoPath=args.videoPath,
         task_count=args.taskCount
@@ -0,0 +1,10 @@
+from .base import Codec
+from .binaryCodec import BinaryCodec
+from .compression import Compression
+from .compression import ConnectionCompression
+from .frame import encodeFrame
+from .frame import FrameReader
+from .frame import sendFrame
+from .initCodecByName import codecByID
+from .initCodecByName import initCodecByName
+from .pickleCodec import PickleCodec
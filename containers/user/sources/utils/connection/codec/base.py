@@ -0,0 +1,27 @@
+from abc import ABC
+from abc import abstractmethod
+from typing import Dict
+from typing import List
+from typing import Union
+
+from pickle import PickleBuffer
+
+Buffer = Union[bytes, bytearray, memoryview, PickleBuffer]
+
+
+class Codec(ABC):
+    # One byte written right after the 4-byte length of every frame,
+    # so a receiver can decode frames without knowing the sender's codec
+    codecID: int = 0
+    name: str = ''
+
+    @abstractmethod
+    def encode(self, messageInDict: Dict) -> List[Buffer]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, payload: memoryview, isOwned: bool) -> Dict:
+        # isOwned tells whether the payload memory belongs to this frame only.
+        # If not, the reader is going to reuse it for the next frame and
+        # nothing returned may keep a reference to it
+        raise NotImplementedError
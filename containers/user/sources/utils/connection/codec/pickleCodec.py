@@ -0,0 +1,20 @@
+from pickle import dumps
+from pickle import loads
+from typing import Dict
+from typing import List
+
+from .base import Buffer
+from .base import Codec
+
+
+class PickleCodec(Codec):
+    # b',' is the separator of the original framing, which keeps the bytes
+    # on the wire identical to those of components not using codecs yet
+    codecID = ord(',')
+    name = 'pickle'
+
+    def encode(self, messageInDict: Dict) -> List[Buffer]:
+        return [dumps(messageInDict)]
+
+    def decode(self, payload: memoryview, isOwned: bool) -> Dict:
+        return loads(payload)
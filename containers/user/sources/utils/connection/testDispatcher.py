@@ -0,0 +1,111 @@
+import unittest
+
+from .dispatcher import Dispatcher
+from .dispatcher import handles
+from .message import MessageReceived
+from ..types import Component
+from ..types import ComponentRole
+from ..types import MessageSubSubType
+from ..types import MessageSubType
+from ..types import MessageType
+
+source = Component(role=ComponentRole.ACTOR, addr=('127.0.0.1', 5000))
+
+
+def message(
+        messageType: MessageType,
+        messageSubType: MessageSubType,
+        messageSubSubType: MessageSubSubType = MessageSubSubType.NONE):
+    return MessageReceived(
+        messageType=messageType,
+        messageSubType=messageSubType,
+        messageSubSubType=messageSubSubType,
+        data={},
+        source=source)
+
+
+class Handler:
+
+    def __init__(self):
+        self.handled = []
+
+    @handles(MessageType.DATA, MessageSubType.SENSORY_DATA)
+    def handleSensoryData(self, message: MessageReceived):
+        self.handled.append('sensoryData')
+        return 'sensoryData'
+
+    @handles(MessageType.DATA)
+    @handles(MessageType.PLACEMENT)
+    def handleOthers(self, message: MessageReceived):
+        self.handled.append('others')
+
+    @handles(MessageType.LOG)
+    def handleFailing(self, message: MessageReceived):
+        raise ValueError('failed')
+
+
+class DispatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatcher = Dispatcher()
+        self.handler = Handler()
+        self.dispatcher.registerHandlers(self.handler)
+
+    def testMostSpecificHandlerIsUsed(self):
+        self.assertEqual(
+            self.dispatcher.dispatch(
+                message(MessageType.DATA, MessageSubType.SENSORY_DATA)),
+            'sensoryData')
+        self.dispatcher.dispatch(
+            message(MessageType.DATA, MessageSubType.RESULT))
+        self.dispatcher.dispatch(
+            message(MessageType.PLACEMENT, MessageSubType.LOOKUP))
+        self.assertEqual(
+            self.handler.handled, ['sensoryData', 'others', 'others'])
+        self.dispatcher.register(
+            lambda _: 'probe',
+            MessageType.RESOURCE_DISCOVERY,
+            MessageSubType.PROBE,
+            MessageSubSubType.RESULT)
+        self.assertEqual(
+            self.dispatcher.dispatch(message(
+                MessageType.RESOURCE_DISCOVERY,
+                MessageSubType.PROBE,
+                MessageSubSubType.RESULT)),
+            'probe')
+
+    def testMessagesAreCounted(self):
+        for _ in range(3):
+            self.dispatcher.dispatch(
+                message(MessageType.DATA, MessageSubType.SENSORY_DATA))
+        self.dispatcher.dispatch(
+            message(MessageType.SCALING, MessageSubType.GET_PROFILES))
+        stats = self.dispatcher.stats()
+        self.assertEqual(stats['data/sensoryData']['count'], 3)
+        self.assertEqual(
+            sum(stats['data/sensoryData']['histogram'].values()), 3)
+        self.assertEqual(stats['unhandled']['count'], 1)
+        # Handlers that have handled nothing are not reported
+        self.assertNotIn('placement', stats)
+
+    def testErrorsAreCountedAndRaised(self):
+        with self.assertRaises(ValueError):
+            self.dispatcher.dispatch(
+                message(MessageType.LOG, MessageSubType.ALL_RESOURCES_PROFILES))
+        stats = self.dispatcher.stats()
+        self.assertEqual(stats['log']['count'], 1)
+        self.assertEqual(stats['log']['errors'], 1)
+
+    def testSlowestHandlersComeFirst(self):
+        self.dispatcher.register(
+            lambda _: sum(range(100000)), MessageType.SCALING)
+        self.dispatcher.dispatch(
+            message(MessageType.SCALING, MessageSubType.GET_PROFILES))
+        self.dispatcher.dispatch(
+            message(MessageType.DATA, MessageSubType.SENSORY_DATA))
+        names = [name for name, _ in self.dispatcher.slowest(2)]
+        self.assertEqual(names, ['scaling', 'data/sensoryData'])
+
+
+if __name__ == '__main__':
+    unittest.main()
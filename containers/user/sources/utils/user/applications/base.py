@@ -4,7 +4,11 @@ from queue import Queue
 from threading import Event
 from time import time
 
+from .rateController import RateController
 from ...component.basic import BasicComponent
+from ...config import ConfigFlowControl
+from ...config import ConfigUser
+from ...connection import Credits
 from ...types import SequenceMedian
 
 
@@ -17,10 +21,31 @@ class ApplicationUserSide:
         self.basicComponent = basicComponent
         self.appName = appName
         self.resultForActuator: Queue = Queue()
-        self.dataToSubmit: Queue = Queue()
+        # The producer waits while the data in flight are out of credits
+        self.dataToSubmit: Queue = Queue(maxsize=1)
+        self.credits = Credits(
+            total=ConfigFlowControl.userCredits,
+            timeout=ConfigFlowControl.creditTimeout)
         self.responseTime = SequenceMedian(maxRecordNumber=10)
         self.responseTimeCount = 0
         self.startTime = time() * 1000
+        # Thins the data of the applications producing them continuously
+        self.rateController = RateController(
+            targetResponseTime=ConfigUser.targetResponseTime,
+            maxInFlight=ConfigUser.maxFramesInFlight,
+            minRate=ConfigUser.minFrameRate,
+            maxRate=ConfigUser.maxFrameRate)
+
+    def admit(self) -> bool:
+        """
+        :return: whether to send the data produced now or to skip it
+        """
+        inFlight = self.credits.inFlight() + self.dataToSubmit.qsize()
+        return self.rateController.admit(inFlight)
+
+    def updateResponseTime(self, responseTime: float):
+        self.responseTime.update(responseTime)
+        self.rateController.onResponse(responseTime)
 
     def start(self):
         threading.Thread(target=self._run).start()
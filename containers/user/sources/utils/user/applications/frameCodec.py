@@ -0,0 +1,88 @@
+from threading import Lock
+from time import time
+
+import cv2
+import numpy as np
+
+# The extension and the quality parameter of cv2 of each encoding
+encodings = {
+    'jpeg': ('.jpg', cv2.IMWRITE_JPEG_QUALITY),
+    'webp': ('.webp', cv2.IMWRITE_WEBP_QUALITY)}
+
+
+def encodeImage(image_bgr: np.ndarray, encoding: str, quality: int) -> bytes:
+    """
+    :param image_bgr: HxWx3 uint8 array in the channel order of cv2
+    :param encoding: jpeg or webp
+    :param quality: from 0 to 100
+    :return: the encoded frame, which the TaskExecutor decodes
+    """
+    extension, qualityParam = encodings[encoding]
+    isEncoded, buffer = cv2.imencode(extension, image_bgr, [qualityParam, quality])
+    if not isEncoded:
+        raise Exception('Failed to encode frame as %s' % encoding)
+    return buffer.tobytes()
+
+
+class AdaptiveQuality:
+    """
+    The quality of the encoded frames, lowered while the response time or
+    the data rate is above its target and raised again while both are well
+    below theirs.
+    """
+
+    def __init__(
+            self,
+            quality: int = 80,
+            minQuality: int = 30,
+            maxQuality: int = 95,
+            step: int = 5,
+            targetResponseTime: float = 300,
+            maxDataRate: float = 20,
+            interval: float = 1):
+        """
+        :param quality: the quality to start from
+        :param minQuality: the lowest quality
+        :param maxQuality: the highest quality
+        :param step: how much the quality changes at once
+        :param targetResponseTime: the most milliseconds of the median
+        response time
+        :param maxDataRate: the most megabits per second of frames sent
+        :param interval: the fewest seconds between two changes
+        """
+        self.quality = quality
+        self.minQuality = minQuality
+        self.maxQuality = maxQuality
+        self.step = step
+        self.targetResponseTime = targetResponseTime
+        self.maxDataRate = maxDataRate
+        self.interval = interval
+        self._lock = Lock()
+        self._bytesSent = 0
+        self._since = time()
+        self.dataRate = .0
+
+    def onSent(self, size: int):
+        with self._lock:
+            self._bytesSent += size
+
+    def adapt(self, responseTime: float) -> int:
+        """
+        :param responseTime: the median response time in milliseconds
+        :return: the quality of the frames to send next
+        """
+        with self._lock:
+            now = time()
+            elapsed = now - self._since
+            if elapsed < self.interval:
+                return self.quality
+            self.dataRate = self._bytesSent * 8 / elapsed / 1e6
+            self._bytesSent = 0
+            self._since = now
+            if responseTime > self.targetResponseTime \
+                    or self.dataRate > self.maxDataRate:
+                self.quality = max(self.minQuality, self.quality - self.step)
+            elif responseTime < .8 * self.targetResponseTime \
+                    and self.dataRate < .8 * self.maxDataRate:
+                self.quality = min(self.maxQuality, self.quality + self.step)
+            return self.quality
@@ -4,7 +4,11 @@ from queue import Queue
 from typing import Any, Tuple
 from threading import Thread
 from .base import ApplicationUserSide
+from .frameCodec import AdaptiveQuality
+from .frameCodec import encodeImage
+from .reorderBuffer import ReorderBuffer
 from ...component.basic import BasicComponent
+from ...config import ConfigUser
 
 
 class ObjectDetection(ApplicationUserSide):
@@ -28,7 +32,15 @@ class ObjectDetection(ApplicationUserSide):
         self.sent_times = [0 for _ in range(self.fps)]
         self.task_count = task_count
         self.last_sent_frame = 0
-        self.frames = Queue(self.task_count)
+        # The frames sent, released with their results in order
+        self.frames = ReorderBuffer(maxHoldTime=ConfigUser.maxFrameHoldTime)
+        self.encoding = ConfigUser.frameEncoding
+        self.quality = AdaptiveQuality(
+            quality=ConfigUser.frameQuality,
+            minQuality=ConfigUser.frameMinQuality,
+            maxQuality=ConfigUser.frameMaxQuality,
+            targetResponseTime=ConfigUser.targetResponseTime,
+            maxDataRate=ConfigUser.maxFrameDataRate)
 
     def prepare(self):
         pass
@@ -38,14 +50,25 @@ class ObjectDetection(ApplicationUserSide):
         if not ret:
             self._set_sensor()
             return True
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_rgb_resized = cv2.resize(frame_rgb, (self.target_height, self.target_height))
+        # Read anyway, so that the next frame sent is a fresh one
+        if not self.admit():
+            return True
+        frame_resized = cv2.resize(frame, (self.target_height, self.target_height))
+        if self.encoding == 'raw':
+            image = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
+            self.quality.onSent(image.nbytes)
+        else:
+            # A few dozen KB instead of the hundreds of KB of the raw array
+            quality = self.quality.adapt(self.responseTime.median())
+            image = encodeImage(frame_resized, self.encoding, quality)
+            self.quality.onSent(len(image))
         input_data = {
-            'image': frame_rgb_resized,
+            'image': image,
+            'encoding': self.encoding,
             'frame_count': frame_count,
         }
         self.sent_times[frame_count % self.fps] = time()
-        self.frames.put((frame_count, frame))
+        self.frames.expect(frame_count, frame)
         self.dataToSubmit.put(input_data)
         # print('Sent frame:', frame_count)
         return True
@@ -78,7 +101,7 @@ class ObjectDetection(ApplicationUserSide):
         self.basicComponent.debugLogger.info(
             'Application is running: %s', self.appName)
         Thread(target=self._frame_sender).start()
-        draw_times = []
+        Thread(target=self._display).start()
         pre_time = time()
         fc = 0
         fps = 0
@@ -87,10 +110,10 @@ class ObjectDetection(ApplicationUserSide):
             result = self.resultForActuator.get()
             frame_count = result['frame_count']
             response_time = (time() - self.sent_times[frame_count % self.fps]) * 1000
-            self.responseTime.update(response_time)
+            self.updateResponseTime(response_time)
 
             objects = result['objects']
-            i, curr_time = 0, time()
+            curr_time = time()
             fc += 1
             if curr_time - pre_time >= 1:
                 fps = fc / (curr_time - pre_time)
@@ -104,29 +127,33 @@ class ObjectDetection(ApplicationUserSide):
                 f'Frame Count: {frame_count}'
                 f', Response time: {response_time:.3f} ms'
                 f', Computation time: {computation_time:.3f} ms'
-                f', FPS: {fps:.2f}')
+                f', FPS: {fps:.2f}'
+                f', Rate: {self.rateController.rate:.2f} fps'
+                f', Quality: {self.quality.quality}'
+                f', Data rate: {self.quality.dataRate:.2f} Mbps')
             ts.append(response_time)
             if len(ts) > 100:
                 ts = ts[1:]
                 self.basicComponent.debugLogger.info("Average response time: %.3f ms", sum(ts) / len(ts))
-            draw_times.append(curr_time)
+            if not self.frames.put(frame_count, objects):
+                self.basicComponent.debugLogger.debug(
+                    'Result of frame %d is too late to draw', frame_count)
 
+    def _display(self):
+        # Sleeps until the result of the next frame arrives or is too late
+        draw_times = []
+        while True:
+            frame_count, frame, objects = self.frames.get()
+            i, curr_time = 0, time()
+            draw_times.append(curr_time)
             for t in draw_times:
                 if curr_time - t <= 1:
                     break
                 i += 1
             draw_times = draw_times[i:]
-            self.draw(frame_count, objects, len(draw_times))
+            self.draw(frame, objects, len(draw_times))
 
-    def draw(self, frame_count, objects, fps):
-        # print('Received frame:', frame_count, objects)
-        while True:
-            count, frame = self.frames.get()
-            if count == frame_count:
-                break
-            self.frames.put((count, frame))
-            sleep(.1)
-            # print(f'Frame checked: {count}, expecting: {frame_count} ')
+    def draw(self, frame, objects, fps):
         if not self.show_window:
             return
         # resize frame to window height and keep the aspect ratio
@@ -0,0 +1,82 @@
+from threading import Lock
+from time import time
+from typing import Callable
+
+
+class RateController:
+    """
+    AIMD control of the rate at which a User sends its data, so that the
+    data do not queue up inside the system when it falls behind.
+
+    While the response time is within the target, the rate grows by
+    increase per second. A response time above the target multiplies it by
+    decrease, at most once per response time, since the data sent before
+    the decrease still come back late. The data produced faster than the
+    rate, or while maxInFlight are waiting for their results, are skipped.
+    """
+
+    def __init__(
+            self,
+            targetResponseTime: float = 300,
+            maxInFlight: int = 4,
+            minRate: float = 1,
+            maxRate: float = 30,
+            increase: float = 1,
+            decrease: float = .75,
+            clock: Callable[[], float] = time):
+        """
+        :param targetResponseTime: the most milliseconds of a response time
+        :param maxInFlight: the most data waiting for results, 0 for no limit
+        :param minRate: the fewest data sent per second
+        :param maxRate: the most data sent per second
+        :param increase: how much the rate grows per second
+        :param decrease: what the rate is multiplied by when it is too high
+        :param clock: the current time in seconds
+        """
+        self.targetResponseTime = targetResponseTime
+        self.maxInFlight = maxInFlight
+        self.minRate = minRate
+        self.maxRate = maxRate
+        self.increase = increase
+        self.decrease = decrease
+        self.clock = clock
+        self._lock = Lock()
+        self.rate = maxRate
+        # When the next data may be sent
+        self._nextAt = float('-inf')
+        self._decreasedAt = float('-inf')
+        self.sent = 0
+        self.skipped = 0
+
+    def admit(self, inFlight: int) -> bool:
+        """
+        :param inFlight: how many data are waiting for their results
+        :return: whether to send the data produced now or to skip it
+        """
+        with self._lock:
+            now = self.clock()
+            if now < self._nextAt or 0 < self.maxInFlight <= inFlight:
+                self.skipped += 1
+                return False
+            # Data produced at a fixed rate make up for the interval
+            # they are late by, up to one interval
+            interval = 1 / self.rate
+            self._nextAt = max(self._nextAt, now - interval) + interval
+            self.sent += 1
+            return True
+
+    def onResponse(self, responseTime: float):
+        """
+        :param responseTime: the milliseconds the latest result took
+        """
+        with self._lock:
+            now = self.clock()
+            if responseTime <= self.targetResponseTime:
+                # By increase per second, as there are rate responses a second
+                self.rate = min(
+                    self.maxRate, self.rate + self.increase / self.rate)
+                return
+            if now - self._decreasedAt < responseTime / 1000:
+                return
+            self.rate = max(self.minRate, self.rate * self.decrease)
+            self._decreasedAt = now
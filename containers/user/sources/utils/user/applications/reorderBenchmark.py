@@ -0,0 +1,161 @@
+"""
+Benchmark of how ObjectDetection draws the results it receives, before
+and after the reorder buffer.
+
+Run from the sources folder of the User:
+    python -m utils.user.applications.reorderBenchmark --seconds 10
+
+Frames are sent at 30 fps and the result of each comes back after a
+random delay, so the results arrive out of order, as they do from several
+TaskExecutors. Before, the thread receiving the results looked for the
+frame of each one in a queue, putting back the others and sleeping. After,
+the results go into a ReorderBuffer, which a display thread waits on.
+Reports the CPU time of the process, the frames drawn and dropped, how
+long a result waits to be drawn, and the jitter of the drawing, i.e., the
+standard deviation of the intervals between two frames drawn.
+"""
+import argparse
+from queue import Queue
+from random import Random
+from statistics import mean
+from statistics import pstdev
+from threading import Thread
+from threading import Timer
+from time import process_time
+from time import sleep
+from time import time
+from typing import Callable
+from typing import List
+
+from .reorderBuffer import ReorderBuffer
+
+fps = 30
+
+
+class ResultGenerator:
+    """
+    Sends frames at fps and delivers the result of each after a random
+    delay to onResult
+    """
+
+    def __init__(self, onSent: Callable[[int], None],
+                 onResult: Callable[[int], None],
+                 delay: float, jitter: float, seconds: float):
+        self.onSent = onSent
+        self.onResult = onResult
+        self.delay = delay
+        self.jitter = jitter
+        self.seconds = seconds
+        self.frames = 0
+        self.random = Random(0)
+        # When the result of each frame was received
+        self.receivedAt = {}
+
+    def run(self):
+        # Sending may block, as it did before, so it stops after seconds
+        # whatever number of frames it has sent
+        sender = Thread(target=self._send, daemon=True)
+        sender.start()
+        sender.join(self.seconds)
+        sleep((self.delay + self.jitter) / 1000 + .5)
+
+    def _send(self):
+        startTime = time()
+        while time() - startTime < self.seconds:
+            frame = self.frames
+            timeToSleep = startTime + frame / fps - time()
+            if timeToSleep > 0:
+                sleep(timeToSleep)
+            self.onSent(frame)
+            self.frames += 1
+            delay = self.delay + self.random.uniform(0, self.jitter)
+            Timer(delay / 1000, self._deliver, args=(frame,)).start()
+
+    def _deliver(self, frame: int):
+        self.receivedAt[frame] = time()
+        self.onResult(frame)
+
+
+def report(name: str, generator: ResultGenerator, drawnAt: List[float],
+           waited: List[float], cpuTime: float, elapsed: float):
+    intervals = [b - a for a, b in zip(drawnAt, drawnAt[1:])]
+    print('%-7s CPU %5.1f%%  drawn %4d/%d  waited %6.1f ms mean  '
+          'jitter %6.1f ms' % (
+              name, cpuTime / elapsed * 100, len(drawnAt), generator.frames,
+              mean(waited) * 1000 if waited else 0,
+              pstdev(intervals) * 1000 if intervals else 0))
+
+
+def runBefore(taskCount: int, delay: float, jitter: float, seconds: float):
+    # As ObjectDetection.draw was
+    frames = Queue(taskCount)
+    results = Queue()
+    drawnAt = []
+    waited = []
+
+    def draw(frameCount: int):
+        while True:
+            count, frame = frames.get()
+            if count == frameCount:
+                break
+            frames.put((count, frame))
+            sleep(.1)
+
+    def receive():
+        while True:
+            frameCount = results.get()
+            draw(frameCount)
+            drawnAt.append(time())
+            waited.append(time() - generator.receivedAt[frameCount])
+
+    generator = ResultGenerator(
+        onSent=lambda frame: frames.put((frame, None)),
+        onResult=results.put,
+        delay=delay, jitter=jitter, seconds=seconds)
+    receiver = Thread(target=receive, daemon=True)
+    receiver.start()
+    startTime, startCPUTime = time(), process_time()
+    generator.run()
+    report('before', generator, drawnAt, waited,
+           process_time() - startCPUTime, time() - startTime)
+
+
+def runAfter(maxHoldTime: float, delay: float, jitter: float, seconds: float):
+    buffer = ReorderBuffer(maxHoldTime=maxHoldTime)
+    drawnAt = []
+    waited = []
+
+    def display():
+        while True:
+            frameCount, _, _ = buffer.get()
+            drawnAt.append(time())
+            waited.append(time() - generator.receivedAt[frameCount])
+
+    generator = ResultGenerator(
+        onSent=lambda frame: buffer.expect(frame, None),
+        onResult=lambda frame: buffer.put(frame, None),
+        delay=delay, jitter=jitter, seconds=seconds)
+    Thread(target=display, daemon=True).start()
+    startTime, startCPUTime = time(), process_time()
+    generator.run()
+    report('after', generator, drawnAt, waited,
+           process_time() - startCPUTime, time() - startTime)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reorder benchmark')
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--taskCount', type=int, default=8,
+                        help='the frames in flight before')
+    parser.add_argument('--delay', type=float, default=100,
+                        help='the least milliseconds of a result')
+    parser.add_argument('--jitter', type=float, default=100,
+                        help='the most milliseconds added to the delay')
+    parser.add_argument('--maxHoldTime', type=float, default=1000)
+    args = parser.parse_args()
+    runBefore(args.taskCount, args.delay, args.jitter, args.seconds)
+    runAfter(args.maxHoldTime, args.delay, args.jitter, args.seconds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from threading import Condition
+from time import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+
+class ReorderBuffer:
+    """
+    Releases the results of the items sent, in the order the items were
+    sent, whatever order the results arrive in.
+
+    The reader sleeps until the result of the next item arrives or the
+    item has waited for maxHoldTime. An item whose result is that late is
+    dropped, and so is its result if it arrives afterwards.
+    """
+
+    def __init__(
+            self,
+            maxHoldTime: float = 500,
+            clock: Callable[[], float] = time):
+        """
+        :param maxHoldTime: the most milliseconds to wait for a result
+        :param clock: the current time in seconds
+        """
+        self.maxHoldTime = maxHoldTime
+        self.clock = clock
+        self._condition = Condition()
+        # The items waiting, by sequence number, the oldest first,
+        # with their deadlines
+        self._items: OrderedDict[int, Tuple[Any, float]] = OrderedDict()
+        self._results: Dict[int, Any] = {}
+        self.dropped = 0
+        self.late = 0
+
+    def expect(self, sequence: int, item: Any):
+        """
+        :param sequence: a number larger than the ones of the items before
+        :param item: what to release with the result
+        """
+        with self._condition:
+            deadline = self.clock() + self.maxHoldTime / 1000
+            self._items[sequence] = (item, deadline)
+            self._condition.notify()
+
+    def put(self, sequence: int, result: Any) -> bool:
+        """
+        :return: whether the result is in time to be released
+        """
+        with self._condition:
+            if sequence not in self._items:
+                self.late += 1
+                return False
+            self._results[sequence] = result
+            if next(iter(self._items)) == sequence:
+                self._condition.notify()
+            return True
+
+    def get(self) -> Tuple[int, Any, Any]:
+        """
+        Waits for the result of the oldest item, dropping the items whose
+        results are too late
+        :return: the sequence number, the item and its result
+        """
+        with self._condition:
+            while True:
+                if not self._items:
+                    self._condition.wait()
+                    continue
+                sequence, (item, deadline) = next(iter(self._items.items()))
+                if sequence in self._results:
+                    del self._items[sequence]
+                    return sequence, item, self._results.pop(sequence)
+                timeToWait = deadline - self.clock()
+                if timeToWait <= 0:
+                    del self._items[sequence]
+                    self.dropped += 1
+                    continue
+                self._condition.wait(timeToWait)
+
+    def __len__(self):
+        with self._condition:
+            return len(self._items)
@@ -0,0 +1,52 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from .frameCodec import AdaptiveQuality
+from .frameCodec import encodeImage
+
+
+class FrameCodecTest(unittest.TestCase):
+
+    def testEncodedFrameIsSmaller(self):
+        row = np.linspace(0, 255, 480, dtype=np.float32)
+        image = (row[None, :, None] + row[:, None, None] / 4) % 256
+        image = np.repeat(image, 3, axis=2).astype(np.uint8)
+        for encoding in ('jpeg', 'webp'):
+            encoded = encodeImage(image, encoding, quality=80)
+            self.assertLess(len(encoded), image.nbytes / 10)
+            decoded = cv2.imdecode(
+                np.frombuffer(encoded, dtype=np.uint8), cv2.IMREAD_COLOR)
+            self.assertEqual(decoded.shape, image.shape)
+            error = np.abs(decoded.astype(int) - image.astype(int)).mean()
+            self.assertLess(error, 4)
+
+    def testQualityFollowsResponseTime(self):
+        quality = AdaptiveQuality(
+            quality=80, minQuality=60, step=10,
+            targetResponseTime=100, maxDataRate=1e6, interval=0)
+        self.assertEqual(quality.adapt(responseTime=150), 70)
+        self.assertEqual(quality.adapt(responseTime=150), 60)
+        self.assertEqual(quality.adapt(responseTime=150), 60)
+        # Between 80% of the target and the target nothing changes
+        self.assertEqual(quality.adapt(responseTime=90), 60)
+        self.assertEqual(quality.adapt(responseTime=50), 70)
+
+    def testQualityFollowsDataRate(self):
+        quality = AdaptiveQuality(
+            quality=80, step=10, targetResponseTime=100,
+            maxDataRate=1, interval=0)
+        quality.onSent(10 * 1000 * 1000)
+        self.assertEqual(quality.adapt(responseTime=10), 70)
+        self.assertGreater(quality.dataRate, 1)
+        self.assertEqual(quality.adapt(responseTime=10), 80)
+
+    def testQualityChangesOncePerInterval(self):
+        quality = AdaptiveQuality(
+            quality=80, targetResponseTime=100, interval=60)
+        self.assertEqual(quality.adapt(responseTime=500), 80)
+
+
+if __name__ == '__main__':
+    unittest.main()
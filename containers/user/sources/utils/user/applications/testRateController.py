@@ -0,0 +1,108 @@
+import heapq
+import unittest
+from typing import List
+from typing import Tuple
+
+from .rateController import RateController
+
+
+class SlowExecutor:
+    """
+    Processes one frame at a time in processingTime seconds, on a
+    simulated clock
+    """
+
+    def __init__(self, processingTime: float):
+        self.processingTime = processingTime
+        self.freeAt = .0
+        self.now = .0
+        # When each frame in flight is done and when it was sent
+        self.inFlight: List[Tuple[float, float]] = []
+
+    def send(self):
+        self.freeAt = max(self.now, self.freeAt) + self.processingTime
+        heapq.heappush(self.inFlight, (self.freeAt, self.now))
+
+    def results(self, until: float) -> List[Tuple[float, float]]:
+        """
+        :return: when each frame done by then was done and how many
+        milliseconds it took
+        """
+        done = []
+        while self.inFlight and self.inFlight[0][0] <= until:
+            doneAt, sentAt = heapq.heappop(self.inFlight)
+            done.append((doneAt, (doneAt - sentAt) * 1000))
+        return done
+
+
+def run(controller: RateController, executor: SlowExecutor,
+        seconds: float, fps: int = 30) -> List[Tuple[float, float]]:
+    """
+    :return: when each result came back and its response time
+    """
+    responses = []
+    for frame in range(int(seconds * fps)):
+        capturedAt = frame / fps
+        for doneAt, responseTime in executor.results(until=capturedAt):
+            executor.now = doneAt
+            if controller is not None:
+                controller.onResponse(responseTime)
+            responses.append((doneAt, responseTime))
+        executor.now = capturedAt
+        if controller is None \
+                or controller.admit(inFlight=len(executor.inFlight)):
+            executor.send()
+    return responses
+
+
+class RateControllerTest(unittest.TestCase):
+
+    def setUp(self):
+        # Half as fast as the frames are captured
+        self.executor = SlowExecutor(processingTime=1 / 15)
+
+    def newController(self, **kwargs) -> RateController:
+        return RateController(
+            clock=lambda: self.executor.now, maxRate=30, **kwargs)
+
+    def testLatencyGrowsWithoutControl(self):
+        responses = run(None, self.executor, seconds=60)
+        self.assertGreater(responses[-1][1], 20000)
+
+    def testLatencyStaysBounded(self):
+        controller = self.newController(targetResponseTime=300, maxInFlight=0)
+        responses = run(controller, self.executor, seconds=60)
+        # After the first decreases
+        lastResponses = [responseTime for doneAt, responseTime in responses
+                         if doneAt >= 10]
+        lastResponses.sort()
+        self.assertLess(lastResponses[int(.95 * len(lastResponses))], 600)
+        self.assertLess(lastResponses[-1], 1000)
+        # Most of what the executor can process is still sent, all along
+        for second in range(0, 60, 10):
+            throughput = sum(
+                1 for doneAt, _ in responses
+                if second <= doneAt < second + 10) / 10
+            self.assertGreater(throughput, .75 * 15)
+        self.assertGreater(controller.skipped, 0)
+
+    def testInFlightIsBounded(self):
+        controller = self.newController(
+            targetResponseTime=float('inf'), maxInFlight=2)
+        responses = run(controller, self.executor, seconds=60)
+        self.assertLessEqual(max(rt for _, rt in responses), 2 * 1000 / 15 + 1)
+        self.assertGreater(len(responses) / 60, .9 * 15)
+
+    def testRateStaysWithinBounds(self):
+        controller = self.newController(minRate=5)
+        for _ in range(100):
+            controller.onResponse(10000)
+            self.executor.now += 10
+        self.assertEqual(controller.rate, 5)
+        for _ in range(10000):
+            controller.onResponse(1)
+        self.assertEqual(controller.rate, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
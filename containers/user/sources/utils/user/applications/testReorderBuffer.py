@@ -0,0 +1,53 @@
+import unittest
+from threading import Thread
+from time import sleep
+from time import time
+
+from .reorderBuffer import ReorderBuffer
+
+
+class ReorderBufferTest(unittest.TestCase):
+
+    def testResultsAreReleasedInOrder(self):
+        buffer = ReorderBuffer(maxHoldTime=1000)
+        for sequence in range(5):
+            buffer.expect(sequence, 'frame %d' % sequence)
+        for sequence in (3, 1, 4, 0, 2):
+            self.assertTrue(buffer.put(sequence, sequence * 10))
+        self.assertEqual(
+            [buffer.get() for _ in range(5)],
+            [(sequence, 'frame %d' % sequence, sequence * 10)
+             for sequence in range(5)])
+        self.assertEqual(len(buffer), 0)
+
+    def testMissingResultIsDroppedAtDeadline(self):
+        buffer = ReorderBuffer(maxHoldTime=50)
+        buffer.expect(0, 'frame 0')
+        buffer.expect(1, 'frame 1')
+        buffer.put(1, 10)
+        startTime = time()
+        self.assertEqual(buffer.get(), (1, 'frame 1', 10))
+        self.assertGreaterEqual(time() - startTime, .04)
+        self.assertEqual(buffer.dropped, 1)
+        # Its result is too late to be released
+        self.assertFalse(buffer.put(0, 0))
+        self.assertEqual(buffer.late, 1)
+
+    def testReaderWakesUpWhenResultArrives(self):
+        buffer = ReorderBuffer(maxHoldTime=10000)
+        buffer.expect(0, 'frame 0')
+        released = []
+        reader = Thread(target=lambda: released.append((buffer.get(), time())))
+        reader.start()
+        sleep(.05)
+        self.assertEqual(released, [])
+        putTime = time()
+        buffer.put(0, 0)
+        reader.join(1)
+        (sequence, _, _), releasedTime = released[0]
+        self.assertEqual(sequence, 0)
+        self.assertLess(releasedTime - putTime, .05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+from typing import List
+from typing import Set
+
+from ...types import Address
+from ...types import Component
+
+
+class DataRoutes:
+    """
+    Where to send the sensory data without going through the master, as
+    told by the master once every task executor is ready
+    """
+
+    def __init__(
+            self,
+            entries: List[Address],
+            exits: List[Address],
+            roundRobin: bool = False):
+        self.entries: List[Component] = [
+            Component(addr=(addr[0], addr[1])) for addr in entries]
+        self.exits: Set[Address] = {(addr[0], addr[1]) for addr in exits}
+        self.roundRobin = roundRobin
+        self._index = 0
+
+    def destinations(self) -> List[Component]:
+        """
+        :return: the entry task executors to send the next data to
+        """
+        if not self.roundRobin:
+            return self.entries
+        entry = self.entries[self._index]
+        self._index = (self._index + 1) % len(self.entries)
+        return [entry]
+
+    def isExit(self, addr: Address) -> bool:
+        return (addr[0], addr[1]) in self.exits
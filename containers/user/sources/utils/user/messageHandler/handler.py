@@ -4,10 +4,13 @@ from pprint import pformat
 from threading import Thread
 from time import sleep
 from time import time
+from typing import Union
 
+from .dataRoutes import DataRoutes
 from ..applications.base import ApplicationUserSide
 from ..registration.manager import RegistrationManager
 from ...component import BasicComponent
+from ...connection.dispatcher import handles
 from ...connection.message.received import MessageReceived
 from ...container.manager import ContainerManager
 from ...resourceDiscovery.resourceDiscovery import ResourcesDiscovery
@@ -32,39 +35,17 @@ class UserMessageHandler:
         self.containerManager = containerManager
         self.basicComponent = basicComponent
         self.basicComponent.handleMessage = self.handleMessage
+        self.basicComponent.handleNack = self.handleNack
         self.lastDataSentTime = 0
         self.registerTime = 0
+        # None to send the data through the master
+        self.dataRoutes: Union[DataRoutes, None] = None
+        self.basicComponent.dispatcher.registerHandlers(self)
 
     def handleMessage(self, message: MessageReceived):
-        if message.typeIs(
-                messageType=MessageType.REGISTRATION,
-                messageSubType=MessageSubType.REGISTERED):
-            self.handleRegistered(message=message)
-        elif message.typeIs(
-                messageType=MessageType.ACKNOWLEDGEMENT,
-                messageSubType=MessageSubType.SERVICE_READY):
-            self.handleReady()
-        elif message.typeIs(
-                messageType=MessageType.DATA,
-                messageSubType=MessageSubType.FINAL_RESULT):
-            self.handleResult(message=message)
-        elif message.typeIs(
-                messageType=MessageType.EXPERIMENTAL,
-                messageSubType=MessageSubType.ACTORS_COUNT):
-            self.handleActorsCount(message=message)
-        elif message.typeIs(
-                messageType=MessageType.SCALING,
-                messageSubType=MessageSubType.CONNECT_TO_NEW_MASTER):
-            self.handleForward(message=message)
-        elif message.typeIs(
-                messageType=MessageType.ACKNOWLEDGEMENT,
-                messageSubType=MessageSubType.NO_ACTOR):
-            self.handleNoActor(message=message)
-        elif message.typeIs(
-                messageType=MessageType.TERMINATION,
-                messageSubType=MessageSubType.STOP):
-            self.handleStop(message=message)
+        self.basicComponent.dispatcher.dispatch(message)
 
+    @handles(MessageType.TERMINATION, MessageSubType.STOP)
     def handleStop(self, message: MessageReceived):
         reason = message.data['reason']
 
@@ -91,6 +72,7 @@ class UserMessageHandler:
         self.basicComponent.debugLogger.debug('Bye')
         terminate()
 
+    @handles(MessageType.REGISTRATION, MessageSubType.REGISTERED)
     def handleRegistered(self, message: MessageReceived):
         source = message.source
         self.basicComponent.master = source
@@ -122,7 +104,8 @@ class UserMessageHandler:
         f.close()
         terminate()
 
-    def handleReady(self):
+    @handles(MessageType.ACKNOWLEDGEMENT, MessageSubType.SERVICE_READY)
+    def handleReady(self, message: MessageReceived):
         # self.basicComponent.debugLogger.info(
         #     'RRT: %f', time() * 1000 - self.registerTime)
         # import os
@@ -136,16 +119,55 @@ class UserMessageHandler:
         # os._exit(0)
         Thread(target=self.ready, name='Actuator').start()
 
+    @handles(MessageType.DATA, MessageSubType.FINAL_RESULT)
     def handleResult(self, message: MessageReceived):
-
+        source = message.source
+        dataRoutes = self.dataRoutes
+        if source.role is ComponentRole.TASK_EXECUTOR:
+            if dataRoutes is None or not dataRoutes.isExit(source.addr):
+                return
         result = message.data['finalResult']
+        self.actuator.credits.release()
         self.actuator.resultForActuator.put(result)
         # self.saveResponseTime()
 
+    def handleNack(self, message: MessageReceived):
+        data = message.data
+        self.basicComponent.debugLogger.debug(
+            '%s rejected %s/%s: %s',
+            message.source.nameLogPrinting,
+            data['type'],
+            data['subType'],
+            data['reason'])
+        if data['type'] != MessageType.DATA.value:
+            return
+        # The rejected data will not have a result
+        self.actuator.credits.release()
+
+    @handles(MessageType.PLACEMENT, MessageSubType.DATA_ROUTES)
+    def handleDataRoutes(self, message: MessageReceived):
+        if message.source.role is not ComponentRole.MASTER:
+            return
+        data = message.data
+        if not data['direct']:
+            self.dataRoutes = None
+            self.basicComponent.debugLogger.info(
+                'Sending data through %s', ComponentRole.MASTER.value)
+            return
+        self.dataRoutes = DataRoutes(
+            entries=data['entries'],
+            exits=data['exits'],
+            roundRobin=data['roundRobin'])
+        self.basicComponent.debugLogger.info(
+            'Sending data to %s directly',
+            ', '.join(str(entry.addr) for entry in self.dataRoutes.entries))
+
+    @handles(MessageType.EXPERIMENTAL, MessageSubType.ACTORS_COUNT)
     def handleActorsCount(self, message: MessageReceived):
         data = message.data
         self.registrationManager.actorsCount = data['actorsCount']
 
+    @handles(MessageType.SCALING, MessageSubType.CONNECT_TO_NEW_MASTER)
     def handleForward(self, message: MessageReceived):
         data = message.data
         addr = data['masterAddr']
@@ -161,6 +183,7 @@ class UserMessageHandler:
             'Found %s at %s', ComponentRole.MASTER.value, str(masterAddr))
         self.registrationManager.registerAt(masterAddr)
 
+    @handles(MessageType.ACKNOWLEDGEMENT, MessageSubType.NO_ACTOR)
     def handleNoActor(self, message: MessageReceived):
         self.basicComponent.debugLogger.warning(
             'There is no %s at %s in domain %s, would you like to discover available %s? '
@@ -182,14 +205,31 @@ class UserMessageHandler:
         self.actuator.start()
 
         while True:
+            sensoryData = self.actuator.dataToSubmit.get()
+            self.actuator.credits.acquire()
+            dataRoutes = self.dataRoutes
+            if dataRoutes is None:
+                data = {
+                    'userID': self.basicComponent.componentID,
+                    'sensoryData': sensoryData}
+                self.basicComponent.sendMessage(
+                    messageType=MessageType.DATA,
+                    messageSubType=MessageSubType.SENSORY_DATA,
+                    data=data,
+                    destination=self.basicComponent.master)
+                self.lastDataSentTime = time() * 1000
+                continue
+            # In the form that the master forwards
             data = {
                 'userID': self.basicComponent.componentID,
-                'sensoryData': self.actuator.dataToSubmit.get()}
-            self.basicComponent.sendMessage(
-                messageType=MessageType.DATA,
-                messageSubType=MessageSubType.SENSORY_DATA,
-                data=data,
-                destination=self.basicComponent.master)
+                'userAddr': self.basicComponent.addr,
+                'intermediateData': sensoryData}
+            for entry in dataRoutes.destinations():
+                self.basicComponent.sendMessage(
+                    messageType=MessageType.DATA,
+                    messageSubType=MessageSubType.INTERMEDIATE_DATA,
+                    data=data,
+                    destination=entry)
             self.lastDataSentTime = time() * 1000
 
     def saveResponseTime(self):
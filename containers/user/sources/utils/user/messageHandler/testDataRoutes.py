@@ -0,0 +1,32 @@
+import unittest
+
+from .dataRoutes import DataRoutes
+
+
+class DataRoutesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.entries = [['127.0.0.1', 5001], ['127.0.0.1', 5002]]
+        self.exits = [['127.0.0.1', 5003]]
+
+    def testBroadcast(self):
+        dataRoutes = DataRoutes(entries=self.entries, exits=self.exits)
+        for _ in range(3):
+            addrs = [entry.addr for entry in dataRoutes.destinations()]
+            self.assertEqual(addrs, [('127.0.0.1', 5001), ('127.0.0.1', 5002)])
+
+    def testRoundRobin(self):
+        dataRoutes = DataRoutes(
+            entries=self.entries, exits=self.exits, roundRobin=True)
+        addrs = [dataRoutes.destinations()[0].addr[1] for _ in range(4)]
+        self.assertEqual(addrs, [5001, 5002, 5001, 5002])
+
+    def testExit(self):
+        dataRoutes = DataRoutes(entries=self.entries, exits=self.exits)
+        self.assertTrue(dataRoutes.isExit(('127.0.0.1', 5003)))
+        self.assertTrue(dataRoutes.isExit(['127.0.0.1', 5003]))
+        self.assertFalse(dataRoutes.isExit(('127.0.0.1', 5001)))
+
+
+if __name__ == '__main__':
+    unittest.main()